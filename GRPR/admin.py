@@ -1,6 +1,6 @@
 from django.contrib import admin
 from django.utils import timezone
-from .models import UserProfile, Games
+from .models import UserProfile, Games, Season
 
 admin.site.register(UserProfile)
 
@@ -15,4 +15,9 @@ def unlock_games(modeladmin, request, queryset):
 @admin.register(Games)
 class GamesAdmin(admin.ModelAdmin):
     list_display = ("id", "PlayDate", "Status", "IsLocked")
-    actions = [lock_games, unlock_games]
\ No newline at end of file
+    actions = [lock_games, unlock_games]
+
+
+@admin.register(Season)
+class SeasonAdmin(admin.ModelAdmin):
+    list_display = ("Name", "StartDate", "EndDate", "PlayStart", "PlayEnd", "Frozen")
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from GRPR.services import replay, synthetic
+
+class Command(BaseCommand):
+    help = 'Replay a synthetic Saturday (score entry + leaderboard polling) in a throwaway test database and report per-view query counts and p50/p95 latency'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--players', type=int, default=48)
+        parser.add_argument('--courses', type=int, default=2)
+        parser.add_argument('--played', type=int, default=10, help='Scored Saturdays before the replayed one')
+        parser.add_argument('--pollers', type=int, default=8, help='Spectators polling the leaderboard')
+        parser.add_argument('--seed', type=int, default=1)
+        parser.add_argument('--keepdb', action='store_true', help='Keep the test database between runs')
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=options['keepdb'])
+        try:
+            league = synthetic.generate(
+                players=options['players'], courses=options['courses'],
+                weeks=options['played'] + 1, played=options['played'], seed=options['seed'],
+            )
+            self.stdout.write(f"{sum(league.counts.values())} rows generated, replaying {league.replay[0].play_date}")
+            rows = replay.saturday(league.replay[0], pollers=options['pollers'], seed=options['seed'])
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=options['keepdb'])
+            teardown_test_environment()
+
+        self.stdout.write(f"{'view':<24}{'n':>6}{'304':>6}{'q p50':>7}{'q p95':>7}{'ms p50':>9}{'ms p95':>9}")
+        for r in rows:
+            self.stdout.write(
+                f"{r['view']:<24}{r['n']:>6}{r['not_modified']:>6}{r['queries_p50']:>7}{r['queries_p95']:>7}"
+                f"{r['ms_p50']:>9}{r['ms_p95']:>9}"
+            )
@@ -0,0 +1,41 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from GRPR.services import outbox
+
+log = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Deliver queued texts and e-mails from the Outbox (once, or continuously with --loop)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true', help='Keep polling for new messages (worker dyno)')
+        parser.add_argument('--interval', type=float, default=2.0, help='Seconds between polls when the outbox is empty')
+        parser.add_argument('--batch', type=int, default=100, help='Messages claimed per round')
+        parser.add_argument('--workers', type=int, default=4, help='Concurrent sends')
+        parser.add_argument('--sms', help='SMS transport for this run (twilio, fake, file), default MESSAGING_SMS')
+        parser.add_argument('--email', help='E-mail transport for this run (smtp, fake, file), default MESSAGING_EMAIL')
+
+    def handle(self, *args, **options):
+        while True:
+            close_old_connections()
+            try:
+                counts = outbox.drain(
+                    limit=options['batch'], workers=options['workers'], sms=options['sms'], email=options['email'],
+                )
+            except Exception:
+                if not options['loop']:
+                    raise
+                # a DB hiccup must not take the worker down; claimed rows are retried after their lease
+                log.exception('drain_outbox round failed')
+                time.sleep(options['interval'])
+                continue
+            if sum(counts.values()) or options['verbosity'] > 1:
+                self.stdout.write(f"{counts['sent']} sent, {counts['retry']} to retry, {counts['failed']} failed")
+            if not options['loop']:
+                return
+            if counts['sent'] + counts['retry'] + counts['failed'] < options['batch']:
+                time.sleep(options['interval'])
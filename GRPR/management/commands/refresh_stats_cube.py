@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from GRPR.services import stats
+
+class Command(BaseCommand):
+    help = 'Refresh the precomputed season statistics (StatsCube) used by the Statistics and Best Rounds pages'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--full', action='store_true', help='Rebuild every row, even if its sources look unchanged')
+        parser.add_argument('--freeze', metavar='SEASON', help='Rebuild this season (Season.Name) once more and freeze it')
+
+    def handle(self, *args, **options):
+        rebuilt, unchanged = stats.refresh_cube(full=options['full'], freeze=options['freeze'])
+
+        for label in rebuilt:
+            self.stdout.write(self.style.SUCCESS(f'Rebuilt {label}'))
+        self.stdout.write(f'{len(rebuilt)} rebuilt, {len(unchanged)} unchanged')
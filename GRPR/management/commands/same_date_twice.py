@@ -26,8 +26,9 @@ class Command(BaseCommand):
                 getTTIs = TeeTimesInd.objects.filter(PID_id=player['PID_id'], gDate=player['gDate'])
                 for tti in getTTIs:
                     email_msg += f"  TeeTimeInd ID: {tti.id}\n"
-                print(email_msg)
-            
+
+            self.stdout.write(email_msg)
+
             # Send an email to cprouty@gmail.com
             subject = 'WARNING: Players playing same date twice'
             from_email = os.environ.get('EMAIL_HOST_USER')
@@ -23,9 +23,9 @@ class Command(BaseCommand):
         # Define the date for filtering
         # filter_date = date(2025, 4, 27) # hard coded.  I *think* we can use current_datetime for this instead, but need to test / verify
         filter_date = timezone.now()
-        print(f"filter_date: {filter_date}")
         current_datetime = timezone.now()
-        print(f"current_datetime: {current_datetime}")
+        if kwargs.get('verbosity', 1) > 1:
+            self.stdout.write(f"filter_date: {filter_date}  current_datetime: {current_datetime}")
 
         # Perform the query
         queryset = SubSwap.objects.select_related('TeeTimeIndID').filter(
@@ -52,7 +52,7 @@ class Command(BaseCommand):
                     
                     self.stdout.write(self.style.SUCCESS(f'SubSwap id {sub_swap.id} gDate has passed, status has been set to Expired'))
                 else:
-                    print(f"Unknown status for SubSwap ID: {sub_swap.id}, should have been Swap Open or Sub Open")
+                    self.stdout.write(self.style.WARNING(f"Unknown status for SubSwap ID: {sub_swap.id}, should have been Swap Open or Sub Open"))
                     continue
 
                 # Append the msg to the email_msg
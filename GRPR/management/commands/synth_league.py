@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from GRPR.services import seasons, synthetic
+
+class Command(BaseCommand):
+    help = 'Generate a synthetic league (players, tee times, scored games, sub/swap traffic) for load testing. Scratch databases only.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--crews', type=int, default=1)
+        parser.add_argument('--players', type=int, default=48, help='Players per crew')
+        parser.add_argument('--courses', type=int, default=2, help='Courses the crew rotates through')
+        parser.add_argument('--weeks', type=int, help='Saturdays to generate (default: the whole season)')
+        parser.add_argument('--played', type=int, help='Saturdays with full scores (default: half)')
+        parser.add_argument('--season', help='Season.Name to fill (default: current season)')
+        parser.add_argument('--seed', type=int, default=1)
+        parser.add_argument('--force', action='store_true', help='Run even when DEBUG is off')
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG and not options['force']:
+            raise CommandError('DEBUG is off; this looks like production. Use --force on a scratch database.')
+
+        league = synthetic.generate(
+            crews=options['crews'], players=options['players'], courses=options['courses'],
+            weeks=options['weeks'], played=options['played'],
+            season=seasons.get(options['season']), seed=options['seed'],
+        )
+
+        for table, n in sorted(league.counts.items()):
+            self.stdout.write(f'{table:<15} {n:>8}')
+        for day in league.replay:
+            self.stdout.write(self.style.SUCCESS(
+                f'Replay Saturday {day.play_date}: Skins game {day.game.id}, {len(day.groups)} groups'
+            ))
@@ -15,7 +15,8 @@ class Command(BaseCommand):
         from_email = os.environ.get('EMAIL_HOST_USER')
         recipient_list = ['cprouty@gmail.com']
 
-        print('from_email', from_email)
+        if kwargs.get('verbosity', 1) > 1:
+            self.stdout.write(f'from_email {from_email}')
 
         try:
             send_mail(subject, email_message, from_email, recipient_list)
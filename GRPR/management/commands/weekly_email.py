@@ -6,9 +6,9 @@ from zoneinfo import ZoneInfo
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 from django.db import transaction
-from django.core.mail import send_mail
 
-from GRPR.models import Players, TeeTimesInd, AutomatedMessages
+from GRPR.models import Players, AutomatedMessages
+from GRPR.services import messaging, teesheet
 
 CENTRAL = ZoneInfo("America/Chicago")        # CST/CDT, DST-aware
 
@@ -92,13 +92,12 @@ class Command(BaseCommand):
         ]
         email_body = "\n".join(part for part in body_parts if part != "")
 
-        send_mail(
+        messaging.send_email(
             subject=f"GAS Weekly for {saturday:%B %d, %Y}",
-            message=email_body,
+            body=email_body,
             from_email=os.environ.get("EMAIL_HOST_USER",
                                       "gasgolf2025@gmail.com"),
-            recipient_list=recipients,
-            fail_silently=False,
+            recipients=recipients,
         )
 
         # mark sent if we had a Verified row
@@ -121,27 +120,17 @@ def next_saturday(now_cst):
 def render_schedule(saturday):
     """Build the schedule text block for the e-mail body."""
     sunday = saturday + timedelta(days=1)
-    qs = (TeeTimesInd.objects
-          .filter(gDate__range=[saturday, sunday])
-          .select_related("PID", "CourseID")
-          .order_by("gDate", "CourseID__courseTimeSlot"))
-
-    schedule = {}
-    for tt in qs:
-        fd = tt.gDate.strftime("%A, %B %d, %Y")
-        schedule.setdefault(fd, []).append({
-            "course": tt.CourseID.courseName,
-            "time":   tt.CourseID.courseTimeSlot,
-            "player": f"{tt.PID.FirstName} {tt.PID.LastName}",
-        })
+    sheets = teesheet.for_dates([saturday, sunday])   # cached per date
 
     lines = []
-    for fd, times in schedule.items():
-        lines.append(f"Schedule for {fd}:")
+    for day, groups in sheets.items():
+        if not groups:
+            continue
+        lines.append(f"Schedule for {day.strftime('%A, %B %d, %Y')}:")
         grouped = {}
-        for t in times:
-            key = f"{t['course']} at {t['time']}am"
-            grouped.setdefault(key, []).append(t["player"])
+        for group in sorted(groups, key=lambda g: g["time_slot"]):
+            key = f"{group['course']} at {group['time_slot']}am"
+            grouped.setdefault(key, []).append(teesheet.player_names(group))
         for key, players in grouped.items():
             lines.append(f"  {key}: {', '.join(players)}")
     return "\n".join(lines)
@@ -155,13 +144,12 @@ def send_preview(msg_row, schedule_text, saturday):
         f"Coogan's Corner--\n{msg_row.Msg}\n\n"
         "Hit 'em straight!"
     )
-    send_mail(
+    messaging.send_email(
         subject=("VERIFICATION – this is what the GAS Weekly for "
                  f"{saturday:%B %d, %Y} will look like"),
-        message=body,
+        body=body,
         from_email=os.environ.get("EMAIL_HOST_USER",
                                   "gasgolf2025@gmail.com"),
-        recipient_list=["cprouty@gmail.com",
-                        "Christopher_Coogan@rush.edu"],
-        fail_silently=False,
+        recipients=["cprouty@gmail.com",
+                    "Christopher_Coogan@rush.edu"],
     )
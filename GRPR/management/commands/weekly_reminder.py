@@ -4,14 +4,11 @@ from datetime import timedelta
 from zoneinfo import ZoneInfo
 from django.core.management.base import BaseCommand
 from django.utils import timezone
-from twilio.rest import Client
 
 from GRPR.models import Log, TeeTimesInd
+from GRPR.services import messaging
 
 CENTRAL = ZoneInfo("America/Chicago")
-account_sid = os.getenv('TWILIO_ACCOUNT_SID')
-auth_token  = os.getenv('TWILIO_AUTH_TOKEN')
-client = Client(account_sid, auth_token)
 
 class Command(BaseCommand):
     help = "Tuesday SMS reminder to players on this week’s tee sheet"
@@ -40,29 +37,30 @@ class Command(BaseCommand):
             self.stdout.write(self.style.WARNING("No tee times found."))
             return
 
-        for tt in tee_times:
-            group = [
-                f"{p.PID.FirstName} {p.PID.LastName}"
-                for p in tee_times
-                if p.CourseID == tt.CourseID and p.PID != tt.PID
-            ]
-            if len(group) != 3:
-                continue   # skip malformed foursomes
+        # always live: this reminder has never been gated on TWILIO_ENABLED
+        with messaging.batch(sms="twilio") as sender:   # one Twilio client for the whole sheet
+            for tt in tee_times:
+                group = [
+                    f"{p.PID.FirstName} {p.PID.LastName}"
+                    for p in tee_times
+                    if p.CourseID == tt.CourseID and p.PID != tt.PID
+                ]
+                if len(group) != 3:
+                    continue   # skip malformed foursomes
 
-            msg_text = (f"Reminder: you play Saturday {saturday} at "
-                        f"{tt.CourseID.courseTimeSlot}am "
-                        f"{tt.CourseID.courseName} with {', '.join(group)}.")
-            to_number = tt.PID.Mobile
-            message = client.messages.create(
-                from_='+18449472599', body=msg_text, to=to_number)
+                msg_text = (f"Reminder: you play Saturday {saturday} at "
+                            f"{tt.CourseID.courseTimeSlot}am "
+                            f"{tt.CourseID.courseName} with {', '.join(group)}.")
+                to_number = tt.PID.Mobile
+                mID = sender.sms(to_number, msg_text)
 
-            Log.objects.create(
-                SentDate=timezone.now(),
-                Type="Weekly Reminder",
-                MessageID=message.sid,
-                RequestDate=saturday,
-                OfferID=tt.PID_id,
-                Msg=msg_text,
-                To_number=to_number)
+                Log.objects.create(
+                    SentDate=timezone.now(),
+                    Type="Weekly Reminder",
+                    MessageID=mID,
+                    RequestDate=saturday,
+                    OfferID=tt.PID_id,
+                    Msg=msg_text,
+                    To_number=to_number)
 
         self.stdout.write(self.style.SUCCESS("Weekly SMS reminder sent."))
@@ -1,9 +1,17 @@
 # middleware.py
+import json
+import logging
+import time
+
 from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
 from django.http import HttpResponsePermanentRedirect
 from django.shortcuts import redirect
 from django.urls import reverse
 
+logger = logging.getLogger(__name__)
+
 class SSLRedirectMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
@@ -27,4 +35,52 @@ class ForcePasswordChangeMiddleware:
                 if request.path != reverse('password_change'):
                     return redirect('password_change')
         response = self.get_response(request)
-        return response
\ No newline at end of file
+        return response
+
+
+class RequestMetricsMiddleware:
+    """
+    Per request: view name, SQL query count and time, repeated-query
+    fingerprints and wall time, as one JSON log line, plus a rolling sample
+    for the percentiles on admin_view (GRPR/services/request_metrics.py).
+    Off unless REQUEST_METRICS=True; when off Django drops it at startup.
+    """
+    def __init__(self, get_response):
+        if not settings.REQUEST_METRICS:
+            raise MiddlewareNotUsed
+        from GRPR.services import request_metrics
+        self.metrics = request_metrics
+        self.get_response = get_response
+
+    def __call__(self, request):
+        fingerprints = []
+        sql_time = [0.0]
+
+        def wrapper(execute, sql, params, many, context):
+            start = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                sql_time[0] += time.perf_counter() - start
+                fingerprints.append(self.metrics.fingerprint(sql))
+
+        start = time.perf_counter()
+        with connection.execute_wrapper(wrapper):
+            response = self.get_response(request)
+        wall_ms = (time.perf_counter() - start) * 1000
+
+        match = getattr(request, 'resolver_match', None)
+        view = (match.view_name if match else None) or request.path
+        sql_ms = sql_time[0] * 1000
+        logger.info(json.dumps({
+            'event': 'request',
+            'view': view,
+            'method': request.method,
+            'status': response.status_code,
+            'wall_ms': round(wall_ms, 1),
+            'queries': len(fingerprints),
+            'sql_ms': round(sql_ms, 1),
+            'dup_queries': self.metrics.duplicates(fingerprints),
+        }))
+        self.metrics.record(view, wall_ms, len(fingerprints), sql_ms)
+        return response
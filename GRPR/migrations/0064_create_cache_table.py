@@ -0,0 +1,21 @@
+# Creates the DatabaseCache table configured in settings.CACHES so deploys
+# that only run `migrate` get it too. No-op if the table already exists or
+# the cache backend is not database-backed.
+
+from django.core.management import call_command
+from django.db import migrations
+
+
+def create_cache_table(apps, schema_editor):
+    call_command('createcachetable', database=schema_editor.connection.alias, verbosity=0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('GRPR', '0063_fortygrouprule'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_cache_table, migrations.RunPython.noop),
+    ]
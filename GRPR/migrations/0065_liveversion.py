@@ -0,0 +1,26 @@
+# Generated by Django 4.2.16 on 2026-10-18 00:34
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('GRPR', '0064_create_cache_table'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LiveVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('Version', models.PositiveBigIntegerField(default=0)),
+                ('AlterDate', models.DateTimeField(auto_now=True)),
+                ('Game', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='live_version', to='GRPR.games')),
+            ],
+            options={
+                'db_table': 'LiveVersion',
+            },
+        ),
+    ]
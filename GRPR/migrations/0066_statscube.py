@@ -0,0 +1,34 @@
+# Generated by Django 4.2.16 on 2026-10-18 00:41
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('GRPR', '0065_liveversion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatsCube',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('Kind', models.CharField(max_length=32)),
+                ('Key', models.CharField(blank=True, default='', max_length=32)),
+                ('Window', models.CharField(max_length=32)),
+                ('Data', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('Sources', models.JSONField(default=dict)),
+                ('BuiltAt', models.DateTimeField()),
+                ('CheckedAt', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'StatsCube',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='statscube',
+            constraint=models.UniqueConstraint(fields=('Kind', 'Key', 'Window'), name='uniq_statscube_kind_key_window'),
+        ),
+    ]
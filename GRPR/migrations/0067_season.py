@@ -0,0 +1,44 @@
+# Generated by Django 4.2.16 on 2026-10-18 00:45
+
+import datetime
+
+from django.db import migrations, models
+
+
+def seed_2025(apps, schema_editor):
+    # the windows that used to be hard-coded in views.py
+    Season = apps.get_model('GRPR', 'Season')
+    Season.objects.get_or_create(
+        Name='2025',
+        defaults=dict(
+            StartDate=datetime.date(2025, 1, 1), EndDate=datetime.date(2025, 12, 31),
+            PlayStart=datetime.date(2025, 4, 1), PlayEnd=datetime.date(2025, 9, 1),
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('GRPR', '0066_statscube'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Season',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('Name', models.CharField(max_length=16, unique=True)),
+                ('StartDate', models.DateField()),
+                ('EndDate', models.DateField()),
+                ('PlayStart', models.DateField()),
+                ('PlayEnd', models.DateField()),
+                ('Frozen', models.BooleanField(default=False)),
+            ],
+            options={
+                'db_table': 'Season',
+                'ordering': ['StartDate'],
+            },
+        ),
+        migrations.RunPython(seed_2025, migrations.RunPython.noop),
+    ]
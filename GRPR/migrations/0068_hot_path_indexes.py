@@ -0,0 +1,123 @@
+# Generated by Django 4.2.16 on 2026-10-18 00:48
+
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+
+def merge_duplicates(apps, schema_editor):
+    """
+    Clear rows the new unique constraints would reject (left by the old
+    read-then-write paths). Duplicate ScorecardMeta rows for a player in a
+    game are merged into the oldest one: its missing holes are taken from the
+    duplicates, then the duplicates go. For Scorecard, the oldest row for a
+    (meta, hole) wins: the scorer looked rows up with .first() (pk order), so
+    every later correction went to it and a newer duplicate holds the stale
+    score. The OUT/IN/Total/Putts of every meta touched here are then summed
+    again from its remaining holes, since the running totals were kept by
+    deltas against rows that no longer exist.
+    """
+    ScorecardMeta = apps.get_model('GRPR', 'ScorecardMeta')
+    Scorecard = apps.get_model('GRPR', 'Scorecard')
+    touched = set()
+
+    dup_metas = (
+        ScorecardMeta.objects.values('GameID_id', 'PID_id')
+        .annotate(n=Count('id')).filter(n__gt=1)
+    )
+    for dup in dup_metas:
+        ids = list(
+            ScorecardMeta.objects
+            .filter(GameID_id=dup['GameID_id'], PID_id=dup['PID_id'])
+            .order_by('id').values_list('id', flat=True)
+        )
+        keep, drop = ids[0], ids[1:]
+        have = set(Scorecard.objects.filter(smID_id=keep).values_list('HoleID_id', flat=True))
+        for sc_id, hole_id in Scorecard.objects.filter(smID_id__in=drop).order_by('id').values_list('id', 'HoleID_id'):
+            if hole_id not in have:
+                Scorecard.objects.filter(id=sc_id).update(smID_id=keep)
+                have.add(hole_id)
+        ScorecardMeta.objects.filter(id__in=drop).delete()
+        touched.add(keep)
+
+    dup_scores = (
+        Scorecard.objects.values('smID_id', 'HoleID_id')
+        .annotate(n=Count('id')).filter(n__gt=1)
+    )
+    for dup in dup_scores:
+        ids = list(
+            Scorecard.objects
+            .filter(smID_id=dup['smID_id'], HoleID_id=dup['HoleID_id'])
+            .order_by('id').values_list('id', flat=True)
+        )
+        Scorecard.objects.filter(id__in=ids[1:]).delete()
+        touched.add(dup['smID_id'])
+
+    front = Q(HoleID__HoleNumber__lte=9)
+    back = Q(HoleID__HoleNumber__gte=10)
+    for meta_id in touched:
+        sums = {
+            name: value or 0
+            for name, value in Scorecard.objects.filter(smID_id=meta_id).aggregate(
+                RawOUT=Sum('RawScore', filter=front), NetOUT=Sum('NetScore', filter=front),
+                RawIN=Sum('RawScore', filter=back), NetIN=Sum('NetScore', filter=back),
+                Putts=Sum('Putts'),
+            ).items()
+        }
+        ScorecardMeta.objects.filter(id=meta_id).update(
+            RawTotal=sums['RawOUT'] + sums['RawIN'], NetTotal=sums['NetOUT'] + sums['NetIN'], **sums,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('GRPR', '0067_season'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='forty',
+            index=models.Index(fields=['GameID', 'GroupID'], name='Forty_GameID__076c70_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='games',
+            index=models.Index(fields=['AssocGame', 'Type'], name='Games_AssocGa_c849da_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='log',
+            index=models.Index(fields=['RefID'], name='Log_RefID_634abb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='scorecard',
+            index=models.Index(fields=['GameID', 'HoleID', 'smID'], name='Scorecard_GameID__aa3dd0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='scorecardmeta',
+            index=models.Index(fields=['GameID', 'GroupID'], name='ScorecardMe_GameID__6120de_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='scorecardmeta',
+            index=models.Index(fields=['PlayDate'], name='ScorecardMe_PlayDat_a25cdf_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skins',
+            index=models.Index(fields=['SkinDate'], name='Skins_SkinDat_138bfd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='subswap',
+            index=models.Index(fields=['SwapID', 'SubType', 'nStatus'], name='SubSwap_SwapID_c65608_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='subswap',
+            index=models.Index(fields=['PID', 'nType', 'SubType', 'nStatus'], name='SubSwap_PID_id_615f9b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='teetimesind',
+            index=models.Index(fields=['gDate', 'CourseID'], name='TeeTimesInd_gDate_9c15a2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='teetimesind',
+            index=models.Index(fields=['PID', 'gDate'], name='TeeTimesInd_PID_id_8c61a9_idx'),
+        ),
+        migrations.RunPython(merge_duplicates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Unique keys for the scorer's upserts. Separate from 0068 so its duplicate
+# merge commits first (Postgres won't ALTER a table with pending deferred
+# FK trigger events in the same transaction).
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('GRPR', '0068_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='scorecard',
+            constraint=models.UniqueConstraint(fields=('smID', 'HoleID'), name='uniq_scorecard_meta_hole'),
+        ),
+        migrations.AddConstraint(
+            model_name='scorecardmeta',
+            constraint=models.UniqueConstraint(fields=('GameID', 'PID'), name='uniq_scorecardmeta_game_pid'),
+        ),
+    ]
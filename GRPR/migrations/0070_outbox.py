@@ -0,0 +1,36 @@
+# Generated by Django 4.2.16 on 2026-10-18 01:12
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('GRPR', '0069_scorecard_unique'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Outbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('CreateDate', models.DateTimeField(auto_now_add=True)),
+                ('Channel', models.CharField(default='sms', max_length=8)),
+                ('To', models.CharField(max_length=256)),
+                ('Subject', models.CharField(blank=True, default='', max_length=256)),
+                ('Body', models.TextField()),
+                ('Status', models.CharField(default='Pending', max_length=16)),
+                ('Attempts', models.PositiveSmallIntegerField(default=0)),
+                ('NextAttempt', models.DateTimeField()),
+                ('LastError', models.TextField(blank=True, default='')),
+                ('SentDate', models.DateTimeField(blank=True, null=True)),
+                ('MessageID', models.CharField(blank=True, default='', max_length=256)),
+                ('LogRow', models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder)),
+            ],
+            options={
+                'db_table': 'Outbox',
+                'indexes': [models.Index(fields=['Status', 'NextAttempt'], name='Outbox_Status_353e1b_idx')],
+            },
+        ),
+    ]
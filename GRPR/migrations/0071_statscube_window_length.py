@@ -0,0 +1,18 @@
+# Generated by Django 4.2.16 on 2026-10-18 01:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('GRPR', '0070_outbox'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='statscube',
+            name='Window',
+            field=models.CharField(max_length=48),
+        ),
+    ]
@@ -1,6 +1,8 @@
 from django.db import models
 from django.contrib.auth.models import User #Built-in Django User model, called to tie to the User model and the Player table
 from django.core.validators import RegexValidator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.dispatch import Signal
 
 # ▸▸▸  Gas-Cup data models  ◂◂◂
 from django.db.models import UniqueConstraint, Q
@@ -25,14 +27,57 @@ class Crews(models.Model):
         db_table = "Crews"
 
 
+# Sent with dates=<set of gDate> by TeeTimesInd writes that skip post_save/post_delete
+# (queryset .update(), bulk_create, bulk_update) so per-date caches can be dropped.
+tee_times_changed = Signal()
+
+
+class TeeTimesIndQuerySet(models.QuerySet):
+    def update(self, **kwargs):
+        dates = set(self.values_list('gDate', flat=True).distinct())
+        rows = super().update(**kwargs)
+        new_date = kwargs.get('gDate')
+        if not hasattr(new_date, 'resolve_expression'):
+            dates.add(self.model._meta.get_field('gDate').to_python(new_date))
+        dates.discard(None)
+        if rows:
+            tee_times_changed.send(sender=self.model, dates=dates)
+        return rows
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = super().bulk_create(objs, *args, **kwargs)
+        if objs:
+            tee_times_changed.send(sender=self.model, dates={o.gDate for o in objs})
+        return objs
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs = list(objs)
+        rows = super().bulk_update(objs, fields, *args, **kwargs)   # old dates come through update()
+        if rows and 'gDate' in fields:
+            tee_times_changed.send(sender=self.model, dates={o.gDate for o in objs})
+        return rows
+
+
 class TeeTimesInd(models.Model):
     CrewID = models.IntegerField()
     gDate = models.DateField()
     PID = models.ForeignKey('Players', on_delete=models.CASCADE)  # Links to Players table
     CourseID = models.ForeignKey('Courses', on_delete=models.CASCADE)  # Links to Courses table
 
+    objects = TeeTimesIndQuerySet.as_manager()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_gDate = instance.__dict__.get('gDate')   # a save that moves the date clears both
+        return instance
+
     class Meta:
         db_table = "TeeTimesInd"
+        indexes = [
+            models.Index(fields=["gDate", "CourseID"]),   # tee sheet / foursome for a date & slot
+            models.Index(fields=["PID", "gDate"]),        # a player's schedule and availability
+        ]
 
 
 class Players(models.Model):
@@ -86,6 +131,10 @@ class SubSwap(models.Model):
 
     class Meta:
         db_table = "SubSwap"
+        indexes = [
+            models.Index(fields=["SwapID", "SubType", "nStatus"]),        # rows of one swap/sub by stage
+            models.Index(fields=["PID", "nType", "SubType", "nStatus"]),  # a player's open offers/counters
+        ]
 
 
 class Log(models.Model):
@@ -102,6 +151,7 @@ class Log(models.Model):
 
     class Meta:
         db_table = "Log"
+        indexes = [models.Index(fields=["RefID"])]   # log lines for a swap id
 
 
 class LoginActivity(models.Model):
@@ -188,6 +238,13 @@ class ScorecardMeta(models.Model):
 
     class Meta:
         db_table = "ScorecardMeta"
+        indexes = [
+            models.Index(fields=["GameID", "GroupID"]),   # a group's players on scorecard/hole pages
+            models.Index(fields=["PlayDate"]),            # season windows (Best Rounds)
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=["GameID", "PID"], name="uniq_scorecardmeta_game_pid"),
+        ]
 
 
 class Scorecard(models.Model):
@@ -203,6 +260,10 @@ class Scorecard(models.Model):
 
     class Meta:
         db_table = "Scorecard"
+        indexes = [models.Index(fields=["GameID", "HoleID", "smID"])]   # a hole's scores in one game
+        constraints = [
+            models.UniqueConstraint(fields=["smID", "HoleID"], name="uniq_scorecard_meta_hole"),
+        ]
 
 
 ### Games Tables
@@ -252,6 +313,7 @@ class Games(models.Model):
 
     class Meta:
         db_table = "Games"
+        indexes = [models.Index(fields=["AssocGame", "Type"])]   # sibling game of a type for an anchor
 
     @property
     def is_skins_complete(self):
@@ -318,6 +380,7 @@ class Skins(models.Model):
     class Meta:
         db_table = "Skins"
         unique_together = ('GameID', 'PlayerID', 'HoleNumber')  # Prevent duplicate entries
+        indexes = [models.Index(fields=["SkinDate"])]   # season windows (Best Rounds)
 
 
 class Forty(models.Model):
@@ -336,6 +399,7 @@ class Forty(models.Model):
 
     class Meta:
         db_table = "Forty"
+        indexes = [models.Index(fields=["GameID", "GroupID"])]   # a group's picks / scores used
 
 
 class FortyGroupRule(models.Model):
@@ -473,4 +537,83 @@ class GameToggles(models.Model):
         return f"GameToggles(gascup_enabled={self.gascup_enabled})"
     
     class Meta:
-        db_table = "GameToggles" 
\ No newline at end of file
+        db_table = "GameToggles" 
+
+class LiveVersion(models.Model):
+    """
+    Change counter for a round's live views (leaderboard, scorecards).
+    One row per anchor game; Version goes up after every committed change
+    and keys the cached snapshots / ETags in GRPR/services/live.py.
+    """
+    Game      = models.OneToOneField(Games, on_delete=models.CASCADE, related_name='live_version')
+    Version   = models.PositiveBigIntegerField(default=0)
+    AlterDate = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "LiveVersion"
+
+class StatsCube(models.Model):
+    """
+    Precomputed season statistics (heatmap counts, partner matrix, Top-10
+    rankings), one row per (Kind, Key, Window). Written by the
+    refresh_stats_cube command; Sources holds the fingerprints of the tables
+    each row was built from so unchanged rows are skipped on the next run.
+    """
+    Kind      = models.CharField(max_length=32)
+    Key       = models.CharField(max_length=32, blank=True, default='')
+    Window    = models.CharField(max_length=48)   # "<Season.Name>:<start>..<end>"
+    Data      = models.JSONField(encoder=DjangoJSONEncoder)
+    Sources   = models.JSONField(default=dict)
+    BuiltAt   = models.DateTimeField()
+    CheckedAt = models.DateTimeField()
+
+    class Meta:
+        db_table = "StatsCube"
+        constraints = [
+            models.UniqueConstraint(fields=['Kind', 'Key', 'Window'], name='uniq_statscube_kind_key_window'),
+        ]
+
+class Season(models.Model):
+    """
+    One golf season. StartDate..EndDate bounds the tee-sheet, schedule and
+    statistics queries; PlayStart..PlayEnd is the Best Rounds window.
+    A Frozen season's precomputed stats (StatsCube) are final and never
+    refreshed.
+    """
+    Name      = models.CharField(max_length=16, unique=True)
+    StartDate = models.DateField()
+    EndDate   = models.DateField()
+    PlayStart = models.DateField()
+    PlayEnd   = models.DateField()
+    Frozen    = models.BooleanField(default=False)
+
+    class Meta:
+        db_table = "Season"
+        ordering = ["StartDate"]
+
+    def __str__(self):
+        return self.Name
+
+class Outbox(models.Model):
+    """
+    Outbound text / e-mail waiting for the drain_outbox worker. Views add
+    rows in the same transaction as the SubSwap rows they announce; the
+    worker delivers them, retries failures with backoff and writes the Log
+    row described by LogRow once a message is accepted by the provider.
+    """
+    CreateDate  = models.DateTimeField(auto_now_add=True)
+    Channel     = models.CharField(max_length=8, default='sms')        # sms | email
+    To          = models.CharField(max_length=256)
+    Subject     = models.CharField(max_length=256, blank=True, default='')
+    Body        = models.TextField()
+    Status      = models.CharField(max_length=16, default='Pending')   # Pending | Sending | Sent | Failed
+    Attempts    = models.PositiveSmallIntegerField(default=0)
+    NextAttempt = models.DateTimeField()
+    LastError   = models.TextField(blank=True, default='')
+    SentDate    = models.DateTimeField(null=True, blank=True)
+    MessageID   = models.CharField(max_length=256, blank=True, default='')
+    LogRow      = models.JSONField(default=dict, blank=True, encoder=DjangoJSONEncoder)   # Log fields; {} = no Log row
+
+    class Meta:
+        db_table = "Outbox"
+        indexes = [models.Index(fields=["Status", "NextAttempt"])]   # the worker's claim query
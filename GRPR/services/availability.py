@@ -0,0 +1,122 @@
+# GRPR/services/availability.py
+"""
+Member availability matrix for sub and swap candidate selection.
+
+Who can sub on a date, which dates two players can trade, and whether a
+player is still free when an offer is accepted all come down to one
+question: for player × date, is the player playing, requested off (Xdates)
+or free? The matrix answers it for every member and every date from one
+query over TeeTimesInd and Xdates (plus one for the members themselves), so
+candidate lists are set operations instead of per-player queries.
+
+Usage
+-----
+    matrix = availability.load(start=today)                 # members × dates from today
+    matrix.free_on(gDate)                                   # [Players] who could sub
+    matrix.swap_dates(offerer_id, candidate.id, after=today)   # [(date, tt_id)] they could trade
+
+    matrix = availability.load(start=today, include=[offerer_id])   # offerer may be a non-member
+
+    matrix = availability.load(player_ids=[a, b], dates=[d1, d2])
+    matrix.is_playing(a, d1)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from django.db.models import CharField, F, IntegerField, Q, Value
+
+from GRPR.models import Players, TeeTimesInd, Xdates
+
+PLAYING = "playing"
+OFF = "off"
+FREE = "free"
+
+
+@dataclass
+class Matrix:
+    players: Dict[int, Players] = field(default_factory=dict)   # members, in id order
+    playing: Dict[int, Dict[date, int]] = field(default_factory=dict)   # pid -> {gDate: TeeTimesInd id}
+    off: Dict[int, Set[date]] = field(default_factory=dict)             # pid -> requested-off dates
+
+    def status(self, pid: int, d: date) -> str:
+        if d in self.playing.get(pid, {}):
+            return PLAYING
+        if d in self.off.get(pid, ()):
+            return OFF
+        return FREE
+
+    def is_playing(self, pid: int, d: date) -> bool:
+        return self.status(pid, d) == PLAYING
+
+    def free_on(self, d: date, *, exclude: Iterable[int] = ()) -> List[Players]:
+        """Members neither playing nor requested off on `d`."""
+        skip = set(exclude)
+        return [p for pid, p in self.players.items() if pid not in skip and self.status(pid, d) == FREE]
+
+    def swap_dates(self, offerer_id: int, candidate_id: int, *, after: date) -> List[Tuple[date, int]]:
+        """
+        (date, tee time id) of the candidate's rounds after `after` that the
+        offerer could take: dates the offerer is free on. Oldest first.
+        """
+        return sorted(
+            (d, tt_id) for d, tt_id in self.playing.get(candidate_id, {}).items()
+            if d > after and self.status(offerer_id, d) == FREE
+        )
+
+
+def load(
+    *,
+    start: Optional[date] = None,
+    dates: Optional[Iterable[date]] = None,
+    player_ids: Optional[Iterable[int]] = None,
+    include: Iterable[int] = (),
+    members: bool = True,
+) -> Matrix:
+    """
+    Availability from `start` on and/or on `dates`, for `player_ids` or (by
+    default) every member. `include` adds the statuses of players who may
+    not be members (the one making an offer) without making them candidates.
+    `members=False` skips loading the Players rows when only statuses are
+    needed.
+    """
+    tee_times = TeeTimesInd.objects.all()
+    xdates = Xdates.objects.all()
+    if start is not None:
+        tee_times = tee_times.filter(gDate__gte=start)
+        xdates = xdates.filter(xDate__gte=start)
+    if dates is not None:
+        dates = list(dates)
+        tee_times = tee_times.filter(gDate__in=dates)
+        xdates = xdates.filter(xDate__in=dates)
+    people = Players.objects.filter(Member=1) if player_ids is None else Players.objects.filter(id__in=list(player_ids))
+    if player_ids is not None:
+        tee_times = tee_times.filter(PID_id__in=list(player_ids))
+        xdates = xdates.filter(PID_id__in=list(player_ids))
+    else:
+        include = list(include)
+        tee_times = tee_times.filter(Q(PID__Member=1) | Q(PID_id__in=include))
+        xdates = xdates.filter(Q(PID__Member=1) | Q(PID_id__in=include))
+
+    matrix = Matrix()
+    if members:
+        matrix.players = {p.id: p for p in people.order_by("id")}
+
+    rows = (
+        tee_times.annotate(kind=Value(PLAYING, CharField()), tt_id=F("id"))
+        .values_list("PID_id", "gDate", "tt_id", "kind")
+        .union(
+            xdates.annotate(kind=Value(OFF, CharField()), tt_id=Value(None, IntegerField()))
+            .values_list("PID_id", "xDate", "tt_id", "kind"),
+            all=True,
+        )
+    )
+    for pid, d, tt_id, kind in rows:
+        if kind == PLAYING:
+            matrix.playing.setdefault(pid, {})[d] = tt_id
+        else:
+            matrix.off.setdefault(pid, set()).add(d)
+    return matrix
@@ -7,24 +7,33 @@ rows already written to Scorecard for the *Skins* game.
 
 Usage
 -----
-Call `gascup.update_for_score(score_id)` immediately after saving or updating
-a Scorecard row. Safe to call unconditionally: if no Gas Cup is linked to the
-Skins game (Games.AssocGame), the function returns immediately.
+Call `gascup.update_for_scores(score_ids)` once after a batch of Scorecard
+rows has been saved (`update_for_score(score_id)` for a single row). Safe to
+call unconditionally: if no Gas Cup is linked to the Skins game
+(Games.AssocGame), the function returns after one lookup.
 
 Idempotent
 ----------
-Whenever called, we recompute the *entire match* (both teams) result for the
-specific hole that changed, and update/overwrite the corresponding
-GasCupScore rows (Pair, Hole).
+Whenever called, we recompute the *entire match* (both teams) result for
+every (pair, hole) touched by the batch with one aggregate query, and
+upsert the corresponding GasCupScore rows (Pair, Hole) in bulk.
+
+Match map cache
+---------------
+The {timeslot: {team: pair}} map for a Skins game is cached (shared cache,
+see settings.CACHES) and dropped whenever a GasCupPair or GameInvites row
+for that game is saved or deleted.
 """
 
 from __future__ import annotations
 
 from typing import Dict, Optional, Tuple, Iterable
 
+from django.core.cache import cache
 from django.db import transaction
-from django.db.models import Q, Max, Sum, Value, IntegerField
+from django.db.models import Q, Max, Min, Sum, Value, IntegerField, Case, When
 from django.db.models.functions import Coalesce
+from django.db.models.signals import post_save, post_delete
 from django.utils import timezone
 
 from decimal import Decimal
@@ -40,97 +49,101 @@ from GRPR.models import (
 )
 
 
+MATCH_MAP_TTL = 60 * 60 * 12   # a round's pairings; invalidated on change anyway
+
+
 def update_for_score(score_id: int) -> None:
     """
     Update Gas Cup derived scoring for the hole touched by Scorecard pk=score_id.
+    """
+    update_for_scores([score_id])
 
-    Steps:
-      1. Load Scorecard row (Skins game).
-      2. Find Gas Cup game linked via Games.AssocGame.
-      3. Determine the foursome (timeslot) for the player whose score changed.
-      4. For BOTH teams in that foursome, compute their best-ball net for this hole.
-      5. Upsert (Pair, Hole) rows in GasCupScore.
 
-    Silently returns if any prerequisite is missing (no Gas Cup, missing invites, etc.).
+def update_for_scores(score_ids: Iterable[int]) -> None:
     """
-    try:
-        # Follow smID->PID and HoleID in one DB hit
-        sc = (
-            Scorecard.objects
-            .select_related("GameID", "HoleID", "smID__PID")
-            .get(pk=score_id)
-        )
-    except Scorecard.DoesNotExist:
-        return
+    Update Gas Cup derived scoring for every hole touched by a batch of
+    Scorecard rows (normally one foursome's post).
 
-    skins_game = sc.GameID  # Games instance (Type='Skins')
-    gas_game = _get_gascup_game_for_skins(skins_game.id)
-    if not gas_game:
-        return  # no Gas Cup tied to this Skins game
-
-    hole = sc.HoleID  # CourseHoles instance
-    player_pid = sc.smID.PID_id
+    Steps:
+      1. Load (Skins game, hole, player) for the batch              (1 query)
+      2. Find the Gas Cup game linked via Games.AssocGame            (1 query per Skins game)
+      3. Map each player to a match via the cached match map        (cache hit)
+      4. Best-ball net for every affected (pair, hole) in one
+         GROUP BY over Scorecard                                     (1 query)
+      5. Upsert GasCupScore on (Pair, Hole) in bulk                  (1 query)
 
-    # Build match map once
-    match_map = _pairs_by_timeslot(gas_game, skins_game.id)
-    if not match_map:
-        return
+    Silently returns if any prerequisite is missing (no Gas Cup, missing invites, etc.).
+    """
+    rows = (
+        Scorecard.objects
+        .filter(id__in=list(score_ids))
+        .values_list("GameID_id", "HoleID_id", "smID__PID_id")
+    )
+    touched_by_game: Dict[int, set] = {}
+    for skins_game_id, hole_id, pid in rows:
+        if skins_game_id and hole_id:
+            touched_by_game.setdefault(skins_game_id, set()).add((pid, hole_id))
 
-    # Which timeslot is THIS player in?
-    slot = _timeslot_for_pid_in_skins(player_pid, skins_game.id)
-    if not slot:
-        return
+    for skins_game_id, touched in touched_by_game.items():
+        gas_game = _get_gascup_game_for_skins(skins_game_id)
+        if not gas_game:
+            continue  # no Gas Cup tied to this Skins game
+        _update_matches(gas_game.id, skins_game_id, touched)
 
-    match_pairs = match_map.get(slot)
-    if not match_pairs:
-        return
 
-    # Recompute best-ball for BOTH teams for this hole
-    for pair in match_pairs.values():  # dict{'PGA':pair,'LIV':pair}
-        net = _best_net_for_pair_on_hole(pair, hole, skins_game.id)
-        if net is not None:
-            _upsert_gascupscore(gas_game.id, pair.id, hole.id, net)
-        else:
-            # no posted score yet → remove existing row so downstream “thru” calc is correct
-            GasCupScore.objects.filter(
-                Game_id=gas_game.id,
-                Pair_id=pair.id,
-                Hole_id=hole.id,
-            ).delete()
+def invalidate_match_map(skins_game_id: Optional[int]) -> None:
+    """Drop the cached match map for a Skins (anchor) game."""
+    if skins_game_id:
+        cache.delete(_match_map_key(skins_game_id))
 
 
 # ------------------------------------------------------------------ #
 # Internal helpers                                                   #
 # ------------------------------------------------------------------ #
-def _combined_net_for_pair(anchor_game_id: int, pair: 'GasCupPair') -> int | None:
+def _combined_nets_for_pairs(anchor_game_id: int, pairs: Iterable['GasCupPair']) -> Dict[int, int | None]:
     """
-    Sum ScorecardMeta.NetTotal for the partners in `pair` for the *anchor* game.
-    Fallback to summing posted Scorecard.NetScore if NetTotal is not populated.
+    {pair_id: combined net} for the *anchor* game. Sum ScorecardMeta.NetTotal
+    for the partners; fall back to summing posted Scorecard.NetScore if
+    NetTotal is not populated (works mid-round). Two queries for all pairs.
     """
     from GRPR.models import ScorecardMeta, Scorecard
 
-    pids = [pair.PID1_id] + ([pair.PID2_id] if pair.PID2_id else [])
-    if not pids:
-        return None
+    pairs = list(pairs)
+    pids_by_pair = {
+        p.id: [p.PID1_id] + ([p.PID2_id] if p.PID2_id else [])
+        for p in pairs
+    }
+    all_pids = {pid for pids in pids_by_pair.values() for pid in pids}
+    if not all_pids:
+        return {}
 
-    # primary: sum NetTotal from ScorecardMeta (coalesce nulls to 0)
-    meta_sum = (
+    meta_total: Dict[int, int] = {}
+    for pid, net_total in (
         ScorecardMeta.objects
-        .filter(GameID_id=anchor_game_id, PID_id__in=pids)
-        .aggregate(total=Sum(Coalesce('NetTotal', 0)))
-    )['total']
-
-    if meta_sum and int(meta_sum) > 0:
-        return int(meta_sum)
-
-    # fallback: sum posted NetScore rows from Scorecard (works mid-round)
-    sc_sum = (
-        Scorecard.objects
-        .filter(GameID_id=anchor_game_id, smID__PID_id__in=pids)
-        .aggregate(total=Sum('NetScore'))
-    )['total']
+        .filter(GameID_id=anchor_game_id, PID_id__in=all_pids)
+        .values_list("PID_id", "NetTotal")
+    ):
+        meta_total[pid] = meta_total.get(pid, 0) + int(net_total or 0)
+
+    posted_total = {
+        r["smID__PID_id"]: r["total"]
+        for r in (
+            Scorecard.objects
+            .filter(GameID_id=anchor_game_id, smID__PID_id__in=all_pids)
+            .values("smID__PID_id")
+            .annotate(total=Sum("NetScore"))
+        )
+    }
 
-    return int(sc_sum) if sc_sum is not None else None
+    out: Dict[int, int | None] = {}
+    for pair_id, pids in pids_by_pair.items():
+        meta_sum = sum(meta_total.get(pid, 0) for pid in pids)
+        if meta_sum > 0:
+            out[pair_id] = meta_sum
+            continue
+        posted = [posted_total[pid] for pid in pids if posted_total.get(pid) is not None]
+        out[pair_id] = int(sum(posted)) if posted else None
+    return out
 
 def _team_labels_for_game(game: Games) -> tuple[str, str]:
     """
@@ -164,86 +177,138 @@ def _get_gascup_game_for_skins(skins_game_id: int) -> Optional[Games]:
     )
 
 
-def _timeslot_for_pid_in_skins(pid: int, skins_game_id: int) -> Optional[str]:
-    """
-    Return the tee-time slot string for the given player in the Skins game.
-    """
-    gi = (
-        GameInvites.objects
-        .select_related("TTID__CourseID")
-        .filter(GameID_id=skins_game_id, PID_id=pid)
-        .first()
-    )
-    return gi.TTID.CourseID.courseTimeSlot if gi else None
+def _match_map_key(skins_game_id: int) -> str:
+    return f"gascup:match_map:{int(skins_game_id)}"
 
 
-def _pairs_by_timeslot(gas_game: Games, skins_game_id: int) -> Dict[str, Dict[str, GasCupPair]]:
+def _match_map(gas_game_id: int, skins_game_id: int) -> dict:
     """
-    Build a mapping:
-        { timeslot: { 'PGA': GasCupPair, 'LIV': GasCupPair } }
+    Cached description of every match in the Gas Cup, keyed for the update path:
+
+        {
+          "gas_game_id": 12,
+          "slot_by_pid": {pid: "8:40", ...},                    # paired players only
+          "matches":     {"8:40": {"PGA": (pair_id, (pid1, pid2)), "LIV": (...)}},
+        }
 
     We infer each pair's timeslot from *either* partner's GameInvite
     in the Skins game (both must be same foursome by rule).
     """
-    pairs = GasCupPair.objects.filter(Game=gas_game).select_related("PID1", "PID2")
-    if not pairs:
-        return {}
+    key = _match_map_key(skins_game_id)
+    data = cache.get(key)
+    if data is not None and data.get("gas_game_id") == gas_game_id:
+        return data
 
-    # Preload invites for all PIDs
-    pid_list = []
-    for p in pairs:
-        pid_list.extend([p.PID1_id, p.PID2_id])
+    pairs = list(
+        GasCupPair.objects
+        .filter(Game_id=gas_game_id)
+        .values_list("id", "Team", "PID1_id", "PID2_id")
+    )
+    pid_list = [pid for _, _, p1, p2 in pairs for pid in (p1, p2) if pid]
 
     invites = (
         GameInvites.objects
         .filter(GameID_id=skins_game_id, PID_id__in=pid_list)
-        .select_related("TTID__CourseID")
+        .values_list("PID_id", "TTID__CourseID__courseTimeSlot")
     )
-    slot_by_pid = {gi.PID_id: gi.TTID.CourseID.courseTimeSlot for gi in invites}
+    invite_slot = dict(invites)
 
-    out: Dict[str, Dict[str, GasCupPair]] = {}
-    for p in pairs:
-        slot = slot_by_pid.get(p.PID1_id) or slot_by_pid.get(p.PID2_id)
+    slot_by_pid: Dict[int, str] = {}
+    matches: Dict[str, Dict[str, tuple]] = {}
+    for pair_id, team, p1, p2 in pairs:
+        slot = invite_slot.get(p1) or invite_slot.get(p2)
         if not slot:
             continue
-        out.setdefault(slot, {})[p.Team] = p
-    return out
+        pids = (p1, p2) if p2 else (p1,)
+        matches.setdefault(slot, {})[team] = (pair_id, pids)
+        for pid in pids:
+            slot_by_pid[pid] = slot
+
+    data = {"gas_game_id": gas_game_id, "slot_by_pid": slot_by_pid, "matches": matches}
+    cache.set(key, data, MATCH_MAP_TTL)
+    return data
 
 
-def _best_net_for_pair_on_hole(pair: GasCupPair, hole: CourseHoles, skins_game_id: int) -> Optional[int]:
+def _update_matches(gas_game_id: int, skins_game_id: int, touched: set) -> None:
     """
-    Return the LOWER of the two partners' NetScore on this hole,
-    or None if neither has posted.
+    Recompute best-ball nets for both sides of every match touched by
+    `touched` = {(pid, hole_id), ...} and write them to GasCupScore.
     """
+    mm = _match_map(gas_game_id, skins_game_id)
 
-    pid_list = [pair.PID1_id]
-    if pair.PID2_id:                        # singleton team support
-        pid_list.append(pair.PID2_id)
+    pids_by_pair: Dict[int, tuple] = {}
+    affected = set()  # (pair_id, hole_id)
+    for pid, hole_id in touched:
+        slot = mm["slot_by_pid"].get(pid)
+        if not slot:
+            continue
+        for pair_id, pids in mm["matches"].get(slot, {}).values():
+            pids_by_pair[pair_id] = pids
+            affected.add((pair_id, hole_id))
+    if not affected:
+        return
 
-    nets = (
-        Scorecard.objects
-        .filter(GameID_id=skins_game_id,
-                smID__PID_id__in=pid_list,
-                HoleID_id=hole.id,)
-        .values_list("NetScore", flat=True)
+    hole_ids = {h for _, h in affected}
+    pair_of = Case(
+        *[When(smID__PID_id__in=pids, then=Value(pair_id)) for pair_id, pids in pids_by_pair.items()],
+        output_field=IntegerField(),
     )
+    best = {
+        (r["pair_id"], r["HoleID_id"]): r["best"]
+        for r in (
+            Scorecard.objects
+            .filter(
+                GameID_id=skins_game_id,
+                HoleID_id__in=hole_ids,
+                smID__PID_id__in=[pid for pids in pids_by_pair.values() for pid in pids],
+            )
+            .annotate(pair_id=pair_of)
+            .values("pair_id", "HoleID_id")
+            .annotate(best=Min("NetScore"))
+        )
+    }
 
-    nets = [n for n in nets if n is not None]
-    return min(nets) if nets else None
+    upserts = [
+        GasCupScore(Game_id=gas_game_id, Pair_id=pair_id, Hole_id=hole_id, NetScore=best[(pair_id, hole_id)])
+        for pair_id, hole_id in affected
+        if best.get((pair_id, hole_id)) is not None
+    ]
+    missing = [(pair_id, hole_id) for pair_id, hole_id in affected if best.get((pair_id, hole_id)) is None]
+
+    with transaction.atomic():
+        if upserts:
+            GasCupScore.objects.bulk_create(
+                upserts,
+                update_conflicts=True,
+                unique_fields=["Pair", "Hole"],
+                update_fields=["Game", "NetScore"],
+            )
+        if missing:
+            # no posted score yet → remove existing row so downstream “thru” calc is correct
+            q = Q()
+            for pair_id, hole_id in missing:
+                q |= Q(Pair_id=pair_id, Hole_id=hole_id)
+            GasCupScore.objects.filter(q, Game_id=gas_game_id).delete()
 
 
-def _upsert_gascupscore(game_id: int, pair_id: int, hole_id: int, net: int) -> None:
-    """
-    Insert or update the GasCupScore for this (game, pair, hole).
-    """
-    GasCupScore.objects.update_or_create(
-        Game_id=game_id,
-        Pair_id=pair_id,
-        Hole_id=hole_id,
-        defaults={"NetScore": net},
+def _invalidate_on_pair_change(sender, instance, **kwargs):
+    skins_game_id = (
+        Games.objects
+        .filter(id=instance.Game_id)
+        .values_list("AssocGame", flat=True)
+        .first()
     )
+    invalidate_match_map(skins_game_id)
+
+
+def _invalidate_on_invite_change(sender, instance, **kwargs):
+    invalidate_match_map(instance.GameID_id)
 
 
+for _signal in (post_save, post_delete):
+    _signal.connect(_invalidate_on_pair_change, sender=GasCupPair, dispatch_uid=f"gascup_pair_{_signal is post_save}")
+    _signal.connect(_invalidate_on_invite_change, sender=GameInvites, dispatch_uid=f"gascup_invite_{_signal is post_save}")
+
 
 # ------------------------------------------------------------------ #
 # Match status helpers (Front / Back / Overall)                      #
@@ -363,10 +428,17 @@ def status_for_pids(skins_game_id: int,
         n0 = d.get(lbl0); n1 = d.get(lbl1)
         if n0 is None or n1 is None:
             continue
+        front = hn <= 9
         if n0 < n1:
-            (f0 if hn <= 9 else b0).__iadd__(1)
+            if front:
+                f0 += 1
+            else:
+                b0 += 1
         elif n1 < n0:
-            (f1 if hn <= 9 else b1).__iadd__(1)
+            if front:
+                f1 += 1
+            else:
+                b1 += 1
 
     front_txt   = _segment_txt(f0, f1, lbl0, lbl1)
     back_txt    = _segment_txt(b0, b1, lbl0, lbl1)
@@ -540,33 +612,29 @@ def _segment_delta(scores_by_hole: dict[int, Tuple[int, int]], holes: set[int])
     return pga_wins - liv_wins
 
 
-def _scores_for_match(gas_game_id: int, pga_pair_id: int, liv_pair_id: int) -> dict[int, Tuple[Optional[int], Optional[int]]]:
-    """
-    Build {hole_number: (pga_net, liv_net)} for the given two pairs in
-    a single Gas Cup match (one foursome).
-
-    We pull GasCupScore rows for both pairs and merge.
-    """
+def _scores_by_pair(gas_game_id: int) -> dict[int, dict[int, int]]:
+    """{pair_id: {hole_number: net}} for every pair in the game, one query."""
     from GRPR.models import GasCupScore  # local import to avoid cycles
 
-    # fetch all rows for both pairs
-    rows = (
+    out: dict[int, dict[int, int]] = {}
+    for pair_id, hn, net in (
         GasCupScore.objects
-        .filter(Game_id=gas_game_id, Pair_id__in=[pga_pair_id, liv_pair_id])
-        .select_related("Hole")
-        .values("Hole__HoleNumber", "Pair_id", "NetScore")
-    )
-    out: dict[int, list[Tuple[int, int]]] = {}
-    for r in rows:
-        hn = r["Hole__HoleNumber"]
-        out.setdefault(hn, [None, None])  # [pga_net, liv_net]
-        if r["Pair_id"] == pga_pair_id:
-            out[hn][0] = r["NetScore"]
-        else:
-            out[hn][1] = r["NetScore"]
+        .filter(Game_id=gas_game_id)
+        .values_list("Pair_id", "Hole__HoleNumber", "NetScore")
+    ):
+        out.setdefault(pair_id, {})[hn] = net
+    return out
 
-    # collapse to mapping with tuples
-    return {hn: tuple(vals) for hn, vals in out.items()}
+
+def _scores_for_match(scores_by_pair: dict[int, dict[int, int]],
+                      pga_pair_id: int, liv_pair_id: int) -> dict[int, Tuple[Optional[int], Optional[int]]]:
+    """
+    Build {hole_number: (pga_net, liv_net)} for the given two pairs in
+    a single Gas Cup match (one foursome), from `_scores_by_pair` output.
+    """
+    pga = scores_by_pair.get(pga_pair_id, {})
+    liv = scores_by_pair.get(liv_pair_id, {})
+    return {hn: (pga.get(hn), liv.get(hn)) for hn in set(pga) | set(liv)}
 
 
 def summary_for_game(gas_game_id: int):
@@ -614,6 +682,11 @@ def summary_for_game(gas_game_id: int):
     overrides_qs = GasCupOverride.objects.filter(Game_id=gas_game_id)
     overrides    = {ov.Slot: ov for ov in overrides_qs}
 
+    # every pair's hole nets in one read (and combined nets for Fall Classic)
+    scores_by_pair = _scores_by_pair(gas_game_id)
+    is_fallclassic = getattr(team_game, "Type", "") == "FallClassic"
+    combined_nets = _combined_nets_for_pairs(anchor_game_id, pairs) if is_fallclassic else {}
+
     pga_total_pts = Decimal("0")
     liv_total_pts = Decimal("0")
     rows_out = []
@@ -644,7 +717,7 @@ def summary_for_game(gas_game_id: int):
             # If DB 'Team' values are "Cubs"/"Sox" only, above still works via team0/team1 fallback
             continue
 
-        scores_by_hole = _scores_for_match(gas_game_id, pga_pair.id, liv_pair.id)
+        scores_by_hole = _scores_for_match(scores_by_pair, pga_pair.id, liv_pair.id)
         thru = max(scores_by_hole.keys()) if scores_by_hole else 0
 
         front_delta   = _segment_delta(scores_by_hole, FRONT_HOLES)
@@ -677,9 +750,9 @@ def summary_for_game(gas_game_id: int):
         }
 
         # Only for Fall Classic: add combined team nets using the *anchor* game id
-        if getattr(team_game, "Type", "") == "FallClassic":
-            pga_net = _combined_net_for_pair(anchor_game_id, pga_pair)
-            liv_net = _combined_net_for_pair(anchor_game_id, liv_pair)
+        if is_fallclassic:
+            pga_net = combined_nets.get(pga_pair.id)
+            liv_net = combined_nets.get(liv_pair.id)
             if pga_net is not None and liv_net is not None:
                 row["combined"] = f"{team0} {pga_net} \u2013 {liv_net} {team1}"
 
@@ -0,0 +1,236 @@
+# GRPR/services/leaderboard.py
+"""
+Game-day leaderboard builder.
+
+`build(game_id)` assembles everything skins_leaderboard.html shows for one
+game (Skins table, Forty groups, Gas Cup / Fall Classic matches, Stableford
+teams) from grouped aggregates, so the query count does not grow with the
+number of players or groups:
+
+  1. Games          – the game itself (Type, AssocGame, Status, PlayDate)
+  2. Games          – every sibling tied to the anchor, in one lookup
+  3. ScorecardMeta  – players, handicaps, tee names, skins, GroupID
+  4. Skins          – won holes (+ payout) for the whole field
+  5. Scorecard      – thru hole / hole count per player
+  6. Forty          – per-group used / par / net, plus FortyGroupRule
+  7. team game and Stableford summaries (fixed counts, see gascup.py)
+
+Per-user bits (which group is "My Scorecard") are left to the view.
+Returns None if the game does not exist.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Optional
+
+from django.db.models import Count, Max, OuterRef, Subquery, Sum
+
+from GRPR.models import (
+    Forty, FortyGroupRule, Games, Scorecard, ScorecardMeta, Skins, StblScore, StblTeam,
+)
+from GRPR.services import gascup
+
+
+def build(game_id: int) -> Optional[dict]:
+    game_id = int(game_id)
+    game = (
+        Games.objects
+        .filter(id=game_id)
+        .values('Type', 'AssocGame', 'Status', 'PlayDate')
+        .first()
+    )
+    if not game:
+        return None
+
+    # Forty / Skins / Stableford ids hang off this game's AssocGame; the team
+    # game and Stableford board hang off the anchor (Skins if present).
+    assoc_id = game['AssocGame']
+    anchor_id = game_id
+    if game['Type'] != 'Skins' and game['AssocGame']:
+        anchor_id = int(game['AssocGame'])
+
+    siblings = _siblings(assoc_id, anchor_id)
+    forty_game = _first(siblings, assoc_id, 'Forty')
+    skins_game = _first(siblings, assoc_id, 'Skins')
+    team_game = _first(siblings, anchor_id, 'GasCup', 'FallClassic', newest=True)
+    stbl_game = _first(siblings, anchor_id, 'Stableford')
+
+    forty_game_id = forty_game['id'] if forty_game else None
+    stableford_game_id = stbl_game['id'] if stbl_game else None
+
+    # =================== Team game (Gas Cup / Fall Classic) ===================
+    variant = team_game['Type'] if team_game else None
+    team_labels = ("USA", "EU") if variant == "FallClassic" else ("PGA", "LIV")
+    gas_matches, gas_totals, gas_rosters = [], None, None
+    if team_game:
+        gas_matches, gas_totals = gascup.summary_for_game(team_game['id'])
+        gas_rosters = gascup.rosters_for_game(team_game['id'])
+
+    # =================== Skins ===================
+    metas = list(
+        ScorecardMeta.objects
+        .filter(GameID_id=game_id)
+        .values(
+            'PID_id', 'PID__FirstName', 'PID__LastName', 'TeeID__TeeName',
+            'Index', 'RawHDCP', 'NetHDCP', 'Skins', 'GroupID',
+        )
+    )
+
+    won_holes: Dict[int, list] = {}
+    payout = None
+    first_skin = True
+    for pid, hn, pay in (
+        Skins.objects
+        .filter(GameID_id=game_id)
+        .order_by('id')
+        .values_list('PlayerID_id', 'HoleNumber__HoleNumber', 'Payout')
+    ):
+        if first_skin:
+            payout, first_skin = pay, False
+        won_holes.setdefault(pid, []).append(hn)
+
+    progress = {
+        r['smID__PID_id']: r
+        for r in (
+            Scorecard.objects
+            .filter(GameID_id=game_id)
+            .values('smID__PID_id')
+            .annotate(hole_count=Count('id'), max_hole=Max('HoleID__HoleNumber'))
+        )
+    }
+
+    leaderboard = []
+    for m in metas:
+        pid = m['PID_id']
+        leaderboard.append({
+            'pid': pid,
+            'first_name': m['PID__FirstName'],
+            'last_name': m['PID__LastName'],
+            'index': m['Index'],
+            'raw_hdcp': m['RawHDCP'],
+            'net_hdcp': m['NetHDCP'],
+            'tee_name': m['TeeID__TeeName'],
+            'current_hole': (progress.get(pid) or {}).get('max_hole') or 0,
+            'skins': m['Skins'] or 0,
+            'won_holes': sorted(won_holes.get(pid, [])),
+        })
+
+    # All players have completed their rounds
+    scorecard_complete = bool(progress) and all(
+        r['hole_count'] == 18 and r['max_hole'] == 18 for r in progress.values()
+    )
+
+    return {
+        'game_id': game_id,
+        'game_status': game['Status'],
+        'play_date': game['PlayDate'],
+        'leaderboard': leaderboard,
+        'scorecard_complete': scorecard_complete,
+        'payout': payout,
+        'group_ids': sorted({m['GroupID'] for m in metas if m['GroupID'] is not None}),
+        'group_by_pid': {m['PID_id']: m['GroupID'] for m in metas},
+        'forty_game_id': forty_game_id,
+        'forty_leaderboard': _forty_board(forty_game) if forty_game else [],
+        'skins_game_id': skins_game['id'] if skins_game else None,
+        'variant': variant,
+        'team_labels': team_labels,
+        'is_fallclassic': variant == "FallClassic",
+        'gas_matches': gas_matches,
+        'gas_totals': gas_totals,
+        'gas_rosters': gas_rosters,
+        'stableford_game_id': stableford_game_id,
+        'stableford_board': _stableford_board(stableford_game_id) if stableford_game_id else [],
+    }
+
+
+# ------------------------------------------------------------------ #
+# Internal helpers                                                   #
+# ------------------------------------------------------------------ #
+def _siblings(*assoc_ids) -> list[dict]:
+    ids = {a for a in assoc_ids if a}
+    if not ids:
+        return []
+    return list(
+        Games.objects
+        .filter(AssocGame__in=ids)
+        .order_by('id')
+        .values('id', 'Type', 'AssocGame', 'NumScores')
+    )
+
+
+def _first(siblings: Iterable[dict], assoc_id, *types: str, newest: bool = False) -> Optional[dict]:
+    hits = [g for g in siblings if assoc_id and g['AssocGame'] == int(assoc_id) and g['Type'] in types]
+    if not hits:
+        return None
+    return hits[-1] if newest else hits[0]
+
+
+def _forty_board(forty_game: dict) -> list[dict]:
+    """One row per Forty group: scores used, still needed, and over/under par."""
+    forty_game_id = forty_game['id']
+    per_group = list(
+        Forty.objects
+        .filter(GameID_id=forty_game_id)
+        .values('GroupID')
+        .annotate(used=Count('id'), par=Sum('Par'), net=Sum('NetScore'))
+        .order_by('GroupID')
+    )
+    rules = {
+        r['GroupID']: r['NumScores']
+        for r in FortyGroupRule.objects.filter(Game_id=forty_game_id).values('GroupID', 'NumScores')
+    }
+    default_num = forty_game.get('NumScores') or 40
+
+    board = []
+    for r in per_group:
+        num_scores = rules.get(str(r['GroupID']), default_num)
+        board.append({
+            'group_id': r['GroupID'],
+            'scores_used': r['used'],
+            'scores_needed': num_scores - r['used'],
+            'over_under': (r['net'] or 0) - (r['par'] or 0),
+        })
+    return board
+
+
+def _stableford_board(stableford_game_id: int) -> list[dict]:
+    """Points and thru per Stableford team, best first."""
+    # Subqueries: map each StblScore row's PID -> TeamID and TeamName
+    team_id_for_pid = (
+        StblTeam.objects
+        .filter(Game_id=stableford_game_id, PID_id=OuterRef("PID_id"))
+        .values("TeamID")[:1]
+    )
+    team_name_for_pid = (
+        StblTeam.objects
+        .filter(Game_id=stableford_game_id, PID_id=OuterRef("PID_id"))
+        .values("TeamName")[:1]
+    )
+
+    per_team = (
+        StblScore.objects
+        .filter(Game_id=stableford_game_id)
+        .annotate(
+            team_id=Subquery(team_id_for_pid),
+            team_name=Subquery(team_name_for_pid),
+        )
+        .values("team_id", "team_name")
+        .annotate(
+            points=Sum("Points"),
+            thru=Max("Hole_id__HoleNumber"),
+        )
+        .order_by("-points", "team_id")
+    )
+
+    board = []
+    for row in per_team:
+        tid = row["team_id"]
+        if tid is None:
+            continue  # orphan score without a team assignment
+        board.append({
+            "team_id": tid,
+            "team_name": row["team_name"] or f"Team {tid}",
+            "thru": row["thru"] or 0,
+            "points": row["points"] or 0,
+        })
+    return board
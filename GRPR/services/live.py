@@ -0,0 +1,227 @@
+# GRPR/services/live.py
+"""
+Live-round snapshots and change versions.
+
+During a round the whole field keeps polling the leaderboard and the
+scorecards. Instead of recomputing on every hit, each anchor game (the
+Skins/Forty game every sibling points at through Games.AssocGame) carries a
+monotonically increasing version in LiveVersion:
+
+  * writers call `touch(game_id)`; after the surrounding transaction commits
+    the anchor's version goes up once (many touches in one transaction
+    collapse into a single bump)
+  * the scoring path passes rebuild=True so the leaderboard snapshot for the
+    new version is built right after the commit, not by the next poller
+  * readers get the version with one query, serve `snapshot(...)` from the
+    shared cache, and answer If-None-Match with 304 via `etag(...)`
+
+Usage
+-----
+    ver = live.version(game_id)
+    tag = live.etag("lb", game_id, ver, request.user.pk)
+    board = live.board(game_id, ver)
+
+Live feed
+---------
+`wait_for_version(game_id, since, timeout)` long-polls the LiveVersion row
+(no extra infrastructure: the table is the notification channel, so it works
+across gunicorn workers and dynos). `changes_since(game_id, since, ver)` then
+diffs the compact feed state of the two board snapshots: skins won, thru
+hole per player, Gas Cup rows/totals, Stableford and Forty rows. If the old
+snapshot has aged out the full state is sent instead.
+
+Model saves/deletes that change what these pages show are hooked below;
+queryset .update() calls must call `touch` themselves.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from typing import Callable, Iterable, Optional
+
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q
+from django.db.models.signals import post_save, post_delete
+from django.utils import timezone
+
+from GRPR.models import (
+    Forty, FortyGroupRule, Games, GasCupOverride, GasCupPair, LiveVersion, Scorecard, ScorecardMeta, StblTeam,
+)
+from GRPR.services import leaderboard, oncommit
+
+SNAPSHOT_TTL = 60 * 60 * 6   # a round; superseded versions simply age out
+
+
+def version(game_id: int) -> int:
+    """Current version for a game's anchor (0 if nothing has been posted)."""
+    return (
+        LiveVersion.objects
+        .filter(
+            Q(Game_id=game_id)
+            | Q(Game_id__in=Games.objects.filter(id=game_id).values('AssocGame'))
+        )
+        .order_by('-Version')
+        .values_list('Version', flat=True)
+        .first()
+    ) or 0
+
+
+def etag(kind: str, game_id, ver: int, *parts) -> str:
+    """Quoted ETag for one view/variant at one version."""
+    raw = ":".join(str(p) for p in (kind, game_id, ver) + parts)
+    return '"%s"' % hashlib.md5(raw.encode()).hexdigest()
+
+
+def snapshot(kind: str, game_id, ver: int, build: Callable[[], object], *parts):
+    """Cached result of `build()` for (kind, game, parts) at this version."""
+    key = _snapshot_key(kind, game_id, ver, *parts)
+    value = cache.get(key)
+    if value is None:
+        value = build()
+        if value is not None:
+            cache.set(key, value, SNAPSHOT_TTL)
+    return value
+
+
+def board(game_id, ver: int) -> Optional[dict]:
+    """Leaderboard snapshot (see leaderboard.build) for this version."""
+    return snapshot("board", game_id, ver, lambda: leaderboard.build(game_id))
+
+
+def touch(game_id: Optional[int], rebuild: bool = False) -> None:
+    """
+    Mark a game's round as changed. The anchor's version is bumped once,
+    after the current transaction commits (immediately in autocommit).
+    """
+    if not game_id:
+        return
+    oncommit.on_commit_once('live.touch', _flush_touched, (int(game_id), rebuild))
+
+
+def wait_for_version(game_id, since: int, timeout: float, step: float = 1.0) -> int:
+    """
+    Current version, waiting up to `timeout` seconds for it to move past
+    `since`. One cheap query per `step`; timeout=0 is a plain poll.
+    """
+    deadline = time.monotonic() + max(timeout, 0)
+    ver = version(game_id)
+    while ver == since and time.monotonic() < deadline:
+        time.sleep(step)
+        ver = version(game_id)
+    return ver
+
+
+def feed_state(board: Optional[dict]) -> dict:
+    """Compact, JSON-ready view of a leaderboard snapshot for the live feed."""
+    if not board:
+        return {}
+    return {
+        'status': {'game_status': board['game_status'], 'complete': board['scorecard_complete']},
+        'skins': {
+            str(r['pid']): {'skins': r['skins'], 'won': r['won_holes']}
+            for r in board['leaderboard']
+        },
+        'thru': {str(r['pid']): {'thru': r['current_hole']} for r in board['leaderboard']},
+        'gas': {
+            str(m['label']): {k: m.get(k) for k in ('front', 'back', 'overall', 'thru', 'total', 'combined')}
+            for m in board['gas_matches'] or []
+        },
+        'gas_totals': board['gas_totals'],
+        'stableford': {
+            str(r['team_id']): {'team_name': r['team_name'], 'thru': r['thru'], 'points': r['points']}
+            for r in board['stableford_board']
+        },
+        'forty': {
+            str(r['group_id']): {k: r[k] for k in ('scores_used', 'scores_needed', 'over_under')}
+            for r in board['forty_leaderboard']
+        },
+    }
+
+
+def changes_since(game_id, since: int, ver: int) -> dict:
+    """
+    {"version", "full", "changes"} between two versions of a game's board.
+    Changed/new keys carry their new value, removed keys map to None.
+    """
+    new = feed_state(board(game_id, ver))
+    old_board = cache.get(_snapshot_key("board", game_id, since)) if since else None
+    if old_board is None:
+        return {'version': ver, 'full': True, 'changes': new}
+
+    old = feed_state(old_board)
+    changes = {}
+    for section, value in new.items():
+        before = old.get(section)
+        if value == before:
+            continue
+        if isinstance(value, dict) and isinstance(before, dict) and section != 'gas_totals':
+            diff = {k: v for k, v in value.items() if before.get(k) != v}
+            diff.update({k: None for k in before if k not in value})
+            changes[section] = diff
+        else:
+            changes[section] = value
+    return {'version': ver, 'full': False, 'changes': changes}
+
+
+# ------------------------------------------------------------------ #
+# Internal helpers                                                   #
+# ------------------------------------------------------------------ #
+def _snapshot_key(kind: str, game_id, ver: int, *parts) -> str:
+    suffix = ":".join(str(p) for p in parts)
+    return f"live:{kind}:{game_id}:{suffix}:v{ver}"
+
+
+def _flush_touched(touched) -> None:
+    """The single after-commit bump for a transaction's (game_id, rebuild) touches."""
+    _flush({gid for gid, _ in touched}, {gid for gid, rebuild in touched if rebuild})
+
+
+def _flush(game_ids: Iterable[int], rebuild: Iterable[int]) -> None:
+    anchor_by_game = {
+        gid: (assoc or gid)
+        for gid, assoc in Games.objects.filter(id__in=set(game_ids)).values_list('id', 'AssocGame')
+    }
+    rebuild_anchors = {anchor_by_game[g] for g in rebuild if g in anchor_by_game}
+    for anchor_id in sorted(set(anchor_by_game.values())):
+        ver = _bump(anchor_id)
+        if anchor_id in rebuild_anchors:
+            built = leaderboard.build(anchor_id)
+            if built is not None:
+                cache.set(_snapshot_key("board", anchor_id, ver), built, SNAPSHOT_TTL)
+
+
+def _bump(anchor_id: int) -> int:
+    now = timezone.now()
+    bumped = LiveVersion.objects.filter(Game_id=anchor_id).update(Version=F('Version') + 1, AlterDate=now)
+    if not bumped:
+        try:
+            with transaction.atomic():
+                LiveVersion.objects.create(Game_id=anchor_id, Version=1)
+        except IntegrityError:
+            # another worker created it first
+            LiveVersion.objects.filter(Game_id=anchor_id).update(Version=F('Version') + 1, AlterDate=now)
+    return LiveVersion.objects.filter(Game_id=anchor_id).values_list('Version', flat=True).first() or 0
+
+
+def _touch_game(sender, instance, **kwargs):
+    touch(instance.AssocGame or instance.id)
+
+
+def _touch_game_fk(sender, instance, **kwargs):
+    touch(instance.GameID_id)
+
+
+def _touch_game_ref(sender, instance, **kwargs):
+    touch(instance.Game_id)
+
+
+post_save.connect(_touch_game, sender=Games, dispatch_uid="live_game_saved")
+post_delete.connect(_touch_game, sender=Games, dispatch_uid="live_game_deleted")
+for _model in (Scorecard, ScorecardMeta, Forty):
+    post_save.connect(_touch_game_fk, sender=_model, dispatch_uid=f"live_{_model.__name__}_saved")
+    post_delete.connect(_touch_game_fk, sender=_model, dispatch_uid=f"live_{_model.__name__}_deleted")
+for _model in (GasCupPair, GasCupOverride, StblTeam, FortyGroupRule):   # rules set the Forty board's scores_needed
+    post_save.connect(_touch_game_ref, sender=_model, dispatch_uid=f"live_{_model.__name__}_saved")
+    post_delete.connect(_touch_game_ref, sender=_model, dispatch_uid=f"live_{_model.__name__}_deleted")
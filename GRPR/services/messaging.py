@@ -0,0 +1,186 @@
+# GRPR/services/messaging.py
+"""
+One way to send texts and e-mails.
+
+Views, the outbox worker and the scheduled commands all send through a
+batch: one Twilio client and one e-mail connection are opened on first use
+and shared by every message in it (and by every thread of the outbox pool).
+
+Transports are picked by settings, so nothing outside this module checks
+TWILIO_ENABLED:
+
+    MESSAGING_SMS    twilio | fake | file | dotted path   (default: twilio
+                     when TWILIO_ENABLED, else fake)
+    MESSAGING_EMAIL  smtp | fake | file | dotted path of a Django e-mail
+                     backend   (default: settings.EMAIL_BACKEND)
+
+`fake` keeps messages in memory (messaging.sent for texts, Django's
+mail.outbox for e-mail) and returns FAKE_MESSAGE_ID, which is what the Log
+table has always recorded when Twilio is off. `file` appends texts as JSON
+lines to MESSAGING_FILE_PATH/sms.jsonl and e-mails to the same directory,
+so fan-out can be replayed and timed offline.
+
+Usage
+-----
+    with messaging.batch() as sender:
+        for p in players:
+            mid = sender.sms(p.Mobile, body)            # message id for the Log row
+        sender.email([p.Email for p in players], subject, body)
+
+    messaging.send_email(subject, body, ["a@x.com"])    # one-off
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import deque
+from typing import Iterable, List, Optional
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+FAKE_MESSAGE_ID = 'fake mID'
+
+# texts "sent" by the fake transport, newest last (bounded for long-running workers)
+sent = deque(maxlen=10000)
+
+
+class SMSTransport:
+    """Base class: open() once per batch, send() from any thread, close() at the end."""
+
+    live = False   # True when messages really leave the building
+
+    def open(self):
+        pass
+
+    def send(self, to: str, body: str) -> str:
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class TwilioSMS(SMSTransport):
+    live = True
+
+    def open(self):
+        from twilio.rest import Client
+        self.client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
+
+    def send(self, to, body):
+        return self.client.messages.create(from_=settings.TWILIO_PHONE_NUMBER, body=body, to=to).sid
+
+
+class FakeSMS(SMSTransport):
+    def send(self, to, body):
+        sent.append({'to': to, 'body': body})
+        return FAKE_MESSAGE_ID
+
+
+class FileSMS(SMSTransport):
+    def open(self):
+        os.makedirs(settings.MESSAGING_FILE_PATH, exist_ok=True)
+        self._file = open(os.path.join(settings.MESSAGING_FILE_PATH, 'sms.jsonl'), 'a')
+        self._lock = threading.Lock()
+
+    def send(self, to, body):
+        with self._lock:
+            self._file.write(json.dumps({'at': timezone.now().isoformat(), 'to': to, 'body': body}) + '\n')
+        return FAKE_MESSAGE_ID
+
+    def close(self):
+        self._file.close()
+
+
+SMS_TRANSPORTS = {
+    'twilio': TwilioSMS,
+    'fake': FakeSMS,
+    'file': FileSMS,
+}
+
+EMAIL_BACKENDS = {
+    'smtp': 'django.core.mail.backends.smtp.EmailBackend',
+    'fake': 'django.core.mail.backends.locmem.EmailBackend',
+    'file': 'django.core.mail.backends.filebased.EmailBackend',
+}
+
+
+class Batch:
+    """
+    Shared connections for a run of messages; use as a context manager.
+    Transports open lazily, so a batch of texts never touches SMTP.
+    """
+
+    def __init__(self, sms: Optional[str] = None, email: Optional[str] = None):
+        self._sms_name = sms or settings.MESSAGING_SMS
+        self._email_name = email or settings.MESSAGING_EMAIL
+        self._sms: Optional[SMSTransport] = None
+        self._email = None
+        self._lock = threading.Lock()
+
+    @property
+    def sms_live(self) -> bool:
+        return _sms_class(self._sms_name).live
+
+    def sms(self, to: str, body: str) -> str:
+        """Send one text; returns the provider's message id."""
+        if self._sms is None:
+            with self._lock:
+                if self._sms is None:
+                    transport = _sms_class(self._sms_name)()
+                    transport.open()
+                    self._sms = transport
+        return self._sms.send(to, body)
+
+    def email(self, recipients: Iterable[str], subject: str, body: str, from_email: Optional[str] = None) -> str:
+        """Send one e-mail to `recipients` (one message, all on To:)."""
+        if self._email is None:
+            with self._lock:
+                if self._email is None:
+                    backend = self._email_name
+                    connection = get_connection(EMAIL_BACKENDS.get(backend, backend), fail_silently=False,
+                                                **({'file_path': settings.MESSAGING_FILE_PATH} if backend == 'file' else {}))
+                    connection.open()
+                    self._email = connection
+        EmailMessage(subject, body, from_email or settings.DEFAULT_FROM_EMAIL, list(recipients),
+                     connection=self._email).send()
+        return 'email'
+
+    def close(self):
+        if self._sms is not None:
+            self._sms.close()
+        if self._email is not None:
+            self._email.close()
+        self._sms = self._email = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def batch(*, sms: Optional[str] = None, email: Optional[str] = None) -> Batch:
+    return Batch(sms=sms, email=email)
+
+
+def send_sms(to: str, body: str) -> str:
+    with batch() as sender:
+        return sender.sms(to, body)
+
+
+def send_email(subject: str, body: str, recipients: List[str], from_email: Optional[str] = None) -> str:
+    with batch() as sender:
+        return sender.email(recipients, subject, body, from_email=from_email)
+
+
+# ------------------------------------------------------------------ #
+# Internal helpers                                                   #
+# ------------------------------------------------------------------ #
+def _sms_class(name: str):
+    cls = SMS_TRANSPORTS.get(name)
+    return cls if cls is not None else import_string(name)
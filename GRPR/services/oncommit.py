@@ -0,0 +1,69 @@
+# GRPR/services/oncommit.py
+"""
+Collapse many after-commit callbacks into one.
+
+Cache invalidations are requested from signal handlers, often dozens of
+times in one transaction (a scorecard save touches every hole). The
+services queue them here under a key; the first call in a transaction
+registers a single transaction.on_commit callback and later calls only add
+their item to it. Outside a transaction the callback runs right away, as
+transaction.on_commit would.
+
+Pending callbacks live in a per-connection table and are removed when they
+run. A rollback (of the transaction, or of the savepoint the callback was
+registered in) drops the callback without running it; Django replaces the
+connection's hook list when that happens, so an entry registered against
+an older list is stale and a fresh callback is registered instead.
+
+Usage
+-----
+    oncommit.on_commit_once("teesheet", _drop_dates, {gdate})
+    # after commit: _drop_dates([{gdate}, ...]) with every item queued under the key
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.db import transaction
+
+_local = threading.local()   # connections are per thread, so is the pending table
+
+
+def on_commit_once(key: str, fn: Callable[[List[Any]], None], item: Any = None, using: Optional[str] = None) -> None:
+    """
+    Run fn(items) once after the current transaction commits, where items
+    holds the `item` of every call made with `key` until then.
+    """
+    conn = transaction.get_connection(using)
+    if not conn.in_atomic_block:
+        fn([item])
+        return
+
+    pending = _pending(conn.alias)
+    entry = pending.get(key)
+    if entry is not None and entry[0] is conn.run_on_commit:
+        entry[1].append(item)
+        return
+
+    items = [item]
+    hooks = conn.run_on_commit
+
+    def run():
+        if pending.get(key, (None, None))[1] is items:
+            del pending[key]
+        fn(items)
+
+    pending[key] = (hooks, items)
+    transaction.on_commit(run, using=conn.alias)
+
+
+# ------------------------------------------------------------------ #
+# Internal helpers                                                   #
+# ------------------------------------------------------------------ #
+def _pending(alias: str) -> Dict[str, Tuple[list, List[Any]]]:
+    tables = getattr(_local, 'tables', None)
+    if tables is None:
+        tables = _local.tables = {}
+    return tables.setdefault(alias, {})
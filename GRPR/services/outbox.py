@@ -0,0 +1,172 @@
+# GRPR/services/outbox.py
+"""
+Database-backed outbox for texts and e-mails.
+
+Offer views used to call Twilio once per recipient inside the HTTP request,
+so a sub offer to 20 players waited on 20 round-trips. Now they add Outbox
+rows in the same transaction as the SubSwap rows, and return as soon as that
+commits; the drain_outbox worker delivers them.
+
+The worker claims due rows (Pending, or Sending past their lease after a
+crash), sends them from a bounded thread pool and records each result:
+Sent with the provider's message id, plus the Log row described by LogRow
+(both written in bulk for the whole round); or back to Pending with exponential backoff, and Failed after MAX_ATTEMPTS.
+Sending goes through one messaging batch per round, so the transports
+(Twilio, SMTP, fake, file) come from the MESSAGING_* settings.
+
+Usage
+-----
+    outbox.sms(player.Mobile, body, log={"Type": "Sub Offer Sent", "RefID": swap_id, ...})
+    outbox.put(outbox.message("sms", to, body, log=...) for to in numbers)   # one INSERT
+
+    outbox.drain(limit=100, workers=4)   # from the worker; returns counts by outcome
+    outbox.drain(sms="file")             # offline: texts go to MESSAGING_FILE_PATH
+"""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import DatabaseError, connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from GRPR.models import Log, Outbox
+from GRPR.services import messaging
+
+log = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 5
+BACKOFF = 30        # seconds before the first retry; doubles every attempt
+MAX_BACKOFF = 3600
+LEASE = 300         # a row still Sending after this long is claimed again
+
+
+def message(channel: str, to: str, body: str, *, subject: str = '', log: Optional[dict] = None) -> Outbox:
+    """An unsaved outbox row; `log` holds the Log fields written on delivery."""
+    return Outbox(
+        Channel=channel, To=to or '', Subject=subject, Body=body,
+        NextAttempt=timezone.now(), LogRow=log or {},
+    )
+
+
+def put(messages: Iterable[Outbox]) -> List[Outbox]:
+    """Queue several messages with one INSERT."""
+    return Outbox.objects.bulk_create(list(messages))
+
+
+def sms(to: str, body: str, *, log: Optional[dict] = None) -> Outbox:
+    return put([message('sms', to, body, log=log)])[0]
+
+
+def email(to: str, subject: str, body: str, *, log: Optional[dict] = None) -> Outbox:
+    return put([message('email', to, body, subject=subject, log=log)])[0]
+
+
+def drain(*, limit: int = 100, workers: int = 4, sms: Optional[str] = None, email: Optional[str] = None) -> Dict[str, int]:
+    """
+    Deliver up to `limit` due messages with at most `workers` concurrent
+    sends; `sms`/`email` override the configured transports. Returns
+    {"sent": n, "retry": n, "failed": n}.
+    """
+    rows = _claim(limit)
+    counts = {'sent': 0, 'retry': 0, 'failed': 0}
+    if not rows:
+        return counts
+
+    with messaging.batch(sms=sms, email=email) as sender, \
+            ThreadPoolExecutor(max_workers=max(1, min(workers, len(rows)))) as pool:
+        results = list(pool.map(lambda row: _deliver(row, sender), rows))
+
+    # results are written from this thread, on this thread's connection;
+    # delivered rows first, so a failure below cannot get them sent twice
+    sent = [(row, message_id) for row, (message_id, error) in zip(rows, results) if error is None]
+    _mark_sent(sent)
+    counts['sent'] = len(sent)
+    for row, (message_id, error) in zip(rows, results):
+        if error is not None:
+            counts[_retry(row, error)] += 1
+    return counts
+
+
+# ------------------------------------------------------------------ #
+# Internal helpers                                                   #
+# ------------------------------------------------------------------ #
+def _claim(limit: int) -> List[Outbox]:
+    """Mark up to `limit` due rows as Sending (leased for LEASE seconds) and return them."""
+    now = timezone.now()
+    with transaction.atomic():
+        qs = Outbox.objects.filter(Q(Status='Pending') | Q(Status='Sending'), NextAttempt__lte=now)
+        if connection.features.has_select_for_update_skip_locked:
+            qs = qs.select_for_update(skip_locked=True)   # concurrent workers take different rows
+        rows = list(qs.order_by('NextAttempt', 'id')[:limit])
+        for row in rows:
+            row.Status = 'Sending'
+            row.Attempts += 1
+            row.NextAttempt = now + timedelta(seconds=LEASE)
+        Outbox.objects.bulk_update(rows, ['Status', 'Attempts', 'NextAttempt'])
+    return rows
+
+
+def _deliver(row: Outbox, sender: messaging.Batch):
+    """Send one message (runs on a pool thread, no DB access). Returns (message_id, error)."""
+    try:
+        if row.Channel == 'email':
+            return sender.email([row.To], row.Subject, row.Body), None
+        return sender.sms(row.To, row.Body), None
+    except Exception as exc:   # provider / network errors are retried
+        return None, exc
+
+
+def _mark_sent(sent: List[Tuple[Outbox, str]]) -> None:
+    """
+    Mark delivered rows Sent and write their Log rows: one UPDATE and one
+    INSERT per round. If that fails the rows are marked one at a time, status
+    first, since a row left Sending is claimed again (and re-sent) once its
+    lease runs out; a missing Log row is the lesser harm.
+    """
+    if not sent:
+        return
+    now = timezone.now()
+    logs = []
+    for row, message_id in sent:
+        row.Status, row.SentDate, row.MessageID, row.LastError = 'Sent', now, message_id, ''
+        if row.LogRow:
+            logs.append(Log(SentDate=now, MessageID=message_id, To_number=row.To[:16], **row.LogRow))
+    try:
+        with transaction.atomic():
+            Outbox.objects.bulk_update([row for row, _ in sent], ['Status', 'SentDate', 'MessageID', 'LastError'])
+            Log.objects.bulk_create(logs)
+        return
+    except DatabaseError:
+        log.exception('Outbox: recording %s sent messages failed, recording them one by one', len(sent))
+
+    for row, message_id in sent:
+        try:
+            Outbox.objects.filter(id=row.id).update(Status='Sent', SentDate=now, MessageID=message_id, LastError='')
+        except DatabaseError:
+            log.exception('Outbox %s to %s was delivered but not marked Sent; it may be sent again', row.id, row.To)
+            continue
+        if row.LogRow:
+            try:
+                Log.objects.create(SentDate=now, MessageID=message_id, To_number=row.To[:16], **row.LogRow)
+            except DatabaseError:
+                log.exception('Outbox %s: Log row not written', row.id)
+
+
+def _retry(row: Outbox, error: Exception) -> str:
+    now = timezone.now()
+    failed = row.Attempts >= MAX_ATTEMPTS
+    Outbox.objects.filter(id=row.id).update(
+        Status='Failed' if failed else 'Pending',
+        NextAttempt=now + timedelta(seconds=min(BACKOFF * 2 ** (row.Attempts - 1), MAX_BACKOFF)),
+        LastError=repr(error)[:2000],
+    )
+    if failed:
+        log.error('Outbox %s to %s failed after %s attempts: %r', row.id, row.To, row.Attempts, error)
+        return 'failed'
+    log.warning('Outbox %s to %s attempt %s failed, retrying: %r', row.id, row.To, row.Attempts, error)
+    return 'retry'
@@ -0,0 +1,297 @@
+# GRPR/services/rankings.py
+"""
+Season rankings for the Best Rounds page.
+
+One helper per stat, each taking a Season and returning up to ten rows of
+{"name", "value"[, "date"]} from its PlayStart..PlayEnd window; TOP10_FUNC
+maps the stat keys used in the URL (?stat=...) to them and STAT_LABELS gives
+the page titles. The leader cards are the first row of each list, so card
+and table can't disagree.
+
+Usage
+-----
+    rows = rankings.TOP10_FUNC["net"](season)
+    leaders = rankings.round_leaders(season)
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from itertools import chain
+
+from django.db import connection
+from django.db.models import Count
+
+from GRPR.models import Forty, Players, ScorecardMeta, Skins, SubSwap, TeeTimesInd
+
+STAT_LABELS = {
+    # "gross"        : "Best Gross",
+    "net"          : "Best Net Score",
+    "skins"        : "Most Skins (Season)",
+    "gross_member" : "Best Gross Score (Member)",
+    "attendance"   : "Best Attendance",
+    "skins_one"    : "Most Skins (1 Round)",
+    "forty_season" : "Most Forty Holes (Season)",
+    "forty_one"    : "Most Forty Holes (1 Round)",
+    "trader"       : "Best Trader",
+    "quick_draw"   : "Quickest Draw",
+    "friends"      : "Most Frequent Partners",
+}
+
+
+
+# def _top10_gross(season):
+#     qs = (
+#         ScorecardMeta.objects
+#         .filter(PlayDate__gte=season.StartDate)
+#         .values("PID_id", "PID__FirstName", "PID__LastName")
+#         .annotate(value=Min("RawTotal"))
+#         .order_by("value")[:10]
+#     )
+#     return [
+#         {"name": f"{r['PID__FirstName']} {r['PID__LastName']}",
+#          "value": r["value"]}
+#         for r in qs
+#     ]
+
+# ----------  gross_member  (best score + date) -----------------
+def _top10_gross_member(season):
+    rows = (
+        ScorecardMeta.objects
+        .filter(
+            PlayDate__range=(season.PlayStart, season.PlayEnd),
+            PID__Member=1,
+            RawTotal__isnull=False,
+        )
+        .annotate(hole_count=Count("scorecard"))
+        .filter(hole_count__gte=18)
+        .order_by("RawTotal", "-PlayDate")
+        .values("PID__FirstName", "PID__LastName", "PlayDate", "RawTotal")[:10]
+    )
+    return [
+        {"name": f"{r['PID__FirstName']} {r['PID__LastName']}",
+         "value": r["RawTotal"],
+         "date":  r["PlayDate"]}
+        for r in rows
+    ]
+
+
+# ----------  net  (best net score + date) ----------------------
+def _top10_net(season):
+    rows = (
+        ScorecardMeta.objects
+        .filter(
+            PlayDate__range=(season.PlayStart, season.PlayEnd),
+            NetTotal__isnull=False,
+        )
+        .annotate(hole_count=Count("scorecard"))
+        .filter(hole_count__gte=18)
+        .order_by("NetTotal", "-PlayDate")
+        .values("PID__FirstName", "PID__LastName", "PlayDate", "NetTotal")[:10]
+    )
+    return [
+        {"name": f"{r['PID__FirstName']} {r['PID__LastName']}",
+         "value": r["NetTotal"],
+         "date":  r["PlayDate"]}
+        for r in rows
+    ]
+
+
+# ----------  skins_one  (max skins in one round + date) --------
+def _top10_skins_one(season):
+    from collections import defaultdict
+
+    per_round = (
+        Skins.objects
+        .filter(SkinDate__range=(season.PlayStart, season.PlayEnd))
+        .values("PlayerID_id", "PlayerID__FirstName", "PlayerID__LastName",
+                "GameID__PlayDate")
+        .annotate(cnt=Count("id"))
+    )
+
+    best = defaultdict(lambda: {"value": 0})
+    for r in per_round:
+        pid, c = r["PlayerID_id"], r["cnt"]
+        if c > best[pid]["value"]:
+            best[pid] = {
+                "name": f"{r['PlayerID__FirstName']} {r['PlayerID__LastName']}",
+                "value": c,
+                "date":  r["GameID__PlayDate"],
+            }
+
+    top = sorted(best.values(), key=lambda x: -x["value"])[:10]
+    return top
+
+
+# ----------  forty_one  (max forty rows in one round + date) ---
+def _top10_forty_one(season):
+    import itertools
+    from collections import defaultdict
+
+    per_round = (
+        Forty.objects
+        .filter(GameID__PlayDate__range=(season.PlayStart, season.PlayEnd))
+        .values("PID_id", "PID__FirstName", "PID__LastName", "GameID__PlayDate")
+        .annotate(cnt=Count("id"))
+    )
+
+    best = defaultdict(lambda: {"value": 0})
+    for r in per_round:
+        pid, c = r["PID_id"], r["cnt"]
+        if c > best[pid]["value"]:
+            best[pid] = {
+                "name": f"{r['PID__FirstName']} {r['PID__LastName']}",
+                "value": c,
+                "date":  r["GameID__PlayDate"],
+            }
+
+    return sorted(best.values(), key=lambda x: -x["value"])[:10]
+
+def _top10_skins(season):
+    qs = (
+        Skins.objects
+        .filter(SkinDate__range=(season.PlayStart, season.PlayEnd))
+        .values("PlayerID_id", "PlayerID__FirstName", "PlayerID__LastName")
+        .annotate(value=Count("id"))
+        .order_by("-value")[:10]
+    )
+    return [{"name": f"{r['PlayerID__FirstName']} {r['PlayerID__LastName']}", "value": r["value"]} for r in qs]
+
+
+def _top10_attendance(season):
+    qs = (
+        TeeTimesInd.objects
+        .filter(gDate__range=(season.PlayStart, season.PlayEnd))
+        .values("PID_id", "PID__FirstName", "PID__LastName")
+        .annotate(value=Count("id"))
+        .order_by("-value")[:10]
+    )
+    return [{"name": f"{r['PID__FirstName']} {r['PID__LastName']}", "value": r["value"]} for r in qs]
+
+def _top10_forty_season(season):
+    """Most Forty rows per player for the whole season."""
+    qs = (
+        Forty.objects
+        .filter(GameID__PlayDate__range=(season.PlayStart, season.PlayEnd))
+        .values("PID_id", "PID__FirstName", "PID__LastName")
+        .annotate(value=Count("id"))
+        .order_by("-value")[:10]
+    )
+    return [
+        {"name": f"{r['PID__FirstName']} {r['PID__LastName']}",
+         "value": r["value"]}
+        for r in qs
+    ]
+
+def _top10_trader(season):
+    """
+    Counts BOTH players involved in every swap that ended
+    Closed & Accepted within the season window.
+    """
+    # 1) SwapIDs that actually closed/accepted in the window
+    swaps = (
+        SubSwap.objects
+        .filter(nStatus="Closed",
+                SubStatus="Accepted",
+                RequestDate__range=(season.PlayStart, season.PlayEnd))
+        .values_list("SwapID", flat=True)
+    )
+
+    # 2) rows that earn credit
+    offers   = SubSwap.objects.filter(SwapID__in=swaps, SubType="Offer")\
+                              .values_list("PID_id", flat=True)
+    counters = SubSwap.objects.filter(SwapID__in=swaps,
+                                      SubType="Counter",
+                                      SubStatus="Accepted")\
+                              .values_list("PID_id", flat=True)
+
+    freq     = Counter(chain(offers, counters))
+    ranking  = freq.most_common(10)
+    names    = _player_names(pid for pid, _ in ranking)
+
+    return [
+        {
+            "name":  names[pid],
+            "value": total,
+        }
+        for pid, total in ranking
+    ]
+
+
+def _top10_quick_draw(season):
+    qs = (
+        SubSwap.objects
+        .filter(nStatus="Closed", SubStatus="Accepted", nType="Sub", RequestDate__range=(season.PlayStart, season.PlayEnd))
+        .values("PID_id", "PID__FirstName", "PID__LastName")
+        .annotate(value=Count("id"))
+        .order_by("-value")[:10]
+    )
+    return [{"name": f"{r['PID__FirstName']} {r['PID__LastName']}", "value": r["value"]} for r in qs]
+
+def _top10_friends(season):
+    """
+    Top 10 most-frequent playing partners in the season (same date & slot).
+    """
+    sql = """
+        SELECT  t1."PID_id"                       AS p1,   -- t1 < t2, so already ordered
+                t2."PID_id"                       AS p2,
+                COUNT(*)                          AS cnt
+        FROM    "TeeTimesInd" t1
+        JOIN    "TeeTimesInd" t2
+          ON    t1."gDate"       = t2."gDate"
+         AND    t1."CourseID_id" = t2."CourseID_id"
+         AND    t1."PID_id"      < t2."PID_id"          -- avoid (A,B) / (B,A)
+        WHERE   t1."gDate" BETWEEN %s AND %s
+        GROUP BY t1."PID_id", t2."PID_id"
+        ORDER BY cnt DESC
+        LIMIT 10;
+    """
+
+    with connection.cursor() as cur:
+        cur.execute(sql, [season.PlayStart, season.PlayEnd])
+        rows = cur.fetchall()          # (p1, p2, cnt)
+
+    names = _player_names(chain.from_iterable((p1, p2) for p1, p2, _ in rows))
+    result = []
+    for pid1, pid2, cnt in rows:
+        result.append({
+            "name":  f"{names[pid1]} & {names[pid2]}",
+            "value": cnt,
+        })
+    return result
+
+TOP10_FUNC = {
+    # "gross"        : _top10_gross,
+    "net"          : _top10_net,
+    "gross_member" : _top10_gross_member,
+    "skins"        : _top10_skins,
+    "attendance"   : _top10_attendance,
+    "skins_one"    : _top10_skins_one,
+    "forty_season" : _top10_forty_season,
+    "forty_one"    : _top10_forty_one,
+    "trader"       : _top10_trader,
+    "quick_draw"   : _top10_quick_draw,
+    "friends"      : _top10_friends,
+}
+
+def round_leaders(season, top10=None):
+    """
+    Build a dict keyed by stat name whose value is the first row
+    of the corresponding _top10_… helper (or None if no data).
+    This guarantees card == top-row of the Top-10 table.
+    `top10(stat)` supplies the rows (default: compute live).
+    """
+    top10 = top10 or (lambda stat: TOP10_FUNC[stat](season))
+    leaders = {}
+    for stat in TOP10_FUNC:
+        rows = top10(stat)
+        leaders[stat] = rows[0] if rows else None
+    return leaders
+
+
+def _player_names(pids):
+    """{pid: "First Last"} for all `pids` in one query."""
+    return {
+        pid: f"{first} {last}"
+        for pid, first, last in Players.objects.filter(pk__in=set(pids)).values_list("id", "FirstName", "LastName")
+    }
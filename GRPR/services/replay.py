@@ -0,0 +1,129 @@
+# GRPR/services/replay.py
+"""
+Saturday replay benchmark.
+
+Plays one set-up Saturday (see synthetic.generate) through the Django test
+client the way the field uses the site during a round: every foursome's
+scorer posts each hole to hole_input_score_view, groups going off one hole
+apart, while spectators keep polling the leaderboard (with If-None-Match,
+like the page does), the live feed and their group's scorecard.
+
+Each request is timed and its SQL counted; `saturday(...)` returns one row
+per view with p50/p95 of both, plus how many polls were answered 304.
+
+Usage
+-----
+    league = synthetic.generate(players=48, played=10)
+    rows = replay.saturday(league.replay[0], pollers=8)
+    # [{"view": "hole_input_score_view", "n": 216, "queries_p50": 31, ...}, ...]
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import time
+from types import SimpleNamespace
+from typing import Dict, List
+
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from GRPR.services import request_metrics
+
+PERCENTILES = (50, 95)
+HTTPS = {"wsgi.url_scheme": "https", "HTTP_X_FORWARDED_PROTO": "https"}   # no SSL redirect when DEBUG is off
+
+
+def saturday(day: SimpleNamespace, *, pollers: int = 8, seed: int = 1) -> List[dict]:
+    """
+    Replay a full round for `day` (a synthetic.generate(...).replay entry)
+    and report per-view query counts and latency percentiles.
+    """
+    rng = random.Random(seed)
+    samples: Dict[str, List[tuple]] = {}
+    game_id = day.game.id
+    slots = sorted(day.groups)
+    metas = {m.PID_id: m for m in day.metas}
+
+    scorers = {slot: _client(day.groups[slot][0]) for slot in slots}
+    everyone = [p for slot in slots for p in day.groups[slot]]
+    watchers = [
+        SimpleNamespace(client=_client(p), slot=metas[p.id].GroupID, lb_etag=None, sc_etag=None, since=0)
+        for p in rng.sample(everyone, min(pollers, len(everyone)))
+    ]
+
+    for tick in range(len(day.holes) + len(slots) - 1):
+        for g, slot in enumerate(slots):
+            n = tick - g
+            if not 0 <= n < len(day.holes):
+                continue
+            hole = day.holes[n]
+            body = {
+                "game_id": game_id, "hole_id": hole.id, "group_id": slot,
+                "players": [
+                    {"pid": p.id, "score": max(1, hole.Par + rng.choice((-1, 0, 0, 1, 1, 2, 3))), "putts": 2}
+                    for p in day.groups[slot]
+                ],
+            }
+            resp = _timed(samples, "hole_input_score_view", lambda: scorers[slot].post(
+                reverse("hole_input_score_view"), json.dumps(body), content_type="application/json",
+            ))
+            if resp.status_code != 200:
+                raise RuntimeError(f"hole_input_score_view answered {resp.status_code} for {slot} hole {hole.HoleNumber}")
+
+        for w in watchers:
+            _poll(samples, w, game_id)
+
+    return [_summarise(view, rows) for view, rows in sorted(samples.items())]
+
+
+# ------------------------------------------------------------------ #
+# Internal helpers                                                   #
+# ------------------------------------------------------------------ #
+def _client(player) -> Client:
+    client = Client(**HTTPS)
+    client.force_login(player.user)
+    return client
+
+
+def _poll(samples, w, game_id) -> None:
+    """One polling cycle for a spectator: leaderboard, live feed, own scorecard."""
+    headers = {"HTTP_IF_NONE_MATCH": w.lb_etag} if w.lb_etag else {}
+    resp = _timed(samples, "skins_leaderboard_view", lambda: w.client.get(
+        reverse("skins_leaderboard_view"), {"game_id": game_id}, **headers,
+    ))
+    w.lb_etag = resp.get("ETag") or w.lb_etag
+
+    resp = _timed(samples, "live_updates_view", lambda: w.client.get(
+        reverse("live_updates_view"), {"game_id": game_id, "since": w.since},
+    ))
+    if resp.status_code == 200:
+        w.since = resp.json().get("version", w.since)
+
+    headers = {"HTTP_IF_NONE_MATCH": w.sc_etag} if w.sc_etag else {}
+    resp = _timed(samples, "scorecard_view", lambda: w.client.get(
+        reverse("scorecard_view"), {"game_id": game_id, "group_id": w.slot}, **headers,
+    ))
+    w.sc_etag = resp.get("ETag") or w.sc_etag
+
+
+def _timed(samples, view: str, request):
+    with CaptureQueriesContext(connection) as ctx:
+        start = time.perf_counter()
+        resp = request()
+        wall_ms = (time.perf_counter() - start) * 1000
+    samples.setdefault(view, []).append((wall_ms, len(ctx.captured_queries), resp.status_code))
+    return resp
+
+
+def _summarise(view: str, rows: List[tuple]) -> dict:
+    out = {"view": view, "n": len(rows), "not_modified": sum(1 for r in rows if r[2] == 304)}
+    ms = sorted(r[0] for r in rows)
+    queries = sorted(r[1] for r in rows)
+    for p in PERCENTILES:
+        out[f"queries_p{p}"] = request_metrics.percentile(queries, p)
+        out[f"ms_p{p}"] = round(request_metrics.percentile(ms, p), 1)
+    return out
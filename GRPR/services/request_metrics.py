@@ -0,0 +1,112 @@
+# GRPR/services/request_metrics.py
+"""
+Per-view request metrics for RequestMetricsMiddleware (GRPR/middleware.py).
+
+Each worker process keeps the last WINDOW samples per view (wall ms, SQL
+query count, SQL ms) in memory and copies them to the shared cache at most
+every FLUSH_SECONDS, under one key per process. `summary()` merges every
+live process's window and reports p50/p90/p99 per view for admin_view.
+Processes that stop flushing drop out when their key expires.
+
+Usage
+-----
+    request_metrics.record("scorecard_view", wall_ms=84.0, queries=9, sql_ms=21.5)
+    rows = request_metrics.summary()   # [{"view", "n", "wall_p50", ...}, ...]
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import socket
+import time
+from collections import Counter, deque
+from typing import Deque, Dict, Iterable, List, Tuple
+
+from django.core.cache import cache
+
+WINDOW = 500           # samples kept per view, per process
+FLUSH_SECONDS = 30
+PROCESS_TTL = 60 * 60  # a process that stops flushing drops out after this
+PERCENTILES = (50, 90, 99)
+
+_INDEX_KEY = "reqmetrics:index"
+_PROCESS_KEY = f"reqmetrics:{socket.gethostname()}:{os.getpid()}"
+
+_samples: Dict[str, Deque[Tuple[float, int, float]]] = {}
+_state = {'dirty': False, 'flushed_at': 0.0}
+
+
+def record(view: str, wall_ms: float, queries: int, sql_ms: float) -> None:
+    """Add one request to this process's window; flush to the cache when due."""
+    window = _samples.get(view)
+    if window is None:
+        window = _samples[view] = deque(maxlen=WINDOW)
+    window.append((round(wall_ms, 1), queries, round(sql_ms, 1)))
+    _state['dirty'] = True
+    if time.monotonic() - _state['flushed_at'] >= FLUSH_SECONDS:
+        flush()
+
+
+def flush() -> None:
+    """Publish this process's windows to the shared cache."""
+    _state['flushed_at'] = time.monotonic()
+    if not _state['dirty']:
+        return
+    _state['dirty'] = False
+    cache.set(_PROCESS_KEY, {view: list(window) for view, window in _samples.items()}, PROCESS_TTL)
+    index = set(cache.get(_INDEX_KEY) or ())
+    if _PROCESS_KEY not in index:
+        index.add(_PROCESS_KEY)
+        cache.set(_INDEX_KEY, sorted(index), None)
+
+
+def summary() -> List[dict]:
+    """
+    Rolling percentiles per view across all processes, slowest p90 first:
+    {"view", "n", "wall_p50/90/99", "queries_p50/90/99", "sql_p50/90/99"}.
+    """
+    flush()
+    keys = cache.get(_INDEX_KEY) or []
+    published = cache.get_many(keys)
+    if len(published) < len(keys):
+        cache.set(_INDEX_KEY, sorted(published), None)   # forget expired processes
+
+    merged: Dict[str, List[Tuple[float, int, float]]] = {}
+    for windows in published.values():
+        for view, rows in windows.items():
+            merged.setdefault(view, []).extend(rows)
+
+    out = []
+    for view, rows in merged.items():
+        row = {'view': view, 'n': len(rows)}
+        for i, name in enumerate(('wall', 'queries', 'sql')):
+            values = sorted(r[i] for r in rows)
+            for p in PERCENTILES:
+                row[f"{name}_p{p}"] = percentile(values, p)
+        out.append(row)
+    return sorted(out, key=lambda r: -r['wall_p90'])
+
+
+def percentile(values: List, p: int):
+    """Nearest-rank percentile of an already-sorted list."""
+    if not values:
+        return None
+    rank = max(1, -(-p * len(values) // 100))
+    return values[rank - 1]
+
+
+def fingerprint(sql: str) -> str:
+    """SQL with IN-lists collapsed, so `IN (%s, %s)` and `IN (%s)` match."""
+    return _IN_LIST.sub("IN (…)", sql)
+
+
+def duplicates(fingerprints: Iterable[str], top: int = 3) -> List[Tuple[str, int]]:
+    """The most repeated fingerprints (count > 1), truncated for logging."""
+    return [(fp[:200], n) for fp, n in Counter(fingerprints).most_common(top) if n > 1]
+
+
+# ------------------------------------------------------------------ #
+# Internal helpers                                                   #
+# ------------------------------------------------------------------ #
+_IN_LIST = re.compile(r"IN \((?:%s(?:, )?)+\)")
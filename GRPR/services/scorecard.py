@@ -0,0 +1,171 @@
+# GRPR/services/scorecard.py
+"""
+Scorecard grid builder.
+
+`build_grid(game_id, group_id=None)` returns everything scorecard.html needs
+(players, holes, per-hole raw/net, strokes, skins flags, Forty usage) from a
+fixed number of queries, whatever the field size:
+
+  1. Games           – PlayDate + AssocGame (linked Forty game)
+  2. ScorecardMeta   – players, handicaps, tees and OUT/IN/Total
+  3. CourseHoles     – one hole list for the most common tee (+ CourseName),
+                       served from the per-process stroke table once loaded
+  4. Scorecard       – every posted raw/net
+  5. Skins           – skin flags
+  6. Forty           – scores used for Forty (only when a Forty game is linked)
+
+Stroke allocation comes from the same table (GRPR/services/strokes.py) that
+score entry uses for NetScore, so the dots always match the posted nets.
+Leave `group_id` blank for the Big Scorecard (whole field).
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Optional
+
+from GRPR.models import Forty, Games, Scorecard, ScorecardMeta, Skins
+from GRPR.services import strokes
+
+
+def build_grid(game_id: int, group_id: Optional[str] = None) -> dict:
+    """
+    Returns a dict with keys:
+      player_list, course_holes, course_name, play_date, player_scores,
+      player_strokes, forty_used_scores, thru
+    """
+    game = (
+        Games.objects
+        .filter(id=game_id)
+        .values('PlayDate', 'AssocGame')
+        .first()
+    ) or {}
+    play_date = game.get('PlayDate')
+    forty_game_id = game.get('AssocGame')
+
+    # ------------------------------------------------------------------
+    # Players + totals (one ScorecardMeta read for the whole game)
+    # ------------------------------------------------------------------
+    metas = list(
+        ScorecardMeta.objects
+        .filter(GameID=game_id)
+        .order_by('id')
+        .values(
+            'PID_id', 'PID__FirstName', 'PID__LastName', 'NetHDCP', 'GroupID', 'TeeID_id',
+            'RawOUT', 'NetOUT', 'RawIN', 'NetIN', 'RawTotal', 'NetTotal',
+        )
+    )
+
+    # Tee context: most common tee in the game (whole field, not just the group)
+    tee_counts = Counter(m['TeeID_id'] for m in metas if m['TeeID_id'])
+    tee_pk = tee_counts.most_common(1)[0][0] if tee_counts else None
+
+    shown = [m for m in metas if not group_id or m['GroupID'] == group_id]
+    player_list = [
+        {
+            'first_name': m['PID__FirstName'],
+            'last_name': m['PID__LastName'],
+            'pid': m['PID_id'],
+            'net_hdcp': _int_or_zero(m['NetHDCP']),
+        }
+        for m in shown
+    ]
+
+    # ------------------------------------------------------------------
+    # Holes for the tee (CourseName rides along on the join)
+    # ------------------------------------------------------------------
+    table = strokes.for_tee(tee_pk)
+    course_holes = [dict(h) for h in table.holes] if table else []
+    course_name = table.course_name if table else None
+
+    # ------------------------------------------------------------------
+    # Raw/Net per-hole scores
+    # ------------------------------------------------------------------
+    scores = (
+        Scorecard.objects
+        .filter(GameID_id=game_id)
+        .values_list('HoleID__HoleNumber', 'NetScore', 'RawScore', 'smID__PID_id')
+    )
+    if group_id:
+        scores = scores.filter(smID__GroupID=group_id)
+
+    player_scores = {p['pid']: {} for p in player_list}
+    thru = 0
+    for hn, net, raw, pid in scores:
+        if pid not in player_scores:
+            continue
+        player_scores[pid][hn] = {
+            'net': net if net is not None else '',
+            'raw': raw if raw is not None else '',
+            'skin': False,
+        }
+        if hn and hn > thru:
+            thru = hn
+
+    # Ensure all holes + Out/In/Total keys exist, totals from ScorecardMeta
+    for m in shown:
+        row = player_scores[m['PID_id']]
+        for h in course_holes:
+            row.setdefault(h['HoleNumber'], {'net': '', 'raw': ''})
+        row['Out'] = _total_cell(m['NetOUT'], m['RawOUT'])
+        row['In'] = _total_cell(m['NetIN'], m['RawIN'])
+        row['Total'] = _total_cell(m['NetTotal'], m['RawTotal'])
+
+    # ------------------------------------------------------------------
+    # Skins mark-up
+    # ------------------------------------------------------------------
+    for hn, pid in (
+        Skins.objects
+        .filter(GameID=game_id)
+        .values_list('HoleNumber__HoleNumber', 'PlayerID_id')
+    ):
+        if pid in player_scores and hn in player_scores[pid]:
+            player_scores[pid][hn]['skin'] = True
+
+    # ------------------------------------------------------------------
+    # Stroke grids from the tee's stroke table
+    # ------------------------------------------------------------------
+    player_strokes = {}
+    for p in player_list:
+        player_strokes[p['pid']] = dict(table.row(p['net_hdcp'])) if table else {}
+
+    # ------------------------------------------------------------------
+    # Linked Forty game (for red-border highlighting)
+    # ------------------------------------------------------------------
+    forty_used_scores = set()
+    if forty_game_id:
+        for pid, hole_id in (
+            Forty.objects
+            .filter(GameID_id=forty_game_id)
+            .values_list('PID_id', 'HoleNumber_id')
+        ):
+            forty_used_scores.add(f"{pid}:{hole_id}")
+
+    return {
+        'player_list': player_list,
+        'course_holes': course_holes,
+        'course_name': course_name,
+        'play_date': play_date,
+        'player_scores': player_scores,
+        'player_strokes': player_strokes,
+        'forty_used_scores': list(forty_used_scores),
+        'thru': thru,
+    }
+
+
+# ------------------------------------------------------------------ #
+# Internal helpers                                                   #
+# ------------------------------------------------------------------ #
+def _int_or_zero(val) -> int:
+    try:
+        return int(val) if val is not None else 0
+    except (TypeError, ValueError):
+        return 0
+
+
+def _total_cell(net, raw) -> dict:
+    return {
+        'net': net if net is not None else '',
+        'raw': raw if raw is not None else '',
+        'skin': False,
+    }
@@ -0,0 +1,200 @@
+# GRPR/services/scoring.py
+"""
+Batched hole-score writer.
+
+A foursome posts its results for a hole (or several holes) in one request.
+`record_hole_scores` writes the whole batch inside a single transaction with
+a fixed number of queries, no matter how many players are in the group:
+
+  1. CourseHoles for every posted hole              (0 queries once the tee's
+                                                     stroke table is loaded)
+  2. ScorecardMeta rows for every posted player     (1 query, row-locked)
+  3. existing Scorecard rows for (player, hole)     (1 query)
+  4. bulk_update existing / upsert new Scorecard   (≤ 2 queries, +1 id lookup
+                                                     after inserts)
+  5. bulk_update ScorecardMeta running totals       (1 query)
+  6. skins / Gas Cup / Stableford once per batch
+  7. after commit: live version bump + leaderboard snapshot (see live.py)
+
+Entries are dicts: {"pid", "hole_id", "score", "putts"(optional)}.
+NetScore comes from the per-tee stroke table in GRPR/services/strokes.py.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Tuple
+
+from django.db import transaction
+from django.utils import timezone
+
+from GRPR.models import CourseHoles, Scorecard, ScorecardMeta
+from GRPR.services import gascup, live, skins as skins_svc, stableford as stbl, stats, strokes
+
+
+class MissingScorecardMeta(Exception):
+    """Raised when a posted PID has no ScorecardMeta row in the game."""
+
+    def __init__(self, pid):
+        self.pid = pid
+        super().__init__(f"ScorecardMeta not found for player, PID = {pid}")
+
+
+def record_hole_scores(*, game_id: int, entries: Iterable[dict], alter_pid: int) -> List[int]:
+    """
+    Insert/update Scorecard rows for a batch of (player, hole) results, keep
+    ScorecardMeta OUT/IN/Total/Putts in step, then refresh derived games.
+
+    Returns the Scorecard ids written. Raises MissingScorecardMeta (and
+    writes nothing) if any posted player is not in the game.
+    """
+    game_id = int(game_id)
+    batch = [
+        (int(e["pid"]), int(e["hole_id"]), int(e["score"]), int(e.get("putts") or 0))
+        for e in entries
+    ]
+    if not batch:
+        return []
+
+    pids = {pid for pid, _, _, _ in batch}
+    hole_ids = {hole_id for _, hole_id, _, _ in batch}
+
+    with transaction.atomic():
+        holes = strokes.for_holes(hole_ids)
+        missing_holes = hole_ids - set(holes)
+        if missing_holes:
+            raise CourseHoles.DoesNotExist(f"CourseHoles not found: {sorted(missing_holes)}")
+
+        meta_by_pid: Dict[int, ScorecardMeta] = {}
+        for scm in (
+            ScorecardMeta.objects
+            .select_for_update()
+            .filter(GameID_id=game_id, PID_id__in=pids)
+            .order_by("id")
+        ):
+            meta_by_pid.setdefault(scm.PID_id, scm)
+        for pid in pids:
+            if pid not in meta_by_pid:
+                raise MissingScorecardMeta(pid)
+
+        existing: Dict[Tuple[int, int], Scorecard] = {}
+        for sc in (
+            Scorecard.objects
+            .filter(
+                GameID_id=game_id,
+                HoleID_id__in=hole_ids,
+                smID_id__in=[m.id for m in meta_by_pid.values()],
+            )
+            .order_by("id")
+        ):
+            existing.setdefault((sc.smID_id, sc.HoleID_id), sc)
+
+        now = timezone.now()
+        written: Dict[Tuple[int, int], Scorecard] = {}
+        touched_meta: Dict[int, ScorecardMeta] = {}
+
+        for pid, hole_id, score, putts in batch:
+            scm = meta_by_pid[pid]
+            table, hole = holes[hole_id]
+            hole_number = hole["HoleNumber"]
+            net_score = table.net_score(score, _int_or_zero(scm.NetHDCP), hole_number)
+
+            sc = existing.get((scm.id, hole_id))
+            if sc:
+                d_raw = score - sc.RawScore
+                d_net = net_score - sc.NetScore
+                d_putts = putts - (sc.Putts or 0)
+                sc.AlterDate = now
+                sc.RawScore = score
+                sc.NetScore = net_score
+                sc.AlterID_id = alter_pid
+                sc.Putts = putts
+            else:
+                d_raw, d_net, d_putts = score, net_score, putts
+                sc = Scorecard(
+                    CreateDate=now,
+                    AlterDate=now,
+                    RawScore=score,
+                    NetScore=net_score,
+                    AlterID_id=alter_pid,
+                    smID_id=scm.id,
+                    GameID_id=game_id,
+                    HoleID_id=hole_id,
+                    Putts=putts,
+                )
+                existing[(scm.id, hole_id)] = sc   # same hole twice in one batch → update, not duplicate
+            written[(scm.id, hole_id)] = sc
+
+            # ScorecardMeta running totals (front = OUT, back = IN)
+            if 1 <= hole_number <= 9:
+                scm.RawOUT = _int_or_zero(scm.RawOUT) + d_raw
+                scm.NetOUT = _int_or_zero(scm.NetOUT) + d_net
+            elif 10 <= hole_number <= 18:
+                scm.RawIN = _int_or_zero(scm.RawIN) + d_raw
+                scm.NetIN = _int_or_zero(scm.NetIN) + d_net
+            scm.RawTotal = _int_or_zero(scm.RawTotal) + d_raw
+            scm.NetTotal = _int_or_zero(scm.NetTotal) + d_net
+            scm.Putts = _int_or_zero(scm.Putts) + d_putts
+            touched_meta[scm.id] = scm
+
+        to_update = [sc for sc in written.values() if sc.pk]
+        to_create = [sc for sc in written.values() if not sc.pk]
+        if to_update:
+            Scorecard.objects.bulk_update(
+                to_update,
+                ["AlterDate", "RawScore", "NetScore", "AlterID", "Putts"],
+            )
+        if to_create:
+            # (smID, HoleID) is unique: a row that appeared since the read is
+            # overwritten in the database instead of duplicated
+            Scorecard.objects.bulk_create(
+                to_create,
+                update_conflicts=True,
+                unique_fields=["smID", "HoleID"],
+                update_fields=["AlterDate", "RawScore", "NetScore", "AlterID", "Putts"],
+            )
+        ScorecardMeta.objects.bulk_update(
+            list(touched_meta.values()),
+            ["RawOUT", "NetOUT", "RawIN", "NetIN", "RawTotal", "NetTotal", "Putts"],
+        )
+
+        score_ids = _score_ids(game_id, written.values())
+
+        # Derived games: once per batch
+        skins_svc.update_for_holes(game_id, hole_ids)
+        gascup.update_for_scores(score_ids)
+        stbl.update_for_scores(score_ids)
+
+        # New leaderboard version + snapshot once this batch has committed
+        live.touch(game_id, rebuild=True)
+        stats.invalidate_rankings("Scorecard", "ScorecardMeta")
+
+    return score_ids
+
+
+# ------------------------------------------------------------------ #
+# Internal helpers                                                   #
+# ------------------------------------------------------------------ #
+def _int_or_zero(val) -> int:
+    try:
+        return int(val) if val is not None else 0
+    except (TypeError, ValueError):
+        return 0
+
+
+def _score_ids(game_id: int, rows: Iterable[Scorecard]) -> List[int]:
+    """
+    Ids for the rows written. bulk_create fills pks on Postgres/SQLite;
+    fall back to one lookup for any backend that does not.
+    """
+    rows = list(rows)
+    ids = [sc.pk for sc in rows if sc.pk]
+    if len(ids) < len(rows):
+        keys = {(sc.smID_id, sc.HoleID_id) for sc in rows if not sc.pk}
+        for pk, sm_id, hole_id in (
+            Scorecard.objects
+            .filter(GameID_id=game_id, smID_id__in={k[0] for k in keys}, HoleID_id__in={k[1] for k in keys})
+            .values_list("id", "smID_id", "HoleID_id")
+        ):
+            if (sm_id, hole_id) in keys:
+                ids.append(pk)
+    return sorted(set(ids))
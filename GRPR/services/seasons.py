@@ -0,0 +1,95 @@
+# GRPR/services/seasons.py
+"""
+Season registry.
+
+Every season-bounded query (tee sheet, schedule, statistics, Best Rounds)
+takes its date range from a Season row instead of a hard-coded date, so the
+scans stay one season wide as history grows and any past season can be
+shown on its own.
+
+The table is tiny and read on most pages, so it is held per process and
+reloaded every MAX_AGE seconds or when a Season is saved/deleted.
+
+Usage
+-----
+    season = seasons.current()              # season containing today
+    season = seasons.get(request.GET.get("season"))   # by Name, else current
+    qs.filter(gDate__range=(season.StartDate, season.EndDate))
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import date
+from typing import List, Optional
+
+from django.db.models.signals import post_save, post_delete
+from django.utils import timezone
+
+from GRPR.models import Season
+
+MAX_AGE = 300  # seconds
+
+_CACHE = {'seasons': None, 'loaded_at': 0.0}
+
+
+def all_seasons() -> List[Season]:
+    """Every season, oldest first."""
+    if _CACHE['seasons'] is None or time.monotonic() - _CACHE['loaded_at'] > MAX_AGE:
+        _CACHE['seasons'] = list(Season.objects.order_by('StartDate'))
+        _CACHE['loaded_at'] = time.monotonic()
+    return _CACHE['seasons']
+
+
+def current(today: Optional[date] = None) -> Season:
+    """
+    The season containing `today`; between seasons in the same year, the
+    latest one that has started. In a year no Season row reaches yet (or
+    with no rows at all), an unsaved default for this year, so a missing
+    row never hides the current year's rounds behind last year's EndDate.
+    """
+    today = today or timezone.localdate()
+    started = [s for s in all_seasons() if s.StartDate <= today]
+    for season in reversed(started):
+        if today <= season.EndDate:
+            return season
+    if started and started[-1].EndDate.year >= today.year:
+        return started[-1]
+    return _default(today.year)
+
+
+def with_current() -> List[Season]:
+    """Every season, plus the unsaved default when that is the current one."""
+    now = current()
+    return all_seasons() + ([now] if now.pk is None else [])
+
+
+def get(name: Optional[str]) -> Season:
+    """Season by Name; unknown or empty names give the current season."""
+    for season in all_seasons():
+        if season.Name == name:
+            return season
+    return current()
+
+
+def invalidate() -> None:
+    _CACHE['seasons'] = None
+
+
+# ------------------------------------------------------------------ #
+# Internal helpers                                                   #
+# ------------------------------------------------------------------ #
+def _default(year: int) -> Season:
+    return Season(
+        Name=str(year),
+        StartDate=date(year, 1, 1), EndDate=date(year, 12, 31),
+        PlayStart=date(year, 4, 1), PlayEnd=date(year, 9, 1),
+    )
+
+
+def _season_changed(sender, **kwargs):
+    invalidate()
+
+
+post_save.connect(_season_changed, sender=Season, dispatch_uid="seasons_saved")
+post_delete.connect(_season_changed, sender=Season, dispatch_uid="seasons_deleted")
@@ -0,0 +1,158 @@
+# GRPR/services/skins.py
+"""
+Skins scoring utilities.
+
+A skin is won on a hole when exactly one player posts the lowest NetScore
+for that hole (keyed on Scorecard.HoleID). Ties carry nothing.
+
+Usage
+-----
+Call `skins.update_for_holes(game_id, hole_ids)` after a batch of Scorecard
+rows has been saved. Only the listed holes are re-derived: Skins rows whose
+winner changed are deleted/inserted, and ScorecardMeta.Skins is recounted
+for the players who gained or lost a skin. Every other row is left alone.
+
+`skins.rebuild(game_id)` re-derives the whole game the same way; use it as a
+repair path if the Skins table ever drifts from the posted scores.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Optional, Set
+
+from django.db import transaction
+from django.db.models import Count
+
+from GRPR.models import Scorecard, ScorecardMeta, Skins
+from GRPR.services import stats
+
+
+def update_for_holes(game_id: int, hole_ids: Iterable[int]) -> None:
+    """
+    Recompute skins for the given CourseHoles ids in one Skins game.
+    """
+    hole_ids = {int(h) for h in hole_ids if h}
+    if not hole_ids:
+        return
+
+    with transaction.atomic():
+        _sync_holes(int(game_id), hole_ids)
+
+
+def rebuild(game_id: int) -> None:
+    """
+    Recompute skins for every hole in the game and reset every player's
+    ScorecardMeta.Skins counter. Result matches the per-hole path.
+    """
+    game_id = int(game_id)
+    with transaction.atomic():
+        scored = set(
+            Scorecard.objects
+            .filter(GameID_id=game_id)
+            .values_list("HoleID_id", flat=True)
+            .distinct()
+        )
+        stale = set(
+            Skins.objects
+            .filter(GameID_id=game_id)
+            .values_list("HoleNumber_id", flat=True)
+        )
+        _sync_holes(game_id, scored | stale)
+
+        ScorecardMeta.objects.filter(GameID_id=game_id).update(Skins=0)
+        _recount_players(game_id, None)
+
+
+# ------------------------------------------------------------------ #
+# Internal helpers                                                   #
+# ------------------------------------------------------------------ #
+def _winners_by_hole(game_id: int, hole_ids: Set[int]) -> Dict[int, Optional[int]]:
+    """
+    Return {hole_id: winning PID or None (tied / unscored)} from a single
+    Scorecard query.
+    """
+    rows = (
+        Scorecard.objects
+        .filter(GameID_id=game_id, HoleID_id__in=hole_ids)
+        .values_list("HoleID_id", "NetScore", "smID__PID_id")
+    )
+
+    best: Dict[int, tuple[int, list[int]]] = {}  # hole_id -> (min_net, [pid, ...])
+    for hole_id, net, pid in rows:
+        if net is None:
+            continue
+        cur = best.get(hole_id)
+        if cur is None or net < cur[0]:
+            best[hole_id] = (net, [pid])
+        elif net == cur[0]:
+            cur[1].append(pid)
+
+    out: Dict[int, Optional[int]] = {h: None for h in hole_ids}
+    for hole_id, (_, pids) in best.items():
+        if len(pids) == 1:
+            out[hole_id] = pids[0]
+    return out
+
+
+def _sync_holes(game_id: int, hole_ids: Set[int]) -> Set[int]:
+    """
+    Bring the Skins rows for `hole_ids` in line with the posted scores and
+    recount ScorecardMeta.Skins for anyone whose tally changed.
+    Returns the set of affected PIDs.
+    """
+    if not hole_ids:
+        return set()
+
+    winners = _winners_by_hole(game_id, hole_ids)
+
+    existing = (
+        Skins.objects
+        .filter(GameID_id=game_id, HoleNumber_id__in=hole_ids)
+        .values_list("id", "HoleNumber_id", "PlayerID_id")
+    )
+
+    affected: Set[int] = set()
+    stale_ids = []
+    kept = set()  # (hole_id, pid) already correct
+    for skin_id, hole_id, pid in existing:
+        if winners.get(hole_id) == pid:
+            kept.add((hole_id, pid))
+        else:
+            stale_ids.append(skin_id)
+            affected.add(pid)
+
+    to_create = []
+    for hole_id, pid in winners.items():
+        if pid is None or (hole_id, pid) in kept:
+            continue
+        to_create.append(Skins(GameID_id=game_id, PlayerID_id=pid, HoleNumber_id=hole_id))
+        affected.add(pid)
+
+    if stale_ids:
+        Skins.objects.filter(id__in=stale_ids).delete()
+    if to_create:
+        Skins.objects.bulk_create(to_create)
+    if stale_ids or to_create:
+        stats.invalidate_rankings("Skins")
+
+    if affected:
+        _recount_players(game_id, affected)
+    return affected
+
+
+def _recount_players(game_id: int, pids: Optional[Set[int]]) -> None:
+    """
+    Set ScorecardMeta.Skins from the Skins table for `pids`
+    (or for every player holding a skin when pids is None).
+    """
+    qs = Skins.objects.filter(GameID_id=game_id)
+    if pids is not None:
+        qs = qs.filter(PlayerID_id__in=pids)
+    counts = dict(
+        qs.values("PlayerID_id")
+        .annotate(n=Count("id"))
+        .values_list("PlayerID_id", "n")
+    )
+
+    for pid in (pids if pids is not None else counts.keys()):
+        ScorecardMeta.objects.filter(GameID_id=game_id, PID_id=pid).update(Skins=counts.get(pid, 0))
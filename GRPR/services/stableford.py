@@ -127,43 +127,109 @@ def ensure_teams_for_stableford(draft, stbl_game: Games):
             for (pid, tid, tname) in new_rows
         ])
 
-# ---- scoring entrypoint -------------------------------------
+# ---- scoring entrypoints ------------------------------------
 
 def update_for_score(scorecard_id: int):
     """
     Given a Scorecard row id that was inserted/updated, compute & upsert
     the Stableford points for the associated Stableford game (if present).
     """
-    sc = (
+    update_for_scores([scorecard_id])
+
+def update_for_scores(scorecard_ids):
+    """
+    Bulk version of update_for_score for one score post (or any batch).
+
+    One query loads every Scorecard with its Par/anchor, one resolves the
+    Stableford game(s), points are computed in memory and StblScore is
+    upserted with a single INSERT .. ON CONFLICT (Game, PID, Hole).
+    """
+    rows = list(
         Scorecard.objects
-        .select_related("GameID", "HoleID", "smID__PID")
-        .filter(id=scorecard_id)
-        .first()
+        .filter(id__in=list(scorecard_ids))
+        .values(
+            "GameID_id", "GameID__AssocGame", "HoleID_id", "HoleID__Par",
+            "RawScore", "NetScore", "smID__PID_id",
+        )
     )
-    if not sc:
+    if not rows:
         return
 
-    anchor_id = _anchor_id_for(sc.GameID)
-    stbl_game = _stableford_game_for_anchor(anchor_id)
-    if not stbl_game:
+    anchors = {r["GameID__AssocGame"] or r["GameID_id"] for r in rows}
+    stbl_by_anchor = _stableford_games_for_anchors(anchors)
+    if not stbl_by_anchor:
         return  # no Stableford game in this event, nothing to do
 
-    # Compute points from Par/NetScore
-    par = sc.HoleID.Par
-    net = sc.NetScore
-    pts = _points_for(par, net)
-    pid = sc.smID.PID_id
+    objs = []
+    for r in rows:
+        stbl_game_id = stbl_by_anchor.get(r["GameID__AssocGame"] or r["GameID_id"])
+        if stbl_game_id and r["HoleID_id"]:
+            objs.append(_score_row(stbl_game_id, r))
+    _upsert(objs)
+
+def rebuild(stbl_game_id: int):
+    """
+    Recompute every StblScore row for a Stableford game from the anchor
+    game's Scorecard rows (e.g. after teams/format change mid-round).
+    Rows with no backing score are removed.
+    """
+    stbl_game = Games.objects.filter(id=stbl_game_id, Type="Stableford").only("id", "AssocGame").first()
+    if not stbl_game:
+        return
+    anchor_id = _anchor_id_for(stbl_game)
+
+    rows = (
+        Scorecard.objects
+        .filter(GameID_id=anchor_id, HoleID__isnull=False)
+        .values("HoleID_id", "HoleID__Par", "RawScore", "NetScore", "smID__PID_id")
+    )
+    objs = [_score_row(stbl_game.id, r) for r in rows]
 
-    # Upsert one row per (stableford game, pid, hole)
     with transaction.atomic():
-        obj, created = StblScore.objects.get_or_create(
-            Game=stbl_game,
-            PID_id=pid,
-            Hole=sc.HoleID,
-            defaults={"Points": pts, "RawScore": sc.RawScore, "NetScore": net},
-        )
-        if not created:
-            obj.Points   = pts
-            obj.RawScore = sc.RawScore
-            obj.NetScore = net
-            obj.save(update_fields=["Points", "RawScore", "NetScore", "AlterDate"])
+        keep = {(o.PID_id, o.Hole_id) for o in objs}
+        stale = [
+            sid for sid, pid, hole_id in
+            StblScore.objects.filter(Game_id=stbl_game.id).values_list("id", "PID_id", "Hole_id")
+            if (pid, hole_id) not in keep
+        ]
+        if stale:
+            StblScore.objects.filter(id__in=stale).delete()
+        _upsert(objs)
+
+# ---- bulk helpers --------------------------------------------
+
+def _stableford_games_for_anchors(anchor_ids) -> dict[int, int]:
+    """{anchor game id: Stableford game id}; lowest id wins, same as _stableford_game_for_anchor."""
+    out = {}
+    for gid, anchor in (
+        Games.objects
+        .filter(Type="Stableford", AssocGame__in=list(anchor_ids))
+        .order_by("-id")
+        .values_list("id", "AssocGame")
+    ):
+        out[anchor] = gid
+    return out
+
+def _score_row(stbl_game_id: int, r: dict) -> StblScore:
+    net = r["NetScore"]
+    return StblScore(
+        Game_id=stbl_game_id,
+        PID_id=r["smID__PID_id"],
+        Hole_id=r["HoleID_id"],
+        Points=_points_for(r["HoleID__Par"], net),
+        RawScore=r["RawScore"],
+        NetScore=net,
+    )
+
+def _upsert(objs: list[StblScore]):
+    if not objs:
+        return
+    # Upsert one row per (stableford game, pid, hole); Postgres rejects an
+    # ON CONFLICT batch that hits the same key twice, so last write wins here
+    by_key = {(o.Game_id, o.PID_id, o.Hole_id): o for o in objs}
+    StblScore.objects.bulk_create(
+        list(by_key.values()),
+        update_conflicts=True,
+        unique_fields=["Game", "PID", "Hole"],
+        update_fields=["Points", "RawScore", "NetScore", "AlterDate"],
+    )
@@ -0,0 +1,321 @@
+# GRPR/services/stats.py
+"""
+Season statistics aggregates.
+
+Grouped queries behind statistics_view's heatmaps. Each helper is one query
+whatever the number of players, courses or dates; the views lay the results
+out into matrices in memory. Everything is per Season (GRPR/services/
+seasons.py): heatmaps cover StartDate..EndDate, rankings PlayStart..PlayEnd.
+
+Season cube
+-----------
+The heatmap counts, the partner matrix and every Best Rounds ranking are
+also precomputed into StatsCube by `manage.py refresh_stats_cube` (nightly).
+Readers take the cube row when it was checked within CUBE_MAX_AGE and fall
+back to the live query otherwise, so a missed run only costs speed.
+
+A refresh fingerprints each source table (row count, max id and a checksum
+over the columns the stats read) and rebuilds only the rows whose sources
+changed. Player names are not fingerprinted; use --full after renames.
+A Frozen season's rows are built once and then served as-is, whatever
+their age, and are never refreshed or invalidated.
+
+Rankings cache
+--------------
+`top10_rankings(season)` keeps each stat's rows in the shared cache, keyed
+by stat and season window, for RANKINGS_TTL. Model saves/deletes on the
+source tables (scores, skins, Forty rows, swaps, tee times) call
+`invalidate_rankings(...)`, which after commit drops the cached stats that
+read them and marks their cube rows stale, so the next read recomputes just
+those stats. TeeTimesInd bulk writes and .update() calls are covered by
+models.tee_times_changed; on the other tables they must invalidate
+themselves.
+
+Usage
+-----
+    season = seasons.get(request.GET.get("season"))
+    counts, dates = stats.attendance_counts(season)
+    partners = stats.partner_counts(season)
+    tops = stats.top10_rankings(season)    # {stat: rows}: cache, cube or live
+    stats.invalidate_rankings('SubSwap')   # after a bulk swap write
+    rebuilt, unchanged = stats.refresh_cube()
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Count, F, Max, Q, Sum
+from django.db.models.signals import post_save, post_delete
+from django.utils import timezone
+
+from GRPR.models import (
+    Forty, Players, Scorecard, ScorecardMeta, Season, Skins, StatsCube, SubSwap, TeeTimesInd,
+    tee_times_changed,
+)
+from GRPR.services import oncommit, rankings, seasons
+
+CUBE_MAX_AGE = timedelta(hours=26)      # nightly run plus slack
+RANKINGS_TTL = 60 * 60 * 12             # writes invalidate; TTL only bounds drift
+
+# Source table -> (model, columns folded into the checksum, extra filtered counts).
+# The checksum Σ(col × id) moves when a value changes on an existing row,
+# including two rows trading values (e.g. a swap exchanging PIDs).
+_SOURCES = {
+    'TeeTimesInd':   (TeeTimesInd, ('PID_id', 'CourseID_id'), {}),
+    'ScorecardMeta': (ScorecardMeta, ('PID_id', 'RawTotal', 'NetTotal'), {}),
+    'Scorecard':     (Scorecard, ('smID_id',), {}),
+    'Skins':         (Skins, ('PlayerID_id',), {}),
+    'Forty':         (Forty, ('PID_id',), {}),
+    'SubSwap':       (SubSwap, ('PID_id',), {'accepted': Q(nStatus='Closed', SubStatus='Accepted')}),
+    'Players':       (Players, ('Member',), {}),
+}
+
+# Best Rounds stat -> source tables its ranking reads
+TOP10_SOURCES = {
+    'net':          ('ScorecardMeta', 'Scorecard', 'Players'),
+    'gross_member': ('ScorecardMeta', 'Scorecard', 'Players'),
+    'skins':        ('Skins', 'Players'),
+    'attendance':   ('TeeTimesInd', 'Players'),
+    'skins_one':    ('Skins', 'Players'),
+    'forty_season': ('Forty', 'Players'),
+    'forty_one':    ('Forty', 'Players'),
+    'trader':       ('SubSwap', 'Players'),
+    'quick_draw':   ('SubSwap', 'Players'),
+    'friends':      ('TeeTimesInd', 'Players'),
+}
+
+
+def attendance_counts(season: Season) -> Tuple[Dict[Tuple[int, int, date], int], List[date]]:
+    """
+    ({(pid, course_id, gDate): rounds}, sorted distinct dates) for the
+    season's tee times. Course and date heatmaps are both sums over this.
+    """
+    data = _cube_read('attendance', '', season)
+    if data is not None:
+        return _decode_attendance(data)
+    return _attendance_live(season)
+
+
+def partner_counts(season: Season) -> Dict[int, Dict[int, int]]:
+    """
+    {pid_a: {pid_b: n}} – how often B was in A's group (same date & slot)
+    during the season. Directional, so both A→B and B→A are present.
+    """
+    data = _cube_read('partners', '', season)
+    if data is not None:
+        out: Dict[int, Dict[int, int]] = defaultdict(dict)
+        for pid_a, pid_b, cnt in data:
+            out[pid_a][pid_b] = cnt
+        return dict(out)
+    return _partners_live(season)
+
+
+def top10_rankings(season: Season) -> Dict[str, list]:
+    """
+    {stat: rows} for every Best Rounds stat in the season's play window.
+    One cache read when warm; misses come from usable cube rows (one query)
+    or are computed live, and are cached for the next page load.
+    """
+    window = _play_window(season)
+    keys = {stat: _rankings_key(window, stat) for stat in rankings.TOP10_FUNC}
+    cached = cache.get_many(keys.values())
+    out = {stat: cached[key] for stat, key in keys.items() if key in cached}
+
+    missing = [stat for stat in rankings.TOP10_FUNC if stat not in out]
+    if missing:
+        fresh = dict(
+            _usable(StatsCube.objects.filter(Kind='top10', Key__in=missing, Window=window), season)
+            .values_list('Key', 'Data')
+        )
+        for stat in missing:
+            out[stat] = _decode_top10(fresh[stat]) if stat in fresh else rankings.TOP10_FUNC[stat](season)
+        cache.set_many({keys[stat]: out[stat] for stat in missing}, RANKINGS_TTL)
+    return {stat: out[stat] for stat in rankings.TOP10_FUNC}
+
+
+def invalidate_rankings(*sources: str) -> None:
+    """
+    Forget the rankings that read any of `sources` (_SOURCES names) once the
+    current transaction commits. Many calls in one transaction collapse
+    into a single flush.
+    """
+    affected = {stat for stat, reads in TOP10_SOURCES.items() if set(reads) & set(sources)}
+    if not affected:
+        return
+    oncommit.on_commit_once('stats.rankings', lambda batches: _flush_rankings(set().union(*batches)), affected)
+
+
+def refresh_cube(full: bool = False, freeze: Optional[str] = None) -> Tuple[List[str], List[str]]:
+    """
+    Bring StatsCube up to date for every season: rebuild the rows whose
+    source fingerprints moved since the last run (all rows with full=True),
+    mark the rest as checked, and drop rows for windows no longer in use.
+    Frozen seasons are only built if their rows are missing. `freeze` names
+    a season to rebuild in full and then freeze.
+    Returns (rebuilt, unchanged) row labels.
+    """
+    now = timezone.now()
+    prints: Dict[str, Dict[str, int]] = {}
+    existing = {(r.Kind, r.Key, r.Window): r for r in StatsCube.objects.all()}
+
+    rebuilt, unchanged, checked, wanted = [], [], [], set()
+    for season, kind, key, window, sources, build in _cube_parts():
+        ident = (kind, key, window)
+        wanted.add(ident)
+        label = f"{season.Name} {kind}:{key}" if key else f"{season.Name} {kind}"
+        row = existing.get(ident)
+        if season.Frozen and row is not None:
+            unchanged.append(label)
+            continue
+        for name in sources:
+            if name not in prints:
+                prints[name] = _fingerprint(name)
+        want = {name: prints[name] for name in sources}
+        if row is not None and not full and season.Name != freeze and row.Sources == want:
+            checked.append(row.id)
+            unchanged.append(label)
+            continue
+        StatsCube.objects.update_or_create(
+            Kind=kind, Key=key, Window=window,
+            defaults={'Data': build(), 'Sources': want, 'BuiltAt': now, 'CheckedAt': now},
+        )
+        rebuilt.append(label)
+
+    StatsCube.objects.filter(id__in=checked).update(CheckedAt=now)
+    StatsCube.objects.filter(id__in=[r.id for i, r in existing.items() if i not in wanted]).delete()
+    if freeze:
+        Season.objects.filter(Name=freeze).update(Frozen=True)
+        seasons.invalidate()
+    return rebuilt, unchanged
+
+
+# ------------------------------------------------------------------ #
+# Internal helpers                                                   #
+# ------------------------------------------------------------------ #
+def _window(season: Season) -> str:
+    return f"{season.Name}:{season.StartDate}..{season.EndDate}"
+
+
+def _play_window(season: Season) -> str:
+    return f"{season.Name}:{season.PlayStart}..{season.PlayEnd}"
+
+
+def _rankings_key(window: str, stat: str) -> str:
+    return f"rankings:{window}:{stat}"
+
+
+def _open_seasons() -> List[Season]:
+    return [s for s in seasons.with_current() if not s.Frozen]
+
+
+def _flush_rankings(stats: Iterable[str]) -> None:
+    stats = sorted(stats)
+    windows = [_play_window(season) for season in _open_seasons()]
+    cache.delete_many([_rankings_key(window, stat) for window in windows for stat in stats])
+    # Backdate the check so readers skip these cube rows until the next refresh
+    (
+        StatsCube.objects
+        .filter(Kind='top10', Key__in=stats, Window__in=windows)
+        .update(CheckedAt=timezone.now() - CUBE_MAX_AGE - timedelta(minutes=1))
+    )
+
+
+def _usable(qs, season: Season):
+    """Cube rows a reader may serve: any age for a frozen season, else fresh."""
+    if season.Frozen:
+        return qs
+    return qs.filter(CheckedAt__gte=timezone.now() - CUBE_MAX_AGE)
+
+
+def _cube_read(kind: str, key: str, season: Season):
+    """Data of a usable cube row, or None when missing/stale."""
+    return (
+        _usable(StatsCube.objects.filter(Kind=kind, Key=key, Window=_window(season)), season)
+        .values_list('Data', flat=True)
+        .first()
+    )
+
+
+def _cube_parts() -> Iterator[Tuple[Season, str, str, str, Tuple[str, ...], Callable[[], object]]]:
+    """(season, kind, key, window, sources, build) for every row the cube holds."""
+    for season in seasons.with_current():
+        yield (season, 'attendance', '', _window(season), ('TeeTimesInd',),
+               lambda s=season: [[pid, cid, d, n] for (pid, cid, d), n in _attendance_live(s)[0].items()])
+        yield (season, 'partners', '', _window(season), ('TeeTimesInd',),
+               lambda s=season: [[a, b, n] for a, row in _partners_live(s).items() for b, n in row.items()])
+        for stat, func in rankings.TOP10_FUNC.items():
+            yield (season, 'top10', stat, _play_window(season), TOP10_SOURCES[stat],
+                   lambda s=season, f=func: f(s))
+
+
+def _fingerprint(name: str) -> Dict[str, int]:
+    model, columns, extra = _SOURCES[name]
+    aggs = {'rows': Count('id'), 'max_id': Max('id')}
+    aggs.update({f"sum_{col}": Sum(F(col) * F('id')) for col in columns})
+    aggs.update({label: Count('id', filter=cond) for label, cond in extra.items()})
+    return {k: int(v or 0) for k, v in model.objects.aggregate(**aggs).items()}
+
+
+def _decode_attendance(data) -> Tuple[Dict[Tuple[int, int, date], int], List[date]]:
+    counts = {}
+    for pid, cid, d, n in data:
+        counts[(pid, cid, date.fromisoformat(d))] = n
+    return counts, sorted({d for _, _, d in counts})
+
+
+def _decode_top10(rows: list) -> list:
+    # JSON stores dates as ISO strings; the template formats real dates
+    return [
+        {**r, 'date': date.fromisoformat(r['date'])} if r.get('date') else r
+        for r in rows
+    ]
+
+
+def _attendance_live(season: Season) -> Tuple[Dict[Tuple[int, int, date], int], List[date]]:
+    counts = {}
+    dates = set()
+    for row in (
+        TeeTimesInd.objects
+        .filter(gDate__range=(season.StartDate, season.EndDate))
+        .values('PID_id', 'CourseID_id', 'gDate')
+        .annotate(n=Count('id'))
+    ):
+        counts[(row['PID_id'], row['CourseID_id'], row['gDate'])] = row['n']
+        dates.add(row['gDate'])
+    return counts, sorted(dates)
+
+
+def _partners_live(season: Season) -> Dict[int, Dict[int, int]]:
+    sql = """
+        SELECT  t1."PID_id", t2."PID_id", COUNT(*)
+        FROM    "TeeTimesInd" t1
+        JOIN    "TeeTimesInd" t2
+          ON    t1."gDate"       = t2."gDate"
+         AND    t1."CourseID_id" = t2."CourseID_id"
+         AND    t1."PID_id"     <> t2."PID_id"
+        WHERE   t1."gDate" BETWEEN %s AND %s
+        GROUP BY t1."PID_id", t2."PID_id";
+    """
+    with connection.cursor() as cur:
+        cur.execute(sql, [season.StartDate, season.EndDate])
+        rows = cur.fetchall()
+
+    out: Dict[int, Dict[int, int]] = defaultdict(dict)
+    for pid_a, pid_b, cnt in rows:
+        out[pid_a][pid_b] = cnt
+    return dict(out)
+
+
+def _invalidate_for_model(sender, **kwargs):
+    invalidate_rankings(sender.__name__)
+
+
+for _model in (TeeTimesInd, ScorecardMeta, Scorecard, Skins, Forty, SubSwap, Players):
+    post_save.connect(_invalidate_for_model, sender=_model, dispatch_uid=f"rankings_{_model.__name__}_saved")
+    post_delete.connect(_invalidate_for_model, sender=_model, dispatch_uid=f"rankings_{_model.__name__}_deleted")
+tee_times_changed.connect(_invalidate_for_model, sender=TeeTimesInd, dispatch_uid="rankings_TeeTimesInd_changed")
@@ -0,0 +1,154 @@
+# GRPR/services/strokes.py
+"""
+Per-tee stroke allocation.
+
+The single source for "how many strokes does NetHDCP n get on hole h" used by
+score entry (NetScore → Forty), scorecard rendering and anything else that
+needs net scores.
+
+Rule (standard allocation): every hole gets NetHDCP // 18 strokes, and the
+holes whose Handicap <= NetHDCP % 18 get one more. A 20 gets 1 everywhere
+and 2 on the two hardest holes; a plus handicap gives strokes back.
+
+A `StrokeTable` is built once per process per CourseTees row (one query) and
+is immutable. It also carries the tee's hole list so callers don't need their
+own CourseHoles query. Tables are dropped when a CourseHoles row for the tee
+is saved/deleted, and rebuilt after MAX_AGE so other workers catch up.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+
+from django.db.models.signals import post_save, post_delete
+
+from GRPR.models import CourseHoles
+
+NET_HDCP_RANGE = range(-10, 55)   # rows precomputed; anything else is computed on demand
+MAX_AGE = 60 * 60                 # seconds a process keeps a table without a local invalidation
+
+_HOLE_FIELDS = ("id", "HoleNumber", "Par", "Yardage", "Handicap")
+
+
+def strokes_for(net_hdcp: int, hole_handicap: int) -> int:
+    """Strokes received on a hole of the given Handicap (1 = hardest)."""
+    base_strokes, addl_strokes = divmod(int(net_hdcp or 0), 18)
+    return base_strokes + (1 if hole_handicap <= addl_strokes else 0)
+
+
+@dataclass(frozen=True)
+class StrokeTable:
+    tee_id: int
+    course_name: Optional[str]
+    holes: Tuple[Mapping, ...]                      # ordered by HoleNumber
+    rows: Mapping[int, Mapping[int, int]]           # NetHDCP -> {HoleNumber: strokes}
+    built_at: float
+
+    def row(self, net_hdcp: int) -> Mapping[int, int]:
+        """{HoleNumber: strokes} for one NetHDCP."""
+        net_hdcp = int(net_hdcp or 0)
+        row = self.rows.get(net_hdcp)
+        if row is None:
+            row = _row_for(net_hdcp, self.holes)
+        return row
+
+    def strokes(self, net_hdcp: int, hole_number: int) -> int:
+        return self.row(net_hdcp).get(hole_number, 0)
+
+    def net_score(self, raw_score: int, net_hdcp: int, hole_number: int) -> int:
+        return raw_score - self.strokes(net_hdcp, hole_number)
+
+
+_TABLES: Dict[int, StrokeTable] = {}
+_TEE_BY_HOLE: Dict[int, int] = {}
+
+
+def for_tee(tee_id: Optional[int]) -> Optional[StrokeTable]:
+    """Stroke table for a CourseTees id (None if the tee has no holes)."""
+    if not tee_id:
+        return None
+    tee_id = int(tee_id)
+    table = _TABLES.get(tee_id)
+    if table is None or time.monotonic() - table.built_at > MAX_AGE:
+        table = _build(tee_id)
+    return table
+
+
+def for_holes(hole_ids: Iterable[int]) -> Dict[int, Tuple[StrokeTable, Mapping]]:
+    """
+    {hole_id: (table, hole)} for CourseHoles ids. Tees not yet loaded in this
+    process cost one query for all of them.
+    """
+    hole_ids = {int(h) for h in hole_ids}
+    unknown = {h for h in hole_ids if h not in _TEE_BY_HOLE}
+    if unknown:
+        for hole_id, tee_id in CourseHoles.objects.filter(id__in=unknown).values_list("id", "CourseTeesID_id"):
+            _TEE_BY_HOLE[hole_id] = tee_id
+
+    out = {}
+    for hole_id in hole_ids:
+        table = for_tee(_TEE_BY_HOLE.get(hole_id))
+        hole = _hole_by_id(table, hole_id) if table else None
+        if hole is not None:
+            out[hole_id] = (table, hole)
+    return out
+
+
+def invalidate(tee_id: Optional[int] = None) -> None:
+    """Drop one tee's table (or all of them) in this process."""
+    if tee_id is None:
+        _TABLES.clear()
+        _TEE_BY_HOLE.clear()
+    else:
+        _TABLES.pop(int(tee_id), None)
+        for hole_id in [h for h, t in _TEE_BY_HOLE.items() if t == int(tee_id)]:
+            _TEE_BY_HOLE.pop(hole_id, None)
+
+
+# ------------------------------------------------------------------ #
+# Internal helpers                                                   #
+# ------------------------------------------------------------------ #
+def _row_for(net_hdcp: int, holes: Tuple[Mapping, ...]) -> Mapping[int, int]:
+    return MappingProxyType({h["HoleNumber"]: strokes_for(net_hdcp, h["Handicap"]) for h in holes})
+
+
+def _hole_by_id(table: StrokeTable, hole_id: int) -> Optional[Mapping]:
+    for h in table.holes:
+        if h["id"] == hole_id:
+            return h
+    return None
+
+
+def _build(tee_id: int) -> Optional[StrokeTable]:
+    rows = list(
+        CourseHoles.objects
+        .filter(CourseTeesID_id=tee_id)
+        .order_by("HoleNumber")
+        .values(*_HOLE_FIELDS, "CourseTeesID__CourseName")
+    )
+    if not rows:
+        return None
+
+    holes = tuple(MappingProxyType({k: r[k] for k in _HOLE_FIELDS}) for r in rows)
+    table = StrokeTable(
+        tee_id=tee_id,
+        course_name=rows[0]["CourseTeesID__CourseName"],
+        holes=holes,
+        rows=MappingProxyType({n: _row_for(n, holes) for n in NET_HDCP_RANGE}),
+        built_at=time.monotonic(),
+    )
+    _TABLES[tee_id] = table
+    for h in holes:
+        _TEE_BY_HOLE[h["id"]] = tee_id
+    return table
+
+
+def _invalidate_on_hole_change(sender, instance, **kwargs):
+    invalidate(instance.CourseTeesID_id)
+
+
+post_save.connect(_invalidate_on_hole_change, sender=CourseHoles, dispatch_uid="strokes_hole_saved")
+post_delete.connect(_invalidate_on_hole_change, sender=CourseHoles, dispatch_uid="strokes_hole_deleted")
@@ -0,0 +1,101 @@
+# GRPR/services/subswap.py
+"""
+Sub/swap dashboard loader.
+
+The sub/swap page shows six tables: the player's upcoming tee times, the sub
+and swap offers they received, counter offers made on their swaps, and what
+they have offered or countered themselves. All of it comes from a fixed
+number of set-based queries, whatever the number of open offers:
+
+    1. the player's upcoming tee times
+    2. every open SubSwap row of the player
+    3. the Offer/Counter rows linked (by SwapID) to those rows
+    4. the foursomes of every tee time referenced above (teesheet)
+
+Usage
+-----
+    board = subswap.dashboard(player.id, since=today)
+    for row in board.received("Sub"):
+        board.offer_pid(row), board.other_players(row.TeeTimeIndID)
+    for offer, counter in board.counters():
+        ...
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from GRPR.models import SubSwap, TeeTimesInd
+from GRPR.services import teesheet
+
+
+@dataclass
+class Dashboard:
+    player_id: int
+    schedule: List[TeeTimesInd]
+    open_rows: List[SubSwap]
+    offers: Dict[Tuple[int, str], SubSwap] = field(default_factory=dict)   # (SwapID, nType) -> Offer row
+    counters_by_swap: Dict[int, List[SubSwap]] = field(default_factory=dict)
+    groups: Dict[teesheet.Key, teesheet.Foursome] = field(default_factory=dict)
+
+    def mine(self, nType: str, SubType: str) -> List[SubSwap]:
+        """The player's own open rows of one kind, in id order."""
+        return [r for r in self.open_rows if r.nType == nType and r.SubType == SubType]
+
+    def received(self, nType: str) -> List[SubSwap]:
+        """Open offers the player received, soonest tee time first."""
+        return sorted(self.mine(nType, "Received"), key=lambda r: r.TeeTimeIndID.gDate)
+
+    def offer_pid(self, row: SubSwap) -> Optional[int]:
+        """Who made the offer a Received row belongs to (None if it is gone)."""
+        offer = self.offers.get((row.SwapID, row.nType))
+        return offer.PID_id if offer is not None else None
+
+    def counters(self) -> Iterator[Tuple[SubSwap, SubSwap]]:
+        """(open swap offer, open counter) pairs for the player's swap offers."""
+        for mine in self.mine("Swap", "Offer"):
+            offer = self.offers.get((mine.SwapID, "Swap"))
+            if offer is None or offer.nStatus != "Open":
+                continue
+            for counter in self.counters_by_swap.get(mine.SwapID, []):
+                yield offer, counter
+
+    def other_players(self, tee_time: TeeTimesInd) -> str:
+        group = self.groups.get(teesheet.key(tee_time))
+        return group.names(exclude_pid=self.player_id) if group else ""
+
+
+def dashboard(player_id: int, *, since: date) -> Dashboard:
+    """Everything the sub/swap page needs for one player, in four queries."""
+    schedule = list(
+        TeeTimesInd.objects.filter(PID=player_id, gDate__gte=since)
+        .select_related("CourseID")
+        .order_by("gDate")
+    )
+    open_rows = list(
+        SubSwap.objects.filter(PID=player_id, nStatus="Open")
+        .select_related("TeeTimeIndID__CourseID")
+        .order_by("id")
+    )
+    board = Dashboard(player_id=player_id, schedule=schedule, open_rows=open_rows)
+
+    mine = SubSwap.objects.filter(PID=player_id, nStatus="Open", SubType__in=("Received", "Offer"))
+    linked = (
+        SubSwap.objects.filter(SwapID__in=mine.values("SwapID"), SubType__in=("Offer", "Counter"))
+        .select_related("PID", "TeeTimeIndID__CourseID")
+        .order_by("id")
+    )
+    for row in linked:
+        if row.SubType == "Offer":
+            seen = board.offers.get((row.SwapID, row.nType))
+            if seen is None or (seen.nStatus != "Open" and row.nStatus == "Open"):
+                board.offers[(row.SwapID, row.nType)] = row
+        elif row.nType == "Swap" and row.nStatus == "Open":
+            board.counters_by_swap.setdefault(row.SwapID, []).append(row)
+
+    board.groups = teesheet.for_tee_times(
+        schedule + [r.TeeTimeIndID for r in open_rows if r.SubType == "Received"]
+    )
+    return board
@@ -0,0 +1,342 @@
+# GRPR/services/synthetic.py
+"""
+Synthetic league generator for load testing and benchmarks.
+
+`generate(...)` writes a self-contained league into the current database:
+crews with players (each linked to a User), courses with 18-hole tees, a
+season of Saturday tee times, played Saturdays with ScorecardMeta/Scorecard
+rows and every derived game (Skins, Forty, Gas Cup, Stableford), plus
+sub/swap traffic with its Log rows. The first unplayed Saturday is set up
+like game setup leaves it (games, metas, pairs, teams, no scores) so
+`replay.saturday(...)` can play it through the test client.
+
+Everything is seeded from `seed`, written with bulk_create inside one
+transaction, and named "Synthetic ..." so it is easy to spot. It is meant
+for a scratch or test database (see the `synth_league` and `bench_saturday`
+commands), never production.
+
+Usage
+-----
+    league = synthetic.generate(players=48, courses=2, played=10, seed=7)
+    league.replay      # [SimpleNamespace(game=..., groups={slot: [Players]}, ...)]
+    league.counts      # {"Players": 48, "TeeTimesInd": 960, ...}
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from collections import Counter
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+
+from GRPR.models import (
+    CourseHoles, Courses, CourseTees, Crews, Forty, Games, GameInvites, GasCupPair, Log,
+    Players, Scorecard, ScorecardMeta, StblTeam, SubSwap, TeeTimesInd,
+)
+from GRPR.services import gascup, live, seasons, skins as skins_svc, stableford as stbl, stats, strokes
+
+HOLE_HANDICAPS = [7, 15, 1, 11, 3, 17, 9, 13, 5, 8, 16, 2, 12, 4, 18, 10, 14, 6]
+HOLE_PARS      = [4, 3, 5, 4, 4, 3, 4, 5, 4, 4, 3, 5, 4, 4, 3, 4, 5, 4]
+FIRST_SLOT     = (8, 0)    # tee times run every SLOT_MINUTES from 8:00
+SLOT_MINUTES   = 10
+SIT_OUT        = 0.1       # share of players not playing on a given Saturday
+SUB_OFFERS     = 0.05      # share of tee times offered as a sub (swaps: half that)
+FORTY_SCORES   = 40
+
+
+def generate(
+    *,
+    crews: int = 1,
+    players: int = 48,
+    courses: int = 2,
+    weeks: Optional[int] = None,
+    played: Optional[int] = None,
+    season=None,
+    seed: int = 1,
+) -> SimpleNamespace:
+    """
+    Write a synthetic league and return what was made.
+
+    crews × players play one of `courses` courses every Saturday of the
+    season's play window (first `weeks` Saturdays if given). The first
+    `played` Saturdays (default: half) have full scores; the next one is the
+    replay Saturday.
+    """
+    rng = random.Random(seed)
+    season = season or seasons.current()
+    saturdays = _saturdays(season.PlayStart, season.PlayEnd)[:weeks]
+    played = len(saturdays) // 2 if played is None else min(played, len(saturdays) - 1)
+
+    with transaction.atomic():
+        tees = _make_tees(courses)
+        out = SimpleNamespace(crews=[], players=[], tees=tees, saturdays=saturdays, replay=[], counts=Counter())
+        for c in range(crews):
+            crew, roster, slots = _make_crew(c, players, courses)
+            out.crews.append(crew)
+            out.players.extend(roster)
+            out.counts["Players"] += len(roster)
+
+            for week, gdate in enumerate(saturdays):
+                course = week % courses
+                tee = tees[course]
+                groups = _tee_times(rng, crew, roster, slots[course], gdate, out.counts)
+                if week < played:
+                    _play_saturday(rng, crew, tee, gdate, groups, week, out.counts)
+                elif week == played:
+                    out.replay.append(_setup_saturday(crew, tee, gdate, groups, out.counts))
+            _subswap_traffic(rng, crew, saturdays, saturdays[played], out.counts)
+
+        # bulk writes skip the model signals that normally do this
+        stats.invalidate_rankings("TeeTimesInd", "ScorecardMeta", "Scorecard", "Skins", "Forty", "SubSwap", "Players")
+        for day in out.replay:
+            live.touch(day.game.id)
+    out.counts = dict(out.counts)
+    return out
+
+
+# ------------------------------------------------------------------ #
+# Internal helpers                                                   #
+# ------------------------------------------------------------------ #
+def _saturdays(start: date, end: date) -> List[date]:
+    first = start + timedelta(days=(5 - start.weekday()) % 7)
+    return [first + timedelta(weeks=i) for i in range((end - first).days // 7 + 1)]
+
+
+def _noon(d: date):
+    return timezone.make_aware(datetime.combine(d, time(12)))
+
+
+def _slot_label(i: int) -> str:
+    minutes = FIRST_SLOT[0] * 60 + FIRST_SLOT[1] + i * SLOT_MINUTES
+    return f"{minutes // 60}:{minutes % 60:02d}"
+
+
+def _make_tees(courses: int) -> List[CourseTees]:
+    tees = CourseTees.objects.bulk_create([
+        CourseTees(
+            CourseID=None, CourseName=f"Synthetic Links {n + 1}", TeeID=1, TeeName="White",
+            CourseRating=Decimal("70.5"), SlopeRating=125, Par=sum(HOLE_PARS), Yards=6400,
+        )
+        for n in range(courses)
+    ])
+    CourseHoles.objects.bulk_create([
+        CourseHoles(
+            CourseTeesID=tee, HoleNumber=n, Par=HOLE_PARS[n - 1],
+            Yardage=380, Handicap=HOLE_HANDICAPS[(n - 1 + 2 * i) % 18],
+        )
+        for i, tee in enumerate(tees) for n in range(1, 19)
+    ])
+    return tees
+
+
+def _make_crew(c: int, n_players: int, n_courses: int):
+    crew = Crews.objects.create(
+        crewName=f"Synthetic Crew {c + 1}", crewCaptain=0, email="synthetic@example.com", mobile="0",
+    )
+    users = User.objects.bulk_create([
+        User(username=f"synthetic-{crew.id}-{i}", password="!", first_name=f"Syn{i}", last_name=f"Player{i:03d}")
+        for i in range(n_players)
+    ])
+    roster = Players.objects.bulk_create([
+        Players(
+            user=u, CrewID=crew.id, FirstName=u.first_name, LastName=u.last_name,
+            Email=f"{u.username}@example.com", Mobile=f"+1555{crew.id % 1000:03d}{i:04d}",
+            Member=1, Index=Decimal(i % 25),
+        )
+        for i, u in enumerate(users)
+    ])
+    crew.crewCaptain = roster[0].id
+    crew.save(update_fields=["crewCaptain"])
+
+    per_course = math.ceil(n_players / 4)
+    slots = []
+    for course in range(n_courses):
+        slots.append(Courses.objects.bulk_create([
+            Courses(crewID=crew.id, courseName=f"Synthetic Links {course + 1}", courseTimeSlot=_slot_label(s))
+            for s in range(per_course)
+        ]))
+    return crew, roster, slots
+
+
+def _tee_times(rng, crew, roster, slots, gdate, counts) -> Dict[str, list]:
+    """Foursomes for one Saturday: {slot label: [(Players, TeeTimesInd), ...]}."""
+    playing = [p for p in roster if rng.random() >= SIT_OUT]
+    rng.shuffle(playing)
+    rows = TeeTimesInd.objects.bulk_create([
+        TeeTimesInd(CrewID=crew.id, gDate=gdate, PID=p, CourseID=slots[i // 4])
+        for i, p in enumerate(playing)
+    ])
+    counts["TeeTimesInd"] += len(rows)
+    groups: Dict[str, list] = {}
+    for i, (p, tt) in enumerate(zip(playing, rows)):
+        groups.setdefault(slots[i // 4].courseTimeSlot, []).append((p, tt))
+    return groups
+
+
+def _games_for(crew, tee, gdate, creator, types, counts) -> Dict[str, Games]:
+    anchor = Games.objects.create(
+        CreateID=creator, CrewID=crew.id, CreateDate=gdate, PlayDate=gdate,
+        CourseTeesID=tee, Status="Live", Type="Skins", Format="Full Handicap",
+    )
+    anchor.AssocGame = anchor.id   # anchors point at themselves, as game setup does
+    anchor.save(update_fields=["AssocGame"])
+    games = {"Skins": anchor}
+    for t in types:
+        games[t] = Games.objects.create(
+            CreateID=creator, CrewID=crew.id, CreateDate=gdate, PlayDate=gdate,
+            CourseTeesID=tee, Status="Live", Type=t, AssocGame=anchor.id,
+            Format="Individual" if t == "Stableford" else None,
+            NumScores=FORTY_SCORES if t == "Forty" else None,
+            Min1=3 if t == "Forty" else None, Min18=3 if t == "Forty" else None,
+        )
+    counts["Games"] += len(games)
+    return games
+
+
+def _setup_players(games, crew, tee, gdate, groups, creator, counts) -> List[ScorecardMeta]:
+    """ScorecardMeta, invites, Gas Cup pairs and Stableford teams for a Saturday."""
+    anchor = games["Skins"]
+    metas, invites, pairs, teams = [], [], [], []
+    for slot, members in groups.items():
+        for p, tt in members:
+            hdcp = int(p.Index or 0)
+            metas.append(ScorecardMeta(
+                GameID=anchor, CreateDate=gdate, CreateID=creator.id, PlayDate=gdate, PID=p, CrewID=crew,
+                CourseID=tee.id, TeeID=tee, Index=p.Index, RawHDCP=Decimal(hdcp), NetHDCP=hdcp, GroupID=slot,
+            ))
+            invites.append(GameInvites(GameID=anchor, AlterDate=gdate, PID=p, TTID=tt, Status="Accepted"))
+        if "GasCup" in games:
+            ps = [p for p, _ in members]
+            pairs.append(GasCupPair(Game=games["GasCup"], PID1=ps[0], PID2=ps[1] if len(ps) > 1 else None, Team="PGA"))
+            if len(ps) > 2:
+                pairs.append(GasCupPair(Game=games["GasCup"], PID1=ps[2], PID2=ps[3] if len(ps) > 3 else None, Team="LIV"))
+    if "Stableford" in games:
+        teams = [
+            StblTeam(Game=games["Stableford"], PID=m.PID, TeamID=i + 1, TeamName=m.PID.LastName)
+            for i, m in enumerate(metas)
+        ]
+    metas = ScorecardMeta.objects.bulk_create(metas)
+    GameInvites.objects.bulk_create(invites)
+    GasCupPair.objects.bulk_create(pairs)
+    StblTeam.objects.bulk_create(teams)
+    counts["ScorecardMeta"] += len(metas)
+    counts["GasCupPair"] += len(pairs)
+    counts["StblTeam"] += len(teams)
+    return metas
+
+
+def _setup_saturday(crew, tee, gdate, groups, counts) -> SimpleNamespace:
+    creator = next(iter(groups.values()))[0][0]
+    games = _games_for(crew, tee, gdate, creator, ("Forty", "GasCup", "Stableford"), counts)
+    metas = _setup_players(games, crew, tee, gdate, groups, creator, counts)
+    return SimpleNamespace(
+        game=games["Skins"], games=games, tee=tee, play_date=gdate, metas=metas,
+        groups={slot: [p for p, _ in members] for slot, members in groups.items()},
+        holes=list(CourseHoles.objects.filter(CourseTeesID=tee).order_by("HoleNumber")),
+    )
+
+
+def _play_saturday(rng, crew, tee, gdate, groups, week, counts) -> None:
+    """A finished Saturday: every hole scored, derived games rebuilt."""
+    creator = next(iter(groups.values()))[0][0]
+    team_game = "GasCup" if week % 2 == 0 else "Stableford"
+    games = _games_for(crew, tee, gdate, creator, ("Forty", team_game), counts)
+    metas = _setup_players(games, crew, tee, gdate, groups, creator, counts)
+
+    table = strokes.for_tee(tee.id)
+    holes = list(CourseHoles.objects.filter(CourseTeesID=tee).order_by("HoleNumber"))
+    played_at = _noon(gdate)
+    cards, forty = [], []
+    for meta in metas:
+        totals = Counter()
+        for hole in holes:
+            raw = max(1, hole.Par + rng.choice((-1, 0, 0, 1, 1, 1, 2, 2, 3)))
+            net = table.net_score(raw, meta.NetHDCP, hole.HoleNumber)
+            half = "OUT" if hole.HoleNumber <= 9 else "IN"
+            totals["Raw" + half] += raw
+            totals["Net" + half] += net
+            totals["Putts"] += 2
+            cards.append(Scorecard(
+                smID=meta, GameID=meta.GameID, CreateDate=played_at, AlterDate=played_at, AlterID=meta.PID,
+                HoleID=hole, RawScore=raw, NetScore=net, Putts=2,
+            ))
+        for field, value in totals.items():
+            setattr(meta, field, value)
+        meta.RawTotal = totals["RawOUT"] + totals["RawIN"]
+        meta.NetTotal = totals["NetOUT"] + totals["NetIN"]
+
+    by_slot: Dict[str, List[Scorecard]] = {}
+    for sc in cards:
+        by_slot.setdefault(sc.smID.GroupID, []).append(sc)
+    for slot, rows in by_slot.items():
+        for sc in rng.sample(rows, min(FORTY_SCORES, len(rows))):
+            forty.append(Forty(
+                CreateID=sc.smID.PID, CrewID=crew.id, GameID=games["Forty"], HoleNumber=sc.HoleID,
+                PID=sc.smID.PID, GroupID=slot, RawScore=sc.RawScore, NetScore=sc.NetScore, Par=sc.HoleID.Par,
+            ))
+
+    cards = Scorecard.objects.bulk_create(cards)
+    ScorecardMeta.objects.bulk_update(metas, ["RawOUT", "NetOUT", "RawIN", "NetIN", "RawTotal", "NetTotal", "Putts"])
+    Forty.objects.bulk_create(forty)
+    counts["Scorecard"] += len(cards)
+    counts["Forty"] += len(forty)
+
+    skins_svc.rebuild(games["Skins"].id)
+    if team_game == "GasCup":
+        gascup.update_for_scores([sc.id for sc in cards])
+    else:
+        stbl.rebuild(games["Stableford"].id)
+    Games.objects.filter(AssocGame=games["Skins"].id).update(Status="Closed")
+
+
+def _subswap_traffic(rng, crew, saturdays, replay_date, counts) -> None:
+    """
+    Sub and swap offers across the season: accepted and closed before the
+    replay Saturday, still open after it. Each offer reaches a handful of
+    available players, with one Log row per text.
+    """
+    tee_times = list(
+        TeeTimesInd.objects.filter(CrewID=crew.id, gDate__in=saturdays).select_related("PID")
+    )
+    playing = {}
+    for tt in tee_times:
+        playing.setdefault(tt.gDate, set()).add(tt.PID_id)
+    roster = list(Players.objects.filter(CrewID=crew.id).values_list("id", flat=True))
+
+    offers = [(tt, "Sub") for tt in tee_times if rng.random() < SUB_OFFERS]
+    offers += [(tt, "Swap") for tt in tee_times if rng.random() < SUB_OFFERS / 2]
+    for tt, kind in offers:
+        past = tt.gDate < replay_date
+        asked = _noon(tt.gDate - timedelta(days=3))
+        offer = SubSwap.objects.create(
+            RequestDate=asked, PID_id=tt.PID_id, TeeTimeIndID=tt, nType=kind, SubType="Offer",
+            nStatus="Closed" if past else "Open", SubStatus="Accepted" if past else None,
+            Msg=f"Synthetic {kind.lower()} offer for {tt.gDate}", OtherPlayers="",
+        )
+        offer.SwapID = offer.id
+        offer.save(update_fields=["SwapID"])
+        available = [pid for pid in roster if pid not in playing[tt.gDate]]
+        received = rng.sample(available, min(6, len(available)))
+        SubSwap.objects.bulk_create([
+            SubSwap(
+                RequestDate=asked, PID_id=pid, TeeTimeIndID=tt, nType=kind, SubType="Received",
+                nStatus="Closed" if past else "Open", Msg=offer.Msg, OtherPlayers="", SwapID=offer.id,
+            )
+            for pid in received
+        ])
+        Log.objects.bulk_create([
+            Log(
+                SentDate=asked, Type=f"{kind} Offer Sent", MessageID="synthetic", RequestDate=asked,
+                OfferID=tt.PID_id, ReceiveID=pid, RefID=offer.id, Msg=offer.Msg, To_number="0",
+            )
+            for pid in received
+        ])
+        counts["SubSwap"] += 1 + len(received)
+        counts["Log"] += len(received)
@@ -0,0 +1,243 @@
+# GRPR/services/teesheet.py
+"""
+Shared tee-sheet loader.
+
+The tee sheet, a player's schedule, the sub/swap page and every sub/swap
+step need the same thing: who is in the foursome for a tee time. Instead of
+one "other players" query per tee time, callers load the TeeTimesInd rows
+they need once (Players and Courses joined) and group them into foursomes
+keyed by (gDate, CourseID).
+
+Per-date cache
+--------------
+A Saturday's sheet is read far more often than it changes, so the tee sheet,
+the home page and the weekly e-mail read plain foursome dicts per gDate from
+the shared cache (`for_date` / `for_dates`, plus `dates()` for the list of
+dates). Every TeeTimesInd write drops the dates it touched once it commits:
+saves and deletes through post_save/post_delete, queryset .update() and
+bulk writes through models.tee_times_changed. The cached groups carry player
+names, so saving a Players row drops every date that player is on.
+
+Usage
+-----
+    sheet = teesheet.load(dates=[gDate])                  # one query
+    for group in sheet.values():
+        group.course.courseTimeSlot, group.names()
+
+    groups = teesheet.for_tee_times(my_tee_times)       # one query
+    groups[teesheet.key(tt)].names(exclude_pid=me.id)   # "Al Bee, Cy Dee"
+
+    for group in teesheet.for_date(gDate):              # cached
+        group["time_slot"], teesheet.player_names(group)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.shortcuts import get_object_or_404
+
+from GRPR.models import Courses, Players, TeeTimesInd, tee_times_changed
+from GRPR.services import oncommit
+
+Key = Tuple[date, int]   # (gDate, CourseID)
+
+CACHE_TTL = 60 * 60 * 12   # backstop for writes made outside the ORM
+
+
+@dataclass
+class Foursome:
+    gDate: date
+    course: Courses
+    tee_times: List[TeeTimesInd] = field(default_factory=list)
+
+    @property
+    def players(self) -> List[Players]:
+        return [tt.PID for tt in self.tee_times]
+
+    def names(self, exclude_pid: Optional[int] = None) -> str:
+        """'First Last, First Last' for the group, optionally without one player."""
+        return ", ".join(
+            f"{tt.PID.FirstName} {tt.PID.LastName}" for tt in self.tee_times if tt.PID_id != exclude_pid
+        )
+
+
+def key(tee_time: TeeTimesInd) -> Key:
+    return (tee_time.gDate, tee_time.CourseID_id)
+
+
+def load(
+    *,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    dates: Optional[Iterable[date]] = None,
+    course_ids: Optional[Iterable[int]] = None,
+) -> Dict[Key, Foursome]:
+    """
+    Foursomes for a date range and/or set of dates (and optionally only some
+    Courses rows), in one query. Ordered by date, then CourseID.
+    """
+    qs = TeeTimesInd.objects.select_related("PID", "CourseID")
+    if start is not None:
+        qs = qs.filter(gDate__gte=start)
+    if end is not None:
+        qs = qs.filter(gDate__lte=end)
+    if dates is not None:
+        qs = qs.filter(gDate__in=list(dates))
+    if course_ids is not None:
+        qs = qs.filter(CourseID_id__in=list(course_ids))
+    return _group(qs.order_by("gDate", "CourseID_id", "id"))
+
+
+def for_tee_times(tee_times: Iterable[TeeTimesInd]) -> Dict[Key, Foursome]:
+    """The foursome of each given tee time, in one query (none if empty)."""
+    wanted = {key(tt) for tt in tee_times}
+    if not wanted:
+        return {}
+    sheet = load(dates={d for d, _ in wanted}, course_ids={c for _, c in wanted})
+    return {k: group for k, group in sheet.items() if k in wanted}
+
+
+def tee_time_details(tt_id, player_id) -> dict:
+    """
+    One tee time plus the names of everyone else in its group, as used by
+    the sub/swap flow (utils.get_tee_time_details). 404 if tt_id is unknown.
+    """
+    teetime = get_object_or_404(TeeTimesInd.objects.select_related("CourseID"), id=tt_id)
+    group = for_tee_times([teetime]).get(key(teetime))
+    course = teetime.CourseID
+    return {
+        'gDate': teetime.gDate,
+        'gDate_display': teetime.gDate.strftime('%B %d, %Y'),
+        'course': course,
+        'tt_pid': teetime.PID_id,
+        'course_name': course.courseName,
+        'course_time_slot': course.courseTimeSlot,
+        'other_players': group.names(exclude_pid=_int_or_none(player_id)) if group else '',
+    }
+
+
+def for_date(gDate) -> List[dict]:
+    """Cached foursomes for one date: [{"course_id", "course", "time_slot", "players"}, ...]."""
+    return for_dates([gDate])[_as_date(gDate)]
+
+
+def for_dates(dates: Iterable) -> Dict[date, List[dict]]:
+    """
+    Cached foursomes for several dates: one cache read, plus one query for
+    all the dates that missed.
+    """
+    dates = sorted({_as_date(d) for d in dates})
+    hits = cache.get_many([_date_key(d) for d in dates])
+    out = {d: hits[_date_key(d)] for d in dates if _date_key(d) in hits}
+    missing = [d for d in dates if d not in out]
+    if missing:
+        built = {d: [] for d in missing}
+        for (d, _course), group in load(dates=missing).items():
+            built[d].append(_as_dict(group))
+        cache.set_many({_date_key(d): groups for d, groups in built.items()}, CACHE_TTL)
+        out.update(built)
+    return out
+
+
+def dates() -> List[date]:
+    """Every date that has tee times, oldest first (cached)."""
+    found = cache.get(_DATES_KEY)
+    if found is None:
+        found = list(TeeTimesInd.objects.order_by('gDate').values_list('gDate', flat=True).distinct())
+        cache.set(_DATES_KEY, found, CACHE_TTL)
+    return found
+
+
+def player_names(group: dict, exclude_pid: Optional[int] = None) -> str:
+    """'First Last, First Last' for a cached group."""
+    return ", ".join(
+        f"{p['first_name']} {p['last_name']}" for p in group["players"] if p["id"] != exclude_pid
+    )
+
+
+def invalidate(dates: Iterable) -> None:
+    """
+    Drop the cached sheets for `dates` (and the date list) once the current
+    transaction commits; many calls in one transaction collapse into one.
+    """
+    dates = {_as_date(d) for d in dates if d}
+    if not dates:
+        return
+    oncommit.on_commit_once('teesheet.invalidate', _drop_dates, dates)
+
+
+# ------------------------------------------------------------------ #
+# Internal helpers                                                   #
+# ------------------------------------------------------------------ #
+_DATES_KEY = "teesheet:dates"
+
+
+def _date_key(d: date) -> str:
+    return f"teesheet:{d.isoformat()}"
+
+
+def _as_date(d) -> date:
+    if isinstance(d, datetime):
+        return d.date()
+    return d if isinstance(d, date) else date.fromisoformat(str(d))
+
+
+def _as_dict(group: Foursome) -> dict:
+    return {
+        "course_id": group.course.id,
+        "course": group.course.courseName,
+        "time_slot": group.course.courseTimeSlot,
+        "players": [
+            {"id": p.id, "first_name": p.FirstName, "last_name": p.LastName} for p in group.players
+        ],
+    }
+
+
+def _drop_dates(batches) -> None:
+    dates = set().union(*batches)
+    cache.delete_many([_DATES_KEY] + [_date_key(d) for d in sorted(dates)])
+
+
+def _group(rows: Iterable[TeeTimesInd]) -> Dict[Key, Foursome]:
+    out: Dict[Key, Foursome] = {}
+    for tt in rows:
+        group = out.get(key(tt))
+        if group is None:
+            group = out[key(tt)] = Foursome(gDate=tt.gDate, course=tt.CourseID)
+        group.tee_times.append(tt)
+    return out
+
+
+def _int_or_none(val) -> Optional[int]:
+    try:
+        return int(val)
+    except (TypeError, ValueError):
+        return None
+
+
+def _saved(sender, instance, **kwargs):
+    invalidate({instance.gDate, getattr(instance, '_loaded_gDate', None)})
+
+
+def _dates_changed(sender, dates, **kwargs):
+    invalidate(dates)
+
+
+_NAME_FIELDS = {'FirstName', 'LastName'}
+
+
+def _player_saved(sender, instance, created, update_fields=None, **kwargs):
+    if created or (update_fields is not None and not _NAME_FIELDS & set(update_fields)):
+        return
+    invalidate(TeeTimesInd.objects.filter(PID=instance).values_list('gDate', flat=True).distinct())
+
+
+post_save.connect(_saved, sender=TeeTimesInd, dispatch_uid="teesheet_saved")
+post_delete.connect(_saved, sender=TeeTimesInd, dispatch_uid="teesheet_deleted")
+tee_times_changed.connect(_dates_changed, sender=TeeTimesInd, dispatch_uid="teesheet_dates_changed")
+post_save.connect(_player_saved, sender=Players, dispatch_uid="teesheet_player_saved")
@@ -0,0 +1,31 @@
+// GRPR/static/js/live_feed.js
+// Long-polls /live/updates/ for one game and hands each batch of changes to
+// onChange(payload). The server says how long to wait between polls.
+function liveFeed(url, gameId, version, onChange) {
+    let since = version;
+
+    function poll() {
+        fetch(`${url}?game_id=${encodeURIComponent(gameId)}&since=${since}`, {credentials: 'same-origin'})
+            .then(resp => resp.ok ? resp.json() : Promise.reject(resp.status))
+            .then(data => {
+                if (data.version !== since) {
+                    since = data.version;
+                    onChange(data);
+                }
+                setTimeout(poll, data.retry_ms || 5000);
+            })
+            .catch(() => setTimeout(poll, 15000));
+    }
+
+    setTimeout(poll, 1000);
+}
+
+// Set the text of the [data-field] cells inside `row` from `values`.
+function liveFill(row, values) {
+    Object.entries(values).forEach(([field, value]) => {
+        const cell = row.querySelector(`[data-field="${field}"]`);
+        if (cell) {
+            cell.textContent = (value === null || value === undefined) ? '' : value;
+        }
+    });
+}
@@ -148,6 +148,7 @@ urlpatterns = [
     path('hole_score/', views.hole_score_view, name='hole_score_view'),
     path('hole_input_score/', views.hole_input_score_view, name='hole_input_score_view'),
     path('hole_display/', views.hole_display_view, name='hole_display_view'),
+    path('live/updates/', views.live_updates_view, name='live_updates_view'),
 
 
 
@@ -1,12 +1,14 @@
 import os
 import json
+import logging
 from django.shortcuts import render, get_object_or_404, redirect
 from django.http import HttpResponse, JsonResponse, HttpResponseBadRequest
 from django.utils import timezone
 from django.utils.timezone import now
 from django.utils.dateparse import parse_date
+from django.utils.cache import get_conditional_response, patch_cache_control # ETag/304 on live round pages
 from GRPR.models import Crews, Courses, TeeTimesInd, Players, SubSwap, Log, LoginActivity, SMSResponse, Xdates, Games, GameInvites, CourseTees, ScorecardMeta, Scorecard, CourseHoles, Skins, AutomatedMessages, Forty, GasCupPair, GasCupScore, GameSetupDraft, StblTeam, StblScore, FortyGroupRule
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from django.conf import settings  # Import settings
 from django.contrib import messages
 from django.contrib.auth import login as auth_login # for user activity tracking on Admin page
@@ -23,13 +25,11 @@ from django.db.models import Q, Count, F, Func, Subquery, OuterRef, Max, Min, In
 from django.db.models.functions import Cast
 from django.db import transaction, connection
 from django.urls import reverse_lazy, reverse
-from django.core.mail import send_mail
 from django.core.management import call_command
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_email, EmailValidator
 from GRPR.utils import get_open_subswap_or_error, check_player_availability, get_tee_time_details, parse_date_any, get_toggles
-from GRPR.services import gascup, stableford as stbl
-from twilio.rest import Client # Import the Twilio client
+from GRPR.services import gascup, stableford as stbl, scoring, scorecard as scorecard_svc, live, stats, rankings, seasons, request_metrics, teesheet, subswap, availability, outbox, messaging
 from twilio.twiml.messaging_response import MessagingResponse
 from decimal import Decimal, InvalidOperation
 import math
@@ -39,6 +39,15 @@ from itertools import chain
 import re
 from typing import Optional, Dict, Tuple
 
+# Leveled diagnostics, one logger per area so each can be turned up on its
+# own (LOG_LEVELS="GRPR.scoring=DEBUG" in settings). Pass payloads as %s
+# arguments: querysets and dicts are only rendered when the level is on.
+log = logging.getLogger(__name__)
+scoring_log = logging.getLogger("GRPR.scoring")
+subswap_log = logging.getLogger("GRPR.subswap")
+messaging_log = logging.getLogger("GRPR.messaging")
+setup_log = logging.getLogger("GRPR.setup")
+
 MOBILE_DIGITS_RE = re.compile(r'\D+')
 EMAIL_VALIDATOR = EmailValidator(message="Enter a valid email address.")
 
@@ -386,19 +395,9 @@ def _create_scorecards_for_game(
         for p in Players.objects.filter(id__in=player_ids).only("id", "Index")
     }
 
-    # Avoid duplicates if re-entering the wizard
-    existing_pids = set(
-        ScorecardMeta.objects
-        .filter(GameID=game.id, PID_id__in=player_ids)
-        .values_list("PID_id", flat=True)
-    )
-
     to_create = []
     now_dt = timezone.now()
     for pid in player_ids:
-        if pid in existing_pids:
-            continue
-
         index_val = idx_map.get(pid, Decimal(0))
         if not index_val:
             raw_hdcp = Decimal(0)
@@ -425,7 +424,8 @@ def _create_scorecards_for_game(
         )
 
     if to_create:
-        ScorecardMeta.objects.bulk_create(to_create)
+        # (GameID, PID) is unique: re-entering the wizard keeps existing rows
+        ScorecardMeta.objects.bulk_create(to_create, ignore_conflicts=True)
 
     # Compute NetHDCP for all players in this game according to handicap_mode
     mode = (state.get("handicap_mode") or "").strip()
@@ -535,14 +535,14 @@ class CustomLoginView(LoginView):
     def form_valid(self, form):
         user = form.get_user()
         auth_login(self.request, user)
-        print(f"User {user.username} authenticated")
+        log.debug('User %s authenticated', user.username)
         
         # Log the login event
         try:
             LoginActivity.objects.create(user=user)
-            print(f"LoginActivity created for user: {user.username}")
+            log.debug('LoginActivity created for user: %s', user.username)
         except Exception as e:
-            print(f"Error creating LoginActivity: {e}")
+            log.warning('Error creating LoginActivity: %s', e, exc_info=True)
         
         return redirect('home_page')
 
@@ -573,30 +573,30 @@ def register(request):
 
 
 def login_view(request):
-    print("login_view called")
+    log.debug('login_view called')
     
     if request.method == 'POST':
-        print("POST request received")
+        log.debug('POST request received')
         
         form = AuthenticationForm(request, data=request.POST)
         if form.is_valid():
-            print("Form is valid")
+            log.debug('Form is valid')
             
             user = form.get_user()
             auth_login(request, user)
-            print(f"User {user.username} authenticated")
+            log.debug('User %s authenticated', user.username)
             
             # Log the login event
             try:
                 LoginActivity.objects.create(user=user)
-                print(f"LoginActivity created for user: {user.username}")
+                log.debug('LoginActivity created for user: %s', user.username)
             except Exception as e:
-                print(f"Error creating LoginActivity: {e}")
+                log.warning('Error creating LoginActivity: %s', e, exc_info=True)
             return redirect('home_page')
         else:
-            print("Form is not valid")
+            log.debug('Form is not valid')
     else:
-        print("GET request received")
+        log.debug('GET request received')
         
         form = AuthenticationForm()
     return render(request, 'login.html', {'form': form})
@@ -608,17 +608,16 @@ def home_page(request):
     # Get today's date
     current_datetime = datetime.now()
 
-    # Query the next closest future date in the TeeTimesInd table
-    next_closest_date = TeeTimesInd.objects.filter(gDate__gte=current_datetime).order_by('gDate').values('gDate').first()
-    # last_date will provide the last date in the TeeTimesInd table if the season is over and done.  Prevents the teesheet page from failing
-    last_date = TeeTimesInd.objects.filter(gDate__lt=current_datetime).order_by('gDate').values('gDate').last()
-    
+    # Next tee-time date from today on, or the last one once the season is over
+    # (keeps the tee-sheet link valid); dates come from the shared cache
+    today = current_datetime.date()
+    tee_dates = teesheet.dates()
+    upcoming = [d for d in tee_dates if d >= today]
+    next_closest_date = upcoming[0] if upcoming else (tee_dates[-1] if tee_dates else None)
 
     # Format the date to be in YYYY-MM-DD format
     if next_closest_date:
-        next_closest_date = next_closest_date['gDate'].strftime('%Y-%m-%d')
-    else:
-        next_closest_date = last_date['gDate'].strftime('%Y-%m-%d')
+        next_closest_date = next_closest_date.strftime('%Y-%m-%d')
 
     context = {
         'userid': request.user.id,
@@ -678,6 +677,8 @@ def admin_view(request):
         'fallclassic_enabled': getattr(toggles, "fallclassic_enabled", False),
         'login_activities': login_activities,
         'responses': responses,
+        'request_metrics_enabled': settings.REQUEST_METRICS,
+        'request_metrics': request_metrics.summary() if settings.REQUEST_METRICS else [],
     }
     return render(request, 'admin_view.html', context)
 
@@ -787,8 +788,8 @@ def automated_msg_sent_view(request):
     # Retrieve the message and user name from the session
     logged_in_user_name = request.session.pop('logged_in_user_name', None)
     msg = request.session.pop('msg', None)
-    print('logged_in_user_name', logged_in_user_name)
-    print('msg', msg)
+    messaging_log.debug('logged_in_user_name %s', logged_in_user_name)
+    messaging_log.debug('msg %s', msg)
 
     # Ensure the required data is present
     if not logged_in_user_name or not msg:
@@ -808,7 +809,7 @@ def automated_msg_sent_view(request):
     # Run the weekly_email.py management command
     try:
         call_command('weekly_email') # This will execute the weekly_email.py code
-        print('call was a success?')  
+        messaging_log.debug('call was a success?')
     except Exception as e:
         return render(request, 'admin_view.html', {
             'error_message': f"Message was logged, but the weekly email failed to send: {e}",
@@ -837,7 +838,7 @@ def email_test_view(request):
         from_email = os.environ.get('EMAIL_HOST_USER')
 
         try:
-            send_mail(subject, message, from_email, [email])
+            messaging.send_email(subject, message, [email], from_email=from_email)
             success_message = 'Test email sent successfully.'
             return render(request, 'email_test.html', {'success_message': success_message})
         except Exception as e:
@@ -855,35 +856,26 @@ def text_test_view(request):
     if request.method == 'POST':
         player_ids = request.POST.getlist('players')
         message = request.POST.get('message')
-        twilio_account_sid = os.environ.get('TWILIO_ACCOUNT_SID')
-        twilio_auth_token = os.environ.get('TWILIO_AUTH_TOKEN')
-        twilio_phone_number = '+18449472599'
-
-        client = Client(twilio_account_sid, twilio_auth_token)
         user_id = request.user.id
         logged_in_user = Players.objects.get(user_id=user_id)
 
         try:
-            for player_id in player_ids:
-                player = Players.objects.get(id=player_id)
-                cell_number = player.Mobile
-                twilio_message = client.messages.create(
-                    body=message,
-                    from_=twilio_phone_number,
-                    to=cell_number
+            # Sent right away through Twilio (this page tests delivery), over one shared connection
+            with messaging.batch(sms='twilio') as sender:
+                for player in Players.objects.filter(id__in=player_ids):
+                    cell_number = player.Mobile
+                    mID = sender.sms(cell_number, message)
+
+                    # Insert record into Log table
+                    Log.objects.create(
+                        SentDate=timezone.now(),
+                        Type="Admin Text Msg",
+                        MessageID=mID,
+                        OfferID=logged_in_user.id,
+                        ReceiveID=player.id,
+                        Msg=message,
+                        To_number=cell_number
                 )
-                mID = twilio_message.sid
-
-                # Insert record into Log table
-                Log.objects.create(
-                    SentDate=timezone.now(),
-                    Type="Admin Text Msg",
-                    MessageID=mID,
-                    OfferID=logged_in_user.id,
-                    ReceiveID=player.id,
-                    Msg=message,
-                    To_number=cell_number
-            )
 
             success_message = 'text message sent successfully.'
             return render(request, 'text_test.html', {'success_message': success_message, 'players': Players.objects.all().exclude(Member=0).order_by('LastName', 'FirstName')})
@@ -908,11 +900,10 @@ def teesheet_view(request):
     # get today's date
     current_datetime = datetime.now()
 
-    # Query distinct dates from TeeTimesInd that are more recent than today's date
-    distinct_dates = TeeTimesInd.objects.filter(gDate__gt='2025-01-01').values('gDate').distinct().order_by('gDate')
-
-    # Format the dates to be in YYYY-MM-DD format
-    distinct_dates = [{'gDate': date['gDate'].strftime('%Y-%m-%d')} for date in distinct_dates]
+    # Tee-time dates from the start of the current season (cached)
+    season_start = seasons.current().StartDate
+    tee_dates = teesheet.dates()
+    distinct_dates = [{'gDate': d.strftime('%Y-%m-%d')} for d in tee_dates if d >= season_start]
 
     # Check if the form was submitted
     if request.method == "GET" and "gDate" in request.GET:
@@ -922,51 +913,31 @@ def teesheet_view(request):
         if not gDate:
             return HttpResponseBadRequest("Date is required.")
 
-        # Query the database for the tee sheet cards
-        queryset = TeeTimesInd.objects.filter(gDate=gDate).select_related('PID', 'CourseID').order_by('CourseID')
-
-        # Construct the cards dictionary
+        # Tee sheet cards for the chosen date and the schedule of every later date
+        try:
+            groups = teesheet.for_date(gDate)
+        except ValueError:
+            return HttpResponseBadRequest("Invalid date.")
         cards = {}
-        for teetime in queryset:
-            courseName = teetime.CourseID.courseName
-            courseTimeSlot = teetime.CourseID.courseTimeSlot
-            key = (courseName, courseTimeSlot)
-            
-            if key not in cards:
-                cards[key] = {
-                    "courseName": courseName,
-                    "courseTimeSlot": courseTimeSlot,
-                    "gDate": gDate,
-                    "players": []
-                }
-            
-            player = teetime.PID
-            cards[key]["players"].append({
-                "firstName": player.FirstName,
-                "lastName": player.LastName
-            })
-        
-        # Query the database for the schedule table
-        schedule_queryset = TeeTimesInd.objects.filter(gDate__gt=current_datetime).select_related('PID', 'CourseID').order_by('gDate', 'CourseID')
-
-        # Construct the schedule dictionary
-        schedule_dict = {}
-        for teetime in schedule_queryset:
-            key = (teetime.gDate, teetime.CourseID.courseName, teetime.CourseID.courseTimeSlot)
-            if key not in schedule_dict:
-                schedule_dict[key] = {
-                    "date": teetime.gDate,
-                    "course": teetime.CourseID.courseName,
-                    "time_slot": teetime.CourseID.courseTimeSlot,
-                    "players": []
-                }
-            schedule_dict[key]["players"].append(f"{teetime.PID.FirstName} {teetime.PID.LastName}")
+        for group in groups:
+            cards[(group["course"], group["time_slot"])] = {
+                "courseName": group["course"],
+                "courseTimeSlot": group["time_slot"],
+                "gDate": gDate,
+                "players": [{"firstName": p["first_name"], "lastName": p["last_name"]} for p in group["players"]],
+            }
 
-        # Convert the schedule dictionary to a list
-        schedule = []
-        for key, value in schedule_dict.items():
-            value["players"] = ", ".join(value["players"])
-            schedule.append(value)
+        upcoming = teesheet.for_dates(d for d in tee_dates if d > current_datetime.date())
+        schedule = [
+            {
+                "date": day,
+                "course": group["course"],
+                "time_slot": group["time_slot"],
+                "players": teesheet.player_names(group),
+            }
+            for day, groups_for_day in upcoming.items()
+            for group in groups_for_day
+        ]
 
         # Pass data to the template
         context = {
@@ -1005,21 +976,15 @@ def schedule_view(request):
         player_id = request.GET.get("player_id", logged_in_player.id if logged_in_player else None)
         if player_id:
             selected_player = Players.objects.filter(id=player_id).exclude(Member=0).first()
-            schedule_query = TeeTimesInd.objects.filter(PID=player_id, gDate__gte='2025-01-01').select_related('CourseID').order_by('gDate')
+            schedule_query = list(TeeTimesInd.objects.filter(PID=player_id, gDate__gte=seasons.current().StartDate).select_related('CourseID').order_by('gDate'))
+            groups = teesheet.for_tee_times(schedule_query)  # everyone's group-mates in one query
             for teetime in schedule_query:
-                # Collect the names of other players in the group
-                group_players = TeeTimesInd.objects.filter(
-                    gDate=teetime.gDate,
-                    CourseID=teetime.CourseID
-                ).exclude(PID=player_id).select_related('PID')
-
-                other_players = [f"{gp.PID.FirstName} {gp.PID.LastName}" for gp in group_players]
                 schedule.append({
                     "id": teetime.id,  # Add the ID column here
                     "gDate": teetime.gDate,
                     "courseName": teetime.CourseID.courseName,
                     "courseTimeSlot": teetime.CourseID.courseTimeSlot,
-                    "otherPlayers": ", ".join(other_players),
+                    "otherPlayers": groups[teesheet.key(teetime)].names(exclude_pid=int(player_id)),
                 })
 
     context = {
@@ -1045,157 +1010,58 @@ def subswap_view(request):
         return HttpResponseBadRequest("Player not found for the logged-in user.")
     player_id = player.id
 
-    # Fetch the schedule for the player
-    schedule = TeeTimesInd.objects.filter(PID=player_id, gDate__gte=current_datetime).select_related('CourseID').order_by('gDate')
+    # Every open offer involving the player, the offers/counters they are linked
+    # to and the foursomes of the tee times on the page, in a fixed number of queries
+    board = subswap.dashboard(player_id, since=current_datetime.date())
 
     # Schedule Table - for player to offer Subs and Swaps from
     schedule_data = []
-    for teetime in schedule:
-        other_players = TeeTimesInd.objects.filter(
-            CourseID=teetime.CourseID, gDate=teetime.gDate
-        ).exclude(PID=player_id)
-
+    for teetime in board.schedule:
         schedule_data.append({
             'tt_id': teetime.id,
             'date': teetime.gDate,
             'course': teetime.CourseID.courseName,
             'time_slot': teetime.CourseID.courseTimeSlot,
-            'other_players': ", ".join([
-                f"{player.PID.FirstName} {player.PID.LastName}" for player in other_players
-            ])
+            'other_players': board.other_players(teetime),
         })
-    
-    # Available Subs Table
-    # Fetch available subs for the player
-    available_subs = SubSwap.objects.filter(
-        nType='Sub',
-        SubType='Received',
-        nStatus='Open',
-        PID=player_id
-    ).select_related('TeeTimeIndID', 'TeeTimeIndID__CourseID').order_by('TeeTimeIndID__gDate')
 
+    # Available Subs and Available Swaps Tables
     available_subs_data = []
-    for sub in available_subs:
-        teetime = sub.TeeTimeIndID
-        other_players = TeeTimesInd.objects.filter(
-            CourseID=teetime.CourseID, gDate=teetime.gDate
-        ).exclude(PID=player_id)
-
-        # Fetch the OfferID for the sub offer
-        try:
-            sub_offer = SubSwap.objects.get(SwapID=sub.SwapID, nType='Sub', SubType='Offer')
-            offer_pid = sub_offer.PID.id
-        except SubSwap.DoesNotExist:
-            offer_pid = None
-            print(f"No sub offer found for SwapID: {sub.SwapID}")
-
-        available_subs_data.append({
-            'date': teetime.gDate,
-            'ymdDate': teetime.gDate.strftime("%Y-%m-%d"), #converts date to YYYY-MM-DD
-            'course': teetime.CourseID.courseName,
-            'time_slot': teetime.CourseID.courseTimeSlot,
-            'swapID': sub.SwapID,
-            'Msg': sub.Msg,
-            'OfferID': offer_pid,
-            'other_players': ", ".join([
-                f"{player.PID.FirstName} {player.PID.LastName}" for player in other_players
-            ])
-        })
-
-    # Available Swaps Table
-    # Fetch available swaps for the player
-    available_swaps = SubSwap.objects.filter(
-        nType='Swap',
-        SubType='Received',
-        nStatus='Open',
-        PID=player_id
-    ).select_related('TeeTimeIndID', 'TeeTimeIndID__CourseID').order_by('TeeTimeIndID__gDate')
-
-    # Prepare the data for the available swaps table
     available_swaps_data = []
-    for swap in available_swaps:
-        teetime = swap.TeeTimeIndID
-        other_players = TeeTimesInd.objects.filter(
-            CourseID=teetime.CourseID, gDate=teetime.gDate
-        ).exclude(PID=player_id)
-
-        # Fetch the OfferID for the swap offer
-        try:
-            swap_offer = SubSwap.objects.get(SwapID=swap.SwapID, nType='Swap', SubType='Offer')
-            offer_pid = swap_offer.PID.id
-        except SubSwap.DoesNotExist:
-            offer_pid = None
-            print(f"No swap offer found for SwapID: {swap.SwapID}")
+    for nType, rows in (('Sub', available_subs_data), ('Swap', available_swaps_data)):
+        for received in board.received(nType):
+            teetime = received.TeeTimeIndID
+            offer_pid = board.offer_pid(received)
+            if offer_pid is None:
+                subswap_log.debug('No %s offer found for SwapID: %s', nType.lower(), received.SwapID)
+
+            rows.append({
+                'date': teetime.gDate,
+                'ymdDate': teetime.gDate.strftime("%Y-%m-%d"), #converts date to YYYY-MM-DD
+                'course': teetime.CourseID.courseName,
+                'time_slot': teetime.CourseID.courseTimeSlot,
+                'swapID': received.SwapID,
+                'Msg': received.Msg,
+                'OfferID': offer_pid,
+                'other_players': board.other_players(teetime),
+            })
 
-        available_swaps_data.append({
-            'date': teetime.gDate,
-            'ymdDate': teetime.gDate.strftime("%Y-%m-%d"), #converts date to YYYY-MM-DD
-            'course': teetime.CourseID.courseName,
-            'time_slot': teetime.CourseID.courseTimeSlot,
-            'swapID': swap.SwapID,
-            'Msg': swap.Msg,
-            'OfferID': offer_pid,
-            'other_players': ", ".join([
-                f"{player.PID.FirstName} {player.PID.LastName}" for player in other_players
-            ])
+    # Counter Offers table - counter offers made on the player's open swap offers
+    counter_offers_data = []
+    for original_offer, proposed_swap in board.counters():
+        counter_offers_data.append({
+            'original_offer_date': f"{original_offer.TeeTimeIndID.gDate} at {original_offer.TeeTimeIndID.CourseID.courseName}  {original_offer.TeeTimeIndID.CourseID.courseTimeSlot}am",
+            'offer_other_players': original_offer.OtherPlayers,
+            'proposed_swap_date': f"{proposed_swap.TeeTimeIndID.gDate} at {proposed_swap.TeeTimeIndID.CourseID.courseName}  {proposed_swap.TeeTimeIndID.CourseID.courseTimeSlot}am",
+            'proposed_by': f"{proposed_swap.PID.FirstName} {proposed_swap.PID.LastName}",
+            'swap_other_players': proposed_swap.OtherPlayers,
+            'swapID': proposed_swap.SwapID,
+            'swap_ttid': proposed_swap.TeeTimeIndID.id,
         })
-    
-    # Counter Offers table - Fetch counter offers for the player
-    offered_swaps = SubSwap.objects.filter(
-        PID=player_id,
-        nType='Swap',
-        SubType='Offer',
-        nStatus='Open'
-    )
 
-    counter_offers_data = []
-    if offered_swaps.exists():
-        for offer in offered_swaps:
-            # Fetch the original offer details
-            original_offer = SubSwap.objects.filter(
-                nType='Swap',
-                SubType='Offer',
-                nStatus='Open',
-                SwapID=offer.SwapID
-            ).select_related('TeeTimeIndID', 'TeeTimeIndID__CourseID').first()
-
-            if original_offer:
-                original_offer_date = f"{original_offer.TeeTimeIndID.gDate} at {original_offer.TeeTimeIndID.CourseID.courseName}  {original_offer.TeeTimeIndID.CourseID.courseTimeSlot}am"
-                offer_other_players = original_offer.OtherPlayers
-
-                # Fetch the proposed swaps
-                proposed_swaps = SubSwap.objects.filter(
-                    nType='Swap',
-                    SubType='Counter',
-                    nStatus='Open',
-                    SwapID=offer.SwapID
-                ).select_related('TeeTimeIndID', 'TeeTimeIndID__CourseID', 'PID')
-
-                for proposed_swap in proposed_swaps:
-                    proposed_swap_date = f"{proposed_swap.TeeTimeIndID.gDate} at {proposed_swap.TeeTimeIndID.CourseID.courseName}  {proposed_swap.TeeTimeIndID.CourseID.courseTimeSlot}am"
-                    proposed_by = f"{proposed_swap.PID.FirstName} {proposed_swap.PID.LastName}"
-                    swap_other_players = proposed_swap.OtherPlayers
-
-                    counter_offers_data.append({
-                        'original_offer_date': original_offer_date,
-                        'offer_other_players': offer_other_players,
-                        'proposed_swap_date': proposed_swap_date,
-                        'proposed_by': proposed_by,
-                        'swap_other_players': swap_other_players,
-                        'swapID': proposed_swap.SwapID,
-                        'swap_ttid': proposed_swap.TeeTimeIndID.id,
-                    })
-    
     #Subs Offered Table
-    subs_proposed = SubSwap.objects.filter(
-        nType='Sub',
-        SubType='Offer',
-        nStatus='Open',
-        PID=player_id
-    ).select_related('TeeTimeIndID', 'TeeTimeIndID__CourseID')
-
     subs_proposed_data = []
-    for sub in subs_proposed:
+    for sub in board.mine('Sub', 'Offer'):
         subs_proposed_data.append({
             'request_date': sub.RequestDate,
             'playing_date': sub.TeeTimeIndID.gDate,
@@ -1203,26 +1069,10 @@ def subswap_view(request):
             'tee_time': sub.TeeTimeIndID.CourseID.courseTimeSlot,
             'swap_id': sub.id
         })
-    
-    # Swaps Proposed Table
-    swaps_proposed = SubSwap.objects.filter(
-        nType='Swap',
-        SubType='Offer',
-        nStatus='Open',
-        PID=player_id
-    ).select_related('TeeTimeIndID', 'TeeTimeIndID__CourseID')
 
     # Counter Offers Proposed Table
-    counter_offers_proposed = SubSwap.objects.filter(
-        nType='Swap',
-        SubType='Counter',
-        nStatus='Open',
-        PID_id=player_id
-    ).select_related('TeeTimeIndID__CourseID')
-
     counter_offers_proposed_data = []
-    for offer in counter_offers_proposed:
-        
+    for offer in board.mine('Swap', 'Counter'):
         counter_offers_proposed_data.append({
             'request_date': offer.RequestDate.strftime('%Y-%m-%d'),
             'playing_date': offer.TeeTimeIndID.gDate.strftime('%Y-%m-%d'),
@@ -1231,10 +1081,11 @@ def subswap_view(request):
             'subswap_table_id': offer.id #gets the unique row id in the subswap table
         })
 
+    # Swaps Proposed Table
     swaps_proposed_data = []
     # used to check if the swap has already been proposed, if it has, the buttons will be disabled
     offered_tee_time_ids = set()
-    for swap in swaps_proposed:
+    for swap in board.mine('Swap', 'Offer'):
         swaps_proposed_data.append({
             'request_date': swap.RequestDate,
             'playing_date': swap.TeeTimeIndID.gDate,
@@ -1242,19 +1093,11 @@ def subswap_view(request):
             'tee_time': swap.TeeTimeIndID.CourseID.courseTimeSlot,
             'swap_id': swap.id
         })
-        offered_tee_time_ids.add(swap.TeeTimeIndID.id)
-    
-    # Query for Open Sub Offers - used to gray out Sub Swap buttons on subswap.html
-    open_sub_offers = SubSwap.objects.filter(
-        nType='Sub',
-        SubType='Offer',
-        nStatus='Open',
-        PID=player_id
-    ).select_related('TeeTimeIndID')
+        offered_tee_time_ids.add(swap.TeeTimeIndID_id)
+
+    # Open Sub Offers - used to gray out Sub Swap buttons on subswap.html
+    offered_tee_time_ids.update(sub.TeeTimeIndID_id for sub in board.mine('Sub', 'Offer'))
 
-    for sub_offer in open_sub_offers:
-        offered_tee_time_ids.add(sub_offer.TeeTimeIndID.id)
-    
     # Calculate the count of rows in key tables
     available_swaps_data_count = len(available_swaps_data)
     available_subs_data_count = len(available_subs_data)
@@ -1310,14 +1153,11 @@ def subrequest_view(request):
     course_time_slot = tee_time_details['course_time_slot']
     other_players = tee_time_details['other_players']
 
-    # Get players already playing on the date
-    playing_players = TeeTimesInd.objects.filter(gDate=gDate).values_list('PID_id', flat=True)
-
-    # Get all players who are members and subtract playing players
-    available_players = Players.objects.filter(Member=1).exclude(id__in=list(playing_players))
+    # Members neither playing nor requested off on the date (the offerer's own rows loaded even for a non-member)
+    available_players = availability.load(dates=[gDate], include=[player_id]).free_on(gDate, exclude=[player_id])
 
     ## GATE - make sure there are players available, send to error page if not.
-    if not available_players.exists():
+    if not available_players:
         return render(request, 'GRPR/error_msg.html', {'error_msg': 'No Players have available tee times on this date.'})
     
     # Get list of players available to sub
@@ -1369,7 +1209,7 @@ def subrequestsent_view(request):
         return HttpResponseBadRequest("Required data is missing. - subrequestsent_view")
     
     for s_id in sub_ids:
-        print(f"Sub ID: {s_id}")
+        subswap_log.debug('Sub ID: %s', s_id)
     
 
     # Fetch the Player ID associated with the logged-in user
@@ -1401,115 +1241,46 @@ def subrequestsent_view(request):
     # Create the sub_offer message
     sub_offer = f"{first_name} {last_name} is offering his tee time on {gDate} at {course_name} {course_time_slot} to play with {other_players} to the first person who wants it."
 
-    # Insert the initial Sub Offer into SubSwap
-    initial_sub = SubSwap.objects.create(
-        RequestDate=timezone.now(),
-        PID_id=offer_player_id,
-        TeeTimeIndID_id=tt_id,
-        nType="Sub",
-        SubType="Offer",
-        nStatus="Open",
-        Msg=sub_offer,
-        OtherPlayers=other_players
-    )
-
-    # Update the SwapID of the initial Sub Offer
-    initial_sub.SwapID = initial_sub.id
-    initial_sub.save()
-    swap_id = initial_sub.id
-    
-    available_players = []
-
-    for s_id in sub_ids:
-        player = Players.objects.get(id=s_id)
-        to_number = player.Mobile
-        avail_id = player.id
-        avail_name = player.FirstName + " " + player.LastName
-        available_players.append({'player': player, 'to_number': to_number, 'avail_id': avail_id, 'avail_name': avail_name})
-
-
-    if settings.TWILIO_ENABLED:
-        # Initialize the Twilio client
-        account_sid = settings.TWILIO_ACCOUNT_SID
-        auth_token = settings.TWILIO_AUTH_TOKEN
-        client = Client(account_sid, auth_token)
-
-        # Generate text message and send to Sub Offering player
-        msg = "This msg has been sent to all of the players available for your request date: '" + sub_offer + "'      you will be able to see this offer and status on the sub swap page."
-        to_number = offer_player.Mobile
-        message = client.messages.create(from_='+18449472599', body=msg, to=to_number)
-        mID = message.sid
-
-        # Insert initial Sub Offer into Log
-        Log.objects.create(
-            SentDate=timezone.now(),
-            Type="Sub Offer",
-            MessageID=mID,
-            RequestDate=gDate,
-            OfferID=offer_player_id,
-            RefID=swap_id,
-            Msg=sub_offer,
-            To_number=to_number
-        )
-
-        # Create an insert in SubSwap table for every player in the Available Players list
-        for player_data in available_players:
-            player = player_data['player']
-            to_number = player_data['to_number']
-            avail_id = player_data['avail_id']
-
-            SubSwap.objects.create(
-                RequestDate=timezone.now(),
-                PID=player,
-                TeeTimeIndID_id=tt_id,
-                nType="Sub",
-                SubType="Received",
-                nStatus="Open",
-                Msg=sub_offer,
-                OtherPlayers=other_players,
-                SwapID=swap_id
-            )
-
-            # Create and send a text to every Available Player
-            msg = f"{sub_offer} https://www.gasgolf.org/GRPR/store_subaccept_data/?swap_id={swap_id}"
-            message = client.messages.create(from_='+18449472599', body=msg, to=to_number)
-            mID = message.sid
-
-            # Insert a row into Log table for every text sent
-            Log.objects.create(
-                SentDate=timezone.now(),
-                Type="Sub Offer Sent",
-                MessageID=mID,
-                RequestDate=gDate,
-                OfferID=offer_player_id,
-                ReceiveID=avail_id,
-                RefID=swap_id,
-                Msg=sub_offer,
-                To_number=to_number
-            )
-    else:
-
-        # Insert initial Sub Offer into Log
-        Log.objects.create(
-            SentDate=timezone.now(),
-            Type="Sub Offer",
-            MessageID='fake mID',
-            RequestDate=gDate,
-            OfferID=offer_player_id,
-            RefID=swap_id,
+    # The offer, its Received rows and the queued texts commit together
+    with transaction.atomic():
+        # Insert the initial Sub Offer into SubSwap
+        initial_sub = SubSwap.objects.create(
+            RequestDate=timezone.now(),
+            PID_id=offer_player_id,
+            TeeTimeIndID_id=tt_id,
+            nType="Sub",
+            SubType="Offer",
+            nStatus="Open",
             Msg=sub_offer,
-            To_number=to_number
+            OtherPlayers=other_players
         )
 
-        # Create an insert in SubSwap table for every player in the Available Players list
-        for player_data in available_players:
-            player = player_data['player']
-            to_number = player_data['to_number']
-            avail_id = player_data['avail_id']
+        # Update the SwapID of the initial Sub Offer
+        initial_sub.SwapID = initial_sub.id
+        initial_sub.save()
+        swap_id = initial_sub.id
+    
+        # Recipients in one query, kept in the order they were picked
+        players_by_id = Players.objects.in_bulk([int(s_id) for s_id in sub_ids])
+        available_players = []
 
-            SubSwap.objects.create(
-                RequestDate=timezone.now(),
-                PID=player,
+        for s_id in sub_ids:
+            player = players_by_id.get(int(s_id))
+            if player is None:
+                continue
+            to_number = player.Mobile
+            avail_id = player.id
+            avail_name = player.FirstName + " " + player.LastName
+            available_players.append({'player': player, 'to_number': to_number, 'avail_id': avail_id, 'avail_name': avail_name})
+
+        # One INSERT for the Received rows and one for the texts: a confirmation to the
+        # Sub Offering player, then one per Available Player; drain_outbox sends them
+        # and writes the Log rows
+        now = timezone.now()
+        SubSwap.objects.bulk_create([
+            SubSwap(
+                RequestDate=now,
+                PID=player_data['player'],
                 TeeTimeIndID_id=tt_id,
                 nType="Sub",
                 SubType="Received",
@@ -1518,19 +1289,22 @@ def subrequestsent_view(request):
                 OtherPlayers=other_players,
                 SwapID=swap_id
             )
+            for player_data in available_players
+        ])
 
-            # Insert a row into Log table for every text sent
-            Log.objects.create(
-                SentDate=timezone.now(),
-                Type="Sub Offer Sent",
-                MessageID='fake mID',
-                RequestDate=gDate,
-                OfferID=offer_player_id,
-                ReceiveID=avail_id,
-                RefID=swap_id,
-                Msg=sub_offer,
-                To_number=to_number
-            )
+        msg = "This msg has been sent to all of the players available for your request date: '" + sub_offer + "'      you will be able to see this offer and status on the sub swap page."
+        msg_link = f"{sub_offer} https://www.gasgolf.org/GRPR/store_subaccept_data/?swap_id={swap_id}"
+        outbox.put([
+            outbox.message('sms', offer_player.Mobile, msg, log=dict(
+                Type="Sub Offer", RequestDate=gDate, OfferID=offer_player_id, RefID=swap_id, Msg=sub_offer,
+            )),
+        ] + [
+            outbox.message('sms', player_data['to_number'], msg_link, log=dict(
+                Type="Sub Offer Sent", RequestDate=gDate, OfferID=offer_player_id,
+                ReceiveID=player_data['avail_id'], RefID=swap_id, Msg=sub_offer,
+            ))
+            for player_data in available_players
+        ])
 
     # Pass data to the template
     context = {
@@ -1703,175 +1477,88 @@ def subfinal_view(request):
     if not swap_id or not tt_id or not gDate or not course_name or not course_time_slot or not offer_player_first_name or not offer_player_last_name or not offer_player_mobile or not offer_player_id or not other_players or not first_name or not last_name or not player_id or not player_mobile:
         return HttpResponseBadRequest("Required data is missing. - subfinal_view")
 
-    # Update SubSwap table
-    # updates the row for the user who took the sub
-    SubSwap.objects.filter(
-        SwapID=swap_id,
-        nStatus='Open',
-        nType='Sub',
-        SubType='Received',
-        PID=player_id
-    ).update(nStatus = 'Closed', SubStatus='Accepted')
-
-    # closes all the other sub offer rows that equal this swap_id
-    SubSwap.objects.filter(
-        SwapID=swap_id,
-        nType='Sub',
-        nStatus='Open'
-    ).update(nStatus='Closed')
-
-    # closes any swap counters that could be open and offered by the original owner of the offered Sub tee time
-    SubSwap.objects.filter(
-        TeeTimeIndID=tt_id,
-        nType = 'Swap',
-        nStatus='Open',
-    ).update(nStatus='Closed', SubStatus='Owner Change')
-    
-    #finds any other sub or swap offers that are open for the accepting player for the same date they just took a sub for
-    subswap_offers_same_date = SubSwap.objects.select_related('TeeTimeIndID').filter(
-            Q(TeeTimeIndID__gDate=gDate) &
-            Q(PID=player_id) &
-            Q(nStatus='Open') 
-    )
-    
-    #closes any other subs or swaps that were opened (when the accepting player was available) that, with this acceptance, are no longer available for
-    for ss in subswap_offers_same_date:
-        ss_id = ss.id
-        ss_swap_id = ss.SwapID
+    # The acceptance, the tee time change and the queued texts commit together
+    with transaction.atomic():
+        # Update SubSwap table
+        # updates the row for the user who took the sub
+        SubSwap.objects.filter(
+            SwapID=swap_id,
+            nStatus='Open',
+            nType='Sub',
+            SubType='Received',
+            PID=player_id
+        ).update(nStatus = 'Closed', SubStatus='Accepted')
+        stats.invalidate_rankings('SubSwap')
+
+        # closes all the other sub offer rows that equal this swap_id
+        SubSwap.objects.filter(
+            SwapID=swap_id,
+            nType='Sub',
+            nStatus='Open'
+        ).update(nStatus='Closed')
 
+        # closes any swap counters that could be open and offered by the original owner of the offered Sub tee time
         SubSwap.objects.filter(
-            id=ss_id,
-            ).update(nStatus='Closed', SubStatus='Superseded')
-        
-        # Insert row into Log for offer player
-        Log.objects.create(
-            SentDate=timezone.now(),
-            Type="SubSwap Superseded",
-            MessageID='none',
-            RequestDate=gDate,
-            ReceiveID=player_id,
-            RefID=ss_swap_id,
-            Msg="Sub Swap was superseded by another Sub Swap for the same date that was accepted by this player",
-        )
+            TeeTimeIndID=tt_id,
+            nType = 'Swap',
+            nStatus='Open',
+        ).update(nStatus='Closed', SubStatus='Owner Change')
     
-    # Find all other players in SubSwap for this SwapID except the Offer Player and Sub Accept Player - allows us to send them a msg the Sub is closed
-    other_subswap_players = SubSwap.objects.filter(
-        SwapID=swap_id
-    ).exclude(
-        PID__in=[offer_player_id, player_id]
-    ).select_related('PID')
-
-
-    # Check if Twilio is enabled
-    if settings.TWILIO_ENABLED:
-        account_sid = settings.TWILIO_ACCOUNT_SID
-        auth_token = settings.TWILIO_AUTH_TOKEN
-        client = Client(account_sid, auth_token)
-
-        # Send text to the Sub Offer Player
-        offer_msg = f"Sub Accepted: {first_name} {last_name} is taking your tee time on {gDate} at {course_name} {course_time_slot}."
-        to_number = offer_player_mobile
-        message = client.messages.create(from_='+18449472599', body=offer_msg, to=to_number)
-        offer_mID = message.sid
-
-        # Insert row into Log for offer player
-        Log.objects.create(
-            SentDate=timezone.now(),
-            Type="Sub Given",
-            MessageID=offer_mID,
-            RequestDate=gDate,
-            OfferID=offer_player_id,
-            ReceiveID=player_id,
-            RefID=swap_id,
-            Msg=offer_msg,
-            To_number=to_number
-        )
-
-        # Send text to the Sub Accept Player
-        accept_msg = f"Sub Accepted: { first_name } { last_name } is taking {offer_player_first_name} {offer_player_last_name}'s tee time on {gDate} at {course_name} {course_time_slot}."
-        to_number = player_mobile
-        message = client.messages.create(from_='+18449472599', body=accept_msg, to=to_number)
-        accept_mID = message.sid
-
-        # Insert row into Log for Sub Accept Player
-        Log.objects.create(
-            SentDate=timezone.now(),
-            Type="Sub Received",
-            MessageID=accept_mID,
-            RequestDate=gDate,
-            OfferID=offer_player_id,
-            ReceiveID=player_id,
-            RefID=swap_id,
-            Msg=accept_msg,
-            To_number=to_number
+        #finds any other sub or swap offers that are open for the accepting player for the same date they just took a sub for
+        subswap_offers_same_date = SubSwap.objects.select_related('TeeTimeIndID').filter(
+                Q(TeeTimeIndID__gDate=gDate) &
+                Q(PID=player_id) &
+                Q(nStatus='Open') 
         )
-
-        # Send text to all other players
-        for sub in other_subswap_players:
-            sub_closed_msg = f"Sub Closed: {first_name} {last_name} has taken {offer_player_first_name} {offer_player_last_name}'s tee time on {gDate}."
-            to_number = sub.PID.Mobile
-            message = client.messages.create(from_='+18449472599', body=sub_closed_msg, to=to_number)
-
-            # Insert row into Log for each player
+    
+        #closes any other subs or swaps that were opened (when the accepting player was available) that, with this acceptance, are no longer available for
+        for ss in subswap_offers_same_date:
+            ss_id = ss.id
+            ss_swap_id = ss.SwapID
+
+            SubSwap.objects.filter(
+                id=ss_id,
+                ).update(nStatus='Closed', SubStatus='Superseded')
+        
+            # Insert row into Log for offer player
             Log.objects.create(
                 SentDate=timezone.now(),
-                Type="Sub Closed Notification",
-                MessageID=message.sid,
+                Type="SubSwap Superseded",
+                MessageID='none',
                 RequestDate=gDate,
-                OfferID=offer_player_id,
-                ReceiveID=sub.PID.id,
-                RefID=swap_id,
-                Msg=sub_closed_msg,
-                To_number=to_number
+                ReceiveID=player_id,
+                RefID=ss_swap_id,
+                Msg="Sub Swap was superseded by another Sub Swap for the same date that was accepted by this player",
             )
+    
+        # Find all other players in SubSwap for this SwapID except the Offer Player and Sub Accept Player - allows us to send them a msg the Sub is closed
+        other_subswap_players = SubSwap.objects.filter(
+            SwapID=swap_id
+        ).exclude(
+            PID__in=[offer_player_id, player_id]
+        ).select_related('PID')
 
-    else:
-        offer_msg = f"Sub Accepted: {first_name} {last_name} is taking your tee time on {gDate} at {course_name} {course_time_slot}."
 
-        # Insert row into Log for offer player
-        Log.objects.create(
-            SentDate=timezone.now(),
-            Type="Sub Given",
-            MessageID='fake mID',
-            RequestDate=gDate,
-            OfferID=offer_player_id,
-            ReceiveID=player_id,
-            RefID=swap_id,
-            Msg=offer_msg,
-            To_number=offer_player_mobile
-        )
+        # Queue texts to the Sub Offer Player, the Sub Accept Player and all other players
+        offer_msg = f"Sub Accepted: {first_name} {last_name} is taking your tee time on {gDate} at {course_name} {course_time_slot}."
+        outbox.sms(offer_player_mobile, offer_msg, log=dict(
+            Type="Sub Given", RequestDate=gDate, OfferID=offer_player_id, ReceiveID=player_id, RefID=swap_id, Msg=offer_msg,
+        ))
 
         accept_msg = f"Sub Accepted: { first_name } { last_name } is taking {offer_player_first_name} {offer_player_last_name}'s tee time on {gDate} at {course_name} {course_time_slot}."
-
-        # Insert row into Log for Sub Accept Player
-        Log.objects.create(
-            SentDate=timezone.now(),
-            Type="Sub Received",
-            MessageID='fake mID',
-            RequestDate=gDate,
-            OfferID=offer_player_id,
-            ReceiveID=player_id,
-            RefID=swap_id,
-            Msg=accept_msg,
-            To_number=player_mobile
-        )
+        outbox.sms(player_mobile, accept_msg, log=dict(
+            Type="Sub Received", RequestDate=gDate, OfferID=offer_player_id, ReceiveID=player_id, RefID=swap_id, Msg=accept_msg,
+        ))
 
         for sub in other_subswap_players:
             sub_closed_msg = f"Sub Closed: {first_name} {last_name} has taken {offer_player_first_name} {offer_player_last_name}'s tee time on {gDate}."
-            Log.objects.create(
-                SentDate=timezone.now(),
-                Type="Sub Closed Notification",
-                MessageID='fake mID',
-                RequestDate=gDate,
-                OfferID=offer_player_id,
-                ReceiveID=sub.PID.id,
-                RefID=swap_id,
-                Msg=sub_closed_msg,
-                To_number=sub.PID.Mobile
-            )
+            outbox.sms(sub.PID.Mobile, sub_closed_msg, log=dict(
+                Type="Sub Closed Notification", RequestDate=gDate, OfferID=offer_player_id,
+                ReceiveID=sub.PID.id, RefID=swap_id, Msg=sub_closed_msg,
+            ))
 
-    # Update TeeTimesInd table
-    TeeTimesInd.objects.filter(id=tt_id).update(PID=player_id)
+        # Update TeeTimesInd table
+        TeeTimesInd.objects.filter(id=tt_id).update(PID=player_id)
 
     # Pass data to the template
     context = {
@@ -2071,50 +1758,18 @@ def swaprequest_view(request):
     course_time_slot = tee_time_details['course_time_slot']
     other_players = tee_time_details['other_players']
 
-    # Get players already playing on the date
-    playing_players = TeeTimesInd.objects.filter(gDate=gDate).values_list('PID_id', flat=True)
+    # One availability matrix (members x dates from today) for the whole page;
+    # the offerer's own rows are loaded even when they are not a member
+    today = datetime.now().date()
+    matrix = availability.load(start=today, include=[player_id])
 
-    # Get all players who are members and subtract playing players
-    available_players = Players.objects.filter(Member=1).exclude(id__in=list(playing_players))
-    
-    ## GATE - make sure there are players available, send to error page if not.
-    if not available_players.exists():
-        return render(request, 'GRPR/error_msg.html', {'error_msg': 'No Players have available tee times on this date.'})
-    
-    # Fetch the list of future dates for the offering player (player_id)
-    offering_player_future_dates = TeeTimesInd.objects.filter(PID=player_id, gDate__gt=today).values_list('gDate', flat=True)
-    print('offering_player_future_dates', offering_player_future_dates)
-
-    available_players_with_swap_dates = []
-    for player in available_players:
-        # Fetch the list of future dates for the current player
-        player_future_dates = TeeTimesInd.objects.filter(PID=player, gDate__gt=today).values_list('gDate', flat=True)
-        print('player', player, 'player_future_dates', player_future_dates)
-        
-        # Check if all future dates for the current player are in the offering player's future dates
-        if all(date in offering_player_future_dates for date in player_future_dates):
-            print(f"Player {player.id} has all future dates in the offering player's schedule. Skipping.")
-            continue
-        
-        # Check if the player has any available swap dates
-        available_swap_dates = TeeTimesInd.objects.filter(PID=player, gDate__gt=today).exists()
-
-        if available_swap_dates:
-            available_players_with_swap_dates.append(player)
-
-    if not available_players_with_swap_dates:
-        return redirect('swapnoneavail_view')
-    
-    # Generate Available Swap Dates for each available player
+    # Members free on the date, each with the later dates of theirs the
+    # offering player could take in exchange
     filtered_players = []
-    for player in available_players:
-        available_player_dates = TeeTimesInd.objects.filter(PID=player, gDate__gt=today).values_list('gDate', 'id')
-        swap_request_player_dates = TeeTimesInd.objects.filter(PID=player_id, gDate__gt=today).values_list('gDate', flat=True)
-        swap_dates = sorted([(d[0], d[1]) for d in available_player_dates if d[0] not in swap_request_player_dates])
-
+    for player in matrix.free_on(gDate):
+        swap_dates = matrix.swap_dates(player_id, player.id, after=today)
         if swap_dates:
-            formatted_swap_dates = [(d[0].strftime('%m/%d/%Y'), d[1]) for d in swap_dates]
-            player.swap_dates = formatted_swap_dates
+            formatted_swap_dates = [(d.strftime('%m/%d/%Y'), tt_id) for d, tt_id in swap_dates]
             filtered_players.append({
                 'id': player.id,
                 'FirstName': player.FirstName,
@@ -2123,6 +1778,11 @@ def swaprequest_view(request):
                 'swap_dates': formatted_swap_dates,
             })
 
+    ## GATE - make sure there are players available with something to swap, send to error page if not.
+    if not filtered_players:
+        if not matrix.free_on(gDate):
+            return render(request, 'GRPR/error_msg.html', {'error_msg': 'No Players have available tee times on this date.'})
+        return redirect('swapnoneavail_view')
 
     context = {
         'tt_id': swap_tt_id,
@@ -2193,115 +1853,46 @@ def swaprequestsent_view(request):
     # Create the swap_offer message
     swap_offer = f"{first_name} {last_name} is offering to trade his tee time on {gDate} at {course_name} {course_time_slot} playing with {other_players} for one of your tee times.  Please review the Sub Swap page for details."
 
-    # Insert the initial Swap Offer into SubSwap
-    initial_swap = SubSwap.objects.create(
-        RequestDate=timezone.now(),
-        PID_id=offer_player_id,
-        TeeTimeIndID_id=tt_id,
-        nType="Swap",
-        SubType="Offer",
-        nStatus="Open",
-        Msg=swap_offer,
-        OtherPlayers=other_players
-    )
-
-    # Update the SwapID of the initial Swap Offer
-    initial_swap.SwapID = initial_swap.id
-    initial_swap.save()
-    swap_id = initial_swap.id
-
-    available_players = []
-
-    for s_id in player_ids:
-        player = Players.objects.get(id=s_id)
-        to_number = player.Mobile
-        avail_id = player.id
-        avail_name = player.FirstName + " " + player.LastName
-        available_players.append({'player': player, 'to_number': to_number, 'avail_id': avail_id, 'avail_name': avail_name})
-
-    if settings.TWILIO_ENABLED:
-        # Initialize the Twilio client
-        account_sid = settings.TWILIO_ACCOUNT_SID
-        auth_token = settings.TWILIO_AUTH_TOKEN
-        client = Client(account_sid, auth_token)
-
-        # Generate text message and send to Swap Offering player
-        msg = "This msg has been sent to all of the players available for your request date: '" + swap_offer + "'      you will be able to see this offer and status on the sub swap page."
-        to_number = offer_player.Mobile
-        message = client.messages.create(from_='+18449472599', body=msg, to=to_number)
-        mID = message.sid
-
-        # Insert initial Swap Offer into Log
-        Log.objects.create(
-            SentDate=timezone.now(),
-            Type="Swap Offer",
-            MessageID=mID,
-            RequestDate=gDate,
-            OfferID=offer_player_id,
-            RefID=swap_id,
+    # The offer, its Received rows and the queued texts commit together
+    with transaction.atomic():
+        # Insert the initial Swap Offer into SubSwap
+        initial_swap = SubSwap.objects.create(
+            RequestDate=timezone.now(),
+            PID_id=offer_player_id,
+            TeeTimeIndID_id=tt_id,
+            nType="Swap",
+            SubType="Offer",
+            nStatus="Open",
             Msg=swap_offer,
-            To_number=to_number
+            OtherPlayers=other_players
         )
 
-        # Create an insert in SubSwap table for every player in the Available Players list
-        for player_data in available_players:
-            player = player_data['player']
-            to_number = player_data['to_number']
-            avail_id = player_data['avail_id']
-
-            SubSwap.objects.create(
-                RequestDate=timezone.now(),
-                PID=player,
-                TeeTimeIndID_id=tt_id,
-                nType="Swap",
-                SubType="Received",
-                nStatus="Open",
-                Msg=swap_offer,
-                OtherPlayers=other_players,
-                SwapID=swap_id
-            )
-
-            # Create and send a text to every Available Player
-            msg = f"{swap_offer} https://www.gasgolf.org/GRPR/store_swapoffer_data/?swapID={swap_id}"
-            message = client.messages.create(from_='+18449472599', body=msg, to=to_number)
-            mID = message.sid
-
-            # Insert a row into Log table for every text sent
-            Log.objects.create(
-                SentDate=timezone.now(),
-                Type="Swap Offer Sent",
-                MessageID=mID,
-                RequestDate=gDate,
-                OfferID=offer_player_id,
-                ReceiveID=avail_id,
-                RefID=swap_id,
-                Msg=swap_offer,
-                To_number=to_number
-            )
-    else:
-        to_number = player.Mobile
-
-        # Insert initial Swap Offer into Log
-        Log.objects.create(
-            SentDate=timezone.now(),
-            Type="Swap Offer",
-            MessageID='fake mID',
-            RequestDate=gDate,
-            OfferID=offer_player_id,
-            RefID=swap_id,
-            Msg=swap_offer,
-            To_number=to_number
-        )
+        # Update the SwapID of the initial Swap Offer
+        initial_swap.SwapID = initial_swap.id
+        initial_swap.save()
+        swap_id = initial_swap.id
 
-        # Create an insert in SubSwap table for every player in the Available Players list
-        for player_data in available_players:
-            player = player_data['player']
-            to_number = player_data['to_number']
-            avail_id = player_data['avail_id']
+        # Recipients in one query, kept in the order they were picked
+        players_by_id = Players.objects.in_bulk([int(s_id) for s_id in player_ids])
+        available_players = []
 
-            SubSwap.objects.create(
-                RequestDate=timezone.now(),
-                PID=player,
+        for s_id in player_ids:
+            player = players_by_id.get(int(s_id))
+            if player is None:
+                continue
+            to_number = player.Mobile
+            avail_id = player.id
+            avail_name = player.FirstName + " " + player.LastName
+            available_players.append({'player': player, 'to_number': to_number, 'avail_id': avail_id, 'avail_name': avail_name})
+
+        # One INSERT for the Received rows and one for the texts: a confirmation to the
+        # Swap Offering player, then one per Available Player; drain_outbox sends them
+        # and writes the Log rows
+        now = timezone.now()
+        SubSwap.objects.bulk_create([
+            SubSwap(
+                RequestDate=now,
+                PID=player_data['player'],
                 TeeTimeIndID_id=tt_id,
                 nType="Swap",
                 SubType="Received",
@@ -2310,19 +1901,23 @@ def swaprequestsent_view(request):
                 OtherPlayers=other_players,
                 SwapID=swap_id
             )
+            for player_data in available_players
+        ])
+
+        msg = "This msg has been sent to all of the players available for your request date: '" + swap_offer + "'      you will be able to see this offer and status on the sub swap page."
+        msg_link = f"{swap_offer} https://www.gasgolf.org/GRPR/store_swapoffer_data/?swapID={swap_id}"
+        outbox.put([
+            outbox.message('sms', offer_player.Mobile, msg, log=dict(
+                Type="Swap Offer", RequestDate=gDate, OfferID=offer_player_id, RefID=swap_id, Msg=swap_offer,
+            )),
+        ] + [
+            outbox.message('sms', player_data['to_number'], msg_link, log=dict(
+                Type="Swap Offer Sent", RequestDate=gDate, OfferID=offer_player_id,
+                ReceiveID=player_data['avail_id'], RefID=swap_id, Msg=swap_offer,
+            ))
+            for player_data in available_players
+        ])
 
-            # Insert a row into Log table for every text sent
-            Log.objects.create(
-                SentDate=timezone.now(),
-                Type="Swap Offer Sent",
-                MessageID='fake mID',
-                RequestDate=gDate,
-                OfferID=offer_player_id,
-                ReceiveID=avail_id,
-                RefID=swap_id,
-                Msg=swap_offer,
-                To_number=to_number
-            )
 
     # Pass data to the template
     context = {
@@ -2465,7 +2060,7 @@ def swapcounter_view(request):
 
     # GATE: Check if the logged-in user is still available to play the Swap gDate on offer
     gDate = swap_offer.TeeTimeIndID.gDate
-    print('gDate', gDate)
+    subswap_log.debug('gDate %s', gDate)
     availability_error = check_player_availability(player_id, gDate, request)
     if availability_error:
         return availability_error
@@ -2487,8 +2082,8 @@ def swapcounter_view(request):
     # Fetch the mobile numbers
     offer_mobile = offer_player.Mobile
     counter_mobile = player.Mobile
-    print('offer_mobile', offer_mobile) 
-    print('counter_mobile', counter_mobile)
+    subswap_log.debug('offer_mobile %s', offer_mobile)
+    subswap_log.debug('counter_mobile %s', counter_mobile)
 
     # Fetch the original offer details
     offer_date = swap_offer.TeeTimeIndID.gDate
@@ -2502,74 +2097,17 @@ def swapcounter_view(request):
     # Create message
     offer_msg = f"{ first_name } { last_name } have proposed dates to swap for {offer_player_first_name} {offer_player_last_name}'s tee time on {offer_date} at {offer_course} {offer_timeslot}am."
 
-    # Send Twilio messages
-    if settings.TWILIO_ENABLED:
-        client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
-
-        # Insert into SubSwap table for each selected date
-        for date in selected_dates:
-
-            counter_date = date['date']
-            counter_time_slot = date['time_slot']
-            counter_course = date['course']
-            counter_msg = f"{player.FirstName} {player.LastName} is willing to swap {counter_date} at {counter_course} at {counter_time_slot}am for your tee time on {offer_date}"
-            print('counter_msg', counter_msg)
-
-            SubSwap.objects.create(
-                RequestDate=timezone.now(),
-                PID=player,
-                nType='Swap',
-                nStatus='Open',
-                SubType='Counter',
-                Msg=counter_msg,
-                OtherPlayers=date['other_players'],
-                SwapID=swap_id,
-                TeeTimeIndID_id=date['tt_id']
-            )
-
-            # Send message to offer player for each counter date
-            message = client.messages.create(from_='+18449472599', body=counter_msg, to=offer_mobile)
-            offer_mID = message.sid
-
-        # Send message to counter player
-        message = client.messages.create(from_='+18449472599', body=offer_msg, to=counter_mobile)
-        counter_mID = message.sid
-
-        # Insert into Log table for offer player
-        Log.objects.create(
-            SentDate=timezone.now(),
-            Type='Swap Counter',
-            MessageID=offer_mID,
-            RequestDate=offer_date,
-            OfferID=player_id,
-            ReceiveID=offer_player.id,
-            RefID=swap_id,
-            To_number=offer_mobile,
-            Msg=offer_msg
-        )
-
-        # Insert into Log table for counter player
-        Log.objects.create(
-            SentDate=timezone.now(),
-            Type='Swap Counter',
-            MessageID=counter_mID,
-            RequestDate=offer_date,
-            OfferID=player_id,
-            ReceiveID=offer_player.id,
-            RefID=swap_id,
-            To_number=counter_mobile,
-            Msg=counter_msg
-        )
-    else:
-        print('Twilio is not enabled')
-
-        # Insert into SubSwap table for each selected date
-        for date in selected_dates:
+    # Insert into SubSwap table for each selected date and queue a text to the offer
+    # player for each counter date, then one to the counter player. The two
+    # 'Swap Counter' Log rows ride on the last text to each player.
+    log_row = dict(Type='Swap Counter', RequestDate=offer_date, OfferID=player_id, ReceiveID=offer_player.id, RefID=swap_id)
+    with transaction.atomic():
+        for n, date in enumerate(selected_dates, 1):
             counter_date = date['date']
             counter_time_slot = date['time_slot']
             counter_course = date['course']
             counter_msg = f"{player.FirstName} {player.LastName} is willing to swap {counter_date} at {counter_course} at {counter_time_slot}am for your tee time on {offer_date}"
-            print('counter_msg', counter_msg)
+            messaging_log.debug('counter_msg %s', counter_msg)
 
             SubSwap.objects.create(
                 RequestDate=timezone.now(),
@@ -2583,38 +2121,14 @@ def swapcounter_view(request):
                 TeeTimeIndID_id=date['tt_id']
             )
 
+            outbox.sms(offer_mobile, counter_msg, log=dict(log_row, Msg=offer_msg) if n == len(selected_dates) else None)
 
+        outbox.sms(counter_mobile, offer_msg, log=dict(log_row, Msg=counter_msg))
 
-        # Insert into Log table for offer player
-        Log.objects.create(
-            SentDate=timezone.now(),
-            Type='Swap Counter',
-            MessageID='fake Mib',
-            RequestDate=offer_date,
-            OfferID=player_id,
-            ReceiveID=offer_player.id,
-            RefID=swap_id,
-            To_number=offer_mobile,
-            Msg=offer_msg
-        )
-
-        # Insert into Log table for counter player
-        Log.objects.create(
-            SentDate=timezone.now(),
-            Type='Swap Counter',
-            MessageID='fake Mib',
-            RequestDate=offer_date,
-            OfferID=player_id,
-            ReceiveID=offer_player.id,
-            RefID=swap_id,
-            To_number=counter_mobile,
-            Msg=counter_msg
-        )
-
+        # Update SubSwap table.  Change status on the offer row to the counter player to 'Swap Kountered'.  
+        # This prevents the same offer showing up in the Counter Players 'Available Swaps' list on subswap.html
+        SubSwap.objects.filter(SwapID=swap_id, nType='Swap', SubType = 'Received', nStatus='Open', PID_id=player).update(SubType='Kountered')
 
-    # Update SubSwap table.  Change status on the offer row to the counter player to 'Swap Kountered'.  
-    # This prevents the same offer showing up in the Counter Players 'Available Swaps' list on subswap.html
-    SubSwap.objects.filter(SwapID=swap_id, nType='Swap', SubType = 'Received', nStatus='Open', PID_id=player).update(SubType='Kountered')
 
     context = {
         'offer_msg': orig_offer_msg,
@@ -2756,53 +2270,23 @@ def swapcounterreject_view(request):
     counter_mobile = counter_player.Mobile
     counter_user_id = counter_player.id
 
-    # Update SubSwap table for the Counter Offer, closes it as rejected
-    SubSwap.objects.filter(
-        SwapID=swap_id,
-        nStatus='Open',
-        nType='Swap',
-        SubType='Counter',
-        TeeTimeIndID=counter_ttid
-    ).update(SubStatus='Rejected', nStatus='Closed')
-
     counter_msg = f"Tee Time Swap Proposal. {offer_first_name} {offer_last_name} has rejected your proposed { counter_date } at { counter_course_name } { counter_time_slot }am swap for his tee time on {offer_date} at {offer_course_name} {offer_time_slot}am.  Comments: {comments}"
-    
-    # Send texts via Twilio
-    if settings.TWILIO_ENABLED:
-        client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
-
-        # Send text to Counter Player
-        message = client.messages.create(from_='+18449472599', body=counter_msg, to=counter_mobile)
-        counter_mID = message.sid
-
-        # Insert into Log table for counter player
-        Log.objects.create(
-            SentDate=timezone.now(),
-            Type='Swap Offer Reject',
-            MessageID=counter_mID,
-            RequestDate=offer_date,
-            OfferID=player_id,
-            ReceiveID=counter_user_id,
-            RefID=swap_id,
-            Msg=counter_msg,
-            To_number=counter_mobile
-        )
-    else:
-        print('Twilio is not enabled')
-        counter_mID = 'Fake Mib'
 
-        # Insert into Log table for counter player
-        Log.objects.create(
-            SentDate=timezone.now(),
-            Type='Swap Offer Accept',
-            MessageID=counter_mID,
-            RequestDate=offer_date,
-            OfferID=player_id,
-            ReceiveID=counter_user_id,
-            RefID=swap_id,
-            Msg=counter_msg,
-            To_number=counter_mobile
-        )
+    with transaction.atomic():
+        # Update SubSwap table for the Counter Offer, closes it as rejected
+        SubSwap.objects.filter(
+            SwapID=swap_id,
+            nStatus='Open',
+            nType='Swap',
+            SubType='Counter',
+            TeeTimeIndID=counter_ttid
+        ).update(SubStatus='Rejected', nStatus='Closed')
+
+        # Queue the text to the Counter Player
+        outbox.sms(counter_mobile, counter_msg, log=dict(
+            Type='Swap Offer Reject', RequestDate=offer_date, OfferID=player_id,
+            ReceiveID=counter_user_id, RefID=swap_id, Msg=counter_msg,
+        ))
 
     context = {
         'original_player': offer_first_name + ' ' + offer_last_name,
@@ -2881,11 +2365,6 @@ def swapfinal_view(request):
     counter_name = f"{counter_offer.PID.FirstName} {counter_offer.PID.LastName}"
     counter_mobile = counter_offer.PID.Mobile
 
-    # GATE: Check if the logged-in user is still available to play the Swap gDate on offer
-    offer_player_availability_error = check_player_availability(player_id, counter_gDate, request)
-    if offer_player_availability_error:
-        return offer_player_availability_error
-
     # Fetch the original offer details
     original_offer = SubSwap.objects.filter(
         SwapID=swap_id,
@@ -2899,168 +2378,122 @@ def swapfinal_view(request):
     offer_Course = original_offer.TeeTimeIndID.CourseID.courseName
     offer_TimeSlot = original_offer.TeeTimeIndID.CourseID.courseTimeSlot
 
+    # Both players on both dates, in one query
+    matrix = availability.load(dates=[counter_gDate, offer_gDate], player_ids=[player_id, counter_user_id], members=False)
+
+    # GATE: Check if the logged-in user is still available to play the Swap gDate on offer
+    offer_player_availability_error = check_player_availability(player_id, counter_gDate, request, matrix)
+    if offer_player_availability_error:
+        return offer_player_availability_error
+
     # GATE: Check if the Counter Player is still available to play the Swap gDate on offer
-    counter_player_availability_error = check_player_availability(counter_user_id, offer_gDate, request)
+    counter_player_availability_error = check_player_availability(counter_user_id, offer_gDate, request, matrix)
     if counter_player_availability_error:
         return counter_player_availability_error
 
-    # Update SubSwap table for the Counter Offer
-    SubSwap.objects.filter(
-        SwapID=swap_id,
-        nStatus='Open',
-        nType='Swap',
-        SubType='Counter',
-        TeeTimeIndID=counter_ttid
-    ).update(SubStatus='Accepted', nStatus='Closed')
-
-    # Update SubSwap table for all other open rows associated with the swap_id
-    SubSwap.objects.filter(
-        SwapID=swap_id,
-        nStatus='Open'
-    ).update(nStatus='Closed')
-
-    # This bit closes any row in the SubSwap table related to the counter_tt_id that just changed ownership
-    # For example, if the counter player currently had a Sub or Swap request live for this counter date, those would now be closed
-    SubSwap.objects.filter(
-        TeeTimeIndID=counter_ttid,
-        nStatus='Open',
-    ).update(nStatus='Closed', SubStatus='Owner Change')
-
-    # Does the same for the offer_tt_id
-    SubSwap.objects.filter(
-        TeeTimeIndID=offer_ttid,
-        nStatus='Open',
-    ).update(nStatus='Closed', SubStatus='Owner Change')
-
-    # Counter Player availability change - closes all sub swaps available to counter player for the offer date they just acquired
-    counter_player_same_date = SubSwap.objects.select_related('TeeTimeIndID').filter(
-            Q(TeeTimeIndID__gDate=offer_gDate) &
-            Q(PID=counter_user_id) &
-            Q(nStatus='Open')
-    )
-
-    for offers in counter_player_same_date:
-        ss_id = offers.id
-        ss_swap_id = offers.SwapID
-
+    # The swap, the tee time changes and the queued texts commit together
+    with transaction.atomic():
+        # Update SubSwap table for the Counter Offer
         SubSwap.objects.filter(
-            id=ss_id,
-            ).update(nStatus='Closed', SubStatus='Superseded')
-        
-        # Insert row into Log for offer player
-        Log.objects.create(
-            SentDate=timezone.now(),
-            Type="SubSwap Superseded",
-            MessageID='none',
-            RequestDate=offer_gDate,
-            ReceiveID=counter_user_id,
-            OfferID=player_id,
-            RefID=ss_swap_id,
-            Msg=f"{counter_name} has accepted a counter offer for this date.  SubSwap request has been superseded.",
-        )
-
-    # Offer Player availability change - closes all sub swaps available to offer player for the counter date they just acquired
-    offer_player_same_date = SubSwap.objects.select_related('TeeTimeIndID').filter(
-            Q(TeeTimeIndID__gDate=counter_gDate) &
-            Q(PID=player_id) &
-            Q(nStatus='Open')
-    )
+            SwapID=swap_id,
+            nStatus='Open',
+            nType='Swap',
+            SubType='Counter',
+            TeeTimeIndID=counter_ttid
+        ).update(SubStatus='Accepted', nStatus='Closed')
+        stats.invalidate_rankings('SubSwap')
+
+        # Update SubSwap table for all other open rows associated with the swap_id
+        SubSwap.objects.filter(
+            SwapID=swap_id,
+            nStatus='Open'
+        ).update(nStatus='Closed')
 
-    for offers in offer_player_same_date:
-        ss_id = offers.id
-        ss_swap_id = offers.SwapID
+        # This bit closes any row in the SubSwap table related to the counter_tt_id that just changed ownership
+        # For example, if the counter player currently had a Sub or Swap request live for this counter date, those would now be closed
+        SubSwap.objects.filter(
+            TeeTimeIndID=counter_ttid,
+            nStatus='Open',
+        ).update(nStatus='Closed', SubStatus='Owner Change')
 
+        # Does the same for the offer_tt_id
         SubSwap.objects.filter(
-            id=ss_id,
-            ).update(nStatus='Closed', SubStatus='Superseded')
-        
-        # Insert row into Log for offer player
-        Log.objects.create(
-            SentDate=timezone.now(),
-            Type="SubSwap Superseded",
-            MessageID='none',
-            RequestDate=offer_gDate,
-            ReceiveID=counter_user_id,
-            OfferID=player_id,
-            RefID=ss_swap_id,
-            Msg=f"{offer_name} has accepted a counter offer for this date.  SubSwap request has been superseded.",
+            TeeTimeIndID=offer_ttid,
+            nStatus='Open',
+        ).update(nStatus='Closed', SubStatus='Owner Change')
+
+        # Counter Player availability change - closes all sub swaps available to counter player for the offer date they just acquired
+        counter_player_same_date = SubSwap.objects.select_related('TeeTimeIndID').filter(
+                Q(TeeTimeIndID__gDate=offer_gDate) &
+                Q(PID=counter_user_id) &
+                Q(nStatus='Open')
         )
 
-    # Update TeeTimesInd table
-    TeeTimesInd.objects.filter(id=offer_ttid).update(PID=counter_user_id)
-    TeeTimesInd.objects.filter(id=counter_ttid).update(PID=player_id)
-
-    # create the msgs that will be sent via text to the players + be entered into the Log table
-    offer_msg = f"Tee Time Swap Accepted. {offer_name} is now playing {counter_gDate} at {counter_Course} at {counter_TimeSlot}am. {counter_name} will play {offer_gDate} at {offer_Course} at {offer_TimeSlot}am."
-    counter_msg = f"Tee Time Swap Accepted. {counter_name} is now playing {offer_gDate} at {offer_Course} at {offer_TimeSlot}am. {offer_name} will play {counter_gDate} at {counter_Course} at {counter_TimeSlot}am."
-    
-    # Send texts via Twilio
-    if settings.TWILIO_ENABLED:
-        client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
-
-        # Send text to Offer Player
-        message = client.messages.create(from_='+18449472599', body=offer_msg, to=offer_mobile)
-        offer_mID = message.sid
+        for offers in counter_player_same_date:
+            ss_id = offers.id
+            ss_swap_id = offers.SwapID
 
-        # Send text to Counter Player
-        message = client.messages.create(from_='+18449472599', body=counter_msg, to=counter_mobile)
-        counter_mID = message.sid
+            SubSwap.objects.filter(
+                id=ss_id,
+                ).update(nStatus='Closed', SubStatus='Superseded')
+        
+            # Insert row into Log for offer player
+            Log.objects.create(
+                SentDate=timezone.now(),
+                Type="SubSwap Superseded",
+                MessageID='none',
+                RequestDate=offer_gDate,
+                ReceiveID=counter_user_id,
+                OfferID=player_id,
+                RefID=ss_swap_id,
+                Msg=f"{counter_name} has accepted a counter offer for this date.  SubSwap request has been superseded.",
+            )
 
-        # Insert into Log table for offer player
-        Log.objects.create(
-            SentDate=timezone.now(),
-            Type='Swap Counter Accept',
-            MessageID=offer_mID,
-            RequestDate=counter_gDate,
-            OfferID=counter_user_id,
-            ReceiveID=player_id,
-            RefID=swap_id,
-            Msg=offer_msg,
-            To_number=offer_mobile
+        # Offer Player availability change - closes all sub swaps available to offer player for the counter date they just acquired
+        offer_player_same_date = SubSwap.objects.select_related('TeeTimeIndID').filter(
+                Q(TeeTimeIndID__gDate=counter_gDate) &
+                Q(PID=player_id) &
+                Q(nStatus='Open')
         )
 
-        # Insert into Log table for counter player
-        Log.objects.create(
-            SentDate=timezone.now(),
-            Type='Swap Offer Accept',
-            MessageID=counter_mID,
-            RequestDate=offer_gDate,
-            OfferID=player_id,
-            ReceiveID=counter_user_id,
-            RefID=swap_id,
-            Msg=counter_msg,
-            To_number=counter_mobile
-        )
-    else:
-        print('Twilio is not enabled')
-        offer_mID = 'Fake Mib'
-        counter_mID = 'Fake Mib'
+        for offers in offer_player_same_date:
+            ss_id = offers.id
+            ss_swap_id = offers.SwapID
+
+            SubSwap.objects.filter(
+                id=ss_id,
+                ).update(nStatus='Closed', SubStatus='Superseded')
+        
+            # Insert row into Log for offer player
+            Log.objects.create(
+                SentDate=timezone.now(),
+                Type="SubSwap Superseded",
+                MessageID='none',
+                RequestDate=offer_gDate,
+                ReceiveID=counter_user_id,
+                OfferID=player_id,
+                RefID=ss_swap_id,
+                Msg=f"{offer_name} has accepted a counter offer for this date.  SubSwap request has been superseded.",
+            )
 
-         # Insert into Log table for offer player
-        Log.objects.create(
-            SentDate=timezone.now(),
-            Type='Swap Counter Accept',
-            MessageID=offer_mID,
-            RequestDate=counter_gDate,
-            OfferID=counter_user_id,
-            ReceiveID=player_id,
-            RefID=swap_id,
-            Msg=offer_msg,
-            To_number=offer_mobile
-        )
+        # Update TeeTimesInd table
+        TeeTimesInd.objects.filter(id=offer_ttid).update(PID=counter_user_id)
+        TeeTimesInd.objects.filter(id=counter_ttid).update(PID=player_id)
+
+        # create the msgs that will be sent via text to the players + be entered into the Log table
+        offer_msg = f"Tee Time Swap Accepted. {offer_name} is now playing {counter_gDate} at {counter_Course} at {counter_TimeSlot}am. {counter_name} will play {offer_gDate} at {offer_Course} at {offer_TimeSlot}am."
+        counter_msg = f"Tee Time Swap Accepted. {counter_name} is now playing {offer_gDate} at {offer_Course} at {offer_TimeSlot}am. {offer_name} will play {counter_gDate} at {counter_Course} at {counter_TimeSlot}am."
+    
+        # Queue the texts to the Offer Player and the Counter Player
+        outbox.sms(offer_mobile, offer_msg, log=dict(
+            Type='Swap Counter Accept', RequestDate=counter_gDate, OfferID=counter_user_id,
+            ReceiveID=player_id, RefID=swap_id, Msg=offer_msg,
+        ))
+        outbox.sms(counter_mobile, counter_msg, log=dict(
+            Type='Swap Offer Accept', RequestDate=offer_gDate, OfferID=player_id,
+            ReceiveID=counter_user_id, RefID=swap_id, Msg=counter_msg,
+        ))
 
-        # Insert into Log table for counter player
-        Log.objects.create(
-            SentDate=timezone.now(),
-            Type='Swap Offer Accept',
-            MessageID=counter_mID,
-            RequestDate=offer_gDate,
-            OfferID=player_id,
-            ReceiveID=counter_user_id,
-            RefID=swap_id,
-            Msg=counter_msg,
-            To_number=counter_mobile
-        )
 
     context = {
         'counter_gDate': counter_gDate,
@@ -3652,10 +3085,19 @@ def subswap_admin_update_view(request):
 
 @login_required
 def statistics_view(request):
-    # for course distro chart:
-    courses = Courses.objects.all().order_by('id')
-    players = Players.objects.filter(Member=1).order_by('LastName')
+    season = seasons.get(request.GET.get('season'))
+    courses = list(Courses.objects.all().order_by('id'))
+    players = list(Players.objects.filter(Member=1).order_by('LastName'))
+
+    # one grouped read of (player, course, date) counts feeds both distro charts
+    attendance, dates = stats.attendance_counts(season)
+    by_course = defaultdict(int)
+    by_date = defaultdict(int)
+    for (pid, course_id, gdate), n in attendance.items():
+        by_course[(pid, course_id)] += n
+        by_date[(pid, gdate)] += n
 
+    # for course distro chart:
     course_names= []
     for course in courses:
         name_slot = f"{course.courseName} {course.courseTimeSlot}am"
@@ -3664,54 +3106,30 @@ def statistics_view(request):
     korse_chart_data = {}
 
     for player_a in players:
-        korse_per = {}
-        for korse in courses:
-            korse_count = TeeTimesInd.objects.filter(PID=player_a.id, CourseID=korse.id, gDate__gt='2025-01-01').count()
-            korse_per[korse.id] = korse_count
-        total_count = sum(korse_per.values())
-        korse_per['total'] = total_count
+        korse_per = {korse.id: by_course[(player_a.id, korse.id)] for korse in courses}
+        korse_per['total'] = sum(korse_per.values())
         korse_chart_data[player_a.id] = korse_per
 
     # for date distro chart:
-    dates = TeeTimesInd.objects.filter(gDate__gt='2025-01-01').values('gDate').distinct().order_by('gDate')
-
-    date_names = [date['gDate'].strftime('%Y-%m-%d') for date in dates]
+    date_names = [d.strftime('%Y-%m-%d') for d in dates]
 
     date_chart_data = {}
-    
+
     for player_b in players:
-        date_per = {}
-        for date in dates:
-            date_count = TeeTimesInd.objects.filter(PID=player_b.id, gDate=date['gDate']).count()
-            # Replace zero values with blanks
-            date_per[date['gDate'].strftime('%Y-%m-%d')] = date_count if date_count != 0 else ''
-        total_count = sum(value for value in date_per.values() if value != '')
-        date_per['total'] = total_count
+        # Replace zero values with blanks
+        date_per = {d.strftime('%Y-%m-%d'): by_date[(player_b.id, d)] or '' for d in dates}
+        date_per['total'] = sum(value for value in date_per.values() if value != '')
         date_chart_data[player_b.id] = date_per
 
-    # For the player heatmap chart:
-    chart_data = {}
-    max_count = 0
-
-    for player_a in players:
-        distinct_counts = {}
-        for p_id in players:
-            distinct_counts[p_id.id] = 0
-        ttis = TeeTimesInd.objects.filter(PID=player_a.id, gDate__gt='2025-01-01')
-        for tt in ttis:
-            tDate = tt.gDate
-            cID = tt.CourseID
-            partners = TeeTimesInd.objects.filter(gDate=tDate, CourseID=cID).exclude(PID=player_a.id)
-            for p in partners:
-                pID = p.PID_id
-                if pID in distinct_counts:
-                    distinct_counts[pID] += 1
-                # else:
-                #     distinct_counts[pID] = 1
-        chart_data[player_a.id] = distinct_counts
+    # For the player heatmap chart (self-join on date & slot, one query):
+    partners = stats.partner_counts(season)
+    chart_data = {
+        player_a.id: {p.id: partners.get(player_a.id, {}).get(p.id, 0) for p in players}
+        for player_a in players
+    }
 
     # Find the maximum count for normalization
-    max_count = max(max(distinct_counts.values()) for distinct_counts in chart_data.values())
+    max_count = max((max(counts.values(), default=0) for counts in chart_data.values()), default=0) or 1
 
     # Normalize the values
     normalized_chart_data = {}
@@ -3773,6 +3191,8 @@ def statistics_view(request):
         'zipped_data': zipped_data,
         "actions": actions,
         'xdates_list': xdates_list,  
+        'season': season,
+        'seasons': seasons.all_seasons(),
         "first_name": request.user.first_name,  # Add the first name of the logged-in user
         "last_name": request.user.last_name, # Add the last name of the logged-in user
     }
@@ -4106,293 +3526,28 @@ def player_add_view(request):
 
 # ------------------------------------------------------------------ #
 #  This section is for the Best Rounds page                          #
-#  Helpers: leaders + top-10 lists                                   #
+#  Rankings live in GRPR/services/rankings.py                        #
 # ------------------------------------------------------------------ #
 
-STAT_LABELS = {
-    # "gross"        : "Best Gross",
-    "net"          : "Best Net Score",
-    "skins"        : "Most Skins (Season)",
-    "gross_member" : "Best Gross Score (Member)",
-    "attendance"   : "Best Attendance",
-    "skins_one"    : "Most Skins (1 Round)",
-    "forty_season" : "Most Forty Holes (Season)",
-    "forty_one"    : "Most Forty Holes (1 Round)",
-    "trader"       : "Best Trader",
-    "quick_draw"   : "Quickest Draw",
-    "friends"      : "Most Frequent Partners",
-}
-
-YEAR_START = date(2025, 1, 1)
-SEASON_START = date(2025, 4, 1)
-SEASON_END   = date(2025, 9, 1)
-TODAY       = timezone.now().date() 
-
-
-
-# def _top10_gross():
-#     qs = (
-#         ScorecardMeta.objects
-#         .filter(PlayDate__gte=YEAR_START)
-#         .values("PID_id", "PID__FirstName", "PID__LastName")
-#         .annotate(value=Min("RawTotal"))
-#         .order_by("value")[:10]
-#     )
-#     return [
-#         {"name": f"{r['PID__FirstName']} {r['PID__LastName']}",
-#          "value": r["value"]}
-#         for r in qs
-#     ]
-
-# ----------  gross_member  (best score + date) -----------------
-def _top10_gross_member():
-    rows = (
-        ScorecardMeta.objects
-        .filter(
-            PlayDate__range=(SEASON_START, SEASON_END),
-            PID__Member=1,
-            RawTotal__isnull=False,
-        )
-        .annotate(hole_count=Count("scorecard"))
-        .filter(hole_count__gte=18)
-        .order_by("RawTotal", "-PlayDate")
-        .values("PID__FirstName", "PID__LastName", "PlayDate", "RawTotal")[:10]
-    )
-    return [
-        {"name": f"{r['PID__FirstName']} {r['PID__LastName']}",
-         "value": r["RawTotal"],
-         "date":  r["PlayDate"]}
-        for r in rows
-    ]
-
-
-# ----------  net  (best net score + date) ----------------------
-def _top10_net():
-    rows = (
-        ScorecardMeta.objects
-        .filter(
-            PlayDate__range=(SEASON_START, SEASON_END),
-            NetTotal__isnull=False,
-        )
-        .annotate(hole_count=Count("scorecard"))
-        .filter(hole_count__gte=18)
-        .order_by("NetTotal", "-PlayDate")
-        .values("PID__FirstName", "PID__LastName", "PlayDate", "NetTotal")[:10]
-    )
-    return [
-        {"name": f"{r['PID__FirstName']} {r['PID__LastName']}",
-         "value": r["NetTotal"],
-         "date":  r["PlayDate"]}
-        for r in rows
-    ]
-
-
-# ----------  skins_one  (max skins in one round + date) --------
-def _top10_skins_one():
-    from collections import defaultdict
-
-    per_round = (
-        Skins.objects
-        .filter(SkinDate__range=(SEASON_START, SEASON_END))
-        .values("PlayerID_id", "PlayerID__FirstName", "PlayerID__LastName",
-                "GameID__PlayDate")
-        .annotate(cnt=Count("id"))
-    )
-
-    best = defaultdict(lambda: {"value": 0})
-    for r in per_round:
-        pid, c = r["PlayerID_id"], r["cnt"]
-        if c > best[pid]["value"]:
-            best[pid] = {
-                "name": f"{r['PlayerID__FirstName']} {r['PlayerID__LastName']}",
-                "value": c,
-                "date":  r["GameID__PlayDate"],
-            }
-
-    top = sorted(best.values(), key=lambda x: -x["value"])[:10]
-    return top
-
-
-# ----------  forty_one  (max forty rows in one round + date) ---
-def _top10_forty_one():
-    import itertools
-    from collections import defaultdict
-
-    per_round = (
-        Forty.objects
-        .filter(GameID__PlayDate__range=(SEASON_START, SEASON_END))
-        .values("PID_id", "PID__FirstName", "PID__LastName", "GameID__PlayDate")
-        .annotate(cnt=Count("id"))
-    )
-
-    best = defaultdict(lambda: {"value": 0})
-    for r in per_round:
-        pid, c = r["PID_id"], r["cnt"]
-        if c > best[pid]["value"]:
-            best[pid] = {
-                "name": f"{r['PID__FirstName']} {r['PID__LastName']}",
-                "value": c,
-                "date":  r["GameID__PlayDate"],
-            }
-
-    return sorted(best.values(), key=lambda x: -x["value"])[:10]
-
-def _top10_skins():
-    qs = (
-        Skins.objects
-        .filter(SkinDate__range=(SEASON_START, SEASON_END))
-        .values("PlayerID_id", "PlayerID__FirstName", "PlayerID__LastName")
-        .annotate(value=Count("id"))
-        .order_by("-value")[:10]
-    )
-    return [{"name": f"{r['PlayerID__FirstName']} {r['PlayerID__LastName']}", "value": r["value"]} for r in qs]
-
-
-def _top10_attendance():
-    qs = (
-        TeeTimesInd.objects
-        .filter(gDate__range=(SEASON_START, SEASON_END))
-        .values("PID_id", "PID__FirstName", "PID__LastName")
-        .annotate(value=Count("id"))
-        .order_by("-value")[:10]
-    )
-    return [{"name": f"{r['PID__FirstName']} {r['PID__LastName']}", "value": r["value"]} for r in qs]
-
-def _top10_forty_season():
-    """Most Forty rows per player for the whole 2025 season."""
-    qs = (
-        Forty.objects
-        .filter(GameID__PlayDate__range=(SEASON_START, SEASON_END))
-        .values("PID_id", "PID__FirstName", "PID__LastName")
-        .annotate(value=Count("id"))
-        .order_by("-value")[:10]
-    )
-    return [
-        {"name": f"{r['PID__FirstName']} {r['PID__LastName']}",
-         "value": r["value"]}
-        for r in qs
-    ]
-
-def _top10_trader():
-    """
-    Counts BOTH players involved in every swap that ended
-    Closed & Accepted between 1 Jan 2025 and today.
-    """
-    # 1) SwapIDs that actually closed/accepted in the window
-    swaps = (
-        SubSwap.objects
-        .filter(nStatus="Closed",
-                SubStatus="Accepted",
-                RequestDate__range=(SEASON_START, SEASON_END))
-        .values_list("SwapID", flat=True)
-    )
-
-    # 2) rows that earn credit
-    offers   = SubSwap.objects.filter(SwapID__in=swaps, SubType="Offer")\
-                              .values_list("PID_id", flat=True)
-    counters = SubSwap.objects.filter(SwapID__in=swaps,
-                                      SubType="Counter",
-                                      SubStatus="Accepted")\
-                              .values_list("PID_id", flat=True)
-
-    freq     = Counter(chain(offers, counters))
-    ranking  = freq.most_common(10)
-
-    return [
-        {
-            "name":  f"{Players.objects.get(pk=pid).FirstName} "
-                     f"{Players.objects.get(pk=pid).LastName}",
-            "value": total,
-        }
-        for pid, total in ranking
-    ]
-
-
-def _top10_quick_draw():
-    qs = (
-        SubSwap.objects
-        .filter(nStatus="Closed", SubStatus="Accepted", nType="Sub", RequestDate__range=(SEASON_START, SEASON_END))
-        .values("PID_id", "PID__FirstName", "PID__LastName")
-        .annotate(value=Count("id"))
-        .order_by("-value")[:10]
-    )
-    return [{"name": f"{r['PID__FirstName']} {r['PID__LastName']}", "value": r["value"]} for r in qs]
-
-def _top10_friends():
-    """
-    Top 10 most-frequent playing partners in 2025 (same date & slot).
-    """
-    sql = """
-        SELECT  LEAST(t1."PID_id", t2."PID_id")  AS p1,
-                GREATEST(t1."PID_id", t2."PID_id") AS p2,
-                COUNT(*)                          AS cnt
-        FROM    "TeeTimesInd" t1
-        JOIN    "TeeTimesInd" t2
-          ON    t1."gDate"       = t2."gDate"
-         AND    t1."CourseID_id" = t2."CourseID_id"
-         AND    t1."PID_id"      < t2."PID_id"          -- avoid (A,B) / (B,A)
-        WHERE   t1."gDate" BETWEEN %s AND %s
-        GROUP BY p1, p2
-        ORDER BY cnt DESC
-        LIMIT 10;
-    """
-
-    with connection.cursor() as cur:
-        cur.execute(sql, [SEASON_START, SEASON_END])
-        rows = cur.fetchall()          # (p1, p2, cnt)
-
-    result = []
-    for pid1, pid2, cnt in rows:
-        p1 = Players.objects.get(pk=pid1)
-        p2 = Players.objects.get(pk=pid2)
-        result.append({
-            "name":  f"{p1.FirstName} {p1.LastName} & "
-                     f"{p2.FirstName} {p2.LastName}",
-            "value": cnt,
-        })
-    return result
-
-TOP10_FUNC = {
-    # "gross"        : _top10_gross,
-    "net"          : _top10_net,
-    "gross_member" : _top10_gross_member,
-    "skins"        : _top10_skins,
-    "attendance"   : _top10_attendance,
-    "skins_one"    : _top10_skins_one,
-    "forty_season" : _top10_forty_season,
-    "forty_one"    : _top10_forty_one,
-    "trader"       : _top10_trader,
-    "quick_draw"   : _top10_quick_draw,
-    "friends"      : _top10_friends,
-}
-
-def _get_round_leaders():
-    """
-    Build a dict keyed by stat name whose value is the first row
-    of the corresponding _top10_… helper (or None if no data).
-    This guarantees card == top-row of the Top-10 table.
-    """
-    leaders = {}
-    for stat, func in TOP10_FUNC.items():
-        rows = func()
-        leaders[stat] = rows[0] if rows else None
-    return leaders
-
 @login_required
 def rounds_leaderboard_view(request):
     chosen = request.GET.get("stat", "gross_member")     # default that exists
-    if chosen not in TOP10_FUNC:
+    if chosen not in rankings.TOP10_FUNC:
         chosen = "gross_member"
 
-    label   = STAT_LABELS[chosen]
-    topten  = TOP10_FUNC[chosen]()          # same helpers…
-    leaders = _get_round_leaders()           # …and cards use them too
+    season  = seasons.get(request.GET.get("season"))
+    label   = rankings.STAT_LABELS[chosen]
+    tops    = stats.top10_rankings(season)   # season cube, live if stale
+    topten  = tops[chosen]                   # same rows…
+    leaders = rankings.round_leaders(season, tops.get)   # …and cards use them too
 
     return render(request, "GRPR/rounds_leaderboard.html", {
         "chosen":  chosen,
         "label":   label,
         "topten":  topten,
         "leaders": leaders,
+        "season":  season,
+        "seasons": seasons.all_seasons(),
     })
 
 
@@ -4539,6 +3694,7 @@ def skins_game_close_view(request):
     Games.objects.filter(id=game_id).update(
         Status="Closed", IsLocked=True, LockedAt=timezone.now()
     )
+    live.touch(game_id)
 
     game = Games.objects.filter(id=game_id).first()
     context = {
@@ -4695,10 +3851,9 @@ def skins_choose_players_view(request):
 
     # Query the next closest future date in the TeeTimesInd table
     next_closest_date = TeeTimesInd.objects.filter(gDate__gte=current_datetime).order_by('gDate').values('gDate').first()
-    print('next_closest_date', next_closest_date)
+    setup_log.debug('next_closest_date %s', next_closest_date)
     # hard code a date:
     # next_closest_date = {'gDate': date(2025, 4, 26)}
-    print('')
 
     # If no future date is found, return an empty context
     if not next_closest_date:
@@ -4714,9 +3869,7 @@ def skins_choose_players_view(request):
 
     # Query the database for tee times on the next closest date
     tee_times_queryset = TeeTimesInd.objects.filter(gDate=next_closest_date).select_related('PID', 'CourseID').order_by('CourseID__courseTimeSlot')
-    print()
-    print('tee_times_queryset"', tee_times_queryset)
-    print()
+    setup_log.debug('tee_times_queryset %s', tee_times_queryset)
 
     # Group players by tee time
     tee_times = []
@@ -4740,9 +3893,8 @@ def skins_choose_players_view(request):
     # Count the number of players in all tee_times groups
     number_of_players = sum(len(group['players']) for group in tee_times)
     
-    print('new_skins_game_view')
-    print('tee_times', tee_times)
-    print()
+    setup_log.debug('new_skins_game_view')
+    setup_log.debug('tee_times %s', tee_times)
 
     context = {
         'playing_date': next_closest_date,
@@ -4799,7 +3951,7 @@ def skins_choose_replacement_player_view(request):
 
     # Query available players
     available_players = Players.objects.filter(CrewID=1, Member=1).exclude(id__in=existing_player_ids).order_by('LastName', 'FirstName')
-    print('available_players', available_players)
+    setup_log.debug('available_players %s', available_players)
 
     # Find groups with less than 4 players
     available_groups = [group for group in tee_times if len(group['players']) < 4]
@@ -5113,11 +4265,10 @@ def skins_new_game_view(request):
 
     # Query the next closest future date in the TeeTimesInd table
     next_closest_date = TeeTimesInd.objects.filter(gDate__gte=current_datetime).order_by('gDate').values('gDate').first()
-    print('next_closest_date', next_closest_date)
+    setup_log.debug('next_closest_date %s', next_closest_date)
     # hard code a date:
     # next_closest_date = {'gDate': date(2025, 4, 26)}
-    print('hard coded next_closest_date', next_closest_date)
-    print('')
+    setup_log.debug('hard coded next_closest_date %s', next_closest_date)
 
     # If no future date is found, return an empty context
     if not next_closest_date:
@@ -5133,9 +4284,7 @@ def skins_new_game_view(request):
 
     # Query the database for tee times on the next closest date
     tee_times_queryset = TeeTimesInd.objects.filter(gDate=next_closest_date).select_related('PID', 'CourseID').order_by('CourseID__courseTimeSlot')
-    print()
-    print('tee_times_queryset"', tee_times_queryset)
-    print()
+    setup_log.debug('tee_times_queryset %s', tee_times_queryset)
 
     # Group players by tee time
     tee_times = []
@@ -5159,9 +4308,8 @@ def skins_new_game_view(request):
     # Count the number of players in all tee_times groups
     number_of_players = sum(len(group['players']) for group in tee_times)
     
-    print('new_skins_game_view')
-    print('tee_times', tee_times)
-    print()
+    setup_log.debug('new_skins_game_view')
+    setup_log.debug('tee_times %s', tee_times)
 
     context = {
         'playig_date': next_closest_date,
@@ -5389,9 +4537,7 @@ def skins_choose_tees_view(request):
     pDate = game.PlayDate
     ct_id = game.CourseTeesID_id
 
-    print()
-    print('skins_choose_tees_view - pDate', pDate)
-    print()
+    setup_log.debug('skins_choose_tees_view - pDate %s', pDate)
 
     # Get the player_id for the current logged-in user
     user = request.user
@@ -5401,8 +4547,7 @@ def skins_choose_tees_view(request):
 
     # Fetch the game invites to display on the skins_invite.html page
     invites_queryset = GameInvites.objects.filter(GameID=game_id, Status='Accepted').select_related('PID', 'TTID__CourseID')
-    print('skins_choose_tees_view - invites_queryset', invites_queryset)
-    print()
+    setup_log.debug('skins_choose_tees_view - invites_queryset %s', invites_queryset)
 
     # Get distinct CourseID values
     distinct_course_ids = invites_queryset.values('TTID__CourseID').distinct()
@@ -5433,12 +4578,11 @@ def skins_choose_tees_view(request):
             'players': players,
         })
     
-    print('skins_choose_tees_view - invites', invites)
-    print()
+    setup_log.debug('skins_choose_tees_view - invites %s', invites)
     
     tee_options = CourseTees.objects.filter(CourseID=ct_id).order_by('TeeID')
-    print('ct_id', ct_id)
-    print('tee_options', tee_options)
+    setup_log.debug('ct_id %s', ct_id)
+    setup_log.debug('tee_options %s', tee_options)
     
     tee_options_list = []
     for tee in tee_options:
@@ -5478,6 +4622,7 @@ def skins_initiate_scorecard_meta_view(request):
 
         # Update the Games table to set the status to 'Live'
         Games.objects.filter(id=game_id).update(Status="Live", Format = game_format)
+        live.touch(game_id)
 
         # Get logged-in user's player ID
         logged_in_user = get_object_or_404(Players, user_id=request.user.id)
@@ -5489,13 +4634,14 @@ def skins_initiate_scorecard_meta_view(request):
         ct_id = game.CourseTeesID_id
         crew_id = game.CrewID
         crew = get_object_or_404(Crews, id=crew_id)
-        print('player_ids', player_ids)
+        setup_log.debug('player_ids %s', player_ids)
 
         # Process each player
         with transaction.atomic():
+            metas = []
             for player_id in player_ids:
                 tee_id = request.POST.get(f"tee_ids_{player_id}")  # Get the tee_id for this player
-                print(f"Processing player_id: {player_id}, tee_id: {tee_id}")
+                setup_log.debug('Processing player_id: %s, tee_id: %s', player_id, tee_id)
 
                 # Convert tee_id to a CourseTees object
                 tee_object = get_object_or_404(CourseTees, id=int(tee_id))
@@ -5523,7 +4669,7 @@ def skins_initiate_scorecard_meta_view(request):
                 )
 
                 # Insert into ScorecardMeta
-                ScorecardMeta.objects.create(
+                metas.append(ScorecardMeta(
                     GameID=game,
                     CreateDate=timezone.now(),
                     CreateID=logged_in_user_player_id,
@@ -5535,16 +4681,19 @@ def skins_initiate_scorecard_meta_view(request):
                     Index=index,
                     RawHDCP=raw_hcdp,
                     GroupID=group_id,
-                )
+                ))
+
+            # (GameID, PID) is unique: a double-submitted form keeps the first rows
+            ScorecardMeta.objects.bulk_create(metas, ignore_conflicts=True)
         
         # Calculate the NetHDCP for each player
         scm = ScorecardMeta.objects.filter(GameID=game_id)
-        print('ScorecardMeta entries:', scm)
+        setup_log.debug('ScorecardMeta entries: %s', scm)
 
         if game_format == 'Low Man':
             # Find the lowest RawHDCP
             lowest_raw_hdcp = scm.order_by('RawHDCP').first().RawHDCP
-            print('Lowest RawHDCP:', lowest_raw_hdcp)
+            setup_log.debug('Lowest RawHDCP: %s', lowest_raw_hdcp)
 
             # Update NetHDCP for each player
             for hdcp in scm:
@@ -5553,7 +4702,7 @@ def skins_initiate_scorecard_meta_view(request):
                 net_hdcp = custom_round(float(raw_hdcp - lowest_raw_hdcp))
                 hdcp.NetHDCP = net_hdcp
                 hdcp.save()
-                print(f"Updated NetHDCP for PID {pid}: {net_hdcp}")
+                setup_log.debug('Updated NetHDCP for PID %s: %s', pid, net_hdcp)
         elif game_format == 'Full Handicap':
             # Set NetHDCP to the rounded RawHDCP for each player
             for hdcp in scm:
@@ -5562,7 +4711,7 @@ def skins_initiate_scorecard_meta_view(request):
                 net_hdcp = custom_round(float(raw_hdcp))
                 hdcp.NetHDCP = net_hdcp
                 hdcp.save()
-                print(f"Updated NetHDCP for PID {pid}: {net_hdcp}")
+                setup_log.debug('Updated NetHDCP for PID %s: %s', pid, net_hdcp)
 
         request.session['game_id'] = game_id
 
@@ -5587,221 +4736,23 @@ def skins_leaderboard_view(request):
     game_id = request.GET.get('game_id') or request.session.pop('game_id', None)
     if not game_id:
         return HttpResponseBadRequest("Game ID is missing.")
-    print('skins_leaderboard_view game_id', game_id)
-
-    # Get the associated Forty game ID
-    forty_game_id = Games.objects.filter(id=game_id).values_list('AssocGame', flat=True).first()
-    assoc_id = Games.objects.filter(id=game_id).values_list('AssocGame', flat=True).first()
-    print("assoc_id", assoc_id)
-    forty_game_id = Games.objects.filter(AssocGame=assoc_id, Type='Forty').values_list('id', flat=True).first()
-    fall_classic_game_id = Games.objects.filter(AssocGame=assoc_id, Type='FallClassic').values_list('id', flat=True).first()
-    skins_game_id = Games.objects.filter(AssocGame=assoc_id, Type='Skins').values_list('id', flat=True).first()
-    stbl_game_id = Games.objects.filter(AssocGame=assoc_id, Type='Stableford').values_list('id', flat=True).first()
-
-    print("forty_id", forty_game_id)
-    print("fall_classic_id", fall_classic_game_id)
-    print("skins_id", skins_game_id)
-
-    # work for forty leaderboard table
-    forty_leaderboard = []
-    if forty_game_id:
-        # Get all groups in the Forty table for this Forty game
-        forty_groups = Forty.objects.filter(GameID_id=forty_game_id).values_list('GroupID', flat=True).distinct()
-        for group_id in forty_groups:
-            scores_used = Forty.objects.filter(GameID_id=forty_game_id, GroupID=group_id).count()
-            scores_played = Scorecard.objects.filter(GameID_id=game_id, smID__GroupID=group_id).count()
-            # num_scores = Games.objects.filter(id=forty_game_id).values_list('NumScores', flat=True).first() or 0
-            num_scores, min1_req, min18_req = _forty_group_requirements(forty_game_id, group_id)
-            scores_needed = num_scores - scores_used
-            # scores_available = 72 - scores_played
-            par = Forty.objects.filter(GameID_id=forty_game_id, GroupID=group_id).aggregate(total=Sum('Par'))['total'] or 0
-            group_score = Forty.objects.filter(GameID_id=forty_game_id, GroupID=group_id).aggregate(total=Sum('NetScore'))['total'] or 0
-            over_under = group_score - par
-
-            forty_leaderboard.append({
-                'group_id': group_id,
-                'scores_used': scores_used,
-                'scores_needed': scores_needed,
-                # 'scores_available': scores_available,
-                'over_under': over_under,
-            })
-    # -- end forty leaderboard table
-
-    # =================== Team game (Gas Cup / Fall Classic) ===================
-    # Figure out the anchor id (Skins if present, else current)
-    row = Games.objects.filter(id=game_id).only("Type", "AssocGame").first()
-    anchor_id = game_id
-    if row and row.Type != "Skins" and row.AssocGame:
-        anchor_id = int(row.AssocGame)
-
-    # Find a team game tied to the anchor (GasCup or FallClassic)
-    team_game = (
-        Games.objects
-        .filter(AssocGame=anchor_id, Type__in=["GasCup", "FallClassic"])
-        .order_by("-id")
-        .first()
-    )
-
-    variant = team_game.Type if team_game else None
-
-    # Default branding is PGA/LIV; switch for Fall Classic
-    team_labels = ("PGA", "LIV")
-    if team_game and team_game.Type == "FallClassic":
-        # team_labels = ("Cubs", "Sox")
-        team_labels = ("USA", "EU")
-
-    gas_matches = []
-    gas_totals  = None
-    gas_rosters = None
-    is_fallclassic = False
-
-    if team_game:
-        gas_matches, gas_totals = gascup.summary_for_game(team_game.id)
-        gas_rosters = gascup.rosters_for_game(team_game.id)
-        is_fallclassic = (team_game.Type == "FallClassic")
-    # =================== End Team game (Gas Cup / Fall Classic) ===================
-
-    # =================== Stableford ===================
-    # Find Stableford sibling game tied to the same anchor
-    stableford_game_id = (
-        Games.objects
-        .filter(AssocGame=anchor_id, Type="Stableford")
-        .values_list("id", flat=True)
-        .first()
-    )
-
-    stableford_board = []
-    if stableford_game_id:
-        # Subqueries: map each StblScore row's PID -> TeamID and TeamName
-        team_id_for_pid = (
-            StblTeam.objects
-            .filter(Game_id=stableford_game_id, PID_id=OuterRef("PID_id"))
-            .values("TeamID")[:1]
-        )
-        team_name_for_pid = (
-            StblTeam.objects
-            .filter(Game_id=stableford_game_id, PID_id=OuterRef("PID_id"))
-            .values("TeamName")[:1]
-        )
-
-        # Aggregate points per team (id + name), and compute "thru"
-        per_team = (
-            StblScore.objects
-            .filter(Game_id=stableford_game_id)
-            .annotate(
-                team_id=Subquery(team_id_for_pid),
-                team_name=Subquery(team_name_for_pid),
-            )
-            .values("team_id", "team_name")
-            .annotate(
-                points=Sum("Points"),
-                thru=Max("Hole_id__HoleNumber"),
-            )
-            .order_by("-points", "team_id")
-        )
-
-        for row in per_team:
-            tid = row["team_id"]
-            if tid is None:
-                continue  # orphan score without a team assignment
-            name = row["team_name"] or f"Team {tid}"
-            stableford_board.append({
-                "team_id": tid,
-                "team_name": name,
-                "thru":    row["thru"] or 0,
-                "points":  row["points"] or 0,
-            })
-    # =================== End Stableford ===================
-
-
-    # =================== Skins ===================
-    # Get the Status and PlayDate of the game in a single query
-    game_data = Games.objects.filter(id=game_id).values('Status', 'PlayDate').first()
-    if not game_data:
+    scoring_log.debug('skins_leaderboard_view game_id %s', game_id)
+
+    # Polling clients revalidate; nothing changed since their copy → 304
+    version = live.version(game_id)
+    etag = live.etag("lb", game_id, version, request.user.pk)
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        return not_modified
+
+    # Skins, Forty, team game and Stableford boards (snapshot for this version)
+    board = live.board(game_id, version)
+    if board is None:
         return HttpResponseBadRequest("Game not found.")
 
-    game_status = game_data['Status']
-    play_date = game_data['PlayDate']
-    print('skins_leaderboard_view game_status:', game_status)
-    print('skins_leaderboard_view play_date:', play_date)
-
-    # Query the ScorecardMeta table and join with related models
-    scorecard_meta = ScorecardMeta.objects.filter(
-        GameID_id=game_id
-    ).select_related(
-        'PID',  # Join with Players
-        'TeeID'  # Join with CourseTees
-    ).annotate(
-        first_name=F('PID__FirstName'),  # Player's first name
-        last_name=F('PID__LastName'),  # Player's last name
-        tee_name=F('TeeID__TeeName'),  # Tee name
-        skins=F('Skins'),
-    )
-
-    print()
-    print('skins_leaderboard.html - scorecard_meta', scorecard_meta)
-
-    # Build a list of dictionaries for the leaderboard
-    leaderboard = []
-    for entry in scorecard_meta:
-        player_id = entry.PID.id
-
-        # Get all holes where this player won a skin in this game
-        won_holes = (
-            Skins.objects
-            .filter(GameID=game_id, PlayerID=player_id)
-            .select_related('HoleNumber')
-            .values_list('HoleNumber__HoleNumber', flat=True)
-            .order_by('HoleNumber__HoleNumber')
-        )
-        won_holes_list = list(won_holes)
-
-        # Query the Scorecard table to find the largest HoleNumber for the player
-        current_hole = (
-            Scorecard.objects.filter(GameID=game_id, smID__PID_id=player_id)
-            .select_related('HoleID')
-            .aggregate(max_hole=Max('HoleID__HoleNumber'))
-        )['max_hole']
-
-        # Add the player's data to the leaderboard
-        leaderboard.append({
-            'first_name': entry.first_name,
-            'last_name': entry.last_name,
-            'index': entry.Index,
-            'raw_hdcp': entry.RawHDCP,
-            'net_hdcp': entry.NetHDCP,
-            'tee_name': entry.tee_name,
-            'current_hole': current_hole if current_hole else 0,
-            'skins': entry.skins if entry.skins else 0, 
-            'won_holes': won_holes_list,
-        })
-    
-    # Check if all players have completed their rounds
-    scorecard_data = Scorecard.objects.filter(GameID_id=game_id).values(
-        'smID__PID_id'
-    ).annotate(
-        hole_count=Count('id'),  # Count the number of rows per player
-        max_hole=Max('HoleID__HoleNumber')  # Get the maximum HoleNumber per player
-    )
-
-    # Determine if all players have completed their rounds
-    scorecard_complete = (
-        scorecard_data.exists() and
-        all(
-        player['hole_count'] == 18 and player['max_hole'] == 18
-        for player in scorecard_data
-        )
-    )
-
-    print()
-    print('scorecard_complete:', scorecard_complete)
-
-    # Get all distinct group_ids for the game
-    group_ids = ScorecardMeta.objects.filter(GameID_id=game_id).values_list('GroupID', flat=True).distinct().order_by('GroupID')
-
     # Determine if the logged-in user is a member of any group
     user_player = get_object_or_404(Players, user=request.user)
-    user_group_id = ScorecardMeta.objects.filter(GameID_id=game_id, PID=user_player).values_list('GroupID', flat=True).first()
+    user_group_id = board['group_by_pid'].get(user_player.id)
 
     # Build the list of group buttons
     group_buttons = []
@@ -5813,42 +4764,42 @@ def skins_leaderboard_view(request):
         })
 
     # Add the remaining groups
-    for group_id in group_ids:
+    for group_id in board['group_ids']:
         if group_id != user_group_id:
             group_buttons.append({
                 'group_id': group_id,
                 'label': f"{group_id}a Scorecard",
             })
-    
-    #Get payout amount per skin if available
-    payout = Skins.objects.filter(GameID_id=game_id).values('Payout').first()
-
 
     # Pass data to the template
     context = {
-        "game_id": game_id,
-        "leaderboard": leaderboard,
-        "forty_game_id": forty_game_id,
-        "forty_leaderboard": forty_leaderboard,
+        "game_id": board['game_id'],
+        "leaderboard": board['leaderboard'],
+        "forty_game_id": board['forty_game_id'],
+        "forty_leaderboard": board['forty_leaderboard'],
         "group_buttons": group_buttons,
-        "scorecard_complete": scorecard_complete,
-        "game_status": game_status,
-        "play_date": play_date,
-        "payout": payout['Payout'] if payout else None,
-        "gas_matches" : gas_matches,
-        "gas_totals"  : gas_totals,
-        "gas_rosters": gas_rosters,
-        "is_fallclassic": is_fallclassic,
-        "team_labels": team_labels,
-        "variant": variant,
-        "stableford_game_id": stableford_game_id,
-        "stableford_board": stableford_board,
-        "skins_game_id": skins_game_id,
+        "scorecard_complete": board['scorecard_complete'],
+        "game_status": board['game_status'],
+        "play_date": board['play_date'],
+        "payout": board['payout'],
+        "gas_matches" : board['gas_matches'],
+        "gas_totals"  : board['gas_totals'],
+        "gas_rosters": board['gas_rosters'],
+        "is_fallclassic": board['is_fallclassic'],
+        "team_labels": board['team_labels'],
+        "variant": board['variant'],
+        "stableford_game_id": board['stableford_game_id'],
+        "stableford_board": board['stableford_board'],
+        "skins_game_id": board['skins_game_id'],
+        "live_version": version,
         "first_name": request.user.first_name,
         "last_name": request.user.last_name,
     }
 
-    return render(request, "GRPR/skins_leaderboard.html", context)
+    response = render(request, "GRPR/skins_leaderboard.html", context)
+    response['ETag'] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
 
 
 # This process closes a completed Skins game and calculates the payouts
@@ -5885,6 +4836,7 @@ def skins_close_view(request):
 
         # Update all Skins records for this game with the payout per skin
         Skins.objects.filter(GameID_id=game_id).update(Payout=skin_payout)
+        live.touch(game_id)
     else:
         skin_payout = None
 
@@ -5928,6 +4880,7 @@ def skins_close_view(request):
         Games.objects.filter(id=game_id).update(Status='Closed')
         # Also close any associated games
         Games.objects.filter(AssocGame=game_id).update(Status='Closed')
+        live.touch(game_id)
 
     # Pass data to the template
     context = {
@@ -5995,6 +4948,7 @@ def skins_reopen_game_view(request):
 
     # Update the game status to 'Live'
     Games.objects.filter(id=game_id).update(Status='Live')
+    live.touch(game_id)
 
     # Get the logged-in user's details
     user = request.user
@@ -6179,11 +5133,11 @@ def forty_config_confirm_view(request):
     min_1st     = request.POST.get("min_1st")
     min_18th    = request.POST.get("min_18th")
 
-    print(game_id)
-    print(num_scores)
-    print(game_format) 
-    print(min_1st)
-    print(min_18th)
+    setup_log.debug('forty config game_id %s', game_id)
+    setup_log.debug('forty config num_scores %s', num_scores)
+    setup_log.debug('forty config game_format %s', game_format)
+    setup_log.debug('forty config min_1st %s', min_1st)
+    setup_log.debug('forty config min_18th %s', min_18th)
 
     group_list = []
     if game_id:
@@ -6202,9 +5156,9 @@ def forty_config_confirm_view(request):
         ]
         group_list.sort(key=lambda g: g["group_id"])
     
-    print("DEBUG want_gascup =", request.session.get("want_gascup"))
-    print("DEBUG skins_game_id =", request.session.get("skins_game_id"))
-    print("DEBUG config confirm game_format = ", game_format)
+    setup_log.debug('want_gascup = %s', request.session.get('want_gascup'))
+    setup_log.debug('skins_game_id = %s', request.session.get('skins_game_id'))
+    setup_log.debug('config confirm game_format = %s', game_format)
 
     context = {
         "group_list":  group_list,
@@ -6385,7 +5339,7 @@ def forty_choose_score_view(request):
     over_under = group_score - par
 
     error_msg = None
-    print('hole #', hole_number)
+    scoring_log.debug('hole # %s', hole_number)
 
     # Check if the user has already chosen players for this hole, but got sent back to this view bc they did not choose enough based on requirements (3 on 1, 3 on 18, etc)
     if request.method == "POST":
@@ -6616,10 +5570,10 @@ def forty_input_scores_view(request):
 
         # Redirect based on next_hole_id
         if next_hole_id and str(next_hole_id).lower() != "none":
-            print("Redirecting to hole_score_data_view with next_hole_id:", next_hole_id)
+            scoring_log.debug('Redirecting to hole_score_data_view with next_hole_id: %s', next_hole_id)
             return redirect(f"{reverse('hole_score_data_view')}?hole_id={next_hole_id}&game_id={game_id}&group_id={group_id}")
         else:
-            print("Redirecting to scorecard_view (end of round)")
+            scoring_log.debug('Redirecting to scorecard_view (end of round)')
             return redirect(f"{reverse('scorecard_view')}?game_id={game_id}&group_id={group_id}")
     else:
         return redirect('home')
@@ -6963,6 +5917,7 @@ def stableford_config_view(request):
             # ensure Stableford teams exist (idempotent)
             from GRPR.services import stableford as stbl
             stbl.ensure_teams_for_stableford(draft, stbl_game=game)
+            stbl.rebuild(game.id)  # no-op before play; re-derives points if reconfigured mid-round
 
             # remove this config step from the queue and route onward
             q = list(request.session.get("game_config_queue") or [])
@@ -8085,12 +7040,12 @@ def game_setup_route_view(request):
         if "Stableford" in created_ids and not is_stableford_ready(anchor_id):
             queue.append(("stableford_config_view", created_ids["Stableford"]))
 
-        print("ROUTER DEBUG — selected:", selected)
-        print("ROUTER DEBUG — plan:", plan)
-        print("ROUTER DEBUG — anchor_id:", anchor_id)
-        print("ROUTER DEBUG — existing:", existing)          # {'Skins': 380, ...}
-        print("ROUTER DEBUG — created_ids:", created_ids)    # after creation pass
-        print("ROUTER DEBUG — queue:", queue) 
+        setup_log.debug('router — selected: %s', selected)
+        setup_log.debug('router — plan: %s', plan)
+        setup_log.debug('router — anchor_id: %s', anchor_id)
+        setup_log.debug('router — existing: %s', existing)  # {'Skins': 380, ...}
+        setup_log.debug('router — created_ids: %s', created_ids)  # after creation pass
+        setup_log.debug('router — queue: %s', queue)
 
         # Persist conveniences (optional)
         state["anchor_game_id"]   = anchor_id
@@ -8395,173 +7350,31 @@ def hole_input_score_view(request):
         logged_in_user = get_object_or_404(Players, user_id=request.user.id)
         logged_in_user_id = logged_in_user.id
 
-        for player in players:
-            pid = player['pid']
-            score = player['score']
-            putts = player.get('putts', 0)  # Default to 0 if not present
-            scorecard_id = player.get('scorecard_id')  # Get the Scorecard row ID if it exists
-
-            # Fetch the Handicap for the hole
-            hole = get_object_or_404(CourseHoles, id=hole_id)
-            handicap = hole.Handicap
-
-            # Fetch NetHDCP (fallback to 0 if missing)
-            net_hdcp = _net_hdcp_or_zero(game_id, pid)
-
-            # Calculate the stroke variable
-            if handicap <= net_hdcp:
-                stroke = 1
-                if handicap + 18 <= net_hdcp:
-                    stroke = 2
-            else:
-                stroke = 0
-
-            # Calculate the NetScore
-            net_score = score - stroke
-
-            # Checks to see if the hole has already had a score saved
-            # Fetch the ScorecardMeta object for the player
-            scm = ScorecardMeta.objects.filter(GameID=game_id, PID=pid).first()
-            if not scm:
-                return JsonResponse({'success': False, 'error': 'ScorecardMeta not found for player, PID = '})
-
-            # --- Prevent duplicate Scorecard rows ---
-            # Always check for an existing Scorecard row for this player/hole/game
-            existing_scorecard = Scorecard.objects.filter(
-                GameID_id=game_id, HoleID_id=hole_id, smID_id=scm.id
-            ).first()
-
-            if existing_scorecard:
-                # Update the existing row
-                current_raw_score = existing_scorecard.RawScore
-                current_net_score = existing_scorecard.NetScore
-                current_putts = existing_scorecard.Putts
-
-                existing_scorecard.AlterDate = timezone.now()
-                existing_scorecard.RawScore = score
-                existing_scorecard.NetScore = net_score
-                existing_scorecard.AlterID_id = logged_in_user_id
-                existing_scorecard.Putts = putts
-                existing_scorecard.save()
-
-                # Update ScorecardMeta based on the hole number
-                if 1 <= hole.HoleNumber <= 9:
-                    scm.RawOUT += score - current_raw_score
-                    scm.NetOUT += net_score - current_net_score
-                elif 10 <= hole.HoleNumber <= 18:
-                    scm.RawIN += score - current_raw_score
-                    scm.NetIN += net_score - current_net_score
-
-                scm.RawTotal += score - current_raw_score
-                scm.NetTotal += net_score - current_net_score
-                scm.Putts += putts - current_putts
-                scm.save()
-
-                # Updates GasCup scores if exists
-                gascup.update_for_score(existing_scorecard.id)
-                stbl.update_for_score(existing_scorecard.id)
-            # --- End duplicate prevention ---
-
-            else:  # Otherwise, no scores have been previously entered for this hole, insert a new row
-                # Insert a new row into the Scorecard table
-                new_score = Scorecard.objects.create(
-                    CreateDate=timezone.now(),
-                    AlterDate=timezone.now(),
-                    RawScore=score,
-                    NetScore=net_score,
-                    AlterID_id=logged_in_user_id,
-                    smID_id=scm.id,
-                    GameID_id=game_id,
-                    HoleID_id=hole_id,
-                    Putts=putts
-                )
-
-                # Update ScorecardMeta based on the hole number
-                if 1 <= hole.HoleNumber <= 9:
-                    scm.RawOUT += score
-                    scm.NetOUT += net_score
-                elif 10 <= hole.HoleNumber <= 18:
-                    scm.RawIN += score
-                    scm.NetIN += net_score
-
-                scm.RawTotal += score
-                scm.NetTotal += net_score
-                scm.Putts += putts
-                scm.save()
-
-                # Updates GasCup scores if exists
-                gascup.update_for_score(new_score.id)
-                stbl.update_for_score(new_score.id)
-
-        print('hole_input_score_view - players', players)
-        print('hole_input_score_view - hole_id', hole_id)
-        print('hole_input_score_view - game_id', game_id)
-        print('hole_input_score_view - group_id', group_id)
-
-        #### Skins Section Starts ####
-        # Reset the Skins column for all players in the game since this process checks for all skins everywhere
-        ScorecardMeta.objects.filter(GameID=game_id).update(Skins=0)
-        Skins.objects.filter(GameID=game_id).delete()
-
-        # Skins process done after all scores are updated - will find if there is a skin per hole and who won it
-        skins_results = Scorecard.objects.filter(GameID_id=game_id).values('HoleID_id').annotate(
-            min_net_score=Min('NetScore')
-        )
-
-        print()
-        print('skins_results', skins_results)
-        print()
-
-        # Fetch the Games instance once
-        game_obj = Games.objects.get(id=game_id)
-        # Prefetch all Players and CourseHoles instances
-        players_map = {player.id: player for player in Players.objects.filter(id__in=Scorecard.objects.filter(GameID_id=game_id).values_list('smID__PID_id', flat=True))}
-        # holes_map = {hole.id: hole for hole in CourseHoles.objects.filter(id__in=Scorecard.objects.filter(GameID_id=game_id).values_list('HoleID_id', flat=True))}
-
-        # Dictionary to track skins for each player
-        player_skins = {}
-
-        # Collect all Skins entries in a list
-        skins_to_create = []
-
-        for result in skins_results:
-            skins_hole_id = result['HoleID_id']
-            min_net_score = result['min_net_score']
-
-            # Find all players with the lowest NetScore for this hole
-            players_with_lowest_score = Scorecard.objects.filter(
-                GameID_id=game_id,
-                HoleID_id=skins_hole_id,
-                NetScore=min_net_score
-            ).values('smID__PID_id')
-
-            if players_with_lowest_score.count() == 1:
-                # Only one player has the lowest score, award a skin
-                player_id = players_with_lowest_score.first()['smID__PID_id']
-                player_obj = players_map[player_id]  # Use pre-fetched Players instance
-                # hole_obj = holes_map[skins_hole_id]  # Use pre-fetched CourseHoles instance
-
-                hole_obj = CourseHoles.objects.get(id=skins_hole_id)  # Fetch the CourseHoles instance
-                skins_to_create.append(Skins(GameID=game_obj, PlayerID=player_obj, HoleNumber=hole_obj))
-                print(f"For hole {skins_hole_id}, player {player_id} scored {min_net_score} and receives 1 skin.")
-                player_skins[player_id] = player_skins.get(player_id, 0) + 1
-            else:
-                # Multiple players have the lowest score, no skins awarded
-                print(f"For hole {skins_hole_id}, there are no skins.")
+        # One entry per posted player; an entry may carry its own hole_id so a
+        # group can post several holes in one request.
+        entries = [
+            {
+                'pid': player['pid'],
+                'hole_id': player.get('hole_id') or hole_id,
+                'score': player['score'],
+                'putts': player.get('putts', 0),  # Default to 0 if not present
+            }
+            for player in players
+        ]
 
-        # Perform bulk insert for all the Skins table data
-        Skins.objects.bulk_create(skins_to_create)
-        
-        print()
-        print('player_skins', player_skins)
-        print()
-        
-        # Update the Skins column in the ScorecardMeta table
-        for player_id, skins in player_skins.items():
-            ScorecardMeta.objects.filter(GameID=game_id, PID_id=player_id).update(Skins=skins)
-        
-        #### Skins Section Done ####
+        # Writes scores + ScorecardMeta totals in one transaction, then
+        # refreshes Skins / Gas Cup / Stableford once for the whole batch
+        try:
+            scoring.record_hole_scores(game_id=game_id, entries=entries, alter_pid=logged_in_user_id)
+        except scoring.MissingScorecardMeta as e:
+            return JsonResponse({'success': False, 'error': str(e)})
+        except CourseHoles.DoesNotExist:
+            return JsonResponse({'success': False, 'error': 'Hole not found.'}, status=404)
 
+        scoring_log.debug('hole_input_score_view - players %s', players)
+        scoring_log.debug('hole_input_score_view - hole_id %s', hole_id)
+        scoring_log.debug('hole_input_score_view - game_id %s', game_id)
+        scoring_log.debug('hole_input_score_view - group_id %s', group_id)
 
         return JsonResponse({
             'success': True,
@@ -8577,7 +7390,7 @@ def hole_display_view(request):
     hole_id = request.GET.get('hole_id')
     game_id = request.GET.get('game_id')
     group_id = request.GET.get('group_id')
-    print('hole_display_view - hole_id', hole_id)
+    scoring_log.debug('hole_display_view - hole_id %s', hole_id)
 
     # Fetch the hole details
     hole = get_object_or_404(CourseHoles, id=hole_id)
@@ -8610,7 +7423,7 @@ def hole_display_view(request):
     ).order_by('HoleNumber').first()
 
     next_hole_id = next_hole.id if next_hole else None
-    print('hole_display_view - next_hole_id', next_hole_id)
+    scoring_log.debug('hole_display_view - next_hole_id %s', next_hole_id)
 
     # ------------------- Gas Cup status (optional) -------------------
     gas_status = None
@@ -8626,7 +7439,7 @@ def hole_display_view(request):
                 pga_lbl, liv_lbl = gascup.pair_labels_for_pids(game_id, pids)
                 gas_status = gascup.format_status_human_verbose(status, pga_lbl, liv_lbl)
     except Exception as e:
-        print("GAS STATUS ERROR (hole_display_view):", e)
+        scoring_log.exception('Gas Cup status failed (hole_display_view)')
         gas_status = None
     # ------------------- End Gas Cup status -------------------
 
@@ -8638,6 +7451,7 @@ def hole_display_view(request):
         'group_id': group_id, 
         'next_hole_id': next_hole_id,  # Pass the next hole ID to the template
         'gas_status': gas_status,
+        'live_version': live.version(game_id),  # starting point for the live feed
     }
     if forty_scores_already_entered:
         context['forty_scores_already_entered'] = forty_scores_already_entered
@@ -8645,6 +7459,30 @@ def hole_display_view(request):
     return render(request, 'GRPR/hole_display.html', context)
 
 
+@login_required
+def live_updates_view(request):
+    """
+    Live round feed (long-poll). GET game_id & since=<version>; answers as
+    soon as the anchor's version moves past `since` (or after
+    LIVE_POLL_WAIT seconds) with the changes in between.
+    """
+    game_id = request.GET.get('game_id')
+    try:
+        since = int(request.GET.get('since') or 0)
+    except ValueError:
+        return HttpResponseBadRequest("Invalid version.")
+    if not game_id:
+        return HttpResponseBadRequest("Game ID is missing.")
+
+    version = live.wait_for_version(game_id, since, settings.LIVE_POLL_WAIT)
+    if version == since:
+        payload = {'version': version, 'full': False, 'changes': {}}
+    else:
+        payload = live.changes_since(game_id, since, version)
+    payload['retry_ms'] = settings.LIVE_POLL_RETRY_MS
+    return JsonResponse(payload)
+
+
 @login_required
 def scorecard_view(request):
     # ------------------------------------------------------------------
@@ -8654,215 +7492,49 @@ def scorecard_view(request):
     group_id = request.GET.get('group_id')  # may be blank → Big Scorecard
     msg = request.GET.get('msg')
 
-    # ------------------------------------------------------------------
-    # Linked Forty game (for red-border highlighting)
-    # ------------------------------------------------------------------
-    forty_game_id = (
-        Games.objects
-        .filter(id=game_id)
-        .values_list('AssocGame', flat=True)
-        .first()
-    )
-
-    forty_used_scores = set()
-    if forty_game_id:
-        for forty in Forty.objects.filter(GameID_id=forty_game_id):
-            forty_used_scores.add(f"{forty.PID_id}:{forty.HoleNumber_id}")
-
-    # ------------------------------------------------------------------
-    # Player list (Skins ScorecardMeta -> players shown on card)
-    # ------------------------------------------------------------------
-    players_qs = (
-        ScorecardMeta.objects
-        .filter(GameID=game_id)
-        .select_related('PID')
-        .values(
-            first_name=F('PID__FirstName'),
-            last_name=F('PID__LastName'),
-            pid=F('PID__id'),
-            net_hdcp=F('NetHDCP'),
-        )
-    )
-    if group_id:
-        players_qs = players_qs.filter(GroupID=group_id)
-
-    player_list = list(players_qs)
-    print('player_list', player_list)
-
-    # Normalize handicap now (int; fallback 0 if missing)
-    for p in player_list:
-        nh = p.get('net_hdcp')
-        try:
-            p['net_hdcp'] = int(nh) if nh is not None else 0
-        except (TypeError, ValueError):
-            p['net_hdcp'] = 0
-
-    # ------------------------------------------------------------------
-    # Tee context (we pick the most common tee in the game)
-    # ------------------------------------------------------------------
-    most_common_tee_id = (
-        ScorecardMeta.objects
-        .filter(GameID=game_id)
-        .values('TeeID_id')
-        .annotate(count=Count('TeeID_id'))
-        .order_by('-count')
-        .first()
-    )
-    print()
-    print('most_common_tee_id', most_common_tee_id)
-
-    course_holes = []
-    course_name = None
-    tee_pk = None
-    if most_common_tee_id and most_common_tee_id['TeeID_id']:
-        tee_pk = most_common_tee_id['TeeID_id']
-        course_holes = (
-            CourseHoles.objects
-            .filter(CourseTeesID_id=tee_pk)
-            .order_by('HoleNumber')
-            .values('id', 'HoleNumber', 'Par', 'Yardage', 'Handicap')
-        )
-        course_name = (
-            CourseTees.objects
-            .filter(id=tee_pk)
-            .values_list('CourseName', flat=True)
-            .first()
-        )
-
-    print()
-    print('course_holes', list(course_holes))
-
-    # ------------------------------------------------------------------
-    # Game date
-    # ------------------------------------------------------------------
-    play_date = (
-        Games.objects
-        .filter(id=game_id)
-        .values_list('PlayDate', flat=True)
-        .first()
-    )
-    print()
-    print('play_date', play_date)
-
-    # ------------------------------------------------------------------
-    # Raw/Net per-hole scores
-    # ------------------------------------------------------------------
-    scores = (
-        Scorecard.objects
-        .filter(GameID_id=game_id)
-        .select_related('HoleID', 'smID')
-        .values('HoleID__HoleNumber', 'NetScore', 'RawScore', 'smID__PID_id')
-    )
-    if group_id:
-        scores = scores.filter(smID__GroupID=group_id)
-
-    player_scores = {p['pid']: {} for p in player_list}
-
-    for s in scores:
-        pid = s['smID__PID_id']
-        hn = s['HoleID__HoleNumber']
-        player_scores[pid][hn] = {
-            'net': s['NetScore'] if s['NetScore'] is not None else '',
-            'raw': s['RawScore'] if s['RawScore'] is not None else '',
-            'skin': False,
-        }
-
-    # Ensure all holes + Out/In/Total keys exist
-    for pid in player_scores:
-        for h in course_holes:
-            hn = h['HoleNumber']
-            player_scores[pid].setdefault(hn, {'net': '', 'raw': ''})
-        player_scores[pid]['Out']   = {'net': '', 'raw': '', 'skin': False}
-        player_scores[pid]['In']    = {'net': '', 'raw': '', 'skin': False}
-        player_scores[pid]['Total'] = {'net': '', 'raw': '', 'skin': False}
-
-    # ------------------------------------------------------------------
-    # Totals from ScorecardMeta
-    # ------------------------------------------------------------------
-    meta_qs = (
-        ScorecardMeta.objects
-        .filter(GameID=game_id)
-        .values('PID_id', 'RawOUT', 'NetOUT', 'RawIN', 'NetIN', 'RawTotal', 'NetTotal')
-    )
-    if group_id:
-        meta_qs = meta_qs.filter(GroupID=group_id)
-
-    for m in meta_qs:
-        pid = m['PID_id']
-        if pid not in player_scores:
-            continue
-        player_scores[pid]['Out'] = {
-            'net': m['NetOUT'] if m['NetOUT'] is not None else '',
-            'raw': m['RawOUT'] if m['RawOUT'] is not None else '',
-            'skin': False,
-        }
-        player_scores[pid]['In'] = {
-            'net': m['NetIN'] if m['NetIN'] is not None else '',
-            'raw': m['RawIN'] if m['RawIN'] is not None else '',
-            'skin': False,
-        }
-        player_scores[pid]['Total'] = {
-            'net': m['NetTotal'] if m['NetTotal'] is not None else '',
-            'raw': m['RawTotal'] if m['RawTotal'] is not None else '',
-            'skin': False,
-        }
+    # Polling clients revalidate; nothing changed since their copy → 304
+    version = live.version(game_id)
+    etag = live.etag("sc", game_id, version, group_id or '', msg or '', request.user.pk)
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        return not_modified
 
     # ------------------------------------------------------------------
-    # Skins mark-up
+    # Players, holes, raw/net, strokes, skins, Forty flags and the Gas Cup
+    # banner, cached per version
     # ------------------------------------------------------------------
-    skins = (
-        Skins.objects
-        .filter(GameID=game_id)
-        .select_related('HoleNumber')
-        .values('HoleNumber__HoleNumber', 'PlayerID_id')
+    card = live.snapshot(
+        "card", game_id, version,
+        lambda: _scorecard_snapshot(game_id, group_id), group_id or '',
     )
-    for s in skins:
-        hn = s['HoleNumber__HoleNumber']
-        pid = s['PlayerID_id']
-        if pid in player_scores and hn in player_scores[pid]:
-            player_scores[pid][hn]['skin'] = True
-
-    if not player_scores:
-        player_scores = {}
+    grid = card['grid']
 
     # ------------------------------------------------------------------
-    # Stroke grids (uses normalized net_hdcp from player_list)
+    # Context & render
     # ------------------------------------------------------------------
-    player_strokes = {}
-    if tee_pk:  # we have a tee context
-        # Preload the “extra stroke” hole set once for each player inside loop.
-        # (Per-player anyway because addl_strokes differs by player.)
-        for p in player_list:
-            pid = p['pid']
-            net_hdcp = p['net_hdcp']  # already int fallback 0
-
-            base_strokes, addl_strokes = divmod(net_hdcp, 18)
-
-            if addl_strokes > 0:
-                stroke_holes = set(
-                    CourseHoles.objects
-                    .filter(CourseTeesID_id=tee_pk, Handicap__lte=addl_strokes)
-                    .values_list('HoleNumber', flat=True)
-                )
-            else:
-                stroke_holes = set()
+    context = {
+        'game_id': game_id,
+        'group_id': group_id,
+        'player_list': grid['player_list'],
+        'course_holes': grid['course_holes'],
+        'course_name': grid['course_name'],
+        'play_date': grid['play_date'],
+        'player_scores': grid['player_scores'],
+        'player_strokes': grid['player_strokes'],
+        'msg': msg,
+        'gas_status': card['gas_status'],
+        'first_name': request.user.first_name,
+        'last_name': request.user.last_name,
+        'forty_used_scores': grid['forty_used_scores'],
+    }
+    response = render(request, 'GRPR/scorecard.html', context)
+    response['ETag'] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
 
-            strokes = {}
-            for h in course_holes:
-                hn = h['HoleNumber']
-                if hn in stroke_holes:
-                    strokes[hn] = base_strokes + 1
-                else:
-                    strokes[hn] = base_strokes
-            player_strokes[pid] = strokes
-    else:
-        # No tee context; give everyone 0 strokes so templates remain safe.
-        for p in player_list:
-            pid = p['pid']
-            player_strokes[pid] = {}
 
-    print("")
-    print("forty_used_scores:", forty_used_scores)
+def _scorecard_snapshot(game_id, group_id):
+    grid = scorecard_svc.build_grid(game_id, group_id or None)
 
     # ------------------------------------------------------------------
     # Gas Cup status banner (only for 4-player sub-card)
@@ -8870,41 +7542,15 @@ def scorecard_view(request):
     gas_status = None
     try:
         if group_id:
-            pids = list(
-                ScorecardMeta.objects
-                .filter(GameID=game_id, GroupID=group_id)
-                .values_list("PID_id", flat=True)
-            )
+            pids = [p['pid'] for p in grid['player_list']]
             if pids:
-                thru = (
-                    Scorecard.objects
-                    .filter(GameID=game_id, smID__PID_id__in=pids)
-                    .aggregate(Max("HoleID__HoleNumber"))["HoleID__HoleNumber__max"]
-                ) or 0
+                thru = grid['thru']
                 status = gascup.status_for_pids(game_id, pids, thru)
                 if status:
                     pga_lbl, liv_lbl = gascup.pair_labels_for_pids(game_id, pids)
                     gas_status = gascup.format_status_human_verbose(status, pga_lbl, liv_lbl)
     except Exception as e:
-        print("GAS STATUS ERROR (scorecard_view):", e)
+        scoring_log.exception('Gas Cup status failed (scorecard_view)')
         gas_status = None
 
-    # ------------------------------------------------------------------
-    # Context & render
-    # ------------------------------------------------------------------
-    context = {
-        'game_id': game_id,
-        'group_id': group_id,
-        'player_list': player_list,
-        'course_holes': list(course_holes),
-        'course_name': course_name,
-        'play_date': play_date,
-        'player_scores': player_scores,
-        'player_strokes': player_strokes,
-        'msg': msg,
-        'gas_status': gas_status,
-        'first_name': request.user.first_name,
-        'last_name': request.user.last_name,
-        'forty_used_scores': list(forty_used_scores),
-    }
-    return render(request, 'GRPR/scorecard.html', context)
+    return {'grid': grid, 'gas_status': gas_status}
@@ -10,11 +10,14 @@ django.setup()
 
 from django.utils import timezone
 from GRPR.models import Players, Log
-from django.core.mail import send_mail
-from twilio.rest import Client # Import the Twilio client
+from GRPR.services import messaging
 
 players = Players.objects.all().exclude(Member=0).order_by('LastName', 'FirstName')
 
+# one SMTP connection and one Twilio client for the whole run; texts always
+# go through Twilio, whatever TWILIO_ENABLED says
+sender = messaging.batch(sms='twilio')
+
 for player in players:
     email = player.Email
     subject = 'The GAS schedule is posted'
@@ -37,7 +40,7 @@ for player in players:
     from_email = os.environ.get('EMAIL_HOST_USER')
 
     try:
-        send_mail(subject, message, from_email, [email])
+        sender.email([email], subject, message, from_email=from_email)
         email_success_message = f'Email sent {player.LastName} {email}.'
         print(email_success_message)
     except Exception as e:
@@ -54,20 +57,10 @@ for player in players:
           You will be prompted to change your password on login.\n
           See your email for more instructions.
         '''
-    twilio_account_sid = os.environ.get('TWILIO_ACCOUNT_SID')
-    twilio_auth_token = os.environ.get('TWILIO_AUTH_TOKEN')
-    twilio_phone_number = '+18449472599'
     mobile = player.Mobile
     player_id = player.id
 
-    client = Client(twilio_account_sid, twilio_auth_token)
-
-    twilio_message = client.messages.create(
-        body=txt_msg,
-        from_=twilio_phone_number,
-        to=mobile
-    )
-    mID = twilio_message.sid
+    mID = sender.sms(mobile, txt_msg)
 
     # Insert record into Log table
     Log.objects.create(
@@ -84,3 +77,5 @@ for player in players:
 
     txt_success_message = f'text message sent {player.LastName} {mobile}.'
     print(txt_success_message)
+
+sender.close()
@@ -40,6 +40,24 @@ else:
         }
     }
 
+# Shared cache. Database-backed so every gunicorn worker / dyno sees the same
+# entries and signal-driven invalidation reaches all of them. The table is
+# created by migration 0064 (or `python manage.py createcachetable`).
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'DjangoCache',
+        'TIMEOUT': 60 * 60,  # 1 hour default; callers pass their own TTLs
+    }
+}
+
+# Live round feed (GRPR/services/live.py). LIVE_POLL_WAIT is how long
+# /live/updates/ holds a request open waiting for a new score; keep it 0 on
+# sync gunicorn workers (each held request pins a worker) and raise it when
+# running threaded/async workers. LIVE_POLL_RETRY_MS is the client back-off.
+LIVE_POLL_WAIT = int(os.environ.get('LIVE_POLL_WAIT', '0'))
+LIVE_POLL_RETRY_MS = int(os.environ.get('LIVE_POLL_RETRY_MS', '5000'))
+
 
 # Application definition
 INSTALLED_APPS = [
@@ -54,6 +72,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'GRPR.middleware.RequestMetricsMiddleware',  # query count / latency per view, off unless REQUEST_METRICS=True
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware', # added as part of port to Postgres
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -156,6 +175,32 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Per-request query count / SQL time / wall time logging + percentiles on the admin page (GRPR.middleware.RequestMetricsMiddleware)
+REQUEST_METRICS = os.environ.get('REQUEST_METRICS', 'False') == 'True'
+
+# Logging: everything to stdout (Heroku collects it). LOG_LEVEL sets the GRPR default,
+# LOG_LEVELS turns single areas up or down, e.g. LOG_LEVELS="GRPR.scoring=DEBUG,GRPR.messaging=WARNING"
+# Areas: GRPR.scoring, GRPR.subswap, GRPR.messaging, GRPR.setup, GRPR.views, GRPR.middleware
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'leveled': {'format': '%(levelname)s %(name)s %(message)s'},
+    },
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler', 'stream': 'ext://sys.stdout', 'formatter': 'leveled'},
+    },
+    'root': {'handlers': ['console'], 'level': 'WARNING'},
+    'loggers': {
+        'django': {'level': 'WARNING'},
+        'GRPR': {'level': LOG_LEVEL},
+    },
+}
+for _pair in filter(None, os.environ.get('LOG_LEVELS', '').split(',')):
+    _name, _, _level = _pair.partition('=')
+    LOGGING['loggers'][_name.strip()] = {'level': _level.strip().upper() or LOG_LEVEL}
+
 # Add this setting to control Twilio functionality, defualt is False if no environment variable is set
 TWILIO_ENABLED = os.environ.get('TWILIO_ENABLED', 'False') == 'True'
 
@@ -163,6 +208,14 @@ TWILIO_ENABLED = os.environ.get('TWILIO_ENABLED', 'False') == 'True'
 # Twilio credentials
 TWILIO_ACCOUNT_SID = os.getenv('TWILIO_ACCOUNT_SID')
 TWILIO_AUTH_TOKEN = os.getenv('TWILIO_AUTH_TOKEN')
+TWILIO_PHONE_NUMBER = os.getenv('TWILIO_PHONE_NUMBER', '+18449472599')
+
+# Messaging transports (GRPR/services/messaging.py): texts go through Twilio only when
+# enabled, otherwise they are faked; e-mail uses EMAIL_BACKEND unless overridden.
+# 'file' writes both to MESSAGING_FILE_PATH for offline runs.
+MESSAGING_SMS = os.getenv('MESSAGING_SMS') or ('twilio' if TWILIO_ENABLED else 'fake')
+MESSAGING_EMAIL = os.getenv('MESSAGING_EMAIL') or None
+MESSAGING_FILE_PATH = os.getenv('MESSAGING_FILE_PATH') or str(BASE_DIR / 'tmp' / 'messages')
 
 # Email backend configuration
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
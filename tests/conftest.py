@@ -0,0 +1,90 @@
+# tests/conftest.py
+"""
+Shared fixtures for the DB-backed (non-Playwright) tests.
+
+`make_round(n_players)` seeds one Saturday: a crew, an 18-hole tee, a Skins
+game with ScorecardMeta rows, and foursome tee times + GameInvites so the
+Gas Cup / Stableford helpers can resolve time slots.
+"""
+from datetime import date, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from GRPR.models import (
+    Crews, Courses, CourseTees, CourseHoles, Players, TeeTimesInd,
+    Games, GameInvites, ScorecardMeta,
+)
+from GRPR.services import seasons, strokes
+
+# Handicap order for holes 1..18 (index = HoleNumber - 1)
+HOLE_HANDICAPS = [7, 15, 1, 11, 3, 17, 9, 13, 5, 8, 16, 2, 12, 4, 18, 10, 14, 6]
+HOLE_PARS      = [4, 3, 5, 4, 4, 3, 4, 5, 4, 4, 3, 5, 4, 4, 3, 4, 5, 4]
+SLOTS          = ["8:00", "8:10", "8:20", "8:30", "8:40", "8:50", "9:00", "9:10"]
+
+
+def _seed_round(n_players, play_date=None, net_hdcps=None):
+    play_date = play_date or (date.today() + timedelta(days=7))
+    crew = Crews.objects.create(crewName="GAS", crewCaptain=1, email="c@x.com", mobile="1")
+    tee = CourseTees.objects.create(
+        CourseID=1, CourseName="Test Links", TeeID=1, TeeName="White",
+        CourseRating=Decimal("70.1"), SlopeRating=125, Par=72, Yards=6400,
+    )
+    holes = [
+        CourseHoles.objects.create(
+            CourseTeesID=tee, HoleNumber=n, Par=HOLE_PARS[n - 1],
+            Yardage=380, Handicap=HOLE_HANDICAPS[n - 1],
+        )
+        for n in range(1, 19)
+    ]
+
+    players = [
+        Players.objects.create(
+            CrewID=crew.id, FirstName=f"P{i}", LastName=f"Player{i:02d}",
+            Email=f"p{i}@x.com", Mobile=f"1555000{i:04d}", Member=1,
+        )
+        for i in range(n_players)
+    ]
+
+    game = Games.objects.create(
+        CreateID=players[0], CrewID=crew.id, CreateDate=play_date, PlayDate=play_date,
+        CourseTeesID=tee, Status="Live", Type="Skins",
+    )
+    game.AssocGame = game.id   # anchors point at themselves, as game setup does
+    game.save(update_fields=["AssocGame"])
+
+    courses, metas, groups = {}, [], {}
+    for i, p in enumerate(players):
+        slot = SLOTS[(i // 4) % len(SLOTS)]
+        if slot not in courses:
+            courses[slot] = Courses.objects.create(crewID=crew.id, courseName="Test Links", courseTimeSlot=slot)
+        tt = TeeTimesInd.objects.create(CrewID=crew.id, gDate=play_date, PID=p, CourseID=courses[slot])
+        GameInvites.objects.create(GameID=game, AlterDate=play_date, PID=p, TTID=tt, Status="Accepted")
+        net = net_hdcps[i] if net_hdcps else i % 20
+        metas.append(ScorecardMeta.objects.create(
+            GameID=game, CreateDate=play_date, CreateID=players[0].id, PlayDate=play_date,
+            PID=p, CrewID=crew, CourseID=1, TeeID=tee, NetHDCP=net, GroupID=slot,
+        ))
+        groups.setdefault(slot, []).append(p)
+
+    return SimpleNamespace(
+        crew=crew, tee=tee, holes=holes, players=players, game=game,
+        metas=metas, groups=groups, play_date=play_date, courses=courses,
+    )
+
+
+@pytest.fixture
+def make_round(db):
+    return _seed_round
+
+
+@pytest.fixture(autouse=True)
+def _fresh_process_caches():
+    # Row ids are reused across rolled-back tests; don't let one test's tee
+    # or seasons leak into the next.
+    strokes.invalidate()
+    seasons.invalidate()
+    yield
+    strokes.invalidate()
+    seasons.invalidate()
@@ -0,0 +1,88 @@
+# tests/test_availability.py
+"""
+Availability matrix: sub candidates and swap date pairs come from one
+TeeTimesInd/Xdates query and honour requested-off dates.
+"""
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from GRPR.models import Players, TeeTimesInd, Xdates
+from GRPR.services import availability
+
+
+def _league(make_round, n_players):
+    """Eight players on the round's date; the rest play the week after, one of them asked off."""
+    rnd = make_round(8)
+    later = rnd.play_date + timedelta(days=7)
+    course = next(iter(rnd.courses.values()))
+    extra = [
+        Players.objects.create(CrewID=rnd.crew.id, FirstName=f"X{i}", LastName=f"Extra{i:02d}", Member=1)
+        for i in range(n_players - 8)
+    ]
+    for p in extra:
+        TeeTimesInd.objects.create(CrewID=rnd.crew.id, gDate=later, PID=p, CourseID=course)
+    Xdates.objects.create(CrewID=rnd.crew.id, PID=extra[0], xDate=rnd.play_date, rDate=date.today())
+    me = rnd.players[0]
+    me.user = User.objects.create_user(username=f"me{n_players}", password="x")
+    me.save()
+    return rnd, later, extra, me
+
+
+def test_matrix_statuses_and_candidates(make_round):
+    rnd, later, extra, me = _league(make_round, 12)
+    with CaptureQueriesContext(connection) as ctx:
+        matrix = availability.load(start=date.today())
+    assert len(ctx.captured_queries) == 2   # members + one TeeTimesInd/Xdates union
+
+    assert matrix.status(me.id, rnd.play_date) == availability.PLAYING
+    assert matrix.status(extra[0].id, rnd.play_date) == availability.OFF
+    assert matrix.status(extra[1].id, rnd.play_date) == availability.FREE
+    assert [p.id for p in matrix.free_on(rnd.play_date)] == [p.id for p in extra[1:]]
+    tt = TeeTimesInd.objects.get(PID=extra[1])
+    assert matrix.swap_dates(me.id, extra[1].id, after=date.today()) == [(later, tt.id)]
+    assert matrix.swap_dates(extra[2].id, extra[1].id, after=date.today()) == []   # both play `later`
+
+
+def test_swaprequest_skips_requested_off(make_round, client):
+    rnd, later, extra, me = _league(make_round, 12)
+    client.force_login(me.user)
+    session = client.session
+    session["swap_tt_id"] = TeeTimesInd.objects.get(PID=me).id
+    session.save()
+    resp = client.get(reverse("swaprequest_view"))
+    assert resp.status_code == 200
+    assert [p["id"] for p in resp.context["available_players"]] == [p.id for p in extra[1:]]
+
+
+def test_subrequest_skips_requested_off(make_round, client):
+    rnd, later, extra, me = _league(make_round, 10)
+    client.force_login(me.user)
+    session = client.session
+    session["tt_id"] = TeeTimesInd.objects.get(PID=me).id
+    session.save()
+    resp = client.get(reverse("subrequest_view"))
+    assert [s["id"] for s in resp.context["available_subs"]] == [extra[1].id]
+
+
+def test_non_member_offerer_keeps_own_dates(make_round, client):
+    rnd, later, extra, me = _league(make_round, 12)
+    Players.objects.filter(id=me.id).update(Member=0)
+    course = next(iter(rnd.courses.values()))
+    TeeTimesInd.objects.create(CrewID=rnd.crew.id, gDate=later, PID=me, CourseID=course)
+
+    matrix = availability.load(start=date.today(), include=[me.id])
+    assert me.id not in matrix.players   # not a sub candidate
+    assert matrix.status(me.id, later) == availability.PLAYING
+    assert matrix.swap_dates(me.id, extra[1].id, after=date.today()) == []
+
+    # every candidate only plays `later`, which the offerer already plays
+    client.force_login(me.user)
+    session = client.session
+    session["swap_tt_id"] = TeeTimesInd.objects.get(PID=me, gDate=rnd.play_date).id
+    session.save()
+    resp = client.get(reverse("swaprequest_view"))
+    assert resp.status_code == 302 and resp.url == reverse("swapnoneavail_view")
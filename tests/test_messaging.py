@@ -0,0 +1,47 @@
+# tests/test_messaging.py
+"""
+Messaging transports: a batch opens each transport once, and the file
+transports write what would have been sent.
+"""
+import json
+
+from django.core import mail
+from django.test import override_settings
+
+from GRPR.services import messaging
+
+
+class CountingSMS(messaging.SMSTransport):
+    opened = 0
+
+    def open(self):
+        CountingSMS.opened += 1
+
+    def send(self, to, body):
+        return f"SM-{to}"
+
+
+@override_settings(MESSAGING_SMS="counting", MESSAGING_EMAIL="fake")
+def test_batch_shares_one_connection_per_transport(monkeypatch):
+    monkeypatch.setitem(messaging.SMS_TRANSPORTS, "counting", CountingSMS)
+    CountingSMS.opened = 0
+    with messaging.batch() as sender:
+        ids = [sender.sms(f"+1{n}", "hi") for n in range(5)]
+        sender.email(["a@x.com", "b@x.com"], "Subject", "Body")
+        sender.email(["c@x.com"], "Subject", "Body")
+
+    assert ids == [f"SM-+1{n}" for n in range(5)]
+    assert CountingSMS.opened == 1
+    assert [m.to for m in mail.outbox] == [["a@x.com", "b@x.com"], ["c@x.com"]]
+    assert not sender.sms_live
+
+
+def test_file_transports_write_to_messaging_path(tmp_path):
+    with override_settings(MESSAGING_FILE_PATH=str(tmp_path)):
+        with messaging.batch(sms="file", email="file") as sender:
+            assert sender.sms("+15550001", "tee time moved") == messaging.FAKE_MESSAGE_ID
+            sender.email(["a@x.com"], "Subject", "Body")
+
+    lines = (tmp_path / "sms.jsonl").read_text().splitlines()
+    assert [(r["to"], r["body"]) for r in map(json.loads, lines)] == [("+15550001", "tee time moved")]
+    assert len([p for p in tmp_path.iterdir() if p.suffix == ".log"]) == 1
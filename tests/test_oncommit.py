@@ -0,0 +1,35 @@
+# tests/test_oncommit.py
+"""
+on_commit_once: one callback per key per transaction, and a rolled-back
+savepoint does not swallow the calls made after it.
+"""
+import pytest
+from django.db import transaction
+
+from GRPR.services import oncommit
+
+
+def test_calls_in_one_transaction_collapse(db, django_capture_on_commit_callbacks):
+    runs = []
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        for n in range(3):
+            oncommit.on_commit_once("k", runs.append, n)
+        oncommit.on_commit_once("other", runs.append, "x")
+    assert len(callbacks) == 2
+    assert runs == [[0, 1, 2], ["x"]]
+
+    # the key is free again once its callback ran
+    with django_capture_on_commit_callbacks(execute=True):
+        oncommit.on_commit_once("k", runs.append, 3)
+    assert runs[-1] == [3]
+
+
+def test_rolled_back_savepoint_does_not_leave_a_stale_callback(db, django_capture_on_commit_callbacks):
+    runs = []
+    with django_capture_on_commit_callbacks(execute=True):
+        with pytest.raises(RuntimeError):
+            with transaction.atomic():
+                oncommit.on_commit_once("k", runs.append, "rolled back")
+                raise RuntimeError
+        oncommit.on_commit_once("k", runs.append, "kept")
+    assert runs == [["kept"]]
@@ -0,0 +1,108 @@
+# tests/test_outbox.py
+"""
+Outbox: offer views queue their texts instead of sending them, and the
+drain_outbox worker delivers them, writes the Log rows and retries failures
+with backoff.
+"""
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import OperationalError
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from GRPR.models import Log, Outbox, SubSwap, TeeTimesInd
+from GRPR.services import messaging, outbox
+
+
+def test_sub_offer_is_queued_then_delivered(make_round, client):
+    rnd = make_round(8)
+    me = rnd.players[0]
+    me.user = User.objects.create_user(username="me", password="x", first_name="P0", last_name="Player00")
+    me.save()
+    client.force_login(me.user)
+    session = client.session
+    session["tt_id"] = TeeTimesInd.objects.get(PID=me).id
+    session["player_ids"] = [str(p.id) for p in rnd.players[4:7]]
+    session.save()
+
+    resp = client.get(reverse("subrequestsent_view"))
+    assert resp.status_code == 200
+    assert SubSwap.objects.filter(SubType="Received").count() == 3
+    assert Outbox.objects.filter(Status="Pending").count() == 4   # the offerer + 3 recipients
+    assert not Log.objects.exists()
+
+    call_command("drain_outbox", verbosity=0)
+    assert set(Outbox.objects.values_list("Status", flat=True)) == {"Sent"}
+    logs = Log.objects.order_by("id")
+    assert [l.Type for l in logs] == ["Sub Offer"] + ["Sub Offer Sent"] * 3
+    assert {l.MessageID for l in logs} == {messaging.FAKE_MESSAGE_ID}
+    assert [l.ReceiveID for l in logs[1:]] == [p.id for p in rnd.players[4:7]]
+    assert [l.To_number for l in logs[1:]] == [p.Mobile for p in rnd.players[4:7]]
+
+
+class FlakySMS(messaging.SMSTransport):
+    """Accepts every number except +1bad."""
+
+    def send(self, to, body):
+        if to == "+1bad":
+            raise ConnectionError("provider down")
+        return f"SM-{to}"
+
+
+@override_settings(MESSAGING_SMS="tests.test_outbox.FlakySMS")
+def test_failed_sends_back_off_then_fail(db):
+    outbox.put([
+        outbox.message("sms", "+1good", "hello", log={"Type": "Test", "RefID": 7, "Msg": "hello"}),
+        outbox.message("sms", "+1bad", "hello"),
+    ])
+
+    assert outbox.drain(workers=2) == {"sent": 1, "retry": 1, "failed": 0}
+    good, bad = Outbox.objects.order_by("id")
+    assert (good.Status, good.MessageID) == ("Sent", "SM-+1good")
+    assert Log.objects.get(RefID=7).MessageID == good.MessageID
+    assert bad.Status == "Pending" and bad.Attempts == 1 and "provider down" in bad.LastError
+    assert bad.NextAttempt > timezone.now()   # not due again yet
+    assert outbox.drain() == {"sent": 0, "retry": 0, "failed": 0}
+
+    for attempt in range(2, outbox.MAX_ATTEMPTS + 1):
+        Outbox.objects.filter(id=bad.id).update(NextAttempt=timezone.now() - timedelta(seconds=1))
+        outbox.drain()
+    bad.refresh_from_db()
+    assert (bad.Status, bad.Attempts) == ("Failed", outbox.MAX_ATTEMPTS)
+    good.refresh_from_db()
+    assert good.Attempts == 1
+
+
+def test_sent_rows_are_recorded_one_by_one_when_the_bulk_write_fails(db, monkeypatch):
+    outbox.put([
+        outbox.message("sms", f"+1555000{n}", "hello", log={"Type": "Test", "RefID": n, "Msg": "hello"})
+        for n in range(3)
+    ])
+
+    def broken(*args, **kwargs):
+        raise OperationalError("connection reset")
+    monkeypatch.setattr(Log.objects, "bulk_create", broken)
+
+    assert outbox.drain()["sent"] == 3
+    assert set(Outbox.objects.values_list("Status", flat=True)) == {"Sent"}   # not re-sent after the lease
+    assert sorted(Log.objects.values_list("RefID", flat=True)) == [0, 1, 2]
+
+
+def test_worker_loop_survives_a_failed_round(monkeypatch):
+    rounds = []
+
+    def drain(**kwargs):
+        rounds.append(kwargs)
+        if len(rounds) == 1:
+            raise OperationalError("server closed the connection")
+        raise KeyboardInterrupt   # stop the loop
+    monkeypatch.setattr(outbox, "drain", drain)
+    monkeypatch.setattr("GRPR.management.commands.drain_outbox.close_old_connections", lambda: None)
+
+    with pytest.raises(KeyboardInterrupt):
+        call_command("drain_outbox", "--loop", "--interval", "0")
+    assert len(rounds) == 2
@@ -0,0 +1,140 @@
+# tests/test_query_budgets.py
+"""
+Query budgets for the hot views.
+
+Each view is loaded against a small and a large synthetic league (same seed,
+same number of Saturdays, 8 vs 24 players), with snapshots and shared caches
+cold (WARM views are measured on their second request). The query count must
+stay within the view's budget and must not grow with the number of players,
+so an N+1 loop that creeps back in fails here instead of on a Saturday.
+
+Budgets are the counts measured when they were last tightened; lower them
+when a view gets cheaper.
+"""
+import json
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from GRPR.models import Courses, CourseTees, Crews, Games, Players, Season, SubSwap, TeeTimesInd
+from GRPR.services import seasons, strokes, synthetic
+
+SIZES = (8, 24)
+
+BUDGETS = {
+    "hole_input_score_view": 32,
+    "scorecard_view": 26,
+    "skins_leaderboard_view": 27,
+    "schedule_view": 8,
+    "subswap_view": 8,
+    "swaprequest_view": 11,
+    "subrequestsent_view": 17,
+    "swaprequestsent_view": 17,
+    "statistics_view": 11,
+    "teesheet_view": 6,
+}
+
+# Views served from the per-date tee-sheet cache are measured on their second
+# request: the first one fills the cache, one cache write per tee-time date.
+WARM = {"teesheet_view"}
+
+# Sub/swap request pages read what the previous step left in the session:
+# one of the viewer's tee times and, for the offers, every other player.
+OFFER_PAGES = {"swaprequest_view", "subrequestsent_view", "swaprequestsent_view"}
+
+
+def _league(n_players):
+    """A season around today: scored Saturdays behind, open tee times and sub offers ahead."""
+    for model in (Games, Players, Courses, CourseTees, Crews, User, Season):
+        model.objects.all().delete()
+    strokes.invalidate()
+    seasons.invalidate()
+    today = timezone.localdate()
+    season = Season.objects.create(
+        Name="budget", StartDate=today - timedelta(days=42), EndDate=today + timedelta(days=42),
+        PlayStart=today - timedelta(days=42), PlayEnd=today + timedelta(days=42),
+    )
+    league = synthetic.generate(players=n_players, courses=2, played=5, season=season, seed=4)
+    seasons.all_seasons()   # per-process registry, loaded once per worker
+    return league
+
+
+def _viewer(league):
+    """The player with the most open sub offers received, logged in."""
+    player = max(
+        league.players,
+        key=lambda p: (SubSwap.objects.filter(PID=p, SubType="Received", nStatus="Open").count(), -p.id),
+    )
+    client = Client()
+    client.force_login(player.user)
+    return client
+
+
+def _offer_session(client):
+    player = Players.objects.get(user_id=client.session["_auth_user_id"])
+    offered = SubSwap.objects.filter(SubType="Offer", nStatus="Open").values("TeeTimeIndID")
+    tt = (
+        TeeTimesInd.objects.filter(PID=player, gDate__gte=timezone.localdate())
+        .exclude(id__in=offered).order_by("gDate").first()
+    )
+    session = client.session
+    session.update({
+        "tt_id": tt.id, "swap_tt_id": tt.id,
+        "player_ids": [str(p.id) for p in Players.objects.exclude(id=player.id)],
+    })
+    session.save()
+
+
+def _requests(league):
+    day = league.replay[0]
+    slot = sorted(day.groups)[0]
+    holes = iter(day.holes)
+
+    def post_hole(client):
+        hole = next(holes)
+        body = {
+            "game_id": day.game.id, "hole_id": hole.id, "group_id": slot,
+            "players": [{"pid": p.id, "score": hole.Par, "putts": 2} for p in day.groups[slot]],
+        }
+        return client.post(reverse("hole_input_score_view"), json.dumps(body), content_type="application/json")
+
+    return {
+        "hole_input_score_view": post_hole,
+        "scorecard_view": lambda c: c.get(reverse("scorecard_view"), {"game_id": day.game.id, "group_id": slot}),
+        "skins_leaderboard_view": lambda c: c.get(reverse("skins_leaderboard_view"), {"game_id": day.game.id}),
+        "schedule_view": lambda c: c.get(reverse("schedule_view")),
+        "subswap_view": lambda c: c.get(reverse("subswap_view")),
+        "swaprequest_view": lambda c: c.get(reverse("swaprequest_view")),
+        "subrequestsent_view": lambda c: c.get(reverse("subrequestsent_view")),
+        "swaprequestsent_view": lambda c: c.get(reverse("swaprequestsent_view")),
+        "statistics_view": lambda c: c.get(reverse("statistics_view")),
+        "teesheet_view": lambda c: c.get(reverse("teesheet_view"), {"gDate": str(day.play_date)}),
+    }
+
+
+def _count(view, n_players, capture):
+    with capture(execute=True):
+        league = _league(n_players)
+    client = _viewer(league)
+    request = _requests(league)[view]
+    if view in WARM:
+        request(client)
+    if view in OFFER_PAGES:
+        _offer_session(client)
+    with capture(execute=True), CaptureQueriesContext(connection) as ctx:
+        resp = request(client)
+    assert resp.status_code == 200, (view, resp.status_code)
+    return len(ctx.captured_queries)
+
+
+@pytest.mark.parametrize("view", sorted(BUDGETS))
+def test_query_budget_is_flat(view, db, django_capture_on_commit_callbacks):
+    counts = [_count(view, n, django_capture_on_commit_callbacks) for n in SIZES]
+    assert max(counts) <= BUDGETS[view], f"{view}: {counts} queries, budget {BUDGETS[view]}"
+    assert counts[0] == counts[1], f"{view} grows with players: {dict(zip(SIZES, counts))}"
@@ -0,0 +1,49 @@
+# tests/test_request_metrics.py
+"""
+RequestMetricsMiddleware: one structured log line per request and rolling
+percentiles per view; absent from the stack when REQUEST_METRICS is off.
+"""
+import json
+import logging
+
+from django.contrib.auth.models import User
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from GRPR.services import request_metrics
+
+
+def _request_lines(caplog):
+    return [json.loads(r.getMessage()) for r in caplog.records if r.name == "GRPR.middleware"]
+
+
+@override_settings(REQUEST_METRICS=True)
+def test_metrics_logged_and_summarised(db, caplog):
+    user = User.objects.create_user(username="metrics", password="x")
+    client = Client()
+    client.force_login(user)
+    with caplog.at_level(logging.INFO, logger="GRPR.middleware"):
+        for _ in range(3):
+            assert client.get(reverse("statistics_view")).status_code == 200
+
+    lines = _request_lines(caplog)
+    assert len(lines) == 3
+    line = lines[-1]
+    assert line["view"] == "statistics_view" and line["status"] == 200
+    assert line["queries"] > 0 and line["sql_ms"] <= line["wall_ms"]
+
+    rows = {r["view"]: r for r in request_metrics.summary()}
+    assert rows["statistics_view"]["n"] >= 3
+    assert rows["statistics_view"]["queries_p50"] == line["queries"]
+
+
+def test_metrics_off_by_default(db, caplog, client):
+    with caplog.at_level(logging.INFO, logger="GRPR.middleware"):
+        client.get(reverse("login"))
+    assert _request_lines(caplog) == []
+
+
+def test_duplicate_fingerprints_collapse_in_lists():
+    fps = [request_metrics.fingerprint(f'SELECT * FROM "Players" WHERE "id" IN ({", ".join(["%s"] * n)})') for n in (1, 3, 5)]
+    assert len(set(fps)) == 1
+    assert request_metrics.duplicates(fps + ["SELECT 1"]) == [(fps[0], 3)]
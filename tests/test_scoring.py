@@ -0,0 +1,555 @@
+# tests/test_scoring.py
+"""
+Scoring-path tests: skins derivation, the batched score writer and the
+derived team games.
+Run with pytest-django (not Playwright): `pytest -m "not playwright"`.
+"""
+import json
+import random
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import IntegrityError, connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from GRPR.models import Forty, FortyGroupRule, Games, GasCupPair, GasCupScore, Scorecard, ScorecardMeta, Skins, StblScore
+from GRPR.services import (
+    gascup, leaderboard as leaderboard_svc, live, scorecard as scorecard_svc, scoring,
+    skins as skins_svc, stableford as stbl, strokes,
+)
+
+
+def _post(rnd, meta, hole, raw, net):
+    now = timezone.now()
+    sc, _ = Scorecard.objects.update_or_create(
+        smID=meta, HoleID=hole, GameID=rnd.game,
+        defaults=dict(CreateDate=now, AlterDate=now, AlterID=meta.PID, RawScore=raw, NetScore=net, Putts=2),
+    )
+    return sc
+
+
+def _legacy_full_rebuild(game_id):
+    """The pre-service algorithm, kept here as the reference result."""
+    winners = {}
+    by_hole = {}
+    for hole_id, net, pid in Scorecard.objects.filter(GameID_id=game_id).values_list("HoleID_id", "NetScore", "smID__PID_id"):
+        by_hole.setdefault(hole_id, []).append((net, pid))
+    for hole_id, rows in by_hole.items():
+        low = min(n for n, _ in rows)
+        low_pids = [p for n, p in rows if n == low]
+        if len(low_pids) == 1:
+            winners[hole_id] = low_pids[0]
+    counts = {}
+    for pid in winners.values():
+        counts[pid] = counts.get(pid, 0) + 1
+    return winners, counts
+
+
+def _current_state(game_id):
+    winners = dict(Skins.objects.filter(GameID_id=game_id).values_list("HoleNumber_id", "PlayerID_id"))
+    counts = {
+        pid: n for pid, n in
+        ScorecardMeta.objects.filter(GameID_id=game_id).values_list("PID_id", "Skins") if n
+    }
+    return winners, counts
+
+
+def test_skin_awarded_and_carried_on_tie(make_round):
+    rnd = make_round(4)
+    hole = rnd.holes[0]
+    a, b, c, d = rnd.metas
+
+    for meta, net in ((a, 3), (b, 4), (c, 5), (d, 5)):
+        _post(rnd, meta, hole, net, net)
+    skins_svc.update_for_holes(rnd.game.id, [hole.id])
+    assert list(Skins.objects.filter(GameID=rnd.game).values_list("PlayerID_id", flat=True)) == [a.PID_id]
+    assert ScorecardMeta.objects.get(id=a.id).Skins == 1
+
+    # b ties a → skin is removed and a's counter goes back to zero
+    _post(rnd, b, hole, 3, 3)
+    skins_svc.update_for_holes(rnd.game.id, [hole.id])
+    assert not Skins.objects.filter(GameID=rnd.game).exists()
+    assert ScorecardMeta.objects.get(id=a.id).Skins == 0
+
+
+def test_incremental_matches_full_rebuild(make_round):
+    rnd = make_round(8)
+    rng = random.Random(11)
+
+    for _ in range(120):
+        meta = rng.choice(rnd.metas)
+        hole = rng.choice(rnd.holes[:6])
+        net = rng.randint(2, 7)
+        _post(rnd, meta, hole, net + 1, net)
+        skins_svc.update_for_holes(rnd.game.id, [hole.id])
+        assert _current_state(rnd.game.id) == _legacy_full_rebuild(rnd.game.id)
+
+    # rebuild() is a no-op on a consistent game and repairs a drifted one
+    ScorecardMeta.objects.filter(GameID=rnd.game).update(Skins=9)
+    Skins.objects.filter(GameID=rnd.game).delete()
+    skins_svc.rebuild(rnd.game.id)
+    assert _current_state(rnd.game.id) == _legacy_full_rebuild(rnd.game.id)
+
+
+# ------------------------------------------------------------------ #
+# Batched score submission                                           #
+# ------------------------------------------------------------------ #
+def _login(client, player):
+    user = User.objects.create_user(username=f"u{player.id}", password="pw")
+    player.user = user
+    player.save(update_fields=["user"])
+    client.force_login(user)
+
+
+def _submit(client, rnd, hole, scores):
+    body = {
+        "game_id": rnd.game.id,
+        "hole_id": hole.id,
+        "group_id": rnd.metas[0].GroupID,
+        "players": [{"pid": m.PID_id, "score": s, "putts": 2} for m, s in scores],
+    }
+    return client.post(reverse("hole_input_score_view"), json.dumps(body), content_type="application/json")
+
+
+def test_batch_submission_updates_meta_totals(make_round):
+    rnd = make_round(4, net_hdcps=[0, 1, 19, 0])
+    hole = rnd.holes[2]  # Handicap 1 hole, par 5
+    metas = rnd.metas
+
+    scoring.record_hole_scores(
+        game_id=rnd.game.id, alter_pid=metas[0].PID_id,
+        entries=[{"pid": m.PID_id, "hole_id": hole.id, "score": 5} for m in metas],
+    )
+    nets = dict(Scorecard.objects.filter(HoleID=hole).values_list("smID_id", "NetScore"))
+    assert nets == {metas[0].id: 5, metas[1].id: 4, metas[2].id: 3, metas[3].id: 5}
+
+    # re-post one player: row is updated in place and totals move by the delta
+    scoring.record_hole_scores(
+        game_id=rnd.game.id, alter_pid=metas[0].PID_id,
+        entries=[{"pid": metas[2].PID_id, "hole_id": hole.id, "score": 7, "putts": 3}],
+    )
+    scm = ScorecardMeta.objects.get(id=metas[2].id)
+    assert Scorecard.objects.filter(smID=scm).count() == 1
+    assert (scm.RawOUT, scm.NetOUT, scm.RawTotal, scm.NetTotal, scm.Putts) == (7, 5, 7, 5, 3)
+    assert Skins.objects.filter(GameID=rnd.game, HoleNumber=hole).get().PlayerID_id == metas[1].PID_id
+
+
+def test_missing_meta_writes_nothing(make_round):
+    rnd = make_round(4)
+    other = make_round(1)
+    hole = rnd.holes[0]
+    entries = [{"pid": m.PID_id, "hole_id": hole.id, "score": 4} for m in rnd.metas]
+    entries.append({"pid": other.players[0].id, "hole_id": hole.id, "score": 4})
+
+    try:
+        scoring.record_hole_scores(game_id=rnd.game.id, entries=entries, alter_pid=rnd.players[0].id)
+    except scoring.MissingScorecardMeta:
+        pass
+    assert not Scorecard.objects.filter(GameID=rnd.game).exists()
+
+
+def test_submission_query_count_is_flat(make_round, client):
+    counts = []
+    for n in (4, 12):
+        rnd = make_round(n, net_hdcps=[0] * n)
+        _login(client, rnd.players[0])
+        scores = [(m, 4 + (i % 3)) for i, m in enumerate(rnd.metas)]  # low score tied → no skin
+        with CaptureQueriesContext(connection) as ctx:
+            resp = _submit(client, rnd, rnd.holes[0], scores)
+        assert resp.json()["success"] is True
+        counts.append(len(ctx.captured_queries))
+    assert counts[0] == counts[1], counts
+
+
+# ------------------------------------------------------------------ #
+# Gas Cup                                                            #
+# ------------------------------------------------------------------ #
+def _add_gascup(rnd):
+    gas = Games.objects.create(
+        CreateID=rnd.players[0], CrewID=rnd.crew.id, CreateDate=rnd.play_date, PlayDate=rnd.play_date,
+        CourseTeesID=rnd.tee, Status="Live", Type="GasCup", AssocGame=rnd.game.id,
+    )
+    for slot, group in rnd.groups.items():
+        GasCupPair.objects.create(Game=gas, PID1=group[0], PID2=group[1], Team="PGA")
+        GasCupPair.objects.create(Game=gas, PID1=group[2], PID2=group[3], Team="LIV")
+    return gas
+
+
+def test_gascup_best_ball_per_pair(make_round):
+    rnd = make_round(8, net_hdcps=[0] * 8)
+    gas = _add_gascup(rnd)
+    hole = rnd.holes[0]
+
+    scoring.record_hole_scores(
+        game_id=rnd.game.id, alter_pid=rnd.players[0].id,
+        entries=[{"pid": p.id, "hole_id": hole.id, "score": s} for p, s in zip(rnd.players, [5, 4, 6, 6, 3, 7, 4, 4])],
+    )
+    got = {
+        (pair.PID1_id, pair.Team): pair.gascupscore_set.get(Hole=hole).NetScore
+        for pair in GasCupPair.objects.filter(Game=gas)
+    }
+    p = rnd.players
+    assert got == {(p[0].id, "PGA"): 4, (p[2].id, "LIV"): 6, (p[4].id, "PGA"): 3, (p[6].id, "LIV"): 4}
+
+    # re-post lowers a partner: row is overwritten, not duplicated
+    scoring.record_hole_scores(
+        game_id=rnd.game.id, alter_pid=rnd.players[0].id,
+        entries=[{"pid": p[3].id, "hole_id": hole.id, "score": 2}],
+    )
+    assert GasCupScore.objects.filter(Game=gas, Hole=hole).count() == 4
+    assert GasCupScore.objects.get(Game=gas, Hole=hole, Pair__PID1=p[2]).NetScore == 2
+
+
+def test_gascup_match_map_invalidated_on_pair_change(make_round):
+    rnd = make_round(4, net_hdcps=[0] * 4)
+    gas = _add_gascup(rnd)
+    hole = rnd.holes[0]
+    p = rnd.players
+    entries = [{"pid": pl.id, "hole_id": hole.id, "score": s} for pl, s in zip(p, [5, 4, 6, 3])]
+    scoring.record_hole_scores(game_id=rnd.game.id, alter_pid=p[0].id, entries=entries)
+
+    # swap partners: (0,2) vs (1,3)
+    GasCupPair.objects.filter(Game=gas).delete()
+    GasCupPair.objects.create(Game=gas, PID1=p[0], PID2=p[2], Team="PGA")
+    GasCupPair.objects.create(Game=gas, PID1=p[1], PID2=p[3], Team="LIV")
+    gascup.update_for_scores(Scorecard.objects.filter(GameID=rnd.game).values_list("id", flat=True))
+
+    nets = dict(GasCupScore.objects.filter(Game=gas).values_list("Pair__PID1_id", "NetScore"))
+    assert nets == {p[0].id: 5, p[1].id: 3}
+
+
+def test_gascup_status_counts_holes_won(make_round):
+    rnd = make_round(4, net_hdcps=[0] * 4)
+    _add_gascup(rnd)
+    p = rnd.players
+    # PGA (p0/p1) takes holes 1 and 2, LIV (p2/p3) takes 10, hole 3 is halved
+    for hole, scores in [(0, [3, 5, 5, 5]), (1, [5, 4, 5, 6]), (2, [4, 4, 4, 4]), (9, [5, 5, 3, 5])]:
+        scoring.record_hole_scores(
+            game_id=rnd.game.id, alter_pid=p[0].id,
+            entries=[{"pid": pl.id, "hole_id": rnd.holes[hole].id, "score": s} for pl, s in zip(p, scores)],
+        )
+
+    status = gascup.status_for_pids(rnd.game.id, [p[0].id], 18)
+    assert (status["front"], status["back"], status["overall"]) == ("PGA +2", "LIV +1", "PGA +1")
+    won = dict(zip(status["labels"], zip((status["f_pga"], status["f_liv"]), (status["b_pga"], status["b_liv"]))))
+    assert won == {"PGA": (2, 0), "LIV": (0, 1)}
+    assert (status["leader"], status["diff"]) == ("PGA", 1)
+
+    status = gascup.status_for_pids(rnd.game.id, [p[3].id], 9)
+    assert (status["back"], status["overall"], status["diff"]) == ("All Square", "PGA +2", 2)
+
+
+def test_gascup_submission_query_count_is_flat(make_round, client):
+    counts = []
+    for n in (4, 12):
+        rnd = make_round(n, net_hdcps=[0] * n)
+        _add_gascup(rnd)
+        _login(client, rnd.players[0])
+        scores = [(m, 4 + (i % 3)) for i, m in enumerate(rnd.metas)]
+        _submit(client, rnd, rnd.holes[1], scores)  # warm the match map
+        with CaptureQueriesContext(connection) as ctx:
+            resp = _submit(client, rnd, rnd.holes[0], scores)
+        assert resp.json()["success"] is True
+        counts.append(len(ctx.captured_queries))
+    assert counts[0] == counts[1], counts
+
+
+# ------------------------------------------------------------------ #
+# Stableford                                                         #
+# ------------------------------------------------------------------ #
+def _add_stableford(rnd):
+    return Games.objects.create(
+        CreateID=rnd.players[0], CrewID=rnd.crew.id, CreateDate=rnd.play_date, PlayDate=rnd.play_date,
+        CourseTeesID=rnd.tee, Status="Live", Type="Stableford", Format="Individual", AssocGame=rnd.game.id,
+    )
+
+
+def test_stableford_points_upserted_per_post(make_round):
+    rnd = make_round(4, net_hdcps=[0] * 4)
+    stbl_game = _add_stableford(rnd)
+    hole = rnd.holes[0]  # par 4
+    p = rnd.players
+
+    scoring.record_hole_scores(
+        game_id=rnd.game.id, alter_pid=p[0].id,
+        entries=[{"pid": pl.id, "hole_id": hole.id, "score": s} for pl, s in zip(p, [3, 4, 5, 7])],
+    )
+    pts = dict(StblScore.objects.filter(Game=stbl_game).values_list("PID_id", "Points"))
+    assert pts == {p[0].id: 3, p[1].id: 2, p[2].id: 1, p[3].id: 0}
+
+    scoring.record_hole_scores(
+        game_id=rnd.game.id, alter_pid=p[0].id,
+        entries=[{"pid": p[3].id, "hole_id": hole.id, "score": 2}],
+    )
+    row = StblScore.objects.get(Game=stbl_game, PID=p[3])
+    assert (row.Points, row.RawScore, row.NetScore) == (4, 2, 2)
+    assert StblScore.objects.filter(Game=stbl_game).count() == 4
+
+
+def test_stableford_rebuild_matches_incremental(make_round):
+    rnd = make_round(8)
+    stbl_game = _add_stableford(rnd)
+    rng = random.Random(5)
+    for hole in rnd.holes[:9]:
+        scoring.record_hole_scores(
+            game_id=rnd.game.id, alter_pid=rnd.players[0].id,
+            entries=[{"pid": pl.id, "hole_id": hole.id, "score": rng.randint(3, 8)} for pl in rnd.players],
+        )
+    before = set(StblScore.objects.filter(Game=stbl_game).values_list("PID_id", "Hole_id", "Points", "NetScore"))
+    assert len(before) == 8 * 9
+
+    StblScore.objects.filter(Game=stbl_game).update(Points=0)
+    StblScore.objects.create(Game=stbl_game, PID=rnd.players[0], Hole=rnd.holes[17], Points=5)  # orphan
+    stbl.rebuild(stbl_game.id)
+    after = set(StblScore.objects.filter(Game=stbl_game).values_list("PID_id", "Hole_id", "Points", "NetScore"))
+    assert after == before
+
+
+# ------------------------------------------------------------------ #
+# Scorecard grid                                                     #
+# ------------------------------------------------------------------ #
+
+
+def test_grid_strokes_and_skins(make_round):
+    rnd = make_round(4, net_hdcps=[0, 3, 20, 36])
+    hole1 = rnd.holes[0]  # Handicap 7
+    scoring.record_hole_scores(
+        game_id=rnd.game.id, alter_pid=rnd.players[0].id,
+        entries=[{"pid": p.id, "hole_id": hole1.id, "score": s} for p, s in zip(rnd.players, [4, 5, 6, 7])],
+    )
+    grid = scorecard_svc.build_grid(rnd.game.id, rnd.metas[0].GroupID)
+    p = rnd.players
+
+    assert grid["course_name"] == "Test Links"
+    assert [h["HoleNumber"] for h in grid["course_holes"]] == list(range(1, 19))
+    assert grid["thru"] == 1
+    strokes = grid["player_strokes"]
+    assert strokes[p[0].id][1] == 0 and strokes[p[1].id][1] == 0 and strokes[p[1].id][3] == 1
+    assert strokes[p[2].id][1] == 1 and strokes[p[2].id][12] == 2   # 20 → 1 everywhere, 2 on hdcp 1-2
+    assert set(strokes[p[3].id].values()) == {2}
+    cell = grid["player_scores"][p[3].id][1]
+    assert (cell["raw"], cell["net"], cell["skin"]) == (7, 5, False)
+    assert grid["player_scores"][p[0].id][1]["skin"] is True   # net 4 vs 5, 5, 5
+    assert grid["player_scores"][p[0].id]["Total"]["raw"] == 4
+
+
+def test_big_scorecard_query_count_is_flat(make_round, client):
+    counts = []
+    for n in (4, 16):
+        rnd = make_round(n)
+        for hole in rnd.holes[:3]:
+            scoring.record_hole_scores(
+                game_id=rnd.game.id, alter_pid=rnd.players[0].id,
+                entries=[{"pid": pl.id, "hole_id": hole.id, "score": 4 + i % 3} for i, pl in enumerate(rnd.players)],
+            )
+        _login(client, rnd.players[0])
+        with CaptureQueriesContext(connection) as ctx:
+            resp = client.get(reverse("scorecard_view"), {"game_id": rnd.game.id})
+        assert resp.status_code == 200
+        counts.append(len(ctx.captured_queries))
+    assert counts[0] == counts[1], counts
+
+
+# ------------------------------------------------------------------ #
+# Stroke table                                                       #
+# ------------------------------------------------------------------ #
+
+
+def test_stroke_table_is_single_source_for_net(make_round):
+    rnd = make_round(4, net_hdcps=[-2, 20, 40, 5])
+    table = strokes.for_tee(rnd.tee.id)
+    hole12 = rnd.holes[11]  # Handicap 2
+    assert table.strokes(-2, 12) == 0 and table.strokes(-2, 15) == -1   # plus 2 gives back on hdcp 17-18
+    assert table.strokes(40, 12) == 3 and table.strokes(40, 1) == 2
+    assert table.row(99) == {h.HoleNumber: strokes.strokes_for(99, h.Handicap) for h in rnd.holes}
+
+    scoring.record_hole_scores(
+        game_id=rnd.game.id, alter_pid=rnd.players[0].id,
+        entries=[{"pid": p.id, "hole_id": hole12.id, "score": 6} for p in rnd.players],
+    )
+    nets = dict(Scorecard.objects.filter(GameID=rnd.game).values_list("smID__PID_id", "NetScore"))
+    grid = scorecard_svc.build_grid(rnd.game.id)
+    for p in rnd.players:
+        assert nets[p.id] == 6 - grid["player_strokes"][p.id][12]
+
+
+def test_stroke_table_cached_and_invalidated_on_hole_change(make_round, django_assert_num_queries):
+    rnd = make_round(4)
+    first = strokes.for_tee(rnd.tee.id)
+    with django_assert_num_queries(0):
+        assert strokes.for_tee(rnd.tee.id) is first
+        strokes.for_holes([h.id for h in rnd.holes])
+
+    hole = rnd.holes[0]
+    hole.Handicap, rnd.holes[2].Handicap = 1, 7
+    hole.save()
+    rebuilt = strokes.for_tee(rnd.tee.id)
+    assert rebuilt is not first
+    assert rebuilt.strokes(1, 1) == 1 and first.strokes(1, 1) == 0
+
+
+# ------------------------------------------------------------------ #
+# Leaderboard                                                        #
+# ------------------------------------------------------------------ #
+def _add_forty(rnd, num_scores=40):
+    forty = Games.objects.create(
+        CreateID=rnd.players[0], CrewID=rnd.crew.id, CreateDate=rnd.play_date, PlayDate=rnd.play_date,
+        CourseTeesID=rnd.tee, Status="Live", Type="Forty", AssocGame=rnd.game.id, NumScores=num_scores,
+    )
+    for slot, group in rnd.groups.items():
+        for pl, hole in zip(group, rnd.holes):
+            Forty.objects.create(
+                CreateID=pl, CrewID=rnd.crew.id, GameID=forty, HoleNumber=hole, PID=pl,
+                GroupID=slot, RawScore=hole.Par + 1, NetScore=hole.Par, Par=hole.Par,
+            )
+    return forty
+
+
+def test_leaderboard_board_contents(make_round):
+    rnd = make_round(8, net_hdcps=[0] * 8)
+    forty = _add_forty(rnd, num_scores=10)
+    gas = _add_gascup(rnd)
+    scoring.record_hole_scores(
+        game_id=rnd.game.id, alter_pid=rnd.players[0].id,
+        entries=[{"pid": p.id, "hole_id": rnd.holes[0].id, "score": s} for p, s in zip(rnd.players, [3, 4, 5, 5, 4, 4, 5, 5])],
+    )
+    board = leaderboard_svc.build(rnd.game.id)
+
+    assert board["skins_game_id"] == rnd.game.id and board["forty_game_id"] == forty.id
+    assert board["variant"] == "GasCup" and len(board["gas_matches"]) == 2
+    rows = {r["last_name"]: r for r in board["leaderboard"]}
+    assert rows["Player00"]["won_holes"] == [1] and rows["Player00"]["skins"] == 1
+    assert all(r["current_hole"] == 1 for r in rows.values())
+    assert board["forty_leaderboard"] == [
+        {"group_id": slot, "scores_used": 4, "scores_needed": 6, "over_under": 0} for slot in sorted(rnd.groups)
+    ]
+    assert board["group_ids"] == sorted(rnd.groups)
+    assert leaderboard_svc.build(gas.id)["skins_game_id"] == rnd.game.id
+
+
+def test_leaderboard_query_count_is_flat(make_round, client):
+    counts = []
+    for n in (4, 16):
+        rnd = make_round(n, net_hdcps=[0] * n)
+        _add_forty(rnd)
+        _add_gascup(rnd)
+        _add_stableford(rnd)
+        for hole in rnd.holes[:2]:
+            scoring.record_hole_scores(
+                game_id=rnd.game.id, alter_pid=rnd.players[0].id,
+                entries=[{"pid": pl.id, "hole_id": hole.id, "score": 3 + i % 4} for i, pl in enumerate(rnd.players)],
+            )
+        _login(client, rnd.players[0])
+        with CaptureQueriesContext(connection) as ctx:
+            resp = client.get(reverse("skins_leaderboard_view"), {"game_id": rnd.game.id})
+        assert resp.status_code == 200
+        counts.append(len(ctx.captured_queries))
+    assert counts[0] == counts[1], counts
+
+
+# ------------------------------------------------------------------ #
+# Live snapshot / versioning                                         #
+# ------------------------------------------------------------------ #
+def test_scoring_commit_bumps_version_once_and_warms_board(make_round, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        rnd = make_round(4, net_hdcps=[0] * 4)   # setup writes bump too
+    assert live.version(rnd.game.id) == 1
+    with django_capture_on_commit_callbacks(execute=True):
+        scoring.record_hole_scores(
+            game_id=rnd.game.id, alter_pid=rnd.players[0].id,
+            entries=[{"pid": p.id, "hole_id": rnd.holes[0].id, "score": s} for p, s in zip(rnd.players, [3, 4, 4, 4])],
+        )
+    assert live.version(rnd.game.id) == 2   # one bump for the whole commit
+
+    # the snapshot for version 2 was built by the commit hook
+    with CaptureQueriesContext(connection) as ctx:
+        board = live.board(rnd.game.id, 2)
+    assert len(ctx.captured_queries) == 1   # the cache read
+    assert board["leaderboard"][0]["won_holes"] == [1]
+
+
+def test_leaderboard_and_scorecard_serve_304_until_next_post(make_round, client, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        rnd = make_round(4, net_hdcps=[0] * 4)
+    _login(client, rnd.players[0])
+    pages = [
+        (reverse("skins_leaderboard_view"), {"game_id": rnd.game.id}),
+        (reverse("scorecard_view"), {"game_id": rnd.game.id, "group_id": rnd.metas[0].GroupID}),
+    ]
+    tags = []
+    for url, params in pages:
+        first = client.get(url, params)
+        assert first.status_code == 200 and first["ETag"]
+        again = client.get(url, params, HTTP_IF_NONE_MATCH=first["ETag"])
+        assert again.status_code == 304
+        tags.append(first["ETag"])
+
+    with django_capture_on_commit_callbacks(execute=True):
+        _submit(client, rnd, rnd.holes[0], [(m, 4) for m in rnd.metas])
+
+    for (url, params), tag in zip(pages, tags):
+        resp = client.get(url, params, HTTP_IF_NONE_MATCH=tag)
+        assert resp.status_code == 200 and resp["ETag"] != tag
+
+
+def test_forty_rule_change_bumps_the_round(make_round, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        rnd = make_round(4)
+        forty = Games.objects.create(
+            CreateID=rnd.players[0], CrewID=rnd.crew.id, CreateDate=rnd.play_date, PlayDate=rnd.play_date,
+            CourseTeesID=rnd.tee, Status="Live", Type="Forty", AssocGame=rnd.game.id,
+        )
+    before = live.version(rnd.game.id)
+    with django_capture_on_commit_callbacks(execute=True):
+        rule = FortyGroupRule.objects.create(Game=forty, GroupID=rnd.metas[0].GroupID, NumScores=20)
+    assert live.version(rnd.game.id) == before + 1   # the board's scores_needed changed
+    with django_capture_on_commit_callbacks(execute=True):
+        rule.delete()
+    assert live.version(rnd.game.id) == before + 2
+
+
+def test_live_feed_sends_only_changes(make_round, client, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        rnd = make_round(8, net_hdcps=[0] * 8)
+        _add_gascup(rnd)
+    _login(client, rnd.players[0])
+    url = reverse("live_updates_view")
+    start = client.get(reverse("skins_leaderboard_view"), {"game_id": rnd.game.id})
+    since = start.context["live_version"]
+
+    idle = client.get(url, {"game_id": rnd.game.id, "since": since}).json()
+    assert idle["version"] == since and idle["changes"] == {}
+
+    group = rnd.groups[rnd.metas[0].GroupID]
+    with django_capture_on_commit_callbacks(execute=True):
+        _submit(client, rnd, rnd.holes[0], [(m, s) for m, s in zip(rnd.metas[:4], [3, 4, 5, 5])])
+
+    data = client.get(url, {"game_id": rnd.game.id, "since": since}).json()
+    assert data["version"] == since + 1 and data["full"] is False
+    ch = data["changes"]
+    assert ch["skins"] == {str(group[0].id): {"skins": 1, "won": [1]}}
+    assert set(ch["thru"]) == {str(p.id) for p in group}          # other group untouched
+    assert list(ch["gas"]) == [rnd.metas[0].GroupID]
+    assert "stableford" not in ch and "status" not in ch
+
+
+def test_scorecard_keys_are_unique_and_reposts_upsert(make_round):
+    rnd = make_round(2, net_hdcps=[0, 0])
+    meta, hole = rnd.metas[0], rnd.holes[0]
+    entries = [{"pid": meta.PID_id, "hole_id": hole.id, "score": 5}]
+    scoring.record_hole_scores(game_id=rnd.game.id, alter_pid=meta.PID_id, entries=entries)
+    scoring.record_hole_scores(game_id=rnd.game.id, alter_pid=meta.PID_id, entries=[{**entries[0], "score": 4}])
+    assert list(Scorecard.objects.filter(smID=meta, HoleID=hole).values_list("RawScore", flat=True)) == [4]
+
+    now = timezone.now()
+    with transaction.atomic(), pytest.raises(IntegrityError):
+        Scorecard.objects.create(
+            smID=meta, HoleID=hole, GameID=rnd.game, CreateDate=now, AlterDate=now,
+            AlterID=meta.PID, RawScore=6, NetScore=6, Putts=2,
+        )
+    with transaction.atomic(), pytest.raises(IntegrityError):
+        ScorecardMeta.objects.create(**{
+            f.attname: getattr(meta, f.attname) for f in ScorecardMeta._meta.concrete_fields if f.attname != "id"
+        })
@@ -0,0 +1,225 @@
+# tests/test_statistics.py
+"""
+Statistics page: heatmaps come from grouped aggregates, not per-cell counts,
+and the season cube serves the same numbers as the live queries.
+"""
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from GRPR.models import Courses, Players, Season, StatsCube, TeeTimesInd
+from GRPR.services import rankings, seasons, stats
+
+DATES = [date(2025, 4, 5), date(2025, 4, 12), date(2025, 4, 19)]
+
+
+def _seed_season(n_players):
+    courses = [
+        Courses.objects.create(crewID=1, courseName="Test Links", courseTimeSlot=slot)
+        for slot in ("8:00", "8:10", "8:20")
+    ]
+    players = [
+        Players.objects.create(
+            CrewID=1, FirstName=f"P{i}", LastName=f"Player{i:02d}",
+            Email=f"p{i}@x.com", Mobile=f"1555000{i:04d}", Member=1,
+        )
+        for i in range(n_players)
+    ]
+    for d_idx, gdate in enumerate(DATES):
+        for i, p in enumerate(players):
+            if (i + d_idx) % 5 == 0:
+                continue  # some players sit out some dates
+            course = courses[(i + d_idx) % len(courses)]
+            TeeTimesInd.objects.create(CrewID=1, gDate=gdate, PID=p, CourseID=course)
+    user = User.objects.create_user(username=f"stats{n_players}", password="x")
+    players[0].user = user
+    players[0].save()
+    return players, courses, user
+
+
+def _partners_by_loop(players):
+    """The old per-tee-time partner loop, kept as the reference result."""
+    out = {}
+    for a in players:
+        counts = {p.id: 0 for p in players}
+        for tt in TeeTimesInd.objects.filter(PID=a.id, gDate__gt='2025-01-01'):
+            for p in TeeTimesInd.objects.filter(gDate=tt.gDate, CourseID=tt.CourseID).exclude(PID=a.id):
+                if p.PID_id in counts:
+                    counts[p.PID_id] += 1
+        out[a.id] = counts
+    return out
+
+
+def test_statistics_matrices_match_per_row_counts(db, client):
+    players, courses, user = _seed_season(10)
+    client.force_login(user)
+    resp = client.get(reverse("statistics_view"), {"season": "2025"})
+    assert resp.status_code == 200
+
+    ctx = resp.context
+    expected = _partners_by_loop(players)
+    got = {a.id: {b.id: cell for b, cell, _ in row} for a, row in ctx["zipped_data"]}
+    assert got == expected
+
+    for p in players:
+        korse = ctx["korse_chart_data"][p.id]
+        for c in courses:
+            assert korse[c.id] == TeeTimesInd.objects.filter(PID=p, CourseID=c).count()
+        assert korse["total"] == TeeTimesInd.objects.filter(PID=p).count()
+        dates = ctx["date_chart_data"][p.id]
+        for d in DATES:
+            n = TeeTimesInd.objects.filter(PID=p, gDate=d).count()
+            assert dates[d.strftime('%Y-%m-%d')] == (n or '')
+    assert ctx["date_names"] == [d.strftime('%Y-%m-%d') for d in DATES]
+
+
+def test_statistics_query_count_is_flat(db, client):
+    seasons.all_seasons()   # per-process registry, loaded once
+    counts = []
+    for n in (5, 20):
+        TeeTimesInd.objects.all().delete()
+        Players.objects.all().delete()
+        _, _, user = _seed_season(n)
+        client.force_login(user)
+        with CaptureQueriesContext(connection) as ctx:
+            assert client.get(reverse("statistics_view")).status_code == 200
+        counts.append(len(ctx.captured_queries))
+    assert counts[0] == counts[1], counts
+
+
+def test_stats_cube_serves_live_numbers_and_refreshes_incrementally(db, client):
+    players, courses, user = _seed_season(8)
+    client.force_login(user)
+    live_ctx = client.get(reverse("statistics_view"), {"season": "2025"}).context
+    season = seasons.get("2025")
+    live_tops = {stat: func(season) for stat, func in rankings.TOP10_FUNC.items()}
+
+    rebuilt, unchanged = stats.refresh_cube()   # 2025, and this year's default season
+    assert len([r for r in rebuilt if r.startswith("2025 ")]) == 2 + len(rankings.TOP10_FUNC) and not unchanged
+
+    with CaptureQueriesContext(connection) as ctx:
+        cube_ctx = client.get(reverse("statistics_view"), {"season": "2025"}).context
+    assert not any('"TeeTimesInd"' in q['sql'] for q in ctx.captured_queries)
+    for key in ("zipped_data", "korse_chart_data", "date_chart_data", "date_names"):
+        assert cube_ctx[key] == live_ctx[key]
+    assert stats.top10_rankings(season) == live_tops
+
+    # nothing moved → nothing rebuilt
+    rebuilt, _ = stats.refresh_cube()
+    assert rebuilt == []
+
+    # a swap trades PIDs between two existing rows: same count, same max id
+    a, b = TeeTimesInd.objects.filter(gDate=DATES[0]).order_by('id')[:2]
+    TeeTimesInd.objects.filter(id=a.id).update(PID=b.PID_id)
+    TeeTimesInd.objects.filter(id=b.id).update(PID=a.PID_id)
+    rebuilt, _ = stats.refresh_cube()
+    assert {r for r in rebuilt if r.startswith("2025 ")} == {
+        "2025 attendance", "2025 partners", "2025 top10:attendance", "2025 top10:friends",
+    }
+    assert stats.partner_counts(season) == stats._partners_live(season)
+
+
+def test_stale_cube_falls_back_to_live(db):
+    players, courses, user = _seed_season(4)
+    stats.refresh_cube()
+    TeeTimesInd.objects.create(CrewID=1, gDate=DATES[0], PID=players[0], CourseID=courses[0])
+
+    season = seasons.get("2025")
+    StatsCube.objects.update(CheckedAt=timezone.now() - stats.CUBE_MAX_AGE - timedelta(minutes=1))
+    assert stats.attendance_counts(season) == stats._attendance_live(season)
+    live = rankings.TOP10_FUNC["attendance"](season)
+    assert stats.top10_rankings(season)["attendance"] == live
+    assert StatsCube.objects.get(Kind="top10", Key="attendance", Window=stats._play_window(season)).Data != live
+
+
+def test_rounds_leaderboard_warm_load_is_one_cache_read(db, client, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        players, courses, user = _seed_season(6)
+    client.force_login(user)
+    assert client.get(reverse("rounds_leaderboard_view"), {"season": "2025"}).status_code == 200
+
+    with CaptureQueriesContext(connection) as ctx:
+        resp = client.get(reverse("rounds_leaderboard_view") + "?stat=attendance&season=2025")
+    sqls = [q['sql'] for q in ctx.captured_queries]
+    assert sum('"DjangoCache"' in q for q in sqls) == 1
+    assert not any(t in q for q in sqls for t in ('"TeeTimesInd"', '"Skins"', '"Forty"', '"SubSwap"', '"StatsCube"'))
+    before = resp.context["topten"]
+
+    # a new tee time only drops the stats that read TeeTimesInd
+    with django_capture_on_commit_callbacks(execute=True):
+        TeeTimesInd.objects.create(CrewID=1, gDate=DATES[0], PID=players[1], CourseID=courses[0])
+    with CaptureQueriesContext(connection) as ctx:
+        resp = client.get(reverse("rounds_leaderboard_view") + "?stat=attendance&season=2025")
+    sqls = [q['sql'] for q in ctx.captured_queries]
+    assert sum('"TeeTimesInd"' in q for q in sqls) == 2      # attendance + friends
+    assert not any('"Skins"' in q for q in sqls)
+    assert resp.context["topten"] == rankings.TOP10_FUNC["attendance"](seasons.get("2025")) != before
+
+
+def test_partner_names_resolved_in_one_query(db):
+    _seed_season(12)
+    season = seasons.get("2025")
+    with CaptureQueriesContext(connection) as ctx:
+        rows = rankings.TOP10_FUNC["friends"](season)
+    assert len(rows) == 10 and " & " in rows[0]["name"]
+    assert len(ctx.captured_queries) == 2
+
+
+def test_seasons_are_separate_and_frozen_cube_is_final(db, client):
+    players, courses, user = _seed_season(6)
+    Season.objects.create(
+        Name="2026", StartDate=date(2026, 1, 1), EndDate=date(2026, 12, 31),
+        PlayStart=date(2026, 4, 1), PlayEnd=date(2026, 9, 1),
+    )
+    TeeTimesInd.objects.create(CrewID=1, gDate=date(2026, 4, 4), PID=players[0], CourseID=courses[0])
+    old, new = seasons.get("2025"), seasons.get("2026")
+    assert seasons.current(date(2026, 5, 1)).Name == "2026"
+    assert stats.attendance_counts(new)[1] == [date(2026, 4, 4)]
+    assert stats.attendance_counts(old)[1] == DATES
+
+    client.force_login(user)
+    resp = client.get(reverse("rounds_leaderboard_view"), {"stat": "attendance", "season": "2026"})
+    assert resp.context["season"].Name == "2026"
+    assert [r["value"] for r in resp.context["topten"]] == [1]
+
+    # freezing 2025 builds it once; later refreshes and old cube rows are left alone
+    stats.refresh_cube(freeze="2025")
+    assert seasons.get("2025").Frozen
+    StatsCube.objects.update(CheckedAt=timezone.now() - timedelta(days=30))
+    TeeTimesInd.objects.filter(gDate=DATES[0]).delete()
+    rebuilt, _ = stats.refresh_cube()
+    assert rebuilt and all(label.startswith("2026 ") for label in rebuilt)
+    frozen = seasons.get("2025")
+    assert stats.attendance_counts(frozen)[1] == DATES     # snapshot, not live
+
+
+def test_cube_windows_fit_the_longest_season_name(db):
+    # SQLite ignores varchar lengths; Postgres would reject an over-long Window
+    name = "Fall League 2026"
+    assert len(name) == Season._meta.get_field("Name").max_length
+    Season.objects.create(
+        Name=name, StartDate=date(2026, 9, 1), EndDate=date(2026, 12, 31),
+        PlayStart=date(2026, 9, 5), PlayEnd=date(2026, 11, 28),
+    )
+    seasons.invalidate()
+    stats.refresh_cube()
+    windows = StatsCube.objects.filter(Window__startswith=name).values_list("Window", flat=True)
+    assert windows
+    assert max(map(len, windows)) <= StatsCube._meta.get_field("Window").max_length
+
+
+def test_new_year_without_a_season_row_gets_a_default(db):
+    # only the migration's 2025 season exists
+    players, courses, user = _seed_season(4)
+    assert [s.Name for s in seasons.all_seasons()] == ["2025"]
+    TeeTimesInd.objects.create(CrewID=1, gDate=date(2026, 4, 4), PID=players[0], CourseID=courses[0])
+
+    season = seasons.current(date(2026, 10, 18))
+    assert (season.Name, season.pk) == ("2026", None)
+    assert (season.StartDate, season.EndDate) == (date(2026, 1, 1), date(2026, 12, 31))
+    assert stats.attendance_counts(season)[1] == [date(2026, 4, 4)]
+    assert seasons.current(date(2025, 12, 31)).Name == "2025"
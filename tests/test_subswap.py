@@ -0,0 +1,70 @@
+# tests/test_subswap.py
+"""
+Sub/swap dashboard: shows the same offer owners and counter offers as the
+per-offer lookups it replaced (its query budget is in test_query_budgets).
+"""
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils import timezone
+
+from GRPR.models import SubSwap, TeeTimesInd
+
+
+def _offer(tt, nType, SubType="Offer", **kw):
+    row = SubSwap.objects.create(
+        RequestDate=timezone.now(), PID=tt.PID, TeeTimeIndID=tt, nStatus="Open", nType=nType,
+        SubType=SubType, Msg=f"{nType} {SubType}", OtherPlayers=f"with {tt.PID.LastName}", **kw,
+    )
+    if SubType == "Offer":
+        row.SwapID = row.id
+        row.save(update_fields=["SwapID"])
+    return row
+
+
+def _receive(offer, player):
+    return SubSwap.objects.create(
+        RequestDate=offer.RequestDate, PID=player, TeeTimeIndID=offer.TeeTimeIndID, nStatus="Open",
+        nType=offer.nType, SubType="Received", Msg=offer.Msg, OtherPlayers="", SwapID=offer.SwapID,
+    )
+
+
+def _page(client):
+    resp = client.get(reverse("subswap_view"))
+    assert resp.status_code == 200
+    return resp.context
+
+
+def test_dashboard_offer_owners_and_counters(make_round, client):
+    rnd = make_round(16)
+    me = rnd.players[0]
+    me.user = User.objects.create_user(username="me", password="x")
+    me.save()
+    client.force_login(me.user)
+    tee_times = {tt.PID_id: tt for tt in TeeTimesInd.objects.all()}
+
+    # my swap offer with two counters, and one offer of each kind received
+    my_swap = _offer(tee_times[me.id], "Swap")
+    for p in rnd.players[4:6]:
+        SubSwap.objects.create(
+            RequestDate=timezone.now(), PID=p, TeeTimeIndID=tee_times[p.id], nStatus="Open", nType="Swap",
+            SubType="Counter", Msg="counter", OtherPlayers="theirs", SwapID=my_swap.SwapID,
+        )
+    _receive(_offer(tee_times[rnd.players[8].id], "Sub"), me)
+    _receive(_offer(tee_times[rnd.players[9].id], "Swap"), me)
+    ctx = _page(client)
+
+    assert [r["OfferID"] for r in ctx["available_subs_data"]] == [rnd.players[8].id]
+    assert [r["OfferID"] for r in ctx["available_swaps_data"]] == [rnd.players[9].id]
+    assert ctx["available_subs_data"][0]["other_players"] == ", ".join(
+        f"{p.FirstName} {p.LastName}" for p in rnd.groups["8:20"]
+    )
+    assert [c["proposed_by"] for c in ctx["counter_offers_data"]] == [
+        f"{p.FirstName} {p.LastName}" for p in rnd.players[4:6]
+    ]
+    assert {c["offer_other_players"] for c in ctx["counter_offers_data"]} == {my_swap.OtherPlayers}
+    assert ctx["offered_tee_time_ids"] == {tee_times[me.id].id}
+
+    for p in rnd.players[10:16]:
+        _receive(_offer(tee_times[p.id], "Sub" if p.id % 2 else "Swap"), me)
+    ctx = _page(client)
+    assert len(ctx["available_subs_data"]) + len(ctx["available_swaps_data"]) == 8
@@ -0,0 +1,46 @@
+# tests/test_synthetic.py
+"""
+Synthetic league generator and the Saturday replay benchmark.
+"""
+from GRPR.models import Forty, Games, Scorecard, ScorecardMeta, Skins, StblScore, SubSwap, TeeTimesInd
+from GRPR.services import replay, seasons, synthetic
+
+
+def test_generated_league_is_consistent(db, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        league = synthetic.generate(players=12, courses=2, weeks=4, played=2, seed=3)
+
+    season = seasons.current()
+    assert league.counts["Players"] == 12 and len(league.saturdays) == 4
+    assert all(season.PlayStart <= d <= season.PlayEnd and d.weekday() == 5 for d in league.saturdays)
+    assert TeeTimesInd.objects.count() == league.counts["TeeTimesInd"]
+
+    # played Saturdays: 18 holes per player, totals match, derived games filled
+    played = Games.objects.filter(Type="Skins", Status="Closed")
+    assert played.count() == 2
+    for meta in ScorecardMeta.objects.filter(GameID__in=played):
+        cards = Scorecard.objects.filter(smID=meta)
+        assert cards.count() == 18
+        assert meta.RawTotal == sum(c.RawScore for c in cards)
+    assert Skins.objects.exists() and Forty.objects.exists() and StblScore.objects.exists()
+    assert SubSwap.objects.filter(SubType="Offer").exists()
+
+    # the replay Saturday is set up but unscored
+    day = league.replay[0]
+    assert day.play_date == league.saturdays[2]
+    assert not Scorecard.objects.filter(GameID=day.game).exists()
+    assert {g.Type for g in Games.objects.filter(AssocGame=day.game.id)} == {"Skins", "Forty", "GasCup", "Stableford"}
+
+
+def test_saturday_replay_reports_every_view(db, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        league = synthetic.generate(players=8, courses=1, weeks=2, played=1, seed=5)
+        day = league.replay[0]
+        rows = replay.saturday(day, pollers=3)
+
+    by_view = {r["view"]: r for r in rows}
+    assert set(by_view) == {"hole_input_score_view", "skins_leaderboard_view", "live_updates_view", "scorecard_view"}
+    assert by_view["hole_input_score_view"]["n"] == 18 * len(day.groups)
+    assert Scorecard.objects.filter(GameID=day.game).count() == 18 * len(day.metas)
+    for r in rows:
+        assert r["queries_p50"] <= r["queries_p95"] and r["ms_p50"] <= r["ms_p95"]
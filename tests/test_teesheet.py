@@ -0,0 +1,128 @@
+# tests/test_teesheet.py
+"""
+Tee-sheet service: foursomes are grouped from one query and give the same
+"other players" as the per-tee-time lookups they replaced; the per-date cache
+is dropped by every kind of TeeTimesInd write and by renaming a player.
+"""
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from GRPR.models import TeeTimesInd
+from GRPR.services import teesheet
+from GRPR.utils import get_tee_time_details
+
+
+def _others_by_query(tt, pid):
+    """The old per-row lookup, kept as the reference result."""
+    return ", ".join(
+        f"{r.PID.FirstName} {r.PID.LastName}"
+        for r in TeeTimesInd.objects.filter(CourseID=tt.CourseID, gDate=tt.gDate).exclude(PID=pid).select_related("PID")
+    )
+
+
+def test_foursomes_match_per_row_lookups(make_round):
+    rnd = make_round(12)
+    tee_times = list(TeeTimesInd.objects.all())
+
+    with CaptureQueriesContext(connection) as ctx:
+        groups = teesheet.for_tee_times(tee_times)
+    assert len(ctx.captured_queries) == 1
+    assert len(groups) == 3 and all(len(g.tee_times) == 4 for g in groups.values())
+    for tt in tee_times:
+        assert groups[teesheet.key(tt)].names(exclude_pid=tt.PID_id) == _others_by_query(tt, tt.PID_id)
+
+    tt = tee_times[5]
+    details = get_tee_time_details(tt.id, tt.PID_id)
+    assert details["other_players"] == _others_by_query(tt, tt.PID_id)
+    assert (details["gDate"], details["course_time_slot"], details["tt_pid"]) == (tt.gDate, tt.CourseID.courseTimeSlot, tt.PID_id)
+
+
+def test_schedule_and_teesheet_pages_use_grouped_rows(make_round, client):
+    rnd = make_round(8)
+    player = rnd.players[0]
+    player.user = User.objects.create_user(username="sched", password="x")
+    player.save()
+    client.force_login(player.user)
+
+    resp = client.get(reverse("schedule_view"))
+    [row] = resp.context["schedule"]
+    tt = TeeTimesInd.objects.get(PID=player)
+    assert row["otherPlayers"] == _others_by_query(tt, player.id)
+
+    resp = client.get(reverse("teesheet_view"), {"gDate": str(rnd.play_date)})
+    cards = list(resp.context["cards"].values())
+    assert [c["courseTimeSlot"] for c in cards] == sorted(rnd.groups)
+    assert [len(c["players"]) for c in cards] == [4, 4]
+    assert [r["players"] for r in resp.context["schedule"]] == [
+        ", ".join(f"{p.FirstName} {p.LastName}" for p in rnd.groups[slot]) for slot in sorted(rnd.groups)
+    ]
+
+
+def test_cached_sheet_is_dropped_on_every_kind_of_write(make_round, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        rnd = make_round(8)
+    day = rnd.play_date
+
+    def players_at(slot):
+        return [
+            p["id"] for g in teesheet.for_date(day) if g["time_slot"] == slot for p in g["players"]
+        ]
+
+    slot = sorted(rnd.groups)[0]
+    assert players_at(slot) == [p.id for p in rnd.groups[slot]]
+    assert teesheet.dates() == [day]
+    with CaptureQueriesContext(connection) as ctx:   # second read: cache only
+        teesheet.for_date(day)
+        teesheet.dates()
+    table = TeeTimesInd._meta.db_table.lower()
+    assert not any(table in q["sql"].lower() for q in ctx.captured_queries if "cache" not in q["sql"].lower())
+
+    # queryset .update() (the sub/swap flow)
+    tt = TeeTimesInd.objects.filter(gDate=day, CourseID__courseTimeSlot=slot).order_by("id").first()
+    newcomer = rnd.players[-1]
+    with django_capture_on_commit_callbacks(execute=True):
+        TeeTimesInd.objects.filter(id=tt.id).update(PID=newcomer)
+    assert newcomer.id in players_at(slot)
+
+    # save() moving a tee time to another date drops both dates
+    with django_capture_on_commit_callbacks(execute=True):
+        tt.refresh_from_db()
+        tt.gDate = day + timedelta(days=7)
+        tt.save()
+    assert newcomer.id not in players_at(slot)
+    assert teesheet.dates() == sorted([day, tt.gDate])
+
+    # delete()
+    with django_capture_on_commit_callbacks(execute=True):
+        tt.delete()
+    assert teesheet.dates() == [day]
+
+
+def test_renamed_player_shows_on_cached_sheet(make_round, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        rnd = make_round(4)
+    day = rnd.play_date
+    player = rnd.players[1]
+
+    def names():
+        return [teesheet.player_names(g) for g in teesheet.for_date(day)]
+
+    assert f"{player.FirstName} {player.LastName}" in names()[0]
+
+    # a save that leaves the name alone keeps the cached sheet
+    with django_capture_on_commit_callbacks(execute=True):
+        player.save(update_fields=["Email"])
+    with CaptureQueriesContext(connection) as ctx:
+        names()
+    table = TeeTimesInd._meta.db_table.lower()
+    assert not any(table in q["sql"].lower() for q in ctx.captured_queries if "cache" not in q["sql"].lower())
+
+    with django_capture_on_commit_callbacks(execute=True):
+        player.FirstName = "Renamed"
+        player.save()
+    assert names() == [", ".join(f"{p.FirstName} {p.LastName}" for p in rnd.groups[sorted(rnd.groups)[0]])]
+    assert f"Renamed {player.LastName}" in names()[0]